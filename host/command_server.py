@@ -1,106 +1,761 @@
-"""Command server for Raspberry Pi 5 to control Pico display modes."""
+"""Command server for Raspberry Pi 5 to control Pico display modes.
+
+All Pico connections are served by one asyncio event loop running in a
+background thread, so hundreds of displays cost no threads and no polling
+wakeups. The public methods (start/stop/broadcast/send_mode/...) stay
+synchronous and may be called from any other thread.
+"""
 import argparse
+import asyncio
+import base64
+import hashlib
 import json
 import os
 import socket
 import threading
 import sys
 import time
+import zlib
+from collections import OrderedDict, deque
+
+# Modules shared with the Pico firmware live in src/ and run under CPython too.
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from framing import LineFramer, FRAME_TOO_LARGE  # noqa: E402
+from codec import (  # noqa: E402
+    PROTO_BINARY, PROTO_JSON, encode_message, decode_message, negotiate,
+)
+from coalesce import coalesce, is_render_command  # noqa: E402
+from glyph_push import (  # noqa: E402
+    DEFAULT_TTF, GLYPH_HEIGHT, baked_codepoints, load_rasterizer, payload_codepoints,
+)
+from layout import PayloadLayout  # noqa: E402
+from registry import DeviceRegistry  # noqa: E402
+
+# Pico replies to these are routed to the waiting sender instead of the log.
+TRANSFER_COMMANDS = ("bg_begin", "bg_chunk", "bg_end", "has_asset", "glyph_pack")
+GLYPHS_PER_PACK = 64
+DEFAULT_BACKLOG = 128
+DEFAULT_QUEUE_LIMIT = 32
+# What enqueue does when a Pico's send queue is full
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce", "disconnect")
+# Modes of DisplayManager.handlers; queued render commands for these collapse
+RENDER_MODES = ("status_datetime", "tasks_short", "free_text")
+# Kept small so unsent commands wait in the send queue, where newer ones
+# can still replace them, rather than in socket buffers.
+WRITE_BUFFER_HIGH = 8 * 1024
+SEND_BUFFER = 16 * 1024
+# set_mode commands remembered per connection until the Pico answers them
+UNACKED_LIMIT = 64
+
+
+class PicoConnection(asyncio.BufferedProtocol):
+    """One Pico socket; frames are received straight into its LineFramer.
+
+    Outgoing frames go through a bounded queue. Any thread may enqueue; the
+    event loop drains the queue into the transport until the transport
+    reports its buffer full (pause_writing), so a Pico on a congested link
+    only ever backs up its own queue. Frames queued with key None (transfer
+    requests, answered one at a time) are never dropped.
+
+    Render commands still waiting in the queue are collapsed latest-wins
+    with the same rules the Pico applies to a received burst
+    (src/coalesce.py), so a slow Pico only gets the screen it would end
+    up showing anyway.
+    """
+
+    def __init__(self, server, queue_limit=DEFAULT_QUEUE_LIMIT, overflow="drop_oldest"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow}")
+        self.server = server
+        self.framer = LineFramer(server.max_frame)
+        self.transport = None
+        self.addr = None
+        self.device = None      # registry.Device, once hello named it
+        self.connected_at = None
+        self.mode_commands = 0  # set_mode commands queued on this connection
+        self.unacked = OrderedDict()  # rev -> set_mode written, awaiting its reply
+        self.restore = None     # the set_mode that restores the shadow, until acked
+        self.restore_task = None
+        # One transfer request in flight: replies share one queue per connection.
+        self.request_lock = asyncio.Lock()
+        self.queue_limit = queue_limit
+        self.overflow = overflow
+        self.lock = threading.Lock()
+        self.pending = deque()  # (key, message, frame), oldest first
+        self.closing = False
+        self.paused_at = None   # when the transport buffer filled up
+        self.stall_time = 0.0
+        self.max_depth = 0
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.bytes_saved = 0
+
+    def __repr__(self):
+        return f"<Pico {self.addr}>"
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.addr = transport.get_extra_info("peername")
+        self.connected_at = time.monotonic()
+        transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH)
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER)
+        self.server._connected(self)
+
+    def get_buffer(self, sizehint):
+        return self.framer.writable()
+
+    def buffer_updated(self, nbytes):
+        self.framer.commit(nbytes)
+        self.server._received(self)
+
+    def connection_lost(self, exc):
+        self.closing = True
+        self.server._disconnected(self)
+
+    def pause_writing(self):
+        self.paused_at = time.monotonic()
+
+    def resume_writing(self):
+        self.stall_time += time.monotonic() - self.paused_at
+        self.paused_at = None
+        self.flush()
+
+    def close(self):
+        self.closing = True
+        self.transport.close()
+
+    def enqueue(self, key, frame, message=None):
+        """Queue a frame (any thread); returns what happened to it.
+
+        "queued", "dropped_oldest" (an older frame made room),
+        "coalesced" (merged with or replaced older queued frames),
+        "disconnected" (queue full under the disconnect policy; the caller
+        closes the connection) or "closed". ``message`` is the command the
+        frame encodes, needed to collapse render commands.
+        """
+        with self.lock:
+            if self.closing:
+                return "closed"
+            if message is not None and message.get("cmd") == "set_mode":
+                self.mode_commands += 1
+            if (message is not None and is_render_command(message, RENDER_MODES)
+                    and self._collapse(key, message, frame)):
+                return "coalesced"
+            result = "queued"
+            if key is not None and len(self.pending) >= self.queue_limit:
+                if self.overflow == "disconnect":
+                    self.closing = True
+                    return "disconnected"
+                victim = None
+                if self.overflow == "coalesce":
+                    victim = self._oldest(key)
+                    if victim is not None:
+                        self.coalesced += 1
+                        result = "coalesced"
+                if victim is None:
+                    victim = self._oldest()
+                    if victim is not None:
+                        self.dropped += 1
+                        result = "dropped_oldest"
+                if victim is not None:
+                    del self.pending[victim]
+            self.pending.append((key, message, frame))
+            if len(self.pending) > self.max_depth:
+                self.max_depth = len(self.pending)
+        return result
+
+    def _oldest(self, key=None):
+        """Index of the oldest droppable frame (with this key, if given)."""
+        for index, (queued_key, _, _) in enumerate(self.pending):
+            if queued_key is not None and (key is None or queued_key == key):
+                return index
+        return None
+
+    def _collapse(self, key, message, frame):
+        """Queue a render command collapsed with the queued ones (lock held).
+
+        False, leaving the queue alone, when nothing is superseded.
+        Merged status_datetime updates are encoded afresh.
+        """
+        entries = dict((id(entry[1]), entry) for entry in self.pending)
+        entries[id(message)] = (key, message, frame)
+        commands = [entry[1] for entry in self.pending]
+        commands.append(message)
+        kept, superseded = coalesce(commands, RENDER_MODES)
+        if not superseded:
+            return False
+        before = sum(len(entry[2]) for entry in entries.values())
+        pending = deque()
+        for command in kept:
+            entry = entries.get(id(command))
+            if entry is None:
+                entry = ((command.get("cmd"), command.get("mode")), command,
+                         self.server._encode(self, command))
+            pending.append(entry)
+        self.pending = pending
+        self.coalesced += len(superseded)
+        self.bytes_saved += before - sum(len(entry[2]) for entry in pending)
+        return True
+
+    def flush(self):
+        """Write queued frames until the transport pushes back (loop thread)."""
+        transport = self.transport
+        while self.paused_at is None and not transport.is_closing():
+            with self.lock:
+                if not self.pending:
+                    return
+                _, message, frame = self.pending.popleft()
+            transport.write(frame)
+            self.sent += 1
+            if message is not None and message.get("cmd") == "set_mode":
+                rev = (message.get("payload") or {}).get("rev")
+                if rev is not None:
+                    self.unacked[rev] = message
+                    if len(self.unacked) > UNACKED_LIMIT:
+                        self.unacked.popitem(last=False)
+
+    def stats(self):
+        with self.lock:
+            depth = len(self.pending)
+            queued_bytes = sum(len(frame) for _, _, frame in self.pending)
+        stall = self.stall_time
+        if self.paused_at is not None:
+            stall += time.monotonic() - self.paused_at
+        return {"addr": "%s:%s" % self.addr[:2], "device": self.device and self.device.id,
+                "depth": depth, "max_depth": self.max_depth,
+                "queued_bytes": queued_bytes, "sent": self.sent, "dropped": self.dropped,
+                "coalesced": self.coalesced, "bytes_saved": self.bytes_saved,
+                "stall_s": round(stall, 3),
+                "stalled": self.paused_at is not None}
 
 
 class DisplayCommandServer:
-    def __init__(self, bind="0.0.0.0", port=5000):
+    def __init__(self, bind="0.0.0.0", port=5000, glyph_font=None, prelayout=False,
+                 backlog=DEFAULT_BACKLOG, queue_limit=DEFAULT_QUEUE_LIMIT, overflow="drop_oldest"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow}")
         self.bind = bind
         self.port = port
-        self.accept_timeout = 1.0
-        self.recv_timeout = 2.0
+        self.backlog = backlog
+        self.queue_limit = queue_limit
+        self.overflow = overflow
+        self.max_frame = 65536
         self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.server.bind((self.bind, self.port))
-        self.server.listen(2)
-        self.server.settimeout(self.accept_timeout)
-        self.clients = set()
+        self.server.listen(self.backlog)
+        self.loop = None
+        self._loop_thread = None
+        self._listener = None
+        self.clients = set()    # PicoConnection
+        self.registry = DeviceRegistry()
+        self.rev = 0            # stamped into every set_mode payload
+        self.asset_files = {}   # background hash -> path, to re-upload on restore
+        self.protocols = {}  # conn -> negotiated protocol
+        self.replies = {}    # conn -> asyncio.Queue of transfer replies
+        self.assets = {}     # conn -> background hashes known to be cached
+        self.glyphs = {}     # conn -> codepoints the Pico can draw
+        self.baked_font_id, self.baked_glyphs = baked_codepoints()
+        self.rasterizer = load_rasterizer(glyph_font)
+        self.layout = PayloadLayout(rasterizer=self.rasterizer) if prelayout else None
         self.clients_lock = threading.Lock()
         self.running = threading.Event()
         self.running.set()
 
     def start(self):
-        threading.Thread(target=self._accept_loop, daemon=True).start()
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        asyncio.run_coroutine_threadsafe(self._listen(), self.loop).result()
         print(f"Listening for Pico connections on {self.bind}:{self.port}")
 
+    async def _listen(self):
+        self._listener = await self.loop.create_server(
+            lambda: PicoConnection(self, self.queue_limit, self.overflow),
+            sock=self.server, backlog=self.backlog)
+
     def stop(self):
         self.running.clear()
+        if self.loop is None:
+            self.server.close()
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+        self.loop.close()
+        self.loop = None
+
+    async def _shutdown(self):
+        if self._listener is not None:
+            self._listener.close()
         self.server.close()
         with self.clients_lock:
-            for conn in list(self.clients):
-                conn.close()
+            conns = list(self.clients)
+        for conn in conns:
+            conn.close()
+        await asyncio.sleep(0)  # let connection_lost run
+        with self.clients_lock:
             self.clients.clear()
 
-    def _accept_loop(self):
-        while self.running.is_set():
+    # Event loop callbacks ----------------------------------------------------
+    def _connected(self, conn):
+        print(f"Pico connected from {conn.addr}")
+        with self.clients_lock:
+            self.clients.add(conn)
+            self.replies[conn] = asyncio.Queue()
+            self.assets[conn] = set()
+            self.glyphs[conn] = set()
+
+    def _disconnected(self, conn):
+        with self.clients_lock:
+            self.clients.discard(conn)
+            self.protocols.pop(conn, None)
+            self.replies.pop(conn, None)
+            self.assets.pop(conn, None)
+            self.glyphs.pop(conn, None)
+            self.registry.unregister(conn)
+        conn.unacked.clear()
+        conn.restore = None
+        print(f"Pico disconnected {conn.addr}")
+
+    def _received(self, conn):
+        framer = conn.framer
+        addr = conn.addr
+        while True:
+            frame = framer.next_frame()
+            if frame is None:
+                break
+            if frame is FRAME_TOO_LARGE:
+                print(f"[pico {addr}] frame_too_large (> {self.max_frame} bytes), dropped")
+                continue
             try:
-                conn, addr = self.server.accept()
-            except socket.timeout:
+                message = decode_message(framer.frame_type, frame)
+            except ValueError:
+                print(f"[pico {addr}] undecodable frame: {bytes(frame)[:64]!r}")
                 continue
-            except OSError:
-                break
-            conn.settimeout(self.recv_timeout)
-            print(f"Pico connected from {addr}")
-            with self.clients_lock:
-                self.clients.add(conn)
-            threading.Thread(target=self._handle_client, args=(conn, addr), daemon=True).start()
-
-    def _handle_client(self, conn, addr):
-        buffer = b""
-        try:
-            while self.running.is_set():
-                try:
-                    chunk = conn.recv(1024)
-                except socket.timeout:
-                    # Periodically wake up to observe server shutdowns.
+            if isinstance(message, dict) and message.get("cmd") == "hello":
+                self._negotiate(conn, addr, message)
+                continue
+            if isinstance(message, dict) and message.get("cmd") in TRANSFER_COMMANDS:
+                replies = self.replies.get(conn)
+                if replies is not None:
+                    replies.put_nowait(message)
+                if message.get("status") == "ok":
                     continue
-                except (ConnectionResetError, BrokenPipeError, OSError):
-                    break
-                if not chunk:
-                    break
-                buffer += chunk.replace(b"\r", b"")
-                while b"\n" in buffer:
-                    line, buffer = buffer.split(b"\n", 1)
-                    line = line.strip()
-                    if line:
-                        print(f"[pico {addr}] {line.decode('utf-8', 'replace')}")
-        finally:
-            with self.clients_lock:
-                self.clients.discard(conn)
-            conn.close()
-            print(f"Pico disconnected {addr}")
+            if isinstance(message, dict) and _is_mode_reply(message):
+                self._mode_reply(conn, message)
+            if isinstance(message, dict) and "missing" in message:
+                # Evicted from the Pico's cache: re-check before next use.
+                self.assets.get(conn, set()).discard(message["missing"])
+            print(f"[pico {addr}] {json.dumps(message, ensure_ascii=False)}")
+
+    def _mode_reply(self, conn, reply):
+        """Move the answered set_mode into the device's screen shadow.
+
+        Replies are matched by the ``rev`` the Pico echoes, so frames it
+        dropped unanswered (too large, undecodable) cannot shift the match.
+        Within one burst the Pico reports superseded commands before
+        rendering the rest; they were replaced or merged into a later one,
+        so applying them to the shadow in reply order still ends on the
+        screen shown. A rendered reply also settles every older rev: the
+        Pico answers in order, so those will never be answered.
+        """
+        rev = reply["rev"]
+        command = conn.unacked.pop(rev, None)
+        if command is None:
+            return
+        status = reply.get("status")
+        if status == "ok":
+            while conn.unacked and next(iter(conn.unacked)) < rev:
+                conn.unacked.popitem(last=False)
+        device = conn.device
+        if device is None or status not in ("ok", "superseded"):
+            return
+        with self.clients_lock:
+            device.apply(command["mode"], command.get("payload") or {},
+                         command.get("replace", False))
+        if command is conn.restore:
+            conn.restore = None
+            self._screen_restored(conn, "restored")
+
+    def _screen_restored(self, conn, how):
+        elapsed = (time.monotonic() - conn.connected_at) * 1000
+        conn.device.restore_ms = round(elapsed, 1)
+        print(f"[pico {conn.addr}] device {conn.device.id} screen {how} "
+              f"({conn.device.mode}) {elapsed:.0f} ms after connecting")
+
+    def _negotiate(self, conn, addr, hello):
+        proto = negotiate(hello.get("proto"))
+        # The answer is always a JSON line; the Pico switches after reading it.
+        conn.transport.write(encode_message({"cmd": "hello", "proto": proto}))
+        with self.clients_lock:
+            self.protocols[conn] = proto
+            known = set(hello.get("glyphs") or ())
+            if hello.get("font") and hello.get("font") == self.baked_font_id:
+                known |= self.baked_glyphs
+            self.glyphs[conn] = known
+            replaced = None
+            if hello.get("device"):
+                conn.device, replaced = self.registry.register(conn, hello, time.time())
+        print(f"[pico {addr}] hello, protocol {proto}, {len(known)} glyphs")
+        if conn.device is not None:
+            device = conn.device
+            print(f"[pico {addr}] device {device.id}, firmware {device.firmware}, "
+                  f"groups {sorted(device.groups)}")
+        if replaced is not None:
+            # The same device reconnected before its old socket timed out.
+            replaced.close()
+        if conn.device is not None and conn.device.mode is not None:
+            screen = hello.get("screen") or {}
+            if (screen.get("mode") == conn.device.mode
+                    and screen.get("rev") == conn.device.payload.get("rev")):
+                self._screen_restored(conn, "still current")
+            else:
+                conn.restore_task = self.loop.create_task(self._restore(conn))
+
+    def _targets(self, target=None):
+        """Connections of a device id or group tag; every Pico for None."""
+        with self.clients_lock:
+            if target is None:
+                return list(self.clients)
+            return self.registry.resolve(target)
+
+    async def _restore(self, conn, timeout=5.0):
+        """Bring a reconnected device back to its shadowed screen.
+
+        Sends only what the device lacks: glyphs it does not report, the
+        background if has_asset says it is gone, then one set_mode. Skipped
+        when a newer set_mode was queued for the device in the meantime.
+        """
+        device = conn.device
+        with self.clients_lock:
+            mode, payload = device.mode, dict(device.payload)
+        await self._push_glyphs(payload, timeout, [conn])
+        background = payload.get("background")
+        if isinstance(background, dict) and background.get("hash") in self.asset_files:
+            path = self.asset_files[background["hash"]]
+            try:
+                with open(path, "rb") as fh:
+                    data = fh.read()
+            except OSError as exc:
+                print(f"Unable to re-read background {path}: {exc}")
+            else:
+                await self._ensure_asset(conn, data, background["hash"], False, timeout=timeout)
+        if conn.mode_commands:
+            return
+        # The shadow is the whole screen: merging it into whatever the
+        # Pico kept would bring back fields the host has since dropped.
+        command = {"cmd": "set_mode", "mode": mode, "payload": payload, "replace": True}
+        conn.restore = command
+        if not self._send_to(conn, command):
+            conn.restore = None
 
     def broadcast(self, payload):
+        return self.send_to(None, payload)
+
+    def send_to(self, target, payload):
+        """Queue a command for a device, a group, or (None) every Pico.
+
+        Never waits on a socket. Returns {connection: enqueue result} (see
+        PicoConnection.enqueue); empty, and so false, when no Pico matched
+        or the payload is empty. Raises RuntimeError unless the server has
+        been started.
+        """
+        if self.loop is None:
+            raise RuntimeError("command server is not running; call start() first")
         if not payload:
-            return
-        frame = (json.dumps(payload) + "\n").encode()
-        bad = []
+            return {}
+        if payload.get("cmd") == "set_mode":
+            # Revision the Pico reports back in hello (see _negotiate).
+            with self.clients_lock:
+                self.rev += 1
+                rev = self.rev
+            payload = dict(payload, payload=dict(payload.get("payload") or {}, rev=rev))
+        key = (payload.get("cmd"), payload.get("mode"))
+        frames = {}
+        conns = self._targets(target)
         with self.clients_lock:
-            for conn in list(self.clients):
+            targets = [(conn, self.protocols.get(conn, PROTO_JSON)) for conn in conns]
+        results = {}
+        for conn, proto in targets:
+            frame = frames.get(proto)
+            if frame is None:
+                frame = frames[proto] = encode_message(_for_protocol(payload, proto), proto)
+            results[conn] = conn.enqueue(key, frame, payload)
+        if results:
+            self.loop.call_soon_threadsafe(_flush, results)
+        return results
+
+    def _encode(self, conn, message):
+        proto = self.protocols.get(conn, PROTO_JSON)
+        return encode_message(_for_protocol(message, proto), proto)
+
+    def _send_to(self, conn, message):
+        frame = self._encode(conn, message)
+        result = conn.enqueue(None, frame, message)
+        if result == "closed":
+            return False
+        self.loop.call_soon_threadsafe(_flush, {conn: result})
+        return True
+
+    def devices(self):
+        """Every registered device, online or not."""
+        with self.clients_lock:
+            return [device.describe() for device in self.registry.devices.values()]
+
+    def client_stats(self):
+        """Send queue depth and stall time of every connected Pico."""
+        with self.clients_lock:
+            conns = list(self.clients)
+        return [conn.stats() for conn in conns]
+
+    def _run(self, coro):
+        """Run a coroutine on the server loop and wait for its result.
+
+        For the synchronous API only: called on the loop thread it would
+        deadlock.
+        """
+        if self.loop is None:
+            coro.close()
+            raise RuntimeError("command server is not running; call start() first")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def _request(self, conn, message, timeout):
+        """Send a transfer command and wait for the matching reply (loop thread).
+
+        Requests on one connection take turns (a restore and a
+        send_background can overlap), so a reply is never consumed by a
+        request waiting for another one.
+        """
+        replies = self.replies.get(conn)
+        if replies is None:
+            return None
+        async with conn.request_lock:
+            while not replies.empty():
+                replies.get_nowait()  # late replies of a request that timed out
+            if not self._send_to(conn, message):
+                return None
+            deadline = self.loop.time() + timeout
+            while True:
+                remaining = deadline - self.loop.time()
+                if remaining <= 0:
+                    return None
                 try:
-                    conn.sendall(frame)
-                except OSError:
-                    bad.append(conn)
-            for conn in bad:
-                self.clients.discard(conn)
-        return len(self.clients) > 0
+                    reply = await asyncio.wait_for(replies.get(), remaining)
+                except asyncio.TimeoutError:
+                    return None
+                if reply.get("cmd") == message["cmd"] and reply.get("id") == message.get("id"):
+                    return reply
+
+    def send_background(self, path, apply=True, target=None, **options):
+        """Make sure every targeted Pico has a JPEG cached, uploading only on a miss.
+
+        Uploads go in CRC-checked chunks; each Pico acknowledges every chunk
+        before the next one is sent, and an interrupted upload resumes from
+        the offset the Pico reports. The transfers to all targets run
+        concurrently as coroutines on the server loop.
+        """
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+        except OSError as exc:
+            print(f"Unable to read background: {exc}")
+            return None
+        asset_hash = hashlib.sha256(data).hexdigest()[:16]
+        self.asset_files[asset_hash] = path
+        targets = self._targets(target)
+        if not targets:
+            return None
+        if not self._run(self._ensure_assets(targets, data, asset_hash, apply, options)):
+            return None
+        return asset_hash
+
+    async def _ensure_assets(self, conns, data, asset_hash, apply, options):
+        results = await asyncio.gather(
+            *(self._ensure_asset(conn, data, asset_hash, apply, **options) for conn in conns))
+        return all(results)
+
+    async def _ensure_asset(self, conn, data, asset_hash, apply, chunk_size=1536, pace=0.0, timeout=5.0):
+        known = self.assets.get(conn)
+        if known is None:
+            return False
+        if asset_hash not in known:
+            reply = await self._request(conn, {"cmd": "has_asset", "hashes": [asset_hash]}, timeout)
+            if not reply:
+                return False
+            if asset_hash not in reply.get("present", ()):
+                if not await self._upload(conn, data, asset_hash, chunk_size, pace, apply, timeout):
+                    return False
+                known.add(asset_hash)
+                return True
+            known.add(asset_hash)
+        if apply:
+            reply = await self._request(conn, {"cmd": "bg_end", "id": asset_hash, "apply": True},
+                                        timeout)
+            return bool(reply) and reply.get("status") == "ok"
+        return True
+
+    async def _upload(self, conn, data, upload_id, chunk_size, pace, apply, timeout):
+        reply = await self._request(conn, {"cmd": "bg_begin", "id": upload_id, "size": len(data),
+                                           "crc": zlib.crc32(data)}, timeout)
+        if not reply or reply.get("status") != "ok":
+            print(f"bg_begin failed: {reply}")
+            return False
+        offset = reply["offset"]
+        binary = self.protocols.get(conn) == PROTO_BINARY
+        while offset < len(data):
+            chunk = data[offset:offset + chunk_size]
+            reply = await self._request(conn, {
+                "cmd": "bg_chunk", "id": upload_id, "offset": offset,
+                "data": chunk if binary else base64.b64encode(chunk).decode(),
+                "crc": zlib.crc32(chunk),
+            }, timeout)
+            if not reply:
+                print(f"bg_chunk at {offset} timed out")
+                return False
+            if reply.get("status") != "ok" and reply.get("reason") != "bad_offset":
+                print(f"bg_chunk failed: {reply}")
+                return False
+            offset = reply["offset"]
+            if pace:
+                await asyncio.sleep(pace)
+        reply = await self._request(conn, {"cmd": "bg_end", "id": upload_id, "apply": apply},
+                                    timeout)
+        if not reply or reply.get("status") != "ok":
+            print(f"bg_end failed: {reply}")
+            return False
+        return True
+
+    def push_glyphs(self, payload, timeout=5.0, target=None):
+        """Send each Pico the glyphs a payload needs that it does not have yet.
+
+        A device whose baked font matches src/font_jp16.bin is assumed to
+        have all of it; pushed glyphs are remembered per connection (and
+        re-reported by the Pico in hello), so each crosses the network once.
+        """
+        conns = self._targets(target)
+        if conns and self.rasterizer is not None:
+            self._run(self._push_glyphs(payload, timeout, conns))
+
+    async def _push_glyphs(self, payload, timeout, conns):
+        if self.rasterizer is None:
+            return
+        needed = payload_codepoints(payload)
+        if not needed:
+            return
+        with self.clients_lock:
+            targets = [(conn, self.glyphs.get(conn)) for conn in conns]
+        packs = {}
+        await asyncio.gather(*(self._push_glyphs_to(conn, known, needed, packs, timeout)
+                               for conn, known in targets if known is not None))
+
+    async def _push_glyphs_to(self, conn, known, needed, packs, timeout):
+        missing = sorted(needed - known)
+        binary = self.protocols.get(conn) == PROTO_BINARY
+        for start in range(0, len(missing), GLYPHS_PER_PACK):
+            group = tuple(missing[start:start + GLYPHS_PER_PACK])
+            data = packs.get(group)
+            if data is None:
+                data = packs[group] = self.rasterizer.pack(group)
+            if data:
+                reply = await self._request(conn, {
+                    "cmd": "glyph_pack", "height": GLYPH_HEIGHT,
+                    "data": data if binary else base64.b64encode(data).decode(),
+                }, timeout)
+                if not reply or reply.get("status") != "ok":
+                    print(f"glyph_pack failed: {reply}")
+                    return
+            # Glyphs the TTF lacks are marked known too, so they are not retried.
+            known.update(group)
+            if data:
+                # Compaction on the Pico may have dropped older glyphs.
+                known.difference_update(reply.get("evicted") or ())
+
+    def send_mode(self, mode, payload=None, prelayout=None, target=None):
+        """Send set_mode to a device id, a group tag or (None) every Pico;
+        prelayout (default: the server setting) wraps free_text and
+        truncates task titles here instead of on the Pico."""
+        payload = payload or {}
+        if prelayout is None:
+            prelayout = self.layout is not None
+        if prelayout:
+            if self.layout is None:
+                self.layout = PayloadLayout(rasterizer=self.rasterizer)
+            payload = self.layout.prelayout(mode, payload)
+        background = payload.get("background")
+        if isinstance(background, dict) and "file" in background:
+            # Host-side image: distribute it by hash, then reference the hash.
+            asset_hash = self.send_background(background["file"], apply=False, target=target)
+            if asset_hash is None:
+                print(f"Background {background['file']} not delivered to every Pico")
+                return False
+            payload = dict(payload, background={"hash": asset_hash})
+        self.push_glyphs(payload, target=target)
+        return self.send_to(target, {"cmd": "set_mode", "mode": mode, "payload": payload})
+
+    def send_refresh(self, target=None):
+        return self.send_to(target, {"cmd": "refresh"})
 
-    def send_mode(self, mode, payload=None):
-        return self.broadcast({"cmd": "set_mode", "mode": mode, "payload": payload or {}})
 
-    def send_refresh(self):
-        return self.broadcast({"cmd": "refresh"})
+def _flush(results):
+    """Drain the queues enqueue() touched (event loop thread); never blocks."""
+    for conn, result in results.items():
+        if result == "disconnected":
+            print(f"[pico {conn.addr}] send queue full ({conn.queue_limit}), disconnecting")
+            conn.transport.abort()  # close() would wait for the stuck buffer
+        elif result != "closed":
+            conn.flush()
 
 
-def _dispatch_line(server, line):
-    """Parse and dispatch a single command line to the server."""
+def _is_mode_reply(message):
+    """A Pico's answer to set_mode, carrying the rev of the command."""
+    if not isinstance(message.get("rev"), int):
+        return False
+    if message.get("status") == "superseded":
+        return message.get("cmd") == "set_mode"
+    return "diff" in message or message.get("reason") == "unknown_mode"
+
+
+def _for_protocol(payload, proto):
+    """Swap base64 background data for raw bytes on binary connections."""
+    if proto != PROTO_BINARY:
+        return payload
+    background = (payload.get("payload") or {}).get("background")
+    if not isinstance(background, dict) or not isinstance(background.get("data"), str):
+        return payload
+    try:
+        raw = base64.b64decode(background["data"])
+    except ValueError:
+        return payload
+    inner = dict(payload["payload"], background=dict(background, data=raw))
+    return dict(payload, payload=inner)
+
+
+def _dispatch_line(server, line, target=None):
+    """Parse and dispatch a single command line to the server.
+
+    ``to <device-id|group> <command>`` sends the command to those Picos only.
+    """
     if not line:
         return
+    if line.startswith("to ") and target is None:
+        tokens = line.split(None, 2)
+        if len(tokens) < 3:
+            print("Usage: to <device-id|group> <command>")
+            return
+        with server.clients_lock:
+            known = tokens[1] in server.registry
+        if not known:
+            print(f"Unknown device or group: {tokens[1]}")
+            return
+        _dispatch_line(server, tokens[2], tokens[1])
+        return
     if line.startswith("mode "):
         tokens = line.split(None, 2)
         mode = tokens[1]
@@ -111,17 +766,29 @@ def _dispatch_line(server, line):
             except ValueError:
                 print("Invalid JSON payload.")
                 return
-        server.send_mode(mode, payload)
+        server.send_mode(mode, payload, target=target)
         return
     if line.lower() == "refresh":
-        server.send_refresh()
+        server.send_refresh(target)
+        return
+    if line.lower() == "stats":
+        for stats in server.client_stats():
+            print(json.dumps(stats))
+        return
+    if line.lower() == "devices":
+        for device in server.devices():
+            print(json.dumps(device))
+        return
+    if line.startswith("background "):
+        asset_hash = server.send_background(line.split(None, 1)[1], target=target)
+        print(f"Background {asset_hash or 'upload failed'}")
         return
     try:
         candidate = json.loads(line)
     except ValueError:
         print(f"Unrecognized command: {line}")
         return
-    server.broadcast(candidate)
+    server.send_to(target, candidate)
 
 
 def fifo_loop(server, fifo_path):
@@ -145,7 +812,8 @@ def fifo_loop(server, fifo_path):
 
 
 def interactive_loop(server):
-    print("Enter `mode <mode> <payload-json>`, `refresh`, or raw JSON commands. Type 'exit' to stop.")
+    print("Enter `mode <mode> <payload-json>`, `refresh`, `background <jpeg-path>`, `stats`, `devices`, or raw JSON commands;")
+    print("prefix a command with `to <device-id|group>` to send it to those Picos only. Type 'exit' to stop.")
     while True:
         try:
             line = input("command> ").strip()
@@ -166,12 +834,24 @@ def parse_args():
     parser.add_argument("--preload", help="Path to a JSON file with one command per line to send immediately after the first client connects")
     parser.add_argument("--headless", action="store_true", help="Run without interactive prompt (use with --fifo)")
     parser.add_argument("--fifo", default=None, help="Path to a named pipe (FIFO) for receiving commands (default: none)")
+    parser.add_argument("--glyph-font", default=DEFAULT_TTF if os.path.exists(DEFAULT_TTF) else None,
+                        help="TTF used to rasterize glyphs missing on the Pico (needs freetype-py)")
+    parser.add_argument("--prelayout", action="store_true",
+                        help="Wrap free_text and truncate task titles on the host")
+    parser.add_argument("--backlog", type=int, default=DEFAULT_BACKLOG,
+                        help="Listen backlog: connections the kernel queues while displays reconnect at once")
+    parser.add_argument("--queue-limit", type=int, default=DEFAULT_QUEUE_LIMIT,
+                        help="Commands queued per Pico before the overflow policy applies")
+    parser.add_argument("--overflow", choices=OVERFLOW_POLICIES, default="drop_oldest",
+                        help="What to do when a Pico's send queue is full")
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
-    server = DisplayCommandServer(bind=args.bind, port=args.port)
+    server = DisplayCommandServer(bind=args.bind, port=args.port, glyph_font=args.glyph_font,
+                                  prelayout=args.prelayout, backlog=args.backlog,
+                                  queue_limit=args.queue_limit, overflow=args.overflow)
     server.start()
     try:
         if args.preload:
@@ -208,6 +888,9 @@ def send_preload(path, server):
                 line = line.strip()
                 if not line or line.startswith("#"):
                     continue
+                if line.startswith("to "):
+                    _dispatch_line(server, line)
+                    continue
                 try:
                     payload = json.loads(line)
                 except ValueError:
@@ -0,0 +1,112 @@
+"""Glyphs the Pico lacks: which ones a payload needs and how to draw them.
+
+The Pico's baked font covers a curated charset; anything else renders
+blank. Before a payload is sent, the server compares its characters with
+what that device is known to have (the baked font, identified by the hash
+of its codepoint index, plus glyphs pushed earlier and reported in
+``hello``) and pushes the rest, rasterized here from a TTF, in
+``glyph_pack`` commands (record format: see src/glyph_cache.py).
+
+Rasterizing needs freetype-py (``pip install freetype-py``); without it
+payloads are still sent, the missing characters just stay blank.
+"""
+
+import hashlib
+import os
+import struct
+
+GLYPH_HEIGHT = 17
+GLYPH_SIZE = 16
+DEFAULT_TTF = "/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf"
+BAKED_FONT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "src", "font_jp16.bin")
+FONT_HEADER_SIZE = 16
+
+
+def baked_codepoints(path=BAKED_FONT):
+    """(index id, set of codepoints) of the baked font, as the Pico reports it.
+
+    JPF1 and JPF2 (src/binfont.py) share the header and codepoint index;
+    only the bitmaps differ, and they are not read here.
+    """
+    try:
+        with open(path, "rb") as fh:
+            header = fh.read(FONT_HEADER_SIZE)
+            count, _, _, cp_size = struct.unpack("<HBBB", header[4:9])
+            index = fh.read(count * cp_size)
+    except (OSError, struct.error):
+        return None, set()
+    fmt = "<%d%s" % (count, "H" if cp_size == 2 else "I")
+    return hashlib.sha256(index).hexdigest()[:16], set(struct.unpack(fmt, index))
+
+
+def payload_codepoints(value):
+    """Codepoints drawn from the Japanese font for every string in a payload."""
+    found = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            found.update(ord(ch) for ch in item if ord(ch) > 126 and ch != "°")
+        elif isinstance(item, dict):
+            stack.extend(v for k, v in item.items() if k != "background")
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return found
+
+
+class GlyphRasterizer:
+    """Renders 16 px monochrome glyphs into glyph_pack records."""
+
+    def __init__(self, ttf_path=DEFAULT_TTF):
+        import freetype  # optional dependency, see module docstring
+        self.freetype = freetype
+        self.face = freetype.Face(ttf_path)
+        self.face.set_pixel_sizes(0, GLYPH_SIZE)
+        self.ascender = self.face.size.ascender >> 6
+
+    def render(self, cp):
+        """(width, MONO_HLSB rows) for cp, or None if the TTF lacks it."""
+        face = self.face
+        if not face.get_char_index(cp):
+            return None
+        ft = self.freetype
+        face.load_char(chr(cp), ft.FT_LOAD_RENDER | ft.FT_LOAD_TARGET_MONO)
+        glyph = face.glyph
+        bitmap = glyph.bitmap
+        width = max(1, min(GLYPH_SIZE, glyph.advance.x >> 6))
+        stride = (width + 7) // 8
+        rows = bytearray(stride * GLYPH_HEIGHT)
+        top = self.ascender - glyph.bitmap_top
+        buf = bitmap.buffer
+        for y in range(bitmap.rows):
+            py = top + y
+            if not 0 <= py < GLYPH_HEIGHT:
+                continue
+            for x in range(bitmap.width):
+                px = glyph.bitmap_left + x
+                if 0 <= px < width and buf[y * bitmap.pitch + (x >> 3)] & (0x80 >> (x & 7)):
+                    rows[py * stride + (px >> 3)] |= 0x80 >> (px & 7)
+        return width, bytes(rows)
+
+    def pack(self, codepoints):
+        """glyph_pack data for the codepoints the TTF has."""
+        out = bytearray()
+        for cp in sorted(codepoints):
+            glyph = self.render(cp)
+            if glyph is not None:
+                out += struct.pack("<IB", cp, glyph[0]) + glyph[1]
+        return bytes(out)
+
+
+def load_rasterizer(ttf_path):
+    """GlyphRasterizer for ttf_path, or None (with a message) if unavailable."""
+    if not ttf_path:
+        return None
+    try:
+        return GlyphRasterizer(ttf_path)
+    except ImportError:
+        print("freetype-py not installed; missing glyphs will not be pushed")
+    except Exception as exc:  # freetype raises its own error types
+        print(f"Unable to load glyph font {ttf_path}: {exc}")
+    return None
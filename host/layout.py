@@ -0,0 +1,98 @@
+"""Lay out free_text and tasks_short payloads on the host.
+
+Wrapping notes and truncating task titles costs the Pico milliseconds per
+draw; the Pi does it in microseconds with the same code (src/text_renderer
+runs under CPython) and the same glyph widths: the baked font plus, when a
+rasterizer is configured, the widths of the glyphs glyph_push would send.
+
+A laid-out payload carries ``"prelaid": <width>``. The Pico uses ``lines``
+and the titles as they are when the width matches its own TEXT_WIDTH, and
+lays the payload out itself otherwise. Results are cached per text hash.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import text_renderer
+from binfont import BinaryFont
+
+from glyph_push import BAKED_FONT
+
+TEXT_WIDTH = 216      # display_manager.TEXT_WIDTH
+MAX_TASKS = 4         # display_manager.normalize_tasks
+CACHE_SIZE = 256
+
+
+class RasterizedWidths:
+    """Widths of host-pushed glyphs, in the shape text_renderer expects."""
+
+    def __init__(self, rasterizer):
+        self.rasterizer = rasterizer
+        self.widths = {}
+
+    def lookup(self, ch):
+        cp = ord(ch)
+        if cp not in self.widths:
+            glyph = self.rasterizer.render(cp)
+            self.widths[cp] = glyph[0] if glyph else None
+        width = self.widths[cp]
+        return None if width is None else (cp, width)
+
+
+class PayloadLayout:
+    def __init__(self, font_path=BAKED_FONT, rasterizer=None, width=TEXT_WIDTH):
+        try:
+            baked = BinaryFont(font_path, 64)
+        except (OSError, ValueError) as exc:
+            print(f"Layout without the baked font ({exc}); non-ASCII measured at 16 px")
+            baked = False
+        text_renderer.set_fonts(baked, RasterizedWidths(rasterizer) if rasterizer else False)
+        self.width = width
+        self.cache = OrderedDict()  # (kind, text sha1) -> layout, oldest first
+        self.hits = 0
+        self.misses = 0
+
+    def _cached(self, kind, text, fn):
+        key = (kind, hashlib.sha1(text.encode("utf-8")).digest())
+        value = self.cache.pop(key, None)
+        if value is None:
+            self.misses += 1
+            value = fn(text, self.width)
+            if len(self.cache) >= CACHE_SIZE:
+                self.cache.popitem(last=False)
+        else:
+            self.hits += 1
+        self.cache[key] = value
+        return value
+
+    def prelayout(self, mode, payload):
+        """A laid-out copy of payload, or payload itself for other modes."""
+        if payload.get("prelaid"):
+            return payload
+        if mode == "free_text":
+            return self._free_text(payload)
+        if mode == "tasks_short":
+            return self._tasks(payload)
+        return payload
+
+    def _free_text(self, payload):
+        text = payload.get("text") or payload.get("message") or ""
+        if isinstance(text, (list, tuple)):
+            text = "\n".join(text)
+        lines = self._cached("wrap", text, text_renderer.wrap_text_jp)
+        out = {k: v for k, v in payload.items() if k not in ("text", "message")}
+        out["lines"] = list(lines)
+        out["prelaid"] = self.width
+        return out
+
+    def _tasks(self, payload):
+        raw = payload.get("tasks")
+        if not isinstance(raw, list):
+            return payload
+        tasks = []
+        for item in raw[:MAX_TASKS]:
+            item = dict(item)
+            title = item.get("title", "Untitled")
+            item["title"] = self._cached("title", title, text_renderer.truncate_to_width)
+            tasks.append(item)
+        return dict(payload, tasks=tasks, prelaid=self.width)
@@ -0,0 +1,96 @@
+"""Known Pico displays, indexed by device id and by group tag.
+
+A Pico announces itself in ``hello`` with a stable device id, its firmware
+version, capabilities and group tags (src/config.py DEVICE_ID /
+DEVICE_GROUPS). Devices stay registered while offline, so a reconnect
+under the same id picks up the same record; only the connection changes.
+
+Each device also keeps a shadow of its screen: the last set_mode it
+acknowledged, with status_datetime updates merged the way
+DisplayManager.set_mode merges them. The server restores it when the
+device comes back.
+
+Resolving a target touches only the matching devices: a dict lookup by id,
+then by group, so fan-out cost follows the number of targets rather than
+the size of the fleet. Callers hold the server's clients_lock.
+"""
+
+
+class Device:
+    def __init__(self, device_id):
+        self.id = device_id
+        self.firmware = None
+        self.caps = frozenset()
+        self.groups = frozenset()
+        self.conn = None          # PicoConnection while online
+        self.connected_at = None
+        self.mode = None          # screen shadow: last acknowledged set_mode
+        self.payload = None
+        self.restore_ms = None    # connect to correct screen, last reconnect
+
+    def apply(self, mode, payload, replace=False):
+        """Record an acknowledged set_mode in the shadow."""
+        if mode == "status_datetime" and mode == self.mode and not replace:
+            self.payload = dict(self.payload, **payload)
+        else:
+            self.mode = mode
+            self.payload = dict(payload)
+
+    def describe(self):
+        return {"id": self.id, "fw": self.firmware, "caps": sorted(self.caps),
+                "groups": sorted(self.groups), "online": self.conn is not None,
+                "addr": "%s:%s" % self.conn.addr[:2] if self.conn else None,
+                "mode": self.mode, "rev": (self.payload or {}).get("rev"),
+                "restore_ms": self.restore_ms}
+
+
+class DeviceRegistry:
+    def __init__(self):
+        self.devices = {}  # id -> Device
+        self.groups = {}   # tag -> {id: Device}
+
+    def register(self, conn, hello, now):
+        """Attach conn to the device its hello names; returns (device, replaced conn).
+
+        The replaced connection is a previous socket of the same device
+        that has not been noticed as dead yet; the caller closes it.
+        """
+        device = self.devices.get(hello["device"])
+        if device is None:
+            device = self.devices[hello["device"]] = Device(hello["device"])
+        self._set_groups(device, frozenset(hello.get("groups") or ()))
+        device.firmware = hello.get("fw")
+        device.caps = frozenset(hello.get("caps") or ())
+        replaced = device.conn if device.conn is not conn else None
+        device.conn = conn
+        device.connected_at = now
+        return device, replaced
+
+    def unregister(self, conn):
+        device = getattr(conn, "device", None)
+        if device is not None and device.conn is conn:
+            device.conn = None
+
+    def _set_groups(self, device, groups):
+        for tag in device.groups - groups:
+            members = self.groups.get(tag)
+            if members is not None:
+                members.pop(device.id, None)
+                if not members:
+                    del self.groups[tag]
+        for tag in groups - device.groups:
+            self.groups.setdefault(tag, {})[device.id] = device
+        device.groups = groups
+
+    def resolve(self, target):
+        """Online connections of a device id or a group tag (id wins)."""
+        device = self.devices.get(target)
+        if device is not None:
+            return [device.conn] if device.conn is not None else []
+        members = self.groups.get(target)
+        if not members:
+            return []
+        return [device.conn for device in members.values() if device.conn is not None]
+
+    def __contains__(self, target):
+        return target in self.devices or target in self.groups
@@ -0,0 +1,136 @@
+"""Content-addressed background cache on SD card or flash.
+
+Files are stored as ``<hash>.jpg`` where the hash is the first 16 hex digits
+of the SHA-256 of the content, so an image is written once no matter how
+many times it is sent. Total size is capped; the least recently used
+entries are evicted first, and ``on_evict`` is told so files derived from
+an image (its region sidecars) can go with it. The LRU order lives in RAM and is only written
+to ``index.json`` when entries are added or evicted, keeping flash writes
+off the render path.
+"""
+
+import os
+import json
+import hashlib
+import ubinascii
+
+from config import SD_MOUNT_POINT
+
+INDEX_FILE = "index.json"
+HASH_LEN = 16
+
+
+def storage_root():
+    """Prefer the SD card when it is mounted, else internal flash."""
+    try:
+        os.listdir(SD_MOUNT_POINT)
+        return SD_MOUNT_POINT
+    except OSError:
+        return ""
+
+
+def content_hash(data):
+    return ubinascii.hexlify(hashlib.sha256(data).digest()).decode()[:HASH_LEN]
+
+
+def is_hash(value):
+    if not isinstance(value, str) or len(value) != HASH_LEN:
+        return False
+    for ch in value:
+        if ch not in "0123456789abcdef":
+            return False
+    return True
+
+
+class AssetCache:
+    def __init__(self, directory, max_bytes, on_evict=None):
+        self.dir = directory
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict  # called with the hash of each evicted entry
+        try:
+            os.mkdir(directory)
+        except OSError:
+            pass
+        self.entries = self._load_index()  # [[hash, size], ...] oldest first
+
+    def _load_index(self):
+        try:
+            with open(self.dir + "/" + INDEX_FILE) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = []
+        present = {}
+        for name in os.listdir(self.dir):
+            if name.endswith(".jpg") and is_hash(name[:-4]):
+                present[name[:-4]] = os.stat(self.dir + "/" + name)[6]
+        # Keep the saved order for files that still exist, append strays.
+        ordered = [[h, present.pop(h)] for h, _ in entries if h in present]
+        for h, size in present.items():
+            ordered.append([h, size])
+        return ordered
+
+    def _save_index(self):
+        try:
+            with open(self.dir + "/" + INDEX_FILE, "w") as f:
+                json.dump(self.entries, f)
+        except OSError:
+            pass
+
+    def path(self, asset_hash):
+        return self.dir + "/" + asset_hash + ".jpg"
+
+    def _find(self, asset_hash):
+        for i, entry in enumerate(self.entries):
+            if entry[0] == asset_hash:
+                return i
+        return -1
+
+    def has(self, asset_hash):
+        return self._find(asset_hash) >= 0
+
+    def touch(self, asset_hash):
+        """Mark an entry as most recently used; False if it is not cached."""
+        i = self._find(asset_hash)
+        if i < 0:
+            return False
+        self.entries.append(self.entries.pop(i))
+        return True
+
+    def total_bytes(self):
+        return sum(entry[1] for entry in self.entries)
+
+    def add_file(self, asset_hash, src_path):
+        """Move a completed file into the cache and return its path."""
+        dst = self.path(asset_hash)
+        i = self._find(asset_hash)
+        if i >= 0:
+            self.entries.pop(i)
+            os.remove(dst)
+        os.rename(src_path, dst)
+        self.entries.append([asset_hash, os.stat(dst)[6]])
+        self._evict(asset_hash)
+        self._save_index()
+        return dst
+
+    def add_bytes(self, asset_hash, data):
+        tmp = self.dir + "/" + asset_hash + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        return self.add_file(asset_hash, tmp)
+
+    def _evict(self, keep):
+        total = self.total_bytes()
+        i = 0
+        while total > self.max_bytes and i < len(self.entries):
+            asset_hash, size = self.entries[i]
+            if asset_hash == keep:
+                i += 1
+                continue
+            try:
+                os.remove(self.path(asset_hash))
+            except OSError:
+                pass
+            self.entries.pop(i)
+            total -= size
+            if self.on_evict:
+                self.on_evict(asset_hash)
@@ -0,0 +1,128 @@
+"""Chunked background upload (bg_begin / bg_chunk / bg_end).
+
+Each chunk is decoded and appended to a ``.part`` file as it arrives, so the
+Pico never holds more than one chunk of the image in RAM. The partial file
+survives a dropped connection: a repeated ``bg_begin`` for the same id
+reports the bytes already stored and the host resumes from there. A CRC-32
+over the whole file is checked before the upload is published.
+
+The id is the content hash, so completed uploads land in the AssetCache and
+an image the Pico already has is never transferred again.
+"""
+
+import os
+import ubinascii
+
+from asset_cache import is_hash
+
+TRANSFER_COMMANDS = ("bg_begin", "bg_chunk", "bg_end")
+_READ_BLOCK = 512
+
+
+def _file_size(path):
+    try:
+        return os.stat(path)[6]
+    except OSError:
+        return -1
+
+
+def _file_crc(path):
+    crc = 0
+    buf = bytearray(_READ_BLOCK)
+    with open(path, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                return crc
+            crc = ubinascii.crc32(memoryview(buf)[:n], crc)
+
+
+class BackgroundTransfer:
+    def __init__(self, cache):
+        self.cache = cache
+        self.active = {}  # id -> {"size", "crc", "offset", "running"}
+
+    def _part_path(self, upload_id):
+        return self.cache.dir + "/" + upload_id + ".part"
+
+    def handle(self, payload):
+        """Run one transfer command; returns (reply, completed_path)."""
+        cmd = payload.get("cmd")
+        upload_id = payload.get("id")
+        if not is_hash(upload_id):
+            return self._error(cmd, upload_id, "bad_id"), None
+        if cmd == "bg_begin":
+            return self._begin(upload_id, payload), None
+        state = self.active.get(upload_id)
+        if state is None:
+            if cmd == "bg_end" and self.cache.touch(upload_id):
+                # Already cached (bg_begin answered done): just publish it.
+                final = self.cache.path(upload_id)
+                return self._reply(cmd, upload_id, offset=_file_size(final)), final
+            return self._error(cmd, upload_id, "not_started"), None
+        if cmd == "bg_chunk":
+            return self._chunk(upload_id, state, payload), None
+        return self._end(upload_id, state)
+
+    def _reply(self, cmd, upload_id, **fields):
+        reply = {"status": "ok", "cmd": cmd, "id": upload_id}
+        reply.update(fields)
+        return reply
+
+    def _error(self, cmd, upload_id, reason, **fields):
+        reply = {"status": "error", "cmd": cmd, "id": upload_id, "reason": reason}
+        reply.update(fields)
+        return reply
+
+    def _begin(self, upload_id, payload):
+        size = payload.get("size")
+        crc = payload.get("crc")
+        if not isinstance(size, int) or size <= 0 or not isinstance(crc, int):
+            return self._error("bg_begin", upload_id, "bad_header")
+        if self.cache.has(upload_id):
+            return self._reply("bg_begin", upload_id, offset=size, done=True)
+        part = self._part_path(upload_id)
+        offset = _file_size(part)
+        running = 0
+        if offset > size:
+            os.remove(part)
+            offset = -1
+        if offset > 0:
+            running = _file_crc(part)
+        elif offset < 0:
+            open(part, "wb").close()
+            offset = 0
+        self.active[upload_id] = {"size": size, "crc": crc,
+                                  "offset": offset, "running": running}
+        return self._reply("bg_begin", upload_id, offset=offset)
+
+    def _chunk(self, upload_id, state, payload):
+        offset = payload.get("offset")
+        if offset != state["offset"]:
+            return self._error("bg_chunk", upload_id, "bad_offset", offset=state["offset"])
+        data = payload.get("data")
+        try:
+            if not isinstance(data, (bytes, bytearray)):
+                data = ubinascii.a2b_base64(data)
+        except Exception:
+            return self._error("bg_chunk", upload_id, "bad_data", offset=offset)
+        if "crc" in payload and ubinascii.crc32(data) != payload["crc"]:
+            return self._error("bg_chunk", upload_id, "bad_crc", offset=offset)
+        if offset + len(data) > state["size"]:
+            return self._error("bg_chunk", upload_id, "overflow", offset=offset)
+        with open(self._part_path(upload_id), "ab") as f:
+            f.write(data)
+        state["offset"] = offset + len(data)
+        state["running"] = ubinascii.crc32(data, state["running"])
+        return self._reply("bg_chunk", upload_id, offset=state["offset"])
+
+    def _end(self, upload_id, state):
+        if state["offset"] != state["size"]:
+            return self._error("bg_end", upload_id, "incomplete", offset=state["offset"]), None
+        del self.active[upload_id]
+        part = self._part_path(upload_id)
+        if state["running"] != state["crc"]:
+            os.remove(part)
+            return self._error("bg_end", upload_id, "bad_crc", offset=0), None
+        final = self.cache.add_file(upload_id, part)
+        return self._reply("bg_end", upload_id, offset=state["size"]), final
@@ -0,0 +1,216 @@
+"""Bitmap font read glyph by glyph from a binary file.
+
+The Japanese font used to be a Python module whose byte literals were all
+loaded into the heap at import. This file keeps only the index in RAM and
+seeks to the bitmaps of glyphs as they are drawn; recently used glyphs are
+kept in a small LRU cache.
+
+File layout (written by tools/font_compiler.py, little-endian)::
+
+    0    4 bytes  magic b"JPF1" (plain rows) or b"JPF2" (packed rows)
+    4    u16      glyph count N
+    6    u8       height
+    7    u8       max width
+    8    u8       codepoint size in bytes (2 or 4)
+    9    ...      zero padding up to HEADER_SIZE
+    16   N x u16/u32  codepoints, ascending
+    ..   N x u32  bitmap offsets from the start of the bitmap section
+    ..   N x u8   widths
+    ..   bitmaps, 1 bpp, each row padded to whole bytes (MONO_HLSB)
+
+JPF2 bitmaps drop the blank rows above and below the ink and store rows
+equal to the one above only once. Each glyph is::
+
+    u8 top, u8 count      rows top .. top+count-1 hold the ink
+    (count + 7) // 8      repeat mask, MSB first: bit set = same as the row above
+    rows                  the rows whose bit is clear, byte-padded
+
+Packed glyphs are about 30% smaller; text_renderer blits them straight
+into its line buffer, glyph_at() expands them to plain rows.
+"""
+
+import struct
+from array import array
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ucollections import OrderedDict
+
+import glyph_run
+
+MAGIC = b"JPF1"
+MAGIC_PACKED = b"JPF2"
+HEADER_SIZE = 16
+
+
+class BinaryFont:
+    def __init__(self, path, cache_size):
+        self.path = path
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # glyph index -> stored bitmap, oldest first
+        self._file = open(path, "rb")
+        header = self._file.read(HEADER_SIZE)
+        if len(header) != HEADER_SIZE or header[:4] not in (MAGIC, MAGIC_PACKED):
+            raise ValueError("not a JPF1/JPF2 font")
+        self.compressed = header[:4] == MAGIC_PACKED
+        count, self.height, self.max_width, cp_size = struct.unpack("<HBBB", header[4:9])
+        self.codepoints = array("H" if cp_size == 2 else "I", bytes(count * cp_size))
+        self.offsets = array("I", bytes(count * 4))
+        self.widths = bytearray(count)
+        for table in (self.codepoints, self.offsets, self.widths):
+            self._file.readinto(table)
+        self._bitmap_base = HEADER_SIZE + count * (cp_size + 5)
+        if self.compressed:
+            self._bitmap_end = self._file.seek(0, 2) - self._bitmap_base
+
+    def find(self, ch):
+        """Index of the glyph for ch, or -1 (binary search)."""
+        cp = ord(ch)
+        codepoints = self.codepoints
+        lo = 0
+        hi = len(codepoints)
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if codepoints[mid] < cp:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(codepoints) and codepoints[lo] == cp:
+            return lo
+        return -1
+
+    def _size(self, index):
+        if not self.compressed:
+            return ((self.widths[index] + 7) >> 3) * self.height
+        offsets = self.offsets
+        end = offsets[index + 1] if index + 1 < len(offsets) else self._bitmap_end
+        return end - offsets[index]
+
+    def packed_at(self, index):
+        """Bitmap of glyph ``index`` as stored in the file (LRU cached).
+
+        Plain rows for JPF1, the packed form described above for JPF2.
+        """
+        cache = self._cache
+        data = cache.pop(index, None)
+        if data is None:
+            data = bytearray(self._size(index))
+            self._file.seek(self._bitmap_base + self.offsets[index])
+            self._file.readinto(data)
+            if len(cache) >= self.cache_size:
+                del cache[next(iter(cache))]
+        cache[index] = data  # re-insert as most recently used
+        return data
+
+    def glyph_at(self, index):
+        """Rows of glyph ``index`` as a MONO_HLSB bytearray."""
+        data = self.packed_at(index)
+        if not self.compressed:
+            return data
+        return expand(data, self.widths[index], self.height)
+
+    def lookup(self, ch):
+        """(index, width) for ch or None."""
+        index = self.find(ch)
+        if index < 0:
+            return None
+        return index, self.widths[index]
+
+    def glyph(self, ch):
+        """(width, rows) for ch or None."""
+        index = self.find(ch)
+        if index < 0:
+            return None
+        return self.widths[index], self.glyph_at(index)
+
+    def index_id(self):
+        """Hash of the codepoint index, so the host can tell which charset a device has."""
+        from asset_cache import content_hash
+        return content_hash(bytes(self.codepoints))
+
+
+def expand(data, width, height):
+    """Packed JPF2 glyph -> plain byte-padded rows."""
+    stride = (width + 7) >> 3
+    rows = bytearray(stride * height)
+    top = data[0]
+    count = data[1]
+    src = 2 + ((count + 7) >> 3)
+    dst = top * stride
+    for y in range(count):
+        if data[2 + (y >> 3)] & (0x80 >> (y & 7)):
+            rows[dst:dst + stride] = rows[dst - stride:dst]
+        else:
+            rows[dst:dst + stride] = data[src:src + stride]
+            src += stride
+        dst += stride
+    return rows
+
+
+def pack(rows, width, height):
+    """Plain byte-padded rows -> packed JPF2 glyph (inverse of expand)."""
+    stride = (width + 7) >> 3
+    lines = [bytes(rows[y * stride:(y + 1) * stride]) for y in range(height)]
+    ink = [y for y in range(height) if any(lines[y])]
+    if not ink:
+        return bytes(2)
+    top = ink[0]
+    count = ink[-1] + 1 - top
+    mask = bytearray((count + 7) >> 3)
+    stored = bytearray()
+    for i in range(count):
+        y = top + i
+        if i and lines[y] == lines[y - 1]:
+            mask[i >> 3] |= 0x80 >> (i & 7)
+        else:
+            stored.extend(lines[y])
+    return bytes((top, count)) + bytes(mask) + bytes(stored)
+
+
+def subset(font, text):
+    """Publish the glyphs of text in ``font`` as a font module for panel.write.
+
+    panel.write reads a font module's globals (MAP, WIDTHS, OFFSETS,
+    BITMAPS...), so the subset is written into the glyph_run module.
+    ``font`` is anything with lookup() and glyph_at(); glyphs it lacks are
+    left out.
+    """
+    chars = []
+    widths = bytearray()
+    offsets = bytearray()
+    bitmaps = bytearray()
+    for ch in text:
+        if ch in chars:
+            continue
+        hit = font.lookup(ch)
+        if hit is None:
+            continue
+        index, width = hit
+        chars.append(ch)
+        widths.append(width)
+        offsets.extend(struct.pack(">H", len(bitmaps) * 8))
+        bitmaps.extend(_pack_bits(font.glyph_at(index), width, font.height))
+    glyph_run.MAP = "".join(chars)
+    glyph_run.HEIGHT = font.height
+    glyph_run.MAX_WIDTH = font.max_width
+    glyph_run.WIDTHS = widths
+    glyph_run.OFFSETS = offsets
+    glyph_run.BITMAPS = bitmaps
+    return glyph_run
+
+
+def _pack_bits(rows, width, height):
+    """Byte-padded rows -> the contiguous bit stream panel.write expects."""
+    if not width & 7:
+        return rows
+    stride = (width + 7) >> 3
+    out = bytearray((width * height + 7) >> 3)
+    bit = 0
+    for y in range(height):
+        row = y * stride
+        for x in range(width):
+            if rows[row + (x >> 3)] & (0x80 >> (x & 7)):
+                out[bit >> 3] |= 0x80 >> (bit & 7)
+            bit += 1
+    return out
@@ -0,0 +1,72 @@
+"""Latest-wins collapsing of render commands.
+
+Given a burst of commands, only the final screen state is ever visible:
+
+- the last ``set_mode`` wins; earlier ones are superseded
+- consecutive ``status_datetime`` updates ending the burst are merged field
+  by field, matching how DisplayManager.set_mode applies partial updates
+- ``refresh`` is deduplicated and dropped entirely when a ``set_mode`` in
+  the same burst redraws anyway
+
+When a superseded ``set_mode`` switched to another mode, the kept command
+is marked ``"replace": True``: the device must treat it as a mode switch
+(fresh payload and background), not as an update of what it shows now.
+
+Other commands are kept in their original order. ``set_mode`` for a mode
+outside ``modes`` is passed through untouched so it still gets its error
+reply and never supersedes a valid command.
+"""
+
+MERGED_MODES = ("status_datetime",)
+
+
+def is_render_command(command, modes):
+    cmd = command.get("cmd")
+    if cmd == "refresh":
+        return True
+    return cmd == "set_mode" and command.get("mode") in modes
+
+
+def coalesce(commands, modes):
+    """Return (kept, superseded) lists for a burst of decoded commands."""
+    render = [i for i, command in enumerate(commands)
+              if is_render_command(command, modes)]
+    if len(render) < 2:
+        return list(commands), []
+
+    modes_set = [i for i in render if commands[i].get("cmd") == "set_mode"]
+    if modes_set:
+        last = modes_set[-1]
+        final = commands[last]
+        mode = final.get("mode")
+        if mode in MERGED_MODES:
+            chain = []
+            for i in reversed(modes_set):
+                if commands[i].get("mode") != mode:
+                    break
+                chain.append(i)
+                if commands[i].get("replace"):
+                    break  # nothing before a switch merges into it
+            if len(chain) > 1:
+                merged = {}
+                for i in reversed(chain):
+                    merged.update(commands[i].get("payload") or {})
+                final = {"cmd": "set_mode", "mode": mode, "payload": merged}
+        if any(commands[i].get("mode") != mode or commands[i].get("replace")
+               for i in modes_set):
+            final = dict(final, replace=True)
+    else:
+        last = render[-1]
+        final = commands[last]
+
+    dropped = set(render)
+    kept = []
+    superseded = []
+    for i, command in enumerate(commands):
+        if i == last:
+            kept.append(final)
+        elif i in dropped:
+            superseded.append(command)
+        else:
+            kept.append(command)
+    return kept, superseded
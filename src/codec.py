@@ -0,0 +1,185 @@
+"""Wire encodings shared by the Pico client and the Pi host.
+
+Protocol 1 is the original newline-delimited JSON. Protocol 2 sends
+length-prefixed binary frames::
+
+    +------+----------------+-----------------+
+    | type | length (u32 BE)| body            |
+    +------+----------------+-----------------+
+
+where type 0x01 carries a CBOR (RFC 8949) encoded message. CBOR keeps the
+same dict/list/str/int shape as the JSON commands but adds raw byte strings,
+so bitmaps and JPEGs travel without base64. Only the subset needed by the
+commands is implemented: ints, floats, text, bytes, arrays, maps, booleans
+and null with definite lengths.
+
+Peers agree on a protocol with a JSON ``hello`` exchange; receivers accept
+both framings at any time (see framing.LineFramer), so the switch-over needs
+no synchronization.
+"""
+
+import json
+import struct
+
+from framing import FRAME_JSON, decode_json
+
+PROTO_JSON = 1
+PROTO_BINARY = 2
+SUPPORTED_PROTOCOLS = (PROTO_JSON, PROTO_BINARY)
+
+FRAME_CBOR = 0x01
+
+# Errors a malformed or truncated CBOR body can raise in _decode; cbor_loads
+# turns them into ValueError. MicroPython's struct has no error class and
+# raises ValueError itself.
+_DECODE_ERRORS = (IndexError, TypeError, getattr(struct, "error", ValueError))
+HEADER_SIZE = 5
+
+
+def negotiate(offered, supported=SUPPORTED_PROTOCOLS):
+    """Pick the highest protocol both sides support (JSON if none)."""
+    best = PROTO_JSON
+    for proto in offered or ():
+        if proto in supported and proto > best:
+            best = proto
+    return best
+
+
+def encode_message(message, proto=PROTO_JSON):
+    if proto == PROTO_BINARY:
+        body = cbor_dumps(message)
+        return struct.pack(">BI", FRAME_CBOR, len(body)) + body
+    return (json.dumps(message) + "\n").encode()
+
+
+def decode_message(frame_type, frame):
+    if frame_type == FRAME_JSON:
+        return decode_json(frame)
+    if frame_type == FRAME_CBOR:
+        return cbor_loads(frame)
+    raise ValueError("unknown frame type")
+
+
+# CBOR ------------------------------------------------------------------------
+
+def _head(major, value):
+    major <<= 5
+    if value < 24:
+        return bytes((major | value,))
+    if value < 0x100:
+        return bytes((major | 24, value))
+    if value < 0x10000:
+        return struct.pack(">BH", major | 25, value)
+    if value < 0x100000000:
+        return struct.pack(">BI", major | 26, value)
+    return struct.pack(">BQ", major | 27, value)
+
+
+def _encode(obj, out):
+    if obj is None:
+        out.append(b"\xf6")
+    elif obj is True:
+        out.append(b"\xf5")
+    elif obj is False:
+        out.append(b"\xf4")
+    elif isinstance(obj, int):
+        if obj >= 0:
+            out.append(_head(0, obj))
+        else:
+            out.append(_head(1, -1 - obj))
+    elif isinstance(obj, float):
+        out.append(struct.pack(">Bd", 0xFB, obj))
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        out.append(_head(3, len(data)))
+        out.append(data)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        out.append(_head(2, len(obj)))
+        out.append(bytes(obj))
+    elif isinstance(obj, (list, tuple)):
+        out.append(_head(4, len(obj)))
+        for item in obj:
+            _encode(item, out)
+    elif isinstance(obj, dict):
+        out.append(_head(5, len(obj)))
+        for key, value in obj.items():
+            _encode(key, out)
+            _encode(value, out)
+    else:
+        raise TypeError("cannot encode " + type(obj).__name__)
+
+
+def cbor_dumps(obj):
+    out = []
+    _encode(obj, out)
+    return b"".join(out)
+
+
+def _decode(view, pos):
+    initial = view[pos]
+    pos += 1
+    major = initial >> 5
+    info = initial & 0x1F
+    if major == 7:
+        if info == 20:
+            return False, pos
+        if info == 21:
+            return True, pos
+        if info == 22 or info == 23:
+            return None, pos
+        if info == 26:
+            return struct.unpack(">f", view[pos:pos + 4])[0], pos + 4
+        if info == 27:
+            return struct.unpack(">d", view[pos:pos + 8])[0], pos + 8
+        raise ValueError("unsupported simple value")
+    if info < 24:
+        value = info
+    elif info == 24:
+        value = view[pos]
+        pos += 1
+    elif info == 25:
+        value = (view[pos] << 8) | view[pos + 1]
+        pos += 2
+    elif info == 26:
+        value = struct.unpack(">I", view[pos:pos + 4])[0]
+        pos += 4
+    elif info == 27:
+        value = struct.unpack(">Q", view[pos:pos + 8])[0]
+        pos += 8
+    else:
+        raise ValueError("indefinite lengths are not supported")
+    if major == 0:
+        return value, pos
+    if major == 1:
+        return -1 - value, pos
+    if major in (2, 3) and pos + value > len(view):
+        raise ValueError("truncated CBOR")
+    if major == 2:
+        return bytes(view[pos:pos + value]), pos + value
+    if major == 3:
+        return str(view[pos:pos + value], "utf-8"), pos + value
+    if major == 4:
+        items = []
+        for _ in range(value):
+            item, pos = _decode(view, pos)
+            items.append(item)
+        return items, pos
+    if major == 5:
+        mapping = {}
+        for _ in range(value):
+            key, pos = _decode(view, pos)
+            mapping[key], pos = _decode(view, pos)
+        return mapping, pos
+    raise ValueError("unsupported major type")
+
+
+def cbor_loads(data):
+    """Decode one CBOR item; any malformed input raises ValueError."""
+    view = memoryview(data)
+    try:
+        obj, pos = _decode(view, 0)
+    except _DECODE_ERRORS:
+        raise ValueError("malformed CBOR")
+    if pos != len(view):
+        raise ValueError("trailing data")
+    return obj
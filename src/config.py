@@ -1,11 +1,26 @@
 # Configuration values for Raspberry Pi Pico MicroPython stack.
 TCP_SERVER_HOST = "192.168.11.16"  # Pi 5 local IP
 TCP_SERVER_PORT = 5000
-BUFFER_SIZE = 1024
+MAX_FRAME_SIZE = 65536      # receive buffer; longer lines get frame_too_large
 RECONNECT_DELAY = 5
-SOCKET_TIMEOUT = 0.75  # shorter timeout to allow touch polling
+TOUCH_POLL_MS = 20          # touch panel polling period
+WIFI_CHECK_INTERVAL = 5     # seconds between Wi-Fi/NTP supervisor checks
 AUTO_REFRESH_INTERVAL = 60  # seconds between auto-refresh in status_datetime mode
 JST_OFFSET = 9 * 3600       # UTC+9 in seconds
 NTP_SYNC_INTERVAL = 86400   # re-sync NTP every 24 hours
 SD_CS = 22
 SD_MOUNT_POINT = "/sd"
+BG_CACHE_DIR = "bgcache"    # content-addressed backgrounds, on SD or flash
+BG_CACHE_MAX_BYTES = 1024 * 1024
+REGION_CACHE_DIR = "regions"      # background pixels under status text fields
+REGION_CACHE_RAM_BYTES = 24 * 1024
+REGION_CACHE_MAX_BYTES = 256 * 1024  # sidecars on storage, least recently used evicted
+FONT_JP_FILE = "font_jp16.bin"
+FONT_GLYPH_CACHE = 64             # decoded Japanese glyphs kept in RAM
+GLYPH_CACHE_FILE = "glyphcache.bin"  # host-pushed glyphs, on flash
+GLYPH_CACHE_MAX_BYTES = 32 * 1024
+TEXT_LAYOUT_CACHE = 48            # memoized wrap / truncate results (each paragraph is one)
+DIGIT_ATLAS_FILES = {32: "digits32.bin", 48: "digits48.bin"}  # large clock digits
+SPRITE_ATLAS_FILE = "sprites.bin"  # weather icons and button chrome
+DEVICE_ID = None            # announced in hello; None uses the board's unique id
+DEVICE_GROUPS = ()          # group tags the host can address, e.g. ("kitchen", "floor2")
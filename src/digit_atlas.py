@@ -0,0 +1,132 @@
+"""Pre-rendered large digits for the clock and weather readings.
+
+The 8x16 and 16 px fonts make the clock tiny on a 240x320 panel, and
+scaling glyphs on the Pico is slow. Instead, digits and a few symbols are
+rendered ahead of time (tools/build_digit_atlas.py) at 32 and 48 px, each
+size as one packed MONO_HLSB bitmap with the glyphs side by side. Drawing a
+glyph expands its slice of the atlas into a small RGB565 buffer with
+framebuf and sends it as one blit_buffer (one window write per glyph).
+Given a backdrop (region_cache.Backdrop) the buffer starts from the
+background pixels and only the digit's ink is blitted over them.
+
+File layout (little-endian)::
+
+    0   4 bytes  magic b"DGA1"
+    4   u8       height
+    5   u8       glyph count N
+    6   u16      atlas width in pixels
+    8   N bytes  characters (latin-1, so ° is 0xB0)
+    ..  N x u8   glyph widths
+    ..  N x u16  glyph x offsets in the atlas
+    ..  atlas rows, MONO_HLSB, each ((width + 7) // 8) bytes
+"""
+
+import struct
+from array import array
+
+try:
+    import framebuf
+except ImportError:
+    framebuf = None
+
+from config import DIGIT_ATLAS_FILES
+
+MAGIC = b"DGA1"
+HEADER_SIZE = 8
+
+_atlases = {}  # size -> DigitAtlas, or False if unavailable
+
+
+def _swap(color):
+    # framebuf stores RGB565 little-endian; the panel expects big-endian.
+    return ((color & 0xFF) << 8) | (color >> 8)
+
+
+class DigitAtlas:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE or header[:4] != MAGIC:
+                raise ValueError("not a DGA1 atlas")
+            self.height, count, self.atlas_width = struct.unpack("<BBH", header[4:])
+            self.chars = f.read(count).decode("latin-1")
+            self.widths = bytearray(count)
+            f.readinto(self.widths)
+            self.xs = array("H", bytes(count * 2))
+            f.readinto(self.xs)
+            self.bitmap = bytearray(((self.atlas_width + 7) >> 3) * self.height)
+            f.readinto(self.bitmap)
+        self.space = self.widths[self.chars.find("0")] // 2 if "0" in self.chars else 8
+        self._atlas_fb = framebuf.FrameBuffer(self.bitmap, self.atlas_width, self.height,
+                                              framebuf.MONO_HLSB)
+        self._glyph = bytearray(max(self.widths) * self.height * 2)
+        self._palette = framebuf.FrameBuffer(bytearray(4), 2, 1, framebuf.RGB565)
+
+    def covers(self, text):
+        for ch in text:
+            if ch != " " and ch not in self.chars:
+                return False
+        return True
+
+    def text_width(self, text):
+        width = 0
+        for ch in text:
+            width += self.space if ch == " " else self.widths[self.chars.find(ch)]
+        return width
+
+    def draw(self, panel, text, x, y, fg_color, bg_color=0, backdrop=None):
+        """Draw text (covers() must be true); returns the x after it.
+
+        With a backdrop, spaces are left alone: the region under them
+        already shows the background.
+        """
+        height = self.height
+        palette = self._palette
+        fg = _swap(fg_color)
+        bg = _swap(bg_color)
+        key = fg ^ 1  # glyph background pixels map here and are skipped
+        palette.pixel(1, 0, fg)
+        for ch in text:
+            if ch == " ":
+                if backdrop is None:
+                    panel.fill_rect(x, y, self.space, height, bg_color)
+                x += self.space
+                continue
+            i = self.chars.find(ch)
+            width = self.widths[i]
+            # The atlas is blitted at -offset into a glyph-sized buffer, so
+            # framebuf clips out exactly this glyph.
+            glyph = framebuf.FrameBuffer(self._glyph, width, height, framebuf.RGB565)
+            if backdrop is not None and backdrop.fill(self._glyph, x, y, width, height):
+                palette.pixel(0, 0, key)
+                glyph.blit(self._atlas_fb, -self.xs[i], 0, key, palette)
+            else:
+                palette.pixel(0, 0, bg)
+                glyph.blit(self._atlas_fb, -self.xs[i], 0, -1, palette)
+            panel.blit_buffer(memoryview(self._glyph)[:width * height * 2], x, y, width, height)
+            x += width
+        return x
+
+
+def atlas(size):
+    """The atlas for a pixel size, loaded on first use; None if unavailable."""
+    found = _atlases.get(size)
+    if found is None:
+        path = DIGIT_ATLAS_FILES.get(size)
+        found = False
+        if path and framebuf:
+            try:
+                found = DigitAtlas(path)
+            except (OSError, ValueError) as exc:
+                print("Digit atlas unavailable:", path, exc)
+        _atlases[size] = found
+    return found or None
+
+
+def draw_large(panel, text, x, y, size, fg_color, bg_color=0, backdrop=None):
+    """Draw text from the size's atlas; False if it cannot (caller falls back)."""
+    font = atlas(size)
+    if not font or not text or not font.covers(text):
+        return False
+    font.draw(panel, text, x, y, fg_color, bg_color, backdrop)
+    return True
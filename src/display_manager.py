@@ -2,30 +2,42 @@ from machine import Pin, SPI
 from touch_controller import TouchController
 import utime
 import ubinascii
-import os
 import random
 
 from st7789 import ST7789, color565
 import vga1_8x16 as font
 from text_renderer import draw_text, wrap_text_jp, truncate_to_width
-from config import JST_OFFSET
-
-
-WEATHER_COLOR_MAP = {
-    "Sunny": (255, 205, 60),
-    "Clear": (255, 205, 60),
-    "晴れ": (255, 205, 60),
-    "晴": (255, 205, 60),
-    "Cloudy": (180, 180, 180),
-    "曇り": (180, 180, 180),
-    "曇": (180, 180, 180),
-    "Rain": (64, 150, 235),
-    "雨": (64, 150, 235),
-    "Snow": (200, 230, 255),
-    "雪": (200, 230, 255),
-    "Storm": (220, 80, 120),
-    "雷": (220, 80, 120),
-    "雷雨": (220, 80, 120),
+from digit_atlas import draw_large
+from icons import ICON_COLORS, PAINTERS, BUTTON_STYLES, paint_button
+from sprites import SpriteAtlas
+from bg_transfer import BackgroundTransfer
+from asset_cache import AssetCache, content_hash, storage_root
+import rgb565
+from region_cache import RegionCache
+from frame import Region, area, diff, snapshot
+from scroll import ScrollViewport
+from config import (
+    JST_OFFSET, BG_CACHE_DIR, BG_CACHE_MAX_BYTES, REGION_CACHE_DIR,
+    REGION_CACHE_RAM_BYTES, REGION_CACHE_MAX_BYTES, SPRITE_ATLAS_FILE,
+)
+
+
+# Weather label -> sprite id (also the key of icons.ICON_COLORS)
+WEATHER_ICONS = {
+    "Sunny": "sun",
+    "Clear": "sun",
+    "晴れ": "sun",
+    "晴": "sun",
+    "Cloudy": "cloud",
+    "曇り": "cloud",
+    "曇": "cloud",
+    "Rain": "rain",
+    "雨": "rain",
+    "Snow": "snow",
+    "雪": "snow",
+    "Storm": "storm",
+    "雷": "storm",
+    "雷雨": "storm",
 }
 
 STATUS_DEFAULTS = {
@@ -36,12 +48,32 @@ STATUS_DEFAULTS = {
     "humidity": "--%",
 }
 
-BACKGROUND_FILENAME = "/background.jpg"
-
 BUTTON_LABELS = ("MODE", "UP", "DOWN")
 BUTTON_HEIGHT = 28
 BUTTON_MARGIN = 6
 CONTENT_TOP = BUTTON_HEIGHT + 4
+BUTTON_RECT = (0, 0, 240, BUTTON_HEIGHT)
+
+TASK_ROW_HEIGHT = 36
+TEXT_WIDTH = 216  # free_text lines and task titles; "prelaid" payloads must match
+LINE_HEIGHT = 18
+
+# Panel rotation. 2 mounts the board upside down, which flips the hardware
+# scroll area relative to frame memory (see scroll.py).
+ROTATION = 2
+
+# Dynamic text areas of status_datetime, restored from the background cache.
+# Pixel size per status field; 32 and 48 use the pre-rendered digit atlases
+# (text they cannot draw falls back to the 16 px fonts).
+STATUS_FIELD_SIZES = {"date": 16, "time": 48, "temp": 32, "humidity": 16}
+
+# The clock is sized to "HH:MM" at 48 px (4 x 33 + 19 = 151 px wide) so its
+# 160x72 RGB565 backing (23,040 bytes) fits REGION_CACHE_RAM_BYTES and the
+# minute tick restores it from RAM.
+STATUS_REGIONS = {
+    "clock": (12, CONTENT_TOP, 160, 72),
+    "weather": (8, CONTENT_TOP + 80, 224, 110),
+}
 
 class DisplayManager:
     WIDTH = 240
@@ -65,10 +97,16 @@ class DisplayManager:
             dc=Pin(8, Pin.OUT),
             cs=Pin(9, Pin.OUT),
             backlight=Pin(13, Pin.OUT),
-            rotation=2,
+            rotation=ROTATION,
         )
         self.panel.init()
         self.panel.fill(0)
+        # Everything below the button bar scrolls; 288 rows = 16 text lines.
+        self.viewport = ScrollViewport(self.panel, CONTENT_TOP,
+                                       DisplayManager.HEIGHT - CONTENT_TOP,
+                                       DisplayManager.HEIGHT, ROTATION == 2)
+        self._scroll_lines = None  # (lines, line height, draw(index, y)) of a scrollable mode
+        self._scroll_first = 0     # index of the first visible line
         self.current_mode = None
         self.current_payload = {}
         self.handlers = {
@@ -87,127 +125,291 @@ class DisplayManager:
         )
         self._active_button = None
         self.backgrounds = []
+        self.cache = None
+        self.transfer = None
+        self.missing_asset = None
+        self._strip_buf = None
+        self._bg_source = None  # (key, path) of the background on screen
+        self.regions = RegionCache(self.panel, storage_root() + "/" + REGION_CACHE_DIR,
+                                   REGION_CACHE_RAM_BYTES, REGION_CACHE_MAX_BYTES)
+        self._frame = None  # snapshot of the regions on screen; None forces a full repaint
+        self._frame_bg = None
+        self._drawing = None  # region being drawn, for _backdrop()
+        self.frame_stats = None
+        self._sprites = None  # SpriteAtlas, False if unavailable
 
     def set_backgrounds(self, bg_list):
         self.backgrounds = bg_list
 
-    def set_mode(self, mode, payload):
+    def set_mode(self, mode, payload, replace=False):
+        """Show a mode; ``replace`` treats it as a switch even within the same mode
+        (its payload stands alone, e.g. after coalesce dropped a switch away)."""
         handler = self.handlers.get(mode)
         if not handler:
             return {"status": "error", "reason": "unknown_mode"}
-        mode_changed = self.current_mode != mode
-        if mode == "status_datetime" and self.current_mode == "status_datetime":
+        mode_changed = replace or self.current_mode != mode
+        if mode == "status_datetime" and not mode_changed:
             self.current_payload.update(payload or {})
-            self.current_mode = mode
-            self._redraw_status_content()
-            return {"status": "ok", "mode": mode}
-        self.current_payload = payload or {}
-        if mode_changed and self.backgrounds:
-            self.current_payload["background"] = {"path": random.choice(self.backgrounds)}
+        else:
+            self._scroll_first = 0
+            previous_bg = self.current_payload.get("background")
+            self.current_payload = payload or {}
+            if mode_changed:
+                self._frame = None
+                if self.backgrounds:
+                    self.current_payload["background"] = {"path": random.choice(self.backgrounds)}
+            elif previous_bg and "background" not in self.current_payload:
+                # Same mode resent: keep the background so only the rows repaint.
+                self.current_payload["background"] = previous_bg
         self.current_mode = mode
+        self.missing_asset = None
         handler(self.current_payload)
-        return {"status": "ok", "mode": mode}
-
-    def refresh(self):
-        if self.current_mode == "status_datetime":
-            self._refresh_status_time()
-        elif self.current_mode and self.current_mode in self.handlers:
-            self.handlers[self.current_mode](self.current_payload)
+        response = {"status": "ok", "mode": mode, "diff": self.frame_stats}
+        if self.missing_asset:
+            response["missing"] = self.missing_asset
+        return response
+
+    def refresh(self, full=False):
+        if full:
+            self._frame = None
+        handler = self.handlers.get(self.current_mode)
+        if handler:
+            handler(self.current_payload)
+
+    # Frame rendering -------------------------------------------------------
+    def _render(self, background, regions):
+        """Paint the regions that differ from the previous frame.
+
+        A mode change, a new background or an invalidated frame repaints
+        everything over the background; otherwise only changed regions are
+        cleared (background restored) and redrawn. Counts go to frame_stats.
+        """
+        if self.viewport.offset:
+            # The frame snapshot describes the unscrolled screen.
+            self.viewport.reset()
+            self._frame = None
+        full = self._frame is None or background != self._frame_bg
+        if full:
+            if not self._apply_background(background):
+                self.panel.fill(0)
+            self._frame_bg = background
+            changed = regions
+            pixels = DisplayManager.WIDTH * DisplayManager.HEIGHT
+            redrawn = len(regions)
+        else:
+            changed, stale = diff(self._frame, regions)
+            pixels = 0
+            for key, rect in stale:
+                self._clear_region(key, rect)
+                pixels += area(rect)
+            for region in changed:
+                self._clear_region(region.key, region.rect)
+                pixels += area(region.rect)
+            redrawn = len(changed) + len(stale)
+        for region in changed:
+            self._drawing = region
+            try:
+                region.draw(region.rect, region.content)
+            finally:
+                self._drawing = None
+        self._frame = snapshot(regions)
+        self.frame_stats = {"full": full, "regions": redrawn, "pixels": pixels}
+
+    def _backdrop(self):
+        """Background pixels of the region being drawn, to composite text onto.
+
+        None outside _render or without a cached background: text is then
+        drawn on solid cells.
+        """
+        region = self._drawing
+        if region is None:
+            return None
+        return self.regions.backdrop(self._bg_source, region.key, region.rect)
+
+    def _clear_region(self, key, rect):
+        if not self.regions.restore(self._bg_source, key, rect):
+            self.panel.fill_rect(rect[0], rect[1], rect[2], rect[3], color565(0, 0, 0))
+
+    # Scrolling ---------------------------------------------------------------
+    def scroll(self, step):
+        """Move the viewport by ``step`` lines; False at either end.
+
+        With the panel's scroll registers only the lines that became visible
+        are drawn, into the rows that just scrolled out; the background
+        scrolls with the text, so those lines go on black. Without them the
+        mode handler redraws the visible window.
+        """
+        if not self._scroll_lines:
+            return False
+        lines, line_height, draw = self._scroll_lines
+        visible = self.viewport.height // line_height
+        first = max(0, min(self._scroll_first + step, len(lines) - visible))
+        previous = self._scroll_first
+        if first == previous:
+            return False
+        self._scroll_first = first
+        if not self.viewport.hardware or abs(first - previous) >= visible:
+            self.refresh()
+            return True
+        self.viewport.set_offset(first * line_height)
+        self._frame = None  # lines now sit on black; repaint fully next time
+        if first > previous:
+            exposed = range(previous + visible, first + visible)
+        else:
+            exposed = range(first, previous)
+        black = color565(0, 0, 0)
+        for index in exposed:
+            y = self.viewport.screen_y(index * line_height)
+            self.panel.fill_rect(0, y, DisplayManager.WIDTH, line_height, black)
+            draw(index, y)
+        self.frame_stats = {"full": False, "regions": len(exposed),
+                            "pixels": len(exposed) * line_height * DisplayManager.WIDTH}
+        return True
+
+    def scroll_state(self):
+        """(first visible line, line count) of the current mode."""
+        return self._scroll_first, len(self._scroll_lines[0]) if self._scroll_lines else 0
 
     # Mode handlers ---------------------------------------------------------
     def _draw_status(self, payload):
+        self._scroll_lines = None
         data = prepare_status_data(payload)
-        bg = data.get("background")
-        if bg:
-            self._apply_background(bg)
-        else:
-            self.panel.fill(0)
-        self._draw_buttons()
-        self._draw_status_texts(data)
-
-    def _draw_status_texts(self, data):
-        primary_color = data.get("primary_color", color565(255, 255, 255))
-        secondary_color = data.get("secondary_color", color565(200, 200, 200))
-        y = CONTENT_TOP
-        self.panel.fill_rect(12, y, 200, 48, color565(0, 0, 0))
-        draw_text(self.panel, data["date"], 12, y, primary_color)
-        draw_text(self.panel, data["time"], 12, y + 24, primary_color)
-        self.panel.fill_rect(8, y + 56, DisplayManager.WIDTH - 16, 110, color565(0, 0, 0))
-        draw_text(self.panel, data["weather"], 12, y + 68, primary_color)
-        draw_text(self.panel, data["temp"], 12, y + 92, primary_color)
-        draw_text(self.panel, data["humidity"], 12, y + 116, secondary_color)
-        draw_weather_icon(self.panel, data["weather"], primary_color, y + 66)
-
-    def _redraw_status_content(self):
-        data = prepare_status_data(self.current_payload)
-        self._draw_status_texts(data)
-
-    def _refresh_status_time(self):
-        data = prepare_status_data(self.current_payload)
-        primary_color = data.get("primary_color", color565(255, 255, 255))
-        y = CONTENT_TOP
-        self.panel.fill_rect(12, y, 200, 48, color565(0, 0, 0))
-        draw_text(self.panel, data["date"], 12, y, primary_color)
-        draw_text(self.panel, data["time"], 12, y + 24, primary_color)
+        primary_color = data["primary_color"]
+        self._render(data["background"], [
+            Region("buttons", BUTTON_RECT, BUTTON_LABELS, self._draw_buttons),
+            Region("clock", STATUS_REGIONS["clock"],
+                   (data["date"], data["time"], primary_color), self._draw_clock),
+            Region("weather", STATUS_REGIONS["weather"],
+                   (data["weather"], data["temp"], data["humidity"],
+                    primary_color, data["secondary_color"]), self._draw_weather),
+        ])
+
+    def _draw_clock(self, rect, content):
+        date, time_text, color = content
+        self._draw_field("date", date, 12, rect[1], color)
+        self._draw_field("time", time_text, 12, rect[1] + 24, color)
+
+    def _draw_weather(self, rect, content):
+        weather, temp, humidity, primary_color, secondary_color = content
+        y = rect[1]
+        draw_text(self.panel, weather, 12, y + 12, primary_color, backdrop=self._backdrop())
+        self._draw_field("temp", temp, 12, y + 36, primary_color)
+        self._draw_field("humidity", humidity, 12, y + 76, secondary_color)
+        icon = WEATHER_ICONS.get(weather)
+        x = DisplayManager.WIDTH - 44
+        if icon is None or not self.blit_sprite(icon, x, y + 10, self._backdrop()):
+            draw_weather_icon(self.panel, icon, primary_color, x, y + 10)
+
+    def _draw_field(self, field, text, x, y, color):
+        size = STATUS_FIELD_SIZES.get(field, 16)
+        backdrop = self._backdrop()
+        if size <= 16 or not draw_large(self.panel, text, x, y, size, color, backdrop=backdrop):
+            draw_text(self.panel, text, x, y, color, backdrop=backdrop)
 
     def _draw_tasks(self, payload):
-        tasks = normalize_tasks(payload)
-        bg = payload.get("background")
-        if bg:
-            self._apply_background(bg)
-        else:
-            self.panel.fill(0)
-        self._draw_buttons()
-        self.panel.text(font, "Short Tasks", 12, CONTENT_TOP, color565(255, 255, 255))
+        # At most four rows, which always fit: nothing to scroll locally.
+        self._scroll_lines = None
+        regions = [
+            Region("buttons", BUTTON_RECT, BUTTON_LABELS, self._draw_buttons),
+            Region("title", (12, CONTENT_TOP, 216, 16), "Short Tasks", self._draw_title),
+        ]
         y = CONTENT_TOP + 24
-        for item in tasks:
-            status_color = item.get("color", color565(255, 255, 255))
-            self.panel.fill_rect(6, y - 2, DisplayManager.WIDTH - 12, 20, color565(20, 20, 20))
-            draw_text(self.panel, item["title"], 12, y, status_color)
-            draw_text(self.panel, item["status"], 12, y + 16, color565(180, 180, 180))
-            y += 36
+        for idx, item in enumerate(normalize_tasks(payload)):
+            regions.append(Region("task%d" % idx,
+                                  (6, y - 2, DisplayManager.WIDTH - 12, TASK_ROW_HEIGHT),
+                                  (item["title"], item["status"], item["color"]),
+                                  self._draw_task_row))
+            y += TASK_ROW_HEIGHT
             if y > DisplayManager.HEIGHT - 32:
                 break
+        self._render(payload.get("background"), regions)
+
+    def _draw_title(self, rect, title):
+        self.panel.text(font, title, rect[0], rect[1], color565(255, 255, 255))
+
+    def _draw_task_row(self, rect, content):
+        title, status_text, status_color = content
+        x, y, w, _ = rect
+        self.panel.fill_rect(x, y, w, 20, color565(20, 20, 20))
+        draw_text(self.panel, title, 12, y + 2, status_color)
+        draw_text(self.panel, status_text, 12, y + 18, color565(180, 180, 180))
 
     def _draw_free_text(self, payload):
-        text = payload.get("text") or payload.get("message") or ""
-        if isinstance(text, (list, tuple)):
-            text = "\n".join(text)
-        lines = wrap_text_jp(text or "", 216)
-        bg = payload.get("background")
-        if bg:
-            self._apply_background(bg)
-        else:
-            self.panel.fill(0)
-        self._draw_buttons()
+        lines = payload.get("lines")
+        if payload.get("prelaid") != TEXT_WIDTH or not isinstance(lines, list):
+            text = payload.get("text") or payload.get("message") or ""
+            if isinstance(text, (list, tuple)):
+                text = "\n".join(text)
+            lines = wrap_text_jp(text or "", TEXT_WIDTH)
+        visible = self.viewport.height // LINE_HEIGHT
+        self._scroll_lines = (lines, LINE_HEIGHT, self._draw_scrolled_line)
+        first = self._scroll_first = max(0, min(self._scroll_first, len(lines) - visible))
+        regions = [Region("buttons", BUTTON_RECT, BUTTON_LABELS, self._draw_buttons)]
         y = CONTENT_TOP
-        for line in lines:
-            draw_text(self.panel, line, 12, y, color565(255, 255, 255))
-            y += 18
-            if y > DisplayManager.HEIGHT - 10:
-                break
+        for idx, line in enumerate(lines[first:first + visible]):
+            regions.append(Region("line%d" % idx, (12, y, 216, LINE_HEIGHT), line,
+                                  self._draw_line))
+            y += LINE_HEIGHT
+        self._render(payload.get("background"), regions)
+
+    def _draw_line(self, rect, line):
+        draw_text(self.panel, line, rect[0], rect[1], color565(255, 255, 255),
+                  backdrop=self._backdrop())
+
+    def _draw_scrolled_line(self, index, y):
+        self._draw_line((12, y, 216, LINE_HEIGHT), self._scroll_lines[0][index])
+
+    def _draw_buttons(self, rect=BUTTON_RECT, labels=BUTTON_LABELS):
+        for idx, label in enumerate(labels):
+            self._draw_button(idx, label, label == self._active_button)
 
-    def _draw_buttons(self):
-        btn_height = BUTTON_HEIGHT
+    def _draw_button(self, idx, label, active):
+        """One button: a labelled sprite, else chrome sprite + label, else rectangles."""
         btn_width = (DisplayManager.WIDTH - BUTTON_MARGIN * 2) // len(BUTTON_LABELS)
+        x = BUTTON_MARGIN + idx * btn_width
+        style = "button_active" if active else "button"
+        if self.blit_sprite(style + "_" + label, x, 0):
+            return
+        if not self.blit_sprite(style, x, 0):
+            paint_button(self.panel, x, 0, btn_width - 2, BUTTON_HEIGHT, style)
+        self.panel.text(font, label, x + 6, 6, color565(255, 255, 255),
+                        color565(*BUTTON_STYLES[style][0]))
+
+    def _set_active_button(self, button):
+        """Track the pressed button and repaint the ones whose state changed."""
+        previous = self._active_button
+        if button == previous:
+            return
+        self._active_button = button
         for idx, label in enumerate(BUTTON_LABELS):
-            x = BUTTON_MARGIN + idx * btn_width
-            self.panel.fill_rect(x, 0, btn_width - 2, btn_height, color565(30, 30, 30))
-            self.panel.rect(x, 0, btn_width - 2, btn_height, color565(180, 180, 180))
-            self.panel.text(font, label, x + 6, 6, color565(255, 255, 255))
+            if label in (previous, button):
+                self._draw_button(idx, label, label == button)
+
+    def blit_sprite(self, sprite_id, x, y, backdrop=None):
+        """Draw a sprite from the atlas in one window write; False if unavailable.
+
+        With a backdrop (region_cache.Backdrop) black pixels are transparent.
+        """
+        if self._sprites is None:
+            try:
+                self._sprites = SpriteAtlas(SPRITE_ATLAS_FILE)
+            except (OSError, ValueError) as exc:
+                print("Sprite atlas unavailable:", exc)
+                self._sprites = False
+        return bool(self._sprites) and self._sprites.draw(self.panel, sprite_id, x, y, backdrop)
 
     def poll_touch(self):
         if not self.touch_controller:
             return None
         point = self.touch_controller.get_touch()
         if not point:
-            self._active_button = None
+            self._set_active_button(None)
             return None
         return self._handle_button_touch(*point)
 
     def _handle_button_touch(self, x, y):
         if y > BUTTON_HEIGHT:
-            self._active_button = None
+            self._set_active_button(None)
             return None
         btn_width = (DisplayManager.WIDTH - BUTTON_MARGIN * 2) // len(BUTTON_LABELS)
         x_rel = x - BUTTON_MARGIN
@@ -217,37 +419,104 @@ class DisplayManager:
         button = BUTTON_LABELS[idx]
         if button == self._active_button:
             return None
-        self._active_button = button
+        self._set_active_button(button)
         if button == "MODE":
             return {"cmd": "event", "event": {"type": "mode_request", "source": "touch_button"}}
-        if button == "UP":
-            return {"cmd": "event", "event": {"type": "scroll", "dir": "up", "source": "touch_button"}}
-        return {"cmd": "event", "event": {"type": "scroll", "dir": "down", "source": "touch_button"}}
+        direction = "up" if button == "UP" else "down"
+        moved = self.scroll(-1 if direction == "up" else 1)
+        first, total = self.scroll_state()
+        return {"cmd": "event", "event": {"type": "scroll", "dir": direction, "source": "touch_button",
+                                          "scrolled": moved, "line": first, "lines": total}}
 
     # Background management ------------------------------------------------
+    def _assets(self):
+        if self.cache is None:
+            self.cache = AssetCache(storage_root() + "/" + BG_CACHE_DIR, BG_CACHE_MAX_BYTES,
+                                    self.regions.forget)
+            self.transfer = BackgroundTransfer(self.cache)
+        return self.cache
+
+    def handle_transfer(self, payload):
+        self._assets()
+        reply, path = self.transfer.handle(payload)
+        if path and payload.get("apply", True):
+            self.set_background({"hash": payload["id"]})
+        return reply
+
+    def has_assets(self, hashes):
+        cache = self._assets()
+        return [h for h in hashes or () if cache.has(h)]
+
+    def set_background(self, background):
+        self.current_payload["background"] = background
+        self._frame = None
+        handler = self.handlers.get(self.current_mode)
+        if handler:
+            handler(self.current_payload)
+
     def _apply_background(self, background):
+        self._bg_source = None
         if not background:
-            return
+            return False
+        if "hash" in background:
+            cache = self._assets()
+            if not cache.touch(background["hash"]):
+                self.missing_asset = background["hash"]
+                return False
+            return self._render_image(cache.path(background["hash"]), background["hash"])
         if "path" in background:
-            self._render_jpeg(background["path"])
-        elif "data" in background:
-            self._render_jpeg_bytes(background["data"])
+            return self._render_image(background["path"])
+        if "data" in background:
+            return self._render_jpeg_bytes(background)
+        return False
+
+    def _render_image(self, path, bg_key=None):
+        if path.endswith(rgb565.EXTENSION):
+            if self._render_raw(path):
+                self._bg_source = (bg_key or content_hash(path.encode()), path)
+                return True
+            # Fall back to a JPEG of the same name if the raw file is unusable.
+            path = path[:-len(rgb565.EXTENSION)] + ".jpg"
+        if self._render_jpeg(path):
+            self._bg_source = (bg_key or content_hash(path.encode()), path)
+            return True
+        return False
+
+    def _render_raw(self, path):
+        if self._strip_buf is None:
+            self._strip_buf = bytearray(DisplayManager.WIDTH * 2 * rgb565.STRIP_ROWS)
+        try:
+            rgb565.blit_file(self.panel, path, 0, 0, self._strip_buf)
+            return True
+        except Exception:
+            return False
 
     def _render_jpeg(self, path):
         try:
             self.panel.jpg(path, 0, 0)
+            return True
         except Exception:
-            pass
+            return False
 
-    def _render_jpeg_bytes(self, encoded_data):
+    def _render_jpeg_bytes(self, background):
+        # Store inline images in the cache once and keep only the hash in
+        # the payload, so refresh() neither rewrites flash nor re-decodes base64.
         try:
-            raw = ubinascii.a2b_base64(encoded_data)
-            with open(BACKGROUND_FILENAME, "wb") as f:
-                f.write(raw)
-            self._render_jpeg(BACKGROUND_FILENAME)
-            os.remove(BACKGROUND_FILENAME)
+            encoded_data = background["data"]
+            if isinstance(encoded_data, (bytes, bytearray)):
+                raw = encoded_data  # binary protocol carries raw JPEG bytes
+            else:
+                raw = ubinascii.a2b_base64(encoded_data)
+            asset_hash = content_hash(raw)
+            cache = self._assets()
+            if not cache.touch(asset_hash):
+                cache.add_bytes(asset_hash, raw)
+            del raw
+            background.clear()
+            background["hash"] = asset_hash
+            return self._render_image(cache.path(asset_hash), asset_hash)
         except Exception:
-            pass
+            return False
 
 
 # Helpers -----------------------------------------------------------------
@@ -259,7 +528,7 @@ def prepare_status_data(payload):
     weather = payload.get("weather") or STATUS_DEFAULTS["weather"]
     temp = payload.get("temp") or STATUS_DEFAULTS["temp"]
     humidity = payload.get("humidity") or STATUS_DEFAULTS["humidity"]
-    color_tuple = WEATHER_COLOR_MAP.get(weather, (255, 255, 255))
+    color_tuple = ICON_COLORS.get(WEATHER_ICONS.get(weather), (255, 255, 255))
     status = {
         "date": date,
         "time": time_text,
@@ -277,9 +546,13 @@ def normalize_tasks(payload):
     raw = payload.get("tasks") or []
     if not isinstance(raw, list):
         raw = []
+    # Titles of a payload laid out by the host for this width already fit.
+    prelaid = payload.get("prelaid") == TEXT_WIDTH
     output = []
     for item in raw[:4]:
-        title = truncate_to_width(item.get("title", "Untitled"), 216)
+        title = item.get("title", "Untitled")
+        if not prelaid:
+            title = truncate_to_width(title, TEXT_WIDTH)
         status_text = item.get("status", "pending")
         color = {
             "done": color565(80, 200, 80),
@@ -292,44 +565,10 @@ def normalize_tasks(payload):
     return output
 
 
-def draw_weather_icon(panel, label, primary_color, y=70):
-    x = DisplayManager.WIDTH - 44
-    if label in ("Sunny", "Clear", "晴れ", "晴"):
-        # Sun: filled circle with rays
-        panel.fill_rect(x + 8, y + 8, 16, 16, primary_color)
-        for dy in (0, 28):
-            panel.fill_rect(x + 12, y + dy, 8, 4, primary_color)
-        for dx in (0, 28):
-            panel.fill_rect(x + dx, y + 12, 4, 8, primary_color)
-    elif label in ("Cloudy", "曇り", "曇"):
-        # Cloud: two overlapping rectangles
-        panel.fill_rect(x + 4, y + 12, 24, 12, primary_color)
-        panel.fill_rect(x + 8, y + 6, 16, 8, primary_color)
-    elif label in ("Rain", "雨"):
-        # Cloud + rain drops
-        c = color565(100, 100, 100)
-        panel.fill_rect(x + 4, y + 4, 24, 10, c)
-        panel.fill_rect(x + 8, y + 0, 16, 6, c)
-        for dx in (6, 14, 22):
-            panel.fill_rect(x + dx, y + 18, 2, 6, primary_color)
-            panel.fill_rect(x + dx, y + 26, 2, 4, primary_color)
-    elif label in ("Storm", "雷", "雷雨"):
-        # Cloud + lightning bolt
-        c = color565(100, 100, 100)
-        panel.fill_rect(x + 4, y + 4, 24, 10, c)
-        panel.fill_rect(x + 8, y + 0, 16, 6, c)
-        panel.fill_rect(x + 14, y + 14, 6, 4, primary_color)
-        panel.fill_rect(x + 12, y + 18, 6, 4, primary_color)
-        panel.fill_rect(x + 10, y + 22, 6, 4, primary_color)
-    elif label in ("Snow", "雪"):
-        # Snowflake: cross pattern
-        panel.fill_rect(x + 14, y + 2, 4, 28, primary_color)
-        panel.fill_rect(x + 2, y + 14, 28, 4, primary_color)
-        panel.fill_rect(x + 6, y + 6, 4, 4, primary_color)
-        panel.fill_rect(x + 22, y + 6, 4, 4, primary_color)
-        panel.fill_rect(x + 6, y + 22, 4, 4, primary_color)
-        panel.fill_rect(x + 22, y + 22, 4, 4, primary_color)
+def draw_weather_icon(panel, icon, primary_color, x, y=70):
+    """Paint an icon with rectangles (no sprite atlas); "?" if unknown."""
+    painter = PAINTERS.get(icon)
+    if painter:
+        painter(panel, x, y, primary_color)
     else:
         panel.text(font, "?", x + 8, y + 8, primary_color)
-
-
@@ -1,1768 +0,0 @@
-# -*- coding: utf-8 -*-
-# Converted from /usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf using:
-#     /mnt/ssd/workspace/st7789_mpy/utils/font2bitmap.py /usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf 16 -c 0x20-0x7e,0xb0,0x2014-0x2015,0x2026,0x3000-0x3003,0x300c-0x300f,0x3010-0x3011,0x3041-0x3096,0x30a1-0x30fc,0xff01,0xff08-0xff09,0xff0c,0xff0e,0xff1a-0xff1b,0xff1f,0x65e5,0x4e00,0x56fd,0x4f1a,0x4eba,0x5e74,0x5927,0x5341,0x4e8c,0x672c,0x4e2d,0x9577,0x51fa,0x4e09,0x540c,0x6642,0x653f,0x4e8b,0x81ea,0x884c,0x793e,0x898b,0x6708,0x5206,0x8b70,0x5f8c,0x524d,0x6c11,0x751f,0x9023,0x4e94,0x767a,0x9593,0x5bfe,0x4e0a,0x90e8,0x6771,0x8005,0x515a,0x5730,0x5408,0x5e02,0x696d,0x5185,0x76f8,0x65b9,0x56db,0x5b9a,0x4eca,0x56de,0x65b0,0x5834,0x91d1,0x54e1,0x4e5d,0x5165,0x9078,0x7acb,0x958b,0x624b,0x7c73,0x529b,0x5b66,0x554f,0x9ad8,0x4ee3,0x660e,0x5b9f,0x5186,0x95a2,0x6c7a,0x5b50,0x52d5,0x4eac,0x5168,0x76ee,0x8868,0x6226,0x7d4c,0x901a,0x5916,0x6700,0x8a00,0x6c0f,0x73fe,0x7406,0x8abf,0x4f53,0x5316,0x7530,0x5f53,0x516b,0x516d,0x7d04,0x4e3b,0x984c,0x4e0b,0x9996,0x610f,0x6cd5,0x4e0d,0x6765,0x4f5c,0x6027,0x7684,0x8981,0x7528,0x5236,0x6cbb,0x5ea6,0x52d9,0x5f37,0x6c17,0x5c0f,0x4e03,0x6210,0x671f,0x516c,0x6301,0x91ce,0x5354,0x53d6,0x90fd,0x548c,0x7d71,0x4ee5,0x6a5f,0x5e73,0x7dcf,0x52a0,0x5c71,0x601d,0x5bb6,0x8a71,0x4e16,0x53d7,0x533a,0x57ce,0x5317,0x534a,0x8a18,0x7701,0x897f,0x539f,0x6751,0x6a29,0x5fc3,0x754c,0x54c1,0x6587,0x671d,0x5c4a,0x5831,0x9053,0x5909,0x60c5,0x7279,0x6307,0x793a,0x7d44,0x6709,0x8003,0x6b63,0x8ad6,0x5fc5,0x4f4f,0x5efa,0x7269,0x4f7f,0x70b9,0x4fdd,0x78ba,0x82f1,0x6570,0x8b58,0x611f,0x899a,0x57fa,0x52a9,0x5404,0x59d4,0x4ed8,0x4e0e,0x4ef6,0x8cbb,0x6c42,0x5fdc,0x771f,0x8aad,0x5224,0x66f8,0x7b2c,0x7d50,0x679c,0x6b21,0x6e80,0x9700,0x7d66,0x89e3,0x5229,0x6d3b,0x8cc7,0x767d,0x6848,0x898f,0x5973,0x65ad,0x6539,0x9769,0x914d,0x63d0,0x6761,0x4f8b,0x4ea4,0x53cb,0x597d,0x5411,0x5897,0x8a8d,0x591a,0x5c11,0x53cd,0x7cfb,0x5217,0x8ff0,0x5747,0x7b49,0x542b,0x616e,0x89b3,0x5bdf,0x9332,0x5225,0x9805,0x53f7,0x7740,0x9650,0x544a,0x969b,0x756a,0x6240,0x9a13,0x7a0b,0x5b8c,0x4e86,0x8f09,0x69cb,0x6a21,0x985e,0x8c61,0x683c,0x6e96,0x5099,0x7d42,0x6559,0x80b2,0x60f3,0x50cf,0x653e,0x9001,0x6674,0x66c7,0x96e8,0x96ea,0x96f7,0x98a8,0x9727,0x6691,0x5bd2,0x6dbc,0x6e29,0x6e7f,0x4e7e,0x5feb,0x6696,0x51b7,0x6625,0x590f,0x79cb,0x51ac,0x706b,0x6c34,0x6728,0x571f,0x66dc,0x9031,0x5348,0x591c,0x663c,0x5915,0x523b,0x79d2,0x4e88,0x675f,0x6574,0x9813,0x6383,0x9664,0x8cb7,0x8cfc,0x8ca9,0x58f2,0x55b6,0x6599,0x7de8,0x96c6,0x4fe1,0x8fd4,0x59cb,0x505c,0x6b62,0x518d,0x8d77,0x6253,0x96fb,0x7d61,0x8ac7,0x4f9d,0x983c,0x627f,0x77e5,0x6e08,0x672a,0x9032,0x5f85,0x5ef6,0x98df,0x98ef,0x98f2,0x6d17,0x6fef,0x7247,0x6563,0x6b69,0x904b,0x7761,0x7720,0x4f11,0x61a9,0x5e30,0x5b85,0x99c5,0x5e97,0x6821,0x9662,0x5712,0x9928,0x5357,0x5de6,0x53f3,0x8fd1,0x9060,0x4e07,0x5343,0x767e,0x5104,0x5146,0x500b,0x679a,0x53f0,0x540d,0x826f,0x60aa,0x697d,0x82e6,0x96e3,0x6613,0x5fd9,0x6687,0x5143,0x75c5,0x75db,0x75b2,0x5b89,0x5371,0x967a,0x6025,0x9045,0x65e9,0x901f,0x8d64,0x9752,0x9ec4,0x7dd1,0x9ed2,0x8336,0x7d2b,0x6a59,0x7070,0x5199,0x753b,0x97f3,0x58f0,0x6620,0x8eca,0x8def,0x7a7a,0x6d77,0x5ddd,0x6c60,0x82b1,0x9ce5,0x72ac,0x732b,0x9b5a,0x89aa,0x5144,0x5f1f,0x59c9,0x59b9,0x592b,0x59bb,0x606f,0x5a18,0x7956,0x7236,0x6bcd,0x9054,0x5148,0x8f29,0x50da,0x53f8,0x533b,0x6b6f,0x79d1,0x85ac,0x9280,0x90f5,0x5c40,0x56f3,0x5f79
-
-MAP = (
-    ' !\"#$%&\'()*+,-./0123456789:;<='
-    '>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ['
-    '\\]^_`abcdefghijklmnopqrstuvwxyz'
-    '{|}~°—―…　、。〃「」『』【】ぁあぃいぅうぇえぉおかがきぎ'
-    'くぐけげこごさざしじすずせぜそぞただちぢっつづてでとどなにぬねの'
-    'はばぱひびぴふぶぷへべぺほぼぽまみむめもゃやゅゆょよらりるれろゎ'
-    'わゐゑをんゔゕゖァアィイゥウェエォオカガキギクグケゲコゴサザシジ'
-    'スズセゼソゾタダチヂッツヅテデトドナニヌネノハバパヒビピフブプヘ'
-    'ベペホボポマミムメモャヤュユョヨラリルレロヮワヰヱヲンヴヵヶヷヸ'
-    'ヹヺ・ー！（），．：；？日一国会人年大十二本中長出三同時政事自行'
-    '社見月分議後前民生連五発間対上部東者党地合市業内相方四定今回新場'
-    '金員九入選立開手米力学問高代明実円関決子動京全目表戦経通外最言氏'
-    '現理調体化田当八六約主題下首意法不来作性的要用制治度務強気小七成'
-    '期公持野協取都和統以機平総加山思家話世受区城北半記省西原村権心界'
-    '品文朝届報道変情特指示組有考正論必住建物使点保確英数識感覚基助各'
-    '委付与件費求応真読判書第結果次満需給解利活資白案規女断改革配提条'
-    '例交友好向増認多少反系列述均等含慮観察録別項号着限告際番所験程完'
-    '了載構模類象格準備終教育想像放送晴曇雨雪雷風霧暑寒涼温湿乾快暖冷'
-    '春夏秋冬火水木土曜週午夜昼夕刻秒予束整頓掃除買購販売営料編集信返'
-    '始停止再起打電絡談依頼承知済未進待延食飯飲洗濯片散歩運睡眠休憩帰'
-    '宅駅店校院園館南左右近遠万千百億兆個枚台名良悪楽苦難易忙暇元病痛'
-    '疲安危険急遅早速赤青黄緑黒茶紫橙灰写画音声映車路空海川池花鳥犬猫'
-    '魚親兄弟姉妹夫妻息娘祖父母達先輩僚司医歯科薬銀郵局図役'
-)
-
-BPP = 1
-HEIGHT = 17
-MAX_WIDTH = 16
-_WIDTHS = \
-    b'\x04\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10'\
-    b'\x10\x10\x10\x10\x10\x10'
-
-OFFSET_WIDTH = 3
-_OFFSETS = \
-    b'\x00\x00\x00\x00\x00\x44\x00\x01\x54\x00\x02\x64\x00\x03\x74\x00'\
-    b'\x04\x84\x00\x05\x94\x00\x06\xa4\x00\x07\xb4\x00\x08\xc4\x00\x09'\
-    b'\xd4\x00\x0a\xe4\x00\x0b\xf4\x00\x0d\x04\x00\x0e\x14\x00\x0f\x24'\
-    b'\x00\x10\x34\x00\x11\x44\x00\x12\x54\x00\x13\x64\x00\x14\x74\x00'\
-    b'\x15\x84\x00\x16\x94\x00\x17\xa4\x00\x18\xb4\x00\x19\xc4\x00\x1a'\
-    b'\xd4\x00\x1b\xe4\x00\x1c\xf4\x00\x1e\x04\x00\x1f\x14\x00\x20\x24'\
-    b'\x00\x21\x34\x00\x22\x44\x00\x23\x54\x00\x24\x64\x00\x25\x74\x00'\
-    b'\x26\x84\x00\x27\x94\x00\x28\xa4\x00\x29\xb4\x00\x2a\xc4\x00\x2b'\
-    b'\xd4\x00\x2c\xe4\x00\x2d\xf4\x00\x2f\x04\x00\x30\x14\x00\x31\x24'\
-    b'\x00\x32\x34\x00\x33\x44\x00\x34\x54\x00\x35\x64\x00\x36\x74\x00'\
-    b'\x37\x84\x00\x38\x94\x00\x39\xa4\x00\x3a\xb4\x00\x3b\xc4\x00\x3c'\
-    b'\xd4\x00\x3d\xe4\x00\x3e\xf4\x00\x40\x04\x00\x41\x14\x00\x42\x24'\
-    b'\x00\x43\x34\x00\x44\x44\x00\x45\x54\x00\x46\x64\x00\x47\x74\x00'\
-    b'\x48\x84\x00\x49\x94\x00\x4a\xa4\x00\x4b\xb4\x00\x4c\xc4\x00\x4d'\
-    b'\xd4\x00\x4e\xe4\x00\x4f\xf4\x00\x51\x04\x00\x52\x14\x00\x53\x24'\
-    b'\x00\x54\x34\x00\x55\x44\x00\x56\x54\x00\x57\x64\x00\x58\x74\x00'\
-    b'\x59\x84\x00\x5a\x94\x00\x5b\xa4\x00\x5c\xb4\x00\x5d\xc4\x00\x5e'\
-    b'\xd4\x00\x5f\xe4\x00\x60\xf4\x00\x62\x04\x00\x63\x14\x00\x64\x24'\
-    b'\x00\x65\x34\x00\x66\x44\x00\x67\x54\x00\x68\x64\x00\x69\x74\x00'\
-    b'\x6a\x84\x00\x6b\x94\x00\x6c\xa4\x00\x6d\xb4\x00\x6e\xc4\x00\x6f'\
-    b'\xd4\x00\x70\xe4\x00\x71\xf4\x00\x73\x04\x00\x74\x14\x00\x75\x24'\
-    b'\x00\x76\x34\x00\x77\x44\x00\x78\x54\x00\x79\x64\x00\x7a\x74\x00'\
-    b'\x7b\x84\x00\x7c\x94\x00\x7d\xa4\x00\x7e\xb4\x00\x7f\xc4\x00\x80'\
-    b'\xd4\x00\x81\xe4\x00\x82\xf4\x00\x84\x04\x00\x85\x14\x00\x86\x24'\
-    b'\x00\x87\x34\x00\x88\x44\x00\x89\x54\x00\x8a\x64\x00\x8b\x74\x00'\
-    b'\x8c\x84\x00\x8d\x94\x00\x8e\xa4\x00\x8f\xb4\x00\x90\xc4\x00\x91'\
-    b'\xd4\x00\x92\xe4\x00\x93\xf4\x00\x95\x04\x00\x96\x14\x00\x97\x24'\
-    b'\x00\x98\x34\x00\x99\x44\x00\x9a\x54\x00\x9b\x64\x00\x9c\x74\x00'\
-    b'\x9d\x84\x00\x9e\x94\x00\x9f\xa4\x00\xa0\xb4\x00\xa1\xc4\x00\xa2'\
-    b'\xd4\x00\xa3\xe4\x00\xa4\xf4\x00\xa6\x04\x00\xa7\x14\x00\xa8\x24'\
-    b'\x00\xa9\x34\x00\xaa\x44\x00\xab\x54\x00\xac\x64\x00\xad\x74\x00'\
-    b'\xae\x84\x00\xaf\x94\x00\xb0\xa4\x00\xb1\xb4\x00\xb2\xc4\x00\xb3'\
-    b'\xd4\x00\xb4\xe4\x00\xb5\xf4\x00\xb7\x04\x00\xb8\x14\x00\xb9\x24'\
-    b'\x00\xba\x34\x00\xbb\x44\x00\xbc\x54\x00\xbd\x64\x00\xbe\x74\x00'\
-    b'\xbf\x84\x00\xc0\x94\x00\xc1\xa4\x00\xc2\xb4\x00\xc3\xc4\x00\xc4'\
-    b'\xd4\x00\xc5\xe4\x00\xc6\xf4\x00\xc8\x04\x00\xc9\x14\x00\xca\x24'\
-    b'\x00\xcb\x34\x00\xcc\x44\x00\xcd\x54\x00\xce\x64\x00\xcf\x74\x00'\
-    b'\xd0\x84\x00\xd1\x94\x00\xd2\xa4\x00\xd3\xb4\x00\xd4\xc4\x00\xd5'\
-    b'\xd4\x00\xd6\xe4\x00\xd7\xf4\x00\xd9\x04\x00\xda\x14\x00\xdb\x24'\
-    b'\x00\xdc\x34\x00\xdd\x44\x00\xde\x54\x00\xdf\x64\x00\xe0\x74\x00'\
-    b'\xe1\x84\x00\xe2\x94\x00\xe3\xa4\x00\xe4\xb4\x00\xe5\xc4\x00\xe6'\
-    b'\xd4\x00\xe7\xe4\x00\xe8\xf4\x00\xea\x04\x00\xeb\x14\x00\xec\x24'\
-    b'\x00\xed\x34\x00\xee\x44\x00\xef\x54\x00\xf0\x64\x00\xf1\x74\x00'\
-    b'\xf2\x84\x00\xf3\x94\x00\xf4\xa4\x00\xf5\xb4\x00\xf6\xc4\x00\xf7'\
-    b'\xd4\x00\xf8\xe4\x00\xf9\xf4\x00\xfb\x04\x00\xfc\x14\x00\xfd\x24'\
-    b'\x00\xfe\x34\x00\xff\x44\x01\x00\x54\x01\x01\x64\x01\x02\x74\x01'\
-    b'\x03\x84\x01\x04\x94\x01\x05\xa4\x01\x06\xb4\x01\x07\xc4\x01\x08'\
-    b'\xd4\x01\x09\xe4\x01\x0a\xf4\x01\x0c\x04\x01\x0d\x14\x01\x0e\x24'\
-    b'\x01\x0f\x34\x01\x10\x44\x01\x11\x54\x01\x12\x64\x01\x13\x74\x01'\
-    b'\x14\x84\x01\x15\x94\x01\x16\xa4\x01\x17\xb4\x01\x18\xc4\x01\x19'\
-    b'\xd4\x01\x1a\xe4\x01\x1b\xf4\x01\x1d\x04\x01\x1e\x14\x01\x1f\x24'\
-    b'\x01\x20\x34\x01\x21\x44\x01\x22\x54\x01\x23\x64\x01\x24\x74\x01'\
-    b'\x25\x84\x01\x26\x94\x01\x27\xa4\x01\x28\xb4\x01\x29\xc4\x01\x2a'\
-    b'\xd4\x01\x2b\xe4\x01\x2c\xf4\x01\x2e\x04\x01\x2f\x14\x01\x30\x24'\
-    b'\x01\x31\x34\x01\x32\x44\x01\x33\x54\x01\x34\x64\x01\x35\x74\x01'\
-    b'\x36\x84\x01\x37\x94\x01\x38\xa4\x01\x39\xb4\x01\x3a\xc4\x01\x3b'\
-    b'\xd4\x01\x3c\xe4\x01\x3d\xf4\x01\x3f\x04\x01\x40\x14\x01\x41\x24'\
-    b'\x01\x42\x34\x01\x43\x44\x01\x44\x54\x01\x45\x64\x01\x46\x74\x01'\
-    b'\x47\x84\x01\x48\x94\x01\x49\xa4\x01\x4a\xb4\x01\x4b\xc4\x01\x4c'\
-    b'\xd4\x01\x4d\xe4\x01\x4e\xf4\x01\x50\x04\x01\x51\x14\x01\x52\x24'\
-    b'\x01\x53\x34\x01\x54\x44\x01\x55\x54\x01\x56\x64\x01\x57\x74\x01'\
-    b'\x58\x84\x01\x59\x94\x01\x5a\xa4\x01\x5b\xb4\x01\x5c\xc4\x01\x5d'\
-    b'\xd4\x01\x5e\xe4\x01\x5f\xf4\x01\x61\x04\x01\x62\x14\x01\x63\x24'\
-    b'\x01\x64\x34\x01\x65\x44\x01\x66\x54\x01\x67\x64\x01\x68\x74\x01'\
-    b'\x69\x84\x01\x6a\x94\x01\x6b\xa4\x01\x6c\xb4\x01\x6d\xc4\x01\x6e'\
-    b'\xd4\x01\x6f\xe4\x01\x70\xf4\x01\x72\x04\x01\x73\x14\x01\x74\x24'\
-    b'\x01\x75\x34\x01\x76\x44\x01\x77\x54\x01\x78\x64\x01\x79\x74\x01'\
-    b'\x7a\x84\x01\x7b\x94\x01\x7c\xa4\x01\x7d\xb4\x01\x7e\xc4\x01\x7f'\
-    b'\xd4\x01\x80\xe4\x01\x81\xf4\x01\x83\x04\x01\x84\x14\x01\x85\x24'\
-    b'\x01\x86\x34\x01\x87\x44\x01\x88\x54\x01\x89\x64\x01\x8a\x74\x01'\
-    b'\x8b\x84\x01\x8c\x94\x01\x8d\xa4\x01\x8e\xb4\x01\x8f\xc4\x01\x90'\
-    b'\xd4\x01\x91\xe4\x01\x92\xf4\x01\x94\x04\x01\x95\x14\x01\x96\x24'\
-    b'\x01\x97\x34\x01\x98\x44\x01\x99\x54\x01\x9a\x64\x01\x9b\x74\x01'\
-    b'\x9c\x84\x01\x9d\x94\x01\x9e\xa4\x01\x9f\xb4\x01\xa0\xc4\x01\xa1'\
-    b'\xd4\x01\xa2\xe4\x01\xa3\xf4\x01\xa5\x04\x01\xa6\x14\x01\xa7\x24'\
-    b'\x01\xa8\x34\x01\xa9\x44\x01\xaa\x54\x01\xab\x64\x01\xac\x74\x01'\
-    b'\xad\x84\x01\xae\x94\x01\xaf\xa4\x01\xb0\xb4\x01\xb1\xc4\x01\xb2'\
-    b'\xd4\x01\xb3\xe4\x01\xb4\xf4\x01\xb6\x04\x01\xb7\x14\x01\xb8\x24'\
-    b'\x01\xb9\x34\x01\xba\x44\x01\xbb\x54\x01\xbc\x64\x01\xbd\x74\x01'\
-    b'\xbe\x84\x01\xbf\x94\x01\xc0\xa4\x01\xc1\xb4\x01\xc2\xc4\x01\xc3'\
-    b'\xd4\x01\xc4\xe4\x01\xc5\xf4\x01\xc7\x04\x01\xc8\x14\x01\xc9\x24'\
-    b'\x01\xca\x34\x01\xcb\x44\x01\xcc\x54\x01\xcd\x64\x01\xce\x74\x01'\
-    b'\xcf\x84\x01\xd0\x94\x01\xd1\xa4\x01\xd2\xb4\x01\xd3\xc4\x01\xd4'\
-    b'\xd4\x01\xd5\xe4\x01\xd6\xf4\x01\xd8\x04\x01\xd9\x14\x01\xda\x24'\
-    b'\x01\xdb\x34\x01\xdc\x44\x01\xdd\x54\x01\xde\x64\x01\xdf\x74\x01'\
-    b'\xe0\x84\x01\xe1\x94\x01\xe2\xa4\x01\xe3\xb4\x01\xe4\xc4\x01\xe5'\
-    b'\xd4\x01\xe6\xe4\x01\xe7\xf4\x01\xe9\x04\x01\xea\x14\x01\xeb\x24'\
-    b'\x01\xec\x34\x01\xed\x44\x01\xee\x54\x01\xef\x64\x01\xf0\x74\x01'\
-    b'\xf1\x84\x01\xf2\x94\x01\xf3\xa4\x01\xf4\xb4\x01\xf5\xc4\x01\xf6'\
-    b'\xd4\x01\xf7\xe4\x01\xf8\xf4\x01\xfa\x04\x01\xfb\x14\x01\xfc\x24'\
-    b'\x01\xfd\x34\x01\xfe\x44\x01\xff\x54\x02\x00\x64\x02\x01\x74\x02'\
-    b'\x02\x84\x02\x03\x94\x02\x04\xa4\x02\x05\xb4\x02\x06\xc4\x02\x07'\
-    b'\xd4\x02\x08\xe4\x02\x09\xf4\x02\x0b\x04\x02\x0c\x14\x02\x0d\x24'\
-    b'\x02\x0e\x34\x02\x0f\x44\x02\x10\x54\x02\x11\x64\x02\x12\x74\x02'\
-    b'\x13\x84\x02\x14\x94\x02\x15\xa4\x02\x16\xb4\x02\x17\xc4\x02\x18'\
-    b'\xd4\x02\x19\xe4\x02\x1a\xf4\x02\x1c\x04\x02\x1d\x14\x02\x1e\x24'\
-    b'\x02\x1f\x34\x02\x20\x44\x02\x21\x54\x02\x22\x64\x02\x23\x74\x02'\
-    b'\x24\x84\x02\x25\x94\x02\x26\xa4\x02\x27\xb4\x02\x28\xc4\x02\x29'\
-    b'\xd4\x02\x2a\xe4\x02\x2b\xf4\x02\x2d\x04\x02\x2e\x14\x02\x2f\x24'\
-    b'\x02\x30\x34\x02\x31\x44\x02\x32\x54\x02\x33\x64\x02\x34\x74\x02'\
-    b'\x35\x84\x02\x36\x94\x02\x37\xa4\x02\x38\xb4\x02\x39\xc4\x02\x3a'\
-    b'\xd4\x02\x3b\xe4\x02\x3c\xf4\x02\x3e\x04\x02\x3f\x14\x02\x40\x24'\
-    b'\x02\x41\x34\x02\x42\x44\x02\x43\x54\x02\x44\x64\x02\x45\x74\x02'\
-    b'\x46\x84\x02\x47\x94\x02\x48\xa4\x02\x49\xb4\x02\x4a\xc4\x02\x4b'\
-    b'\xd4\x02\x4c\xe4\x02\x4d\xf4\x02\x4f\x04\x02\x50\x14\x02\x51\x24'\
-    b'\x02\x52\x34\x02\x53\x44\x02\x54\x54\x02\x55\x64\x02\x56\x74\x02'\
-    b'\x57\x84\x02\x58\x94\x02\x59\xa4\x02\x5a\xb4\x02\x5b\xc4\x02\x5c'\
-    b'\xd4\x02\x5d\xe4\x02\x5e\xf4\x02\x60\x04\x02\x61\x14\x02\x62\x24'\
-    b'\x02\x63\x34\x02\x64\x44\x02\x65\x54\x02\x66\x64\x02\x67\x74\x02'\
-    b'\x68\x84\x02\x69\x94\x02\x6a\xa4\x02\x6b\xb4\x02\x6c\xc4\x02\x6d'\
-    b'\xd4\x02\x6e\xe4\x02\x6f\xf4\x02\x71\x04\x02\x72\x14\x02\x73\x24'\
-    b'\x02\x74\x34\x02\x75\x44\x02\x76\x54\x02\x77\x64\x02\x78\x74\x02'\
-    b'\x79\x84\x02\x7a\x94\x02\x7b\xa4\x02\x7c\xb4\x02\x7d\xc4\x02\x7e'\
-    b'\xd4\x02\x7f\xe4\x02\x80\xf4\x02\x82\x04\x02\x83\x14\x02\x84\x24'\
-    b'\x02\x85\x34\x02\x86\x44\x02\x87\x54\x02\x88\x64\x02\x89\x74\x02'\
-    b'\x8a\x84\x02\x8b\x94\x02\x8c\xa4\x02\x8d\xb4\x02\x8e\xc4\x02\x8f'\
-    b'\xd4\x02\x90\xe4\x02\x91\xf4\x02\x93\x04\x02\x94\x14\x02\x95\x24'\
-    b'\x02\x96\x34\x02\x97\x44\x02\x98\x54\x02\x99\x64\x02\x9a\x74\x02'\
-    b'\x9b\x84\x02\x9c\x94\x02\x9d\xa4\x02\x9e\xb4\x02\x9f\xc4\x02\xa0'\
-    b'\xd4\x02\xa1\xe4\x02\xa2\xf4\x02\xa4\x04\x02\xa5\x14\x02\xa6\x24'\
-    b'\x02\xa7\x34\x02\xa8\x44\x02\xa9\x54\x02\xaa\x64\x02\xab\x74\x02'\
-    b'\xac\x84\x02\xad\x94\x02\xae\xa4\x02\xaf\xb4\x02\xb0\xc4\x02\xb1'\
-    b'\xd4\x02\xb2\xe4\x02\xb3\xf4\x02\xb5\x04\x02\xb6\x14\x02\xb7\x24'\
-    b'\x02\xb8\x34\x02\xb9\x44\x02\xba\x54\x02\xbb\x64\x02\xbc\x74\x02'\
-    b'\xbd\x84\x02\xbe\x94\x02\xbf\xa4\x02\xc0\xb4\x02\xc1\xc4\x02\xc2'\
-    b'\xd4\x02\xc3\xe4\x02\xc4\xf4\x02\xc6\x04\x02\xc7\x14\x02\xc8\x24'\
-    b'\x02\xc9\x34\x02\xca\x44\x02\xcb\x54\x02\xcc\x64\x02\xcd\x74\x02'\
-    b'\xce\x84\x02\xcf\x94\x02\xd0\xa4\x02\xd1\xb4\x02\xd2\xc4\x02\xd3'\
-    b'\xd4\x02\xd4\xe4\x02\xd5\xf4\x02\xd7\x04\x02\xd8\x14\x02\xd9\x24'\
-    b'\x02\xda\x34\x02\xdb\x44\x02\xdc\x54\x02\xdd\x64\x02\xde\x74\x02'\
-    b'\xdf\x84\x02\xe0\x94\x02\xe1\xa4\x02\xe2\xb4\x02\xe3\xc4\x02\xe4'\
-    b'\xd4\x02\xe5\xe4\x02\xe6\xf4\x02\xe8\x04\x02\xe9\x14\x02\xea\x24'\
-    b'\x02\xeb\x34\x02\xec\x44\x02\xed\x54\x02\xee\x64\x02\xef\x74\x02'\
-    b'\xf0\x84\x02\xf1\x94\x02\xf2\xa4\x02\xf3\xb4\x02\xf4\xc4\x02\xf5'\
-    b'\xd4\x02\xf6\xe4\x02\xf7\xf4\x02\xf9\x04\x02\xfa\x14\x02\xfb\x24'\
-    b'\x02\xfc\x34\x02\xfd\x44\x02\xfe\x54\x02\xff\x64\x03\x00\x74\x03'\
-    b'\x01\x84'
-
-_BITMAPS =\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x04\x00\x02\x00\x01\x00\x01\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00\x08\x80\x05\x80\x07\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x32\x00\x36'\
-    b'\x00\x26\x00\x24\x00\x6c\x00\x48\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x08\x00\x08\x00\x08\x00\x08'\
-    b'\x00\x08\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x10\x00\x10\x00\x10\x00\x10\x00\x10'\
-    b'\x00\x10\x00\xf0\x00\x00\x00\x00\x00\x00\x00\x0f\x80\x08\x80\x0b'\
-    b'\x80\x0a\x00\x0a\x00\x0a\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x70\x00\x50\x00\x50'\
-    b'\x00\x50\x01\xd0\x01\x10\x01\xf0\x00\x00\x00\x00\x00\x00\x00\x0f'\
-    b'\x80\x0f\x00\x0e\x00\x0e\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c'\
-    b'\x00\x0c\x00\x0e\x00\x0e\x00\x0f\x00\x0f\x80\x00\x00\x00\x00\x00'\
-    b'\x01\xf0\x00\xf0\x00\x70\x00\x70\x00\x30\x00\x30\x00\x30\x00\x30'\
-    b'\x00\x30\x00\x30\x00\x70\x00\x70\x00\xf0\x01\xf0\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x00\x20\x01\xff\x00\x20'\
-    b'\x00\x3e\x00\xef\x00\xa9\x81\x38\x81\x31\x81\xe3\x00\x8e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x20\x03\xff\x83\xff\x80\x20\x00\x3e'\
-    b'\x00\xff\x81\xac\xc3\x28\x42\x38\x42\x30\x42\x20\xc3\xc7\x80\x0e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00'\
-    b'\x01\x83\x01\x81\x01\x81\x01\x81\x81\x81\x81\xa1\x81\xe1\x80\xc1'\
-    b'\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x82\x00\x82\x00'\
-    b'\x82\x00\xc2\x00\xc2\x00\xc2\x00\x42\x00\x42\x60\x42\x40\x43\xc0'\
-    b'\x43\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x02\x00\x3c\x00\xff\x00\x01\x00\x01\x00\x03'\
-    b'\x00\x03\x00\x0e\x00\x38\x00\x00\x00\x00\x00\x00\x00\x80\x00\xfe'\
-    b'\x00\x06\x00\x00\x00\x00\x00\xff\x83\x80\xc0\x00\xc0\x00\x40\x00'\
-    b'\xc0\x00\xc0\x01\x80\x07\x00\x7c\x00\x60\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x70\x00\x7c\x00\x00\x01\xfc\x00\x0c\x00\x18'\
-    b'\x00\x2c\x00\x7c\x00\xcc\x01\x8c\x81\x07\x80\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\xfc\x00\x04\x00\x00\x03\xfe\x00\x0c\x00\x18\x00\x30'\
-    b'\x00\x7c\x00\xe4\x00\x84\x01\x84\x03\x07\xc2\x03\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x00\x22\x01\x3f\x01\xfd'\
-    b'\x80\x20\x80\x7e\x00\xe3\x01\x21\x01\x21\x01\xa7\x00\xee\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x20\x00\x20\x00\x23\x03\xfd\x80\x20\xc0\x20'\
-    b'\x40\x3e\x01\xf7\x83\x20\x82\x20\x86\x20\x82\x21\x83\xef\x00\xc4'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x00\x61\x80\x60\x83\xfc'\
-    b'\xc0\x44\x40\xc4\x60\x84\x20\x84\x21\x84\x01\x04\x03\x04\x03\x3c'\
-    b'\x02\x38\x00\x00\x00\x00\x00\x00\x00\x00\x20\x20\x50\x63\x40\x61'\
-    b'\x03\xfd\x80\x44\x80\xc4\xc0\x84\x40\x84\x61\x84\x01\x04\x03\x04'\
-    b'\x03\x3c\x02\x38\x00\x00\x00\x00\x00\x00\x00\x20\x00\x20\x00\x3f'\
-    b'\x03\xfc\x00\x08\x03\xff\xc7\xfc\x00\x02\x00\xff\x01\x83\x01\x00'\
-    b'\x01\x00\x01\xc3\x00\x7f\x00\x00\x00\x00\x00\x00\x40\x20\xa0\x20'\
-    b'\xe0\x3f\x43\xfc\x00\x08\x03\xff\xc7\xfc\x00\x02\x00\xff\x01\x83'\
-    b'\x01\x00\x01\x00\x01\xc3\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x02'\
-    b'\x00\x06\x00\x0c\x00\x18\x00\x30\x00\x60\x00\xc0\x00\xc0\x00\x60'\
-    b'\x00\x30\x00\x18\x00\x0c\x00\x06\x00\x03\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x02\x20\x06\x50\x0c\x40\x18\x00\x30\x00\x60\x00\xc0\x00\xc0'\
-    b'\x00\x60\x00\x30\x00\x18\x00\x0c\x00\x06\x00\x03\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x03\x01\x03\x01\x03\x01\x02\x7f\xe2\x01\x02\x01'\
-    b'\x02\x01\x02\x01\x02\x01\x02\x03\x02\x02\x02\x06\x03\x0c\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x23\x01\x53\x01\x63\x01\x02\x7f\xe2\x01'\
-    b'\x02\x01\x02\x01\x02\x01\x02\x01\x02\x03\x02\x02\x02\x06\x03\x0c'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\x81\xff\x80\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x01\x80\x03\x00\x03\x00\x01\x80\xc0\xff'\
-    b'\xc0\x00\x00\x00\x00\x00\x00\x00\x40\x00\xa0\x00\x61\xff\xc1\xff'\
-    b'\x80\x00\x00\x00\x00\x00\x00\x00\x01\x80\x03\x00\x03\x00\x01\x80'\
-    b'\xc0\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x18\x00\x18'\
-    b'\x03\xff\xc3\x8c\x00\x06\x00\x02\x00\x7f\x01\xc3\x81\x00\x01\x00'\
-    b'\x01\x80\x00\xff\x80\x1c\x00\x00\x00\x00\x00\x00\x40\x11\xc0\x18'\
-    b'\xa0\x18\x03\xff\xc3\x8c\x00\x06\x00\x02\x00\x7f\x01\xc3\x81\x00'\
-    b'\x01\x00\x01\x80\x00\xff\x80\x1c\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\x80\x00\x80\x00\x80\x40\x80'\
-    b'\x40\x80\xc0\x80\xc0\xc1\x80\x7f\x00\x1c\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\xc2\x80\xc1\x40\xc0\x00\xc0\x00\x80\x00\x80\x00\x80'\
-    b'\x40\x80\x40\x80\xc0\x80\xc0\xc1\x80\x7f\x00\x1c\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x0c\x00\x0c\x07\xff\xe7\xff\xe0\x0c\x00\x7c\x00\xcc'\
-    b'\x00\x84\x00\xcc\x00\x7c\x00\x04\x00\x0c\x00\x38\x00\x60\x00\x00'\
-    b'\x00\x00\x00\x00\x40\x0d\xe0\x0c\xa7\xff\xe7\xff\xe0\x0c\x00\x7c'\
-    b'\x00\xcc\x00\x84\x00\xcc\x00\x7c\x00\x04\x00\x0c\x00\x38\x00\x60'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc1\x00\xc1\x00\xc1\x07\xff'\
-    b'\xe7\xff\x00\x83\x00\x83\x00\x83\x00\x8e\x00\x80\x00\x80\x00\x7f'\
-    b'\x80\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x20\xc1\x50\xc1\x20\xc1'\
-    b'\x07\xff\xe7\xff\x00\x83\x00\x83\x00\x83\x00\x8e\x00\x80\x00\x80'\
-    b'\x00\x7f\x80\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\xe7'\
-    b'\x00\x0c\x00\x18\x00\x20\x03\xff\xe7\x18\x00\x30\x00\x20\x00\x20'\
-    b'\x00\x30\x00\x1f\x00\x07\x00\x00\x00\x00\x00\x00\x00\x00\xa0\xff'\
-    b'\x50\xe7\x40\x0c\x00\x18\x00\x20\x03\xff\xe7\x18\x00\x30\x00\x20'\
-    b'\x00\x20\x00\x30\x00\x1f\x00\x07\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x40\x00\xc0\x07\xf8\x00\x80\x00\x9f\xc0\x98\x01\x80\x01\x80'\
-    b'\x01\x10\x01\x30\x03\x30\x02\x1f\xe2\x0f\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x40\x41\x60\xc0\xa7\xf8\x00\x80\x00\x9f\xc0\x98\x01\x80'\
-    b'\x01\x80\x01\x10\x01\x30\x03\x30\x02\x1f\xe2\x0f\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x30\x00\x20\x00\x21\xc3\xff\xc0\x60\x00\x40\x00\x40'\
-    b'\x00\xdf\x80\xe0\xc0\x80\xc0\x00\xc0\x00\xc0\xff\x80\xfe\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x31\xa0\x20\xd0\x21\xc3\xff\xc0\x60\x00\x40'\
-    b'\x00\x40\x00\xdf\x80\xe0\xc0\x80\xc0\x00\xc0\x00\xc0\xff\x80\xfe'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\xff\x01\xc1\x80\x00\x80\x00\x80\x01\x80\x01\x80\x07\x00\x7c'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x03\xff'\
-    b'\x82\x00\xc0\x00\x40\x00\x40\x00\x40\x00\x40\x00\xc0\x01\x80\x1f'\
-    b'\x00\x78\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x60\x00\xd0\x7f'\
-    b'\x43\xff\x82\x00\xc0\x00\x40\x00\x40\x00\x40\x00\x40\x00\xc0\x01'\
-    b'\x80\x1f\x00\x78\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x07\xff\xe3\x84\x00\x18\x00\x30\x00\x20\x00\x20\x00\x60\x00\x60'\
-    b'\x00\x20\x00\x30\x00\x1f\x80\x03\x80\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x07\xff\xe3\x84\x00\x19\x40\x30\xa0\x20\x80\x20\x00\x60'\
-    b'\x00\x60\x00\x20\x00\x30\x00\x1f\x80\x03\x80\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x20\x00\x20\x00\x20\x00\x21\xc0\x3f\x80\x78\x00\xc0'\
-    b'\x01\x80\x01\x00\x01\x00\x01\x80\x00\xff\xc0\x1e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\xc0\x21\x60\x20\x80\x20\x00\x21\xc0\x3f\x80\x78'\
-    b'\x00\xc0\x01\x80\x01\x00\x01\x00\x01\x80\x00\xff\xc0\x1e\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x40\x00\x43\x03\xf9\x80\xc0\xe0\x82'\
-    b'\x01\x82\x01\x83\x01\x03\x03\x03\x02\x7f\x02\x43\xc0\x66\x60\x3e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x00\x01\x3f\xc3\x00'\
-    b'\x03\x00\x03\x00\x03\x00\x03\x30\x03\x20\x03\x20\x03\x30\x03\x1f'\
-    b'\xc3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x01\x88\x01\x9e'\
-    b'\x00\xff\x81\x98\xc1\x90\x43\xd0\x42\x70\x42\x60\x42\x6f\xc2\x48'\
-    b'\xc3\xcf\xe1\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x80'\
-    b'\x07\xcf\x87\xf8\x80\xe0\xc0\xc0\x40\x80\x41\x80\x43\x86\x46\x8f'\
-    b'\xc0\x98\xe0\x8f\xa0\x87\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7f\x01\xd9\x83\x18\xc2\x10\x46\x10\x66\x10\x66\x30\x66\x20'\
-    b'\x42\x20\xc3\x61\x81\xcf\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x03\x01\x03\x01\x03\x3f\xe3\x3f\xe3\x01\x03\x01\x03\x01\x03\x01'\
-    b'\x83\x1f\x83\x3f\x83\x61\xe3\x3f\x63\x1e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x23\x03\x43\x01\x03\x3f\xe3\x3f\xe3\x01\x03\x01\x03\x01'\
-    b'\x03\x01\x03\x1d\x03\x3f\x83\x61\xe3\x3f\x63\x1c\x00\x00\x00\x00'\
-    b'\x00\x00\x20\x00\x53\x03\x53\x01\x63\x3f\xe3\x3f\xe3\x01\x03\x01'\
-    b'\x03\x01\x03\x01\x03\x1d\x03\x3f\x83\x61\xe3\x3f\x63\x1c\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x02\x07\xe3\x06\x41\x00\x81\x80\x81'\
-    b'\x81\x81\x41\x01\x61\x01\x21\x01\x01\x03\x01\x03\x00\xce\x00\x7c'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x57\xe3\x46\x41\x00\x81'\
-    b'\x80\x81\x81\x81\x41\x01\x61\x01\x21\x01\x01\x03\x01\x03\x00\xce'\
-    b'\x00\x7c\x00\x00\x00\x00\x00\x00\x00\x00\x70\x02\x97\xe3\x66\x41'\
-    b'\x00\x81\x80\x81\x81\x81\x41\x01\x61\x01\x21\x01\x01\x03\x01\x03'\
-    b'\x00\xce\x00\x7c\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\x00\x3e'\
-    b'\x00\x00\x00\x18\x00\x30\x03\x30\x83\x18\xc2\x18\x42\x0c\x46\x06'\
-    b'\x66\x06\x20\x7c\x00\x38\x00\x00\x00\x00\x00\x00\x00\x00\x20\xf8'\
-    b'\xf0\x3e\x40\x00\x00\x18\x00\x30\x03\x30\x83\x18\xc2\x18\x42\x0c'\
-    b'\x46\x06\x66\x06\x20\x7c\x00\x38\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\xe0\xf8\xa0\x3e\xc0\x00\x00\x18\x00\x30\x03\x30\x83\x18\xc2\x18'\
-    b'\x42\x0c\x46\x06\x66\x06\x20\x7c\x00\x38\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x60\x00\xd0\x01\x98\x03\x0c\x03\x06'\
-    b'\x06\x03\x00\x01\x80\x00\xc0\x00\x60\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x01\x00\x02\x80\x61\x00\xd1\x01\x98\x03\x0c'\
-    b'\x03\x06\x06\x03\x00\x01\x80\x00\xc0\x00\x60\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x03\x80\x04\x80\x63\x00\xd0\x01\x98'\
-    b'\x03\x0c\x03\x06\x06\x03\x00\x01\x80\x00\xc0\x00\x60\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x03\x00\x43\x3f\xc3\x01\x03\x01'\
-    b'\x02\x7f\xe2\x3f\x82\x01\x02\x01\x02\x01\x02\x3f\x02\x61\xc2\x7f'\
-    b'\xe2\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x23\x00\x53\x3f\xa3\x01'\
-    b'\x03\x01\x02\x7f\xe2\x3f\x82\x01\x02\x01\x02\x01\x02\x3f\x02\x61'\
-    b'\xc2\x7f\xe2\x3e\x00\x00\x00\x00\x00\x00\x20\x00\x53\x00\x93\x3f'\
-    b'\xe3\x01\x03\x01\x02\x7f\xe2\x3f\x82\x01\x02\x01\x02\x01\x02\x3f'\
-    b'\x02\x61\xc2\x7f\xe2\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18'\
-    b'\x00\x18\x03\xff\xc0\x18\x00\x18\x03\xff\xc0\x18\x00\x18\x01\xf8'\
-    b'\x03\x3e\x02\x1f\x83\x31\xc1\xe0\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x01\xf0\x00\x11\x80\x11\x80\x31\x80\xf9\x83\xff\x82\x21'\
-    b'\xe6\x61\x66\x41\x02\xc3\x03\x86\x00\x06\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x80\x00\xc1\x07\xf9\x87\xf8\xc0\xc0\x61\xc0\x03\x40\x02\x60'\
-    b'\x82\x60\x82\xc0\xc3\x80\xc0\x80\xc0\xff\x80\x7e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x08\x01\x8c\x00\x8c\x00\xbe\x00\xff\x81\xd8\xc3\xd8'\
-    b'\x42\x50\x42\x70\x42\x60\x42\x60\xc3\xc1\x81\x8f\x00\x0c\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x20\x00\x20\x03\xff\x03\xf0\x00\x60'\
-    b'\x00\x67\x07\xff\x00\x60\x40\x40\x40\x40\x40\x60\x40\x3f\xc0\x1f'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x00\xc8'\
-    b'\x00\xdf\x00\xfd\x81\xc4\xc0\x60\xc0\x2f\x80\x2f\x00\x20\x00\x30'\
-    b'\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x01\x88\x00\x88\x00\x8f'\
-    b'\x81\xff\xc7\xc4\x64\xc6\x60\x40\x60\x48\xe0\x6f\xc0\x60\x00\x20'\
-    b'\x00\x20\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x08\x01\x88\x01\xbf\x01\x69\x81\x49\x81\x88\x81\x89\x81\x7b'\
-    b'\x01\x1e\x00\x18\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x03\x0c'\
-    b'\x02\x0c\x02\x3f\x82\x6c\xc2\x8c\xc3\x8c\x43\x0c\x43\x4c\xc2\x6c'\
-    b'\xc2\x3f\x82\x08\x00\x38\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x1f\x00\x18\x00\x18'\
-    b'\x00\x18\x00\xf8\x01\x9e\x01\x9b\x80\xf0\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x10\x00\x10\x00\x10\x80\x1f\x80\x18\x00\x18\x00\x18'\
-    b'\x00\x18\x01\xf8\x03\x1e\x02\x1b\xc3\xf0\xc1\xe0\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\xf0\x00\x3e\x00\x80\x00\x80\x00\x80\x01\x80'\
-    b'\x01\x7f\x01\xc1\x81\x00\x80\x00\x80\x01\x80\xff\x00\xfc\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x87\x01\x8d\x01\x81\x81\x81\x81\x81'\
-    b'\x81\x81\x81\x81\x81\x81\x81\x81\x00\x03\x00\x07\x00\x1e\x00\x38'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\x00\xfe\x00\x0c\x00\x18'\
-    b'\x00\x30\x00\x5f\x00\xe1\x83\x80\xc0\x00\xc0\xf8\xc0\x8d\x80\xff'\
-    b'\x00\x3c\x00\x00\x00\x00\x00\x00\x00\x80\x00\x80\x00\x80\x07\xcf'\
-    b'\x07\xb1\x80\xe1\x80\xc1\x81\x81\x81\x81\x83\x81\x06\x81\x20\x81'\
-    b'\x60\x81\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x01\xff'\
-    b'\x00\x0c\x00\x18\x00\x30\x00\x6e\x00\xff\x83\x80\x80\x00\xc0\x00'\
-    b'\xc0\x01\x80\xff\x00\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x40\x00\x40\x00\x60\x01\xef\x00\x70\x80\x60\x80\xc0'\
-    b'\x81\xc0\x81\x41\x80\x47\x00\x4e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x80\x00\x80\x01\xc7\x07\xdf\xc0\xb0\x40\xe0\x60\x80\x61\x80'\
-    b'\x63\x80\x66\x80\x40\x81\xc0\x8f\x00\x8c\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x01\xf8\x01\xf8\x00\x10\x00\x10\x00\x7f\x00\xf1\x81\x30'\
-    b'\xc3\x20\x42\x20\x42\x6e\x42\x51\xc3\xdf\x81\x0f\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x01\xfe\x01\x8e\x00\x18\x00\x7f\x01\xc1\x83\xf1'\
-    b'\x80\x91\x80\xf7\x00\x78\x00\xc7\x01\xfc\xc3\x18\x46\x18\x60\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x30\x00\xff\x83\xff\x80\x40\x00\xf8'\
-    b'\x01\xcc\x41\x0f\xc3\x3c\x00\x64\x00\x84\x00\x80\x00\xff\xc0\x3f'\
-    b'\x80\x00\x00\x00\x00\x00\x00\x00\x00\x20\x00\x60\x00\x60\x00\x40'\
-    b'\x00\xc0\x00\xb8\x00\xc8\x41\x88\x41\x08\x41\x08\xc3\x08\x82\x0f'\
-    b'\x82\x07\x00\x00\x00\x00\x00\x00\x00\x80\x40\xfe\xa0\x06\x40\x00'\
-    b'\x00\x00\x00\xff\x83\x80\xc0\x00\xc0\x00\x40\x00\xc0\x00\xc0\x01'\
-    b'\x80\x07\x00\x7c\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x01\xff\x80\x01\x80\x13\x00\x16\x00\x16'\
-    b'\x00\x10\x00\x10\x00\x30\x00\x60\x00\xc0\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x1f\xc3\xff\xe0\x00\xc0\x10\x80\x11\x80\x13\x00\x16'\
-    b'\x00\x10\x00\x10\x00\x30\x00\x60\x01\xc0\x01\x80\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x00\x0e\x00\x18'\
-    b'\x00\x78\x00\xf8\x01\x98\x00\x18\x00\x18\x00\x18\x00\x18\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x01\x80\x03\x00\x06\x00\x1c\x00\x38'\
-    b'\x00\xe8\x03\x88\x03\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18'\
-    b'\x01\xff\x81\xff\x81\x81\x81\x81\x01\x81\x00\x03\x00\x06\x00\x1c'\
-    b'\x00\x30\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18\x03\xff'\
-    b'\xc3\x00\xc3\x00\xc3\x00\xc3\x00\x80\x00\x80\x01\x80\x03\x00\x06'\
-    b'\x00\x3c\x00\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x01\xff\x80\x18\x00\x18\x00\x18\x00\x18\x00\x18'\
-    b'\x00\x18\x01\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x03\xff\xc3\xff\xc0\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18'\
-    b'\x00\x18\x07\xff\xe7\xff\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x04\x00\x04\x01\xff\x81\xff\x80\x0c\x00\x1c'\
-    b'\x00\x34\x00\xe4\x01\x84\x00\x14\x00\x1c\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x06\x00\x06\x03\xff\xe3\xff\xe0\x0e\x00\x1a\x00\x32'\
-    b'\x00\x62\x01\xc2\x03\x82\x02\x02\x00\x1e\x00\x1e\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x30\x00\x30\x00\x30\x03\xff\xc3\xff\xc0\x30\xc0\x20'\
-    b'\xc0\x20\x80\x60\x80\x40\x80\xc0\x81\x80\x83\x0f\x82\x06\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x30\xc0\x31\xe0\x30\x83\xff\xc3\xff\xc0\x30'\
-    b'\xc0\x20\xc0\x20\x80\x60\x80\x40\x80\xc0\x81\x80\x83\x0f\x82\x06'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x10\x03\xff\x83\xf8'\
-    b'\x00\x18\x00\x18\x00\x7f\xc3\xff\x80\x08\x00\x08\x00\x08\x00\x08'\
-    b'\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x01\xa0\x10\xf0\x10\x43\xff'\
-    b'\x83\xf8\x00\x18\x00\x18\x00\x7f\xc3\xff\x80\x08\x00\x08\x00\x08'\
-    b'\x00\x08\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x60\x00\x60'\
-    b'\x80\x7f\x80\xc0\x81\x81\x83\x01\x03\x03\x00\x02\x00\x06\x00\x0c'\
-    b'\x00\x18\x00\x70\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x60\x60'\
-    b'\xf0\x40\x40\xff\x80\x81\x81\x81\x03\x01\x02\x03\x00\x06\x00\x06'\
-    b'\x00\x0c\x00\x38\x00\x70\x00\xc0\x00\x00\x00\x00\x00\x00\x00\x40'\
-    b'\x00\x40\x00\xc0\x00\xff\xe1\xff\xe1\x86\x03\x06\x02\x04\x00\x04'\
-    b'\x00\x0c\x00\x18\x00\x38\x00\xe0\x00\xc0\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x41\x40\x41\xa0\xc0\xe0\xff\xe1\xff\xe1\x86\x03\x06\x02\x04'\
-    b'\x00\x04\x00\x0c\x00\x18\x00\x38\x00\xe0\x00\xc0\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x01\xff\xc1\xff\xc0\x00\xc0\x00\xc0\x00'\
-    b'\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc3\xff\xc3\xff\xc0\x00\xc0\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x20\x00\x53\xff\xa3\xff\x80\x00\x80\x00'\
-    b'\x80\x00\x80\x00\x80\x00\x80\x00\x80\x00\x83\xff\x83\xff\x80\x00'\
-    b'\x80\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\xc3\x00\xc3\x07\xff'\
-    b'\xe0\xc3\x00\xc3\x00\xc3\x00\xc3\x00\xc3\x00\x06\x00\x0c\x00\x78'\
-    b'\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x20\xc3\x50\xc3\x60\xc3'\
-    b'\x07\xff\xe0\xc3\x00\xc3\x00\xc3\x00\xc3\x00\xc3\x00\x06\x00\x0c'\
-    b'\x00\x78\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x01\xe0'\
-    b'\x00\x30\x00\x00\x43\x00\xc3\xc0\x80\x41\x80\x03\x00\x06\x00\x1c'\
-    b'\x00\x78\x01\xe0\x01\x80\x00\x00\x00\x00\x00\x00\x00\x01\x41\x81'\
-    b'\xa1\xe0\xe0\x30\x00\x00\x43\x00\xc3\xc0\x80\x41\x80\x03\x00\x06'\
-    b'\x00\x1c\x00\x78\x01\xe0\x01\x80\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x01\xff\x00\x03\x00\x02\x00\x06\x00\x04\x00\x0c\x00\x1c'\
-    b'\x00\x36\x00\x63\x00\xc1\x83\x80\xc2\x00\x40\x00\x00\x00\x00\x00'\
-    b'\x00\x00\xa0\x00\xd1\xff\x40\x03\x00\x02\x00\x06\x00\x04\x00\x0c'\
-    b'\x00\x1c\x00\x36\x00\x63\x00\xc1\x83\x80\xc2\x00\x40\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x40\x00\x40\x00\x40\x47\xff\xe3\xc0\xc0\x41'\
-    b'\x80\x41\x80\x43\x00\x46\x00\x40\x00\x40\x00\x7f\xe0\x3f\xc0\x00'\
-    b'\x00\x00\x00\x00\x00\x00\xa0\x40\xf0\x40\x40\x40\x47\xff\xe3\xc0'\
-    b'\xc0\x41\x80\x41\x80\x43\x00\x46\x00\x40\x00\x40\x00\x7f\xe0\x3f'\
-    b'\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\xc1\x00\xc1\x80'\
-    b'\xc0\xc0\x80\xc1\x80\x01\x00\x03\x00\x06\x00\x0c\x00\x38\x01\xf0'\
-    b'\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x00\xd3\x00\x41\x00'\
-    b'\x81\x80\x80\x81\x80\xc1\x80\x81\x00\x03\x00\x06\x00\x0e\x00\x18'\
-    b'\x01\xf0\x00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x00\x3f'\
-    b'\xc0\x7f\xc0\xc0\xc1\xc0\x83\xb9\x83\x0d\x00\x07\x00\x06\x00\x0c'\
-    b'\x00\x18\x00\x70\x00\x40\x00\x00\x00\x00\x00\x00\x00\x20\xa0\x20'\
-    b'\x50\x7f\xc0\xff\x80\xc1\x81\x81\x83\x73\x02\x1f\x00\x0e\x00\x0c'\
-    b'\x00\x1c\x00\x38\x00\xe0\x00\xc0\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x03\x83\xff\x01\xd8\x00\x18\x00\x18\x07\xff\xe0\x18\x00\x18'\
-    b'\x00\x18\x00\x10\x00\x70\x01\xe0\x01\x80\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x20\x03\xd3\xff\x61\xd8\x00\x18\x00\x18\x07\xff\xe0\x18'\
-    b'\x00\x18\x00\x18\x00\x10\x00\x70\x01\xe0\x01\x80\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x81\x31\x81\x99'\
-    b'\x80\xd9\x80\xc1\x80\x03\x00\x03\x00\x0e\x00\x3c\x00\x60\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x20\x00\x20\x46\x30\x43\x10\x41\x18'\
-    b'\xc1\x80\xc0\x80\x80\x01\x80\x03\x00\x07\x00\x0e\x00\x78\x00\x60'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x20\x20\xd0\x20\x26\x30\xc3\x10'\
-    b'\xc1\x18\xc1\x80\x80\x81\x80\x01\x00\x03\x00\x06\x00\x1c\x00\x78'\
-    b'\x00\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\x81\xff\x80\x00'\
-    b'\x00\x00\x03\xff\xc3\xff\xc0\x18\x00\x18\x00\x18\x00\x10\x00\x30'\
-    b'\x00\xe0\x01\x80\x00\x00\x00\x00\x00\x00\x00\x00\x21\xff\xd1\xff'\
-    b'\xa0\x00\x00\x00\x03\xff\xc3\xff\xc0\x18\x00\x18\x00\x18\x00\x10'\
-    b'\x00\x30\x00\xe0\x01\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x60'\
-    b'\x00\x60\x00\x60\x00\x60\x00\x78\x00\x7f\x00\x63\xc0\x60\x00\x60'\
-    b'\x00\x60\x00\x60\x00\x60\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x60\x80\x63\xc0\x61\x40\x60\x00\x78\x00\x7f\x00\x63\xc0\x60'\
-    b'\x00\x60\x00\x60\x00\x60\x00\x60\x00\x60\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x18\x00\x18\x00\x18\x07\xff\xe0\x18\x00\x18\x00\x18'\
-    b'\x00\x18\x00\x18\x00\x10\x00\x70\x01\xc0\x01\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x01\xff\x81\xff\x80\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\x80\x01\x80\x01\x00\xc3'\
-    b'\x00\x72\x00\x1e\x00\x0e\x00\x1b\x00\x31\xc0\x60\xc1\xc0\x03\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18\x03\xff\x80\x03'\
-    b'\x00\x06\x00\x1c\x00\x3a\x00\xfb\x83\x98\xc2\x18\x60\x18\x00\x18'\
-    b'\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x03\x00\x03'\
-    b'\x00\x03\x00\x02\x00\x06\x00\x06\x00\x04\x00\x0c\x00\x18\x00\x30'\
-    b'\x00\x60\x00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\x00\x42'\
-    b'\x00\xc2\x00\xc3\x00\xc3\x00\x83\x00\x81\x01\x81\x81\x81\x81\x00'\
-    b'\xc3\x00\xc6\x00\x62\x00\x40\x00\x00\x00\x00\x00\x00\x00\xa0\xc2'\
-    b'\xf0\xc2\x40\xc2\x00\xc3\x00\xc3\x00\x83\x00\x81\x01\x81\x81\x81'\
-    b'\x81\x00\xc3\x00\xc6\x00\x62\x00\x40\x00\x00\x00\x00\x00\x00\x00'\
-    b'\xe0\x42\xa0\x42\xe0\xc2\x00\xc3\x00\xc3\x00\x83\x00\x81\x01\x81'\
-    b'\x81\x81\x81\x00\xc3\x00\xc6\x00\x62\x00\x40\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x80\x00\x80\x00\x81\x80\x87\x00\xbc\x00\xe0\x00\x80'\
-    b'\x00\x80\x00\x80\x00\x80\x00\x80\x00\xff\xc0\x3c\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\xe0\x80\xd0\x80\x40\x81\x80\x87\x00\xbc\x00\xe0'\
-    b'\x00\x80\x00\x80\x00\x80\x00\x80\x00\x80\x00\xff\xc0\x3c\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x70\x80\x90\x80\x60\x81\x80\x87\x00\xbc'\
-    b'\x00\xe0\x00\x80\x00\x80\x00\x80\x00\x80\x00\x80\x00\xff\xc0\x3c'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\x83\xff\x80\x00'\
-    b'\x80\x01\x80\x01\x80\x01\x00\x03\x00\x06\x00\x0e\x00\x38\x00\xf0'\
-    b'\x00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x20\x00\x53\xff\x83\xff'\
-    b'\x80\x00\x80\x01\x80\x01\x80\x01\x00\x03\x00\x06\x00\x0e\x00\x38'\
-    b'\x00\xf0\x00\xc0\x00\x00\x00\x00\x00\x00\x60\x00\xa0\x00\xa3\xff'\
-    b'\xc3\xff\x80\x00\x80\x01\x80\x01\x80\x01\x00\x03\x00\x06\x00\x0e'\
-    b'\x00\x1c\x00\xf0\x00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x60\x00\xf0\x00\xd8\x01\x8c\x03\x06\x06\x03\x00\x01'\
-    b'\x80\x00\xc0\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x01\x00\x02\x80\x63\x00\xf1\x00\xd8\x01\x8c\x03\x06\x06\x03'\
-    b'\x00\x01\x80\x00\xc0\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x03\x00\x04\x80\x63\x80\xf0\x00\xd8\x01\x8c\x03\x06'\
-    b'\x06\x03\x00\x01\x80\x00\xc0\x00\x60\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x18\x00\x18\x07\xff\xe7\xff\xe0\x19\x00\x99'\
-    b'\x01\x99\x81\x99\x81\x18\xc3\x18\xc6\x18\x62\x78\x00\x70\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x01\x40\x19\xa0\x18\x87\xff\xe7\xff\xe0\x19'\
-    b'\x00\x99\x01\x99\x81\x99\x81\x18\xc3\x18\xc6\x18\x62\x78\x00\x70'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x18\xa0\x18\xe7\xff\xe7\xff'\
-    b'\xe0\x19\x00\x99\x01\x99\x81\x99\x81\x18\xc3\x18\xc6\x18\x62\x78'\
-    b'\x00\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xc0\x00'\
-    b'\xc0\x01\x80\x01\x80\x83\x00\xc6\x00\x7c\x00\x38\x00\x0c\x00\x06'\
-    b'\x00\x03\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x01\xf0\x01\xff'\
-    b'\x80\x01\x80\x00\x01\xc0\x01\xfe\x00\x0f\x80\x00\x00\x00\x03\x80'\
-    b'\x03\xfc\x00\x0f\xc0\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x30'\
-    b'\x00\x30\x00\x20\x00\x60\x00\x60\x00\x46\x00\xc3\x00\xc1\x00\x81'\
-    b'\x81\x80\x81\xbf\xc7\xff\x40\x00\x60\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x03\x00\x03\x00\x02\x00\xc6\x00\x76\x00\x1c\x00\x0e\x00\x1b'\
-    b'\x80\x31\xc0\x70\x40\xc0\x03\x80\x03\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x03\xff\x80\x20\x00\x20\x00\x20\x03\xff\xc0\x20'\
-    b'\x00\x20\x00\x20\x00\x20\x00\x20\x00\x3f\xc0\x0f\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x00\x40\x00\x7f\x83\xfe'\
-    b'\x80\x21\x80\x23\x00\x26\x00\x34\x00\x30\x00\x30\x00\x10\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc0\x00\xff\xe7\xfe\x40\x40'\
-    b'\xc0\x61\x80\x63\x00\x66\x00\x24\x00\x20\x00\x30\x00\x30\x00\x30'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\xfe\x00\x02\x00\x02\x00\x02\x00\x02\x00\x02\x00\x02\x01\xff'\
-    b'\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\x01\xff'\
-    b'\x00\x01\x00\x01\x00\x01\x00\x01\x00\x03\x00\x03\x00\x03\x07\xff'\
-    b'\xe7\xff\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\xff\x00\xff\x00\x01\x00\x01\x00\xff\x00\x01\x00\x01'\
-    b'\x00\x01\x00\xff\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x01\xff\x80\x00\x80\x00\x80\x00\x81\xff\x81\xff\x80\x00\x80\x00'\
-    b'\x80\x00\x81\xff\x81\xff\x80\x00\x80\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x01\xff\x81\xff\x80\x00\x00\x00\x03\xff\xc0\x00\x80\x00\x80\x01'\
-    b'\x80\x03\x00\x06\x00\x1c\x01\xf8\x00\xc0\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x81\x00\x81\x00\x81\x00\x81\x00\x81\x00\x81\x00\x81'\
-    b'\x00\x81\x00\x01\x00\x03\x00\x06\x00\x7c\x00\x30\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x8c\x00\x8c\x00\x8c\x00\x8c\x00\x8c\x00\x8c'\
-    b'\x20\x8c\x20\x8c\x61\x8c\xc1\x8d\x83\x0f\x07\x0e\x06\x04\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x80\x00\x80\x00\x80\x00\x80\x00\x80'\
-    b'\x00\x80\x40\x80\xe0\x81\xc0\x83\x80\x86\x00\x9c\x00\xf0\x00\xc0'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\x81\x00\x81\x00'\
-    b'\x81\x00\x81\x00\x81\x00\x81\x00\x81\x00\x81\x00\x81\xff\x81\xff'\
-    b'\x81\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x01\xff\x01\xff\x01\x81\x01\x81\x01\x81\x00\x03\x00\x03\x00\x06'\
-    b'\x00\x3c\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xc3\xff'\
-    b'\xc3\x00\xc3\x00\xc3\x00\x83\x00\x83\x01\x80\x01\x80\x01\x00\x03'\
-    b'\x00\x0e\x00\x78\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02'\
-    b'\x00\x02\x03\xff\xc0\x42\x00\x42\x00\x42\x00\x42\x00\x42\x07\xff'\
-    b'\xe7\xff\xe0\x02\x00\x02\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x01\xff\xc1\xff\xc0\x00\x80\x19\x80\x1b\x00\x1e\x00\x18'\
-    b'\x00\x18\x00\x18\x07\xff\xe7\xff\xe0\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x03\xff\xc0\x00\xc0\x00\xc1\xff\x81\xff\x80\x01'\
-    b'\x80\x01\x80\x03\x00\x07\x00\x0e\x00\x78\x00\x60\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x02\x00\x03\x80\x01\xc0\x00\x60\xc0\x00\xc0\x01'\
-    b'\x80\x01\x80\x03\x00\x06\x00\x0c\x00\x78\x03\xe0\x03\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x18\xa0\x18\x50\x18\x03\xff\xc3\x00\xc3\x00'\
-    b'\xc3\x00\x83\x00\x80\x01\x80\x01\x80\x03\x00\x06\x00\x3c\x00\x70'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x10'\
-    b'\x00\x10\x00\xff\x80\x11\x80\x11\x80\x31\x80\x21\x80\x61\x80\xcf'\
-    b'\x00\x87\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20'\
-    b'\x00\x60\x00\x40\x00\xff\x80\x84\x01\x84\x00\x0c\x00\x0c\x00\x18'\
-    b'\x00\x70\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x7e\x00\x42\x00\x42\x00\x42\x00\x42\x00\x42'\
-    b'\x00\x42\x00\x42\x00\x42\x00\x42\x00\x7e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18'\
-    b'\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x03\xff\xc3\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18'\
-    b'\x00\x18\x00\x18\x00\x18\x00\x18\x00\x08\x00\x00\x00\x18\x00\x18'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x08'\
-    b'\x00\x18\x00\x10\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x10'\
-    b'\x00\x18\x00\x08\x00\x04\x00\x03\x00\x00\x00\x00\x00\x00\x00\x60'\
-    b'\x00\x10\x00\x18\x00\x08\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c'\
-    b'\x00\x08\x00\x18\x00\x10\x00\x20\x00\xc0\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x18\x00\x18\x00\x10\x00\x10\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x10\x00\x10'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x18\x00\x7e\x00\x02\x00\x02\x00\x02'\
-    b'\x00\x06\x00\x08\x00\x10\x00\x10\x00\x00\x00\x10\x00\x10\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\x81\x00\x81\x00\x81\x00'\
-    b'\x81\x00\x81\xff\x81\xff\x81\x00\x81\x00\x81\x00\x81\x00\x81\xff'\
-    b'\x81\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x07\xff\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xe6\x00'\
-    b'\x66\xff\x66\x18\x66\x18\x66\xff\x66\x18\x66\x1a\x66\x18\x67\xff'\
-    b'\xe6\x00\x67\xff\xe7\xff\xe0\x00\x00\x00\x00\x00\x00\x08\x00\x18'\
-    b'\x00\x64\x00\xc3\x01\x81\xc6\x7e\xe4\x00\x20\x00\x07\xff\xe0\x20'\
-    b'\x00\x63\x00\xc1\x81\x9f\xc1\xf0\xc0\x00\x00\x00\x00\x00\x00\x18'\
-    b'\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x3c\x00\x24'\
-    b'\x00\x66\x00\xc3\x01\x81\x83\x00\xc6\x00\x60\x00\x00\x00\x00\x00'\
-    b'\x00\x80\x01\xff\xc1\xff\xc3\x0c\x06\x0c\x01\xff\xc1\x0c\x01\x0c'\
-    b'\x01\x0c\x07\xff\xe7\xff\xe0\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x18\x00\x18\x00\x18\x00\x18\x07\xff\xe0\x18\x00\x18'\
-    b'\x00\x1c\x00\x34\x00\x66\x00\xc3\x01\x81\x83\x00\xc6\x00\x60\x00'\
-    b'\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x07\xff'\
-    b'\xe0\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18\x07\xff'\
-    b'\xe0\x3c\x00\x3c\x00\x5a\x00\xdb\x01\x99\x83\x18\xc6\xff\x64\x18'\
-    b'\x20\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x03\xff'\
-    b'\xc3\xff\xc2\x18\x42\x18\x42\x18\x42\x18\x43\xff\xc2\x18\x40\x18'\
-    b'\x00\x18\x00\x18\x00\x18\x00\x18\x00\x00\x00\x00\x00\xff\xc0\xff'\
-    b'\xc0\x80\x00\xff\x80\x80\x00\xff\x80\x80\x07\xff\xe1\x98\x01\x88'\
-    b'\xc1\x87\x81\x86\x01\x9b\x81\xf0\xe0\x00\x00\x00\x00\x00\x00\x18'\
-    b'\x03\x18\xc3\x18\xc3\x18\xc3\x18\xc3\xff\xc0\x18\xc0\x18\x02\x18'\
-    b'\x42\x18\x42\x18\x42\x18\x42\x18\x43\xff\xc0\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x03\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff'\
-    b'\x80\x00\x00\x00\x00\x00\x00\x00\x07\xff\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x03\xff\xc2\x00\x42\xff\x42\xff\x42\x00\x42\x7e'\
-    b'\x42\x7e\x42\x42\x42\x42\x42\x7e\x42\x00\x42\x00\x42\x01\xc2\x00'\
-    b'\x00\x00\x00\x00\x00\x03\x07\xc3\x04\x5f\xe4\x43\x04\x43\x04\x5f'\
-    b'\xe7\xc0\xc4\x40\xc4\x5f\xe4\x40\xc7\xc8\xc4\x4c\xc4\x00\xc0\x03'\
-    b'\xc0\x00\x00\x00\x00\x00\x00\x02\x07\xf2\x00\xc6\x00\xc7\xe2\xc4'\
-    b'\x42\xc4\x42\xec\x42\xce\xc2\xc2\x82\xc3\x82\xc1\x02\xf3\x87\xe6'\
-    b'\xc6\x0c\x60\x00\x00\x00\x00\x00\x00\x10\x07\xff\xe0\x10\x03\xff'\
-    b'\xc2\x10\xc3\xff\xc0\x10\x07\xff\xc0\x10\xc7\xff\xe0\x10\xc7\xff'\
-    b'\xc0\x10\xc0\xf0\x00\x00\x00\x00\x00\x00\x00\x10\x00\x30\x03\xff'\
-    b'\xc3\x00\xc3\x00\xc3\xff\xc3\x00\xc3\x00\xc3\x00\xc3\xff\xc3\x00'\
-    b'\xc3\x00\xc3\xff\xc3\x00\xc0\x00\x00\x00\x00\x00\x00\x80\x01\x9f'\
-    b'\xe3\x00\x06\x00\x00\xc0\x01\xbf\xe1\x00\x83\x00\x85\x00\x81\x00'\
-    b'\x81\x00\x81\x00\x81\x00\x81\x07\x81\x00\x00\x00\x00\x00\x01\x03'\
-    b'\x01\x83\x07\xe3\x00\x63\x00\x43\x00\xcf\xe0\x83\x01\xc3\x06\xa3'\
-    b'\x04\xa3\x00\x83\x00\x83\x00\x83\x00\x9f\xe0\x00\x00\x00\x00\x00'\
-    b'\x01\xff\x81\xff\x81\x00\x81\xff\x81\x00\x81\x00\x81\xff\x81\x00'\
-    b'\x81\x00\x81\xff\x80\x64\x00\x44\x21\x84\x27\x07\xe0\x00\x00\x00'\
-    b'\x00\x00\x01\xff\x81\xff\x81\x00\x81\x00\x81\xff\x81\xff\x81\x00'\
-    b'\x81\x00\x81\xff\x81\xff\x81\x00\x83\x00\x82\x00\x86\x07\x80\x00'\
-    b'\x00\x00\x00\x00\x00\x02\x00\x42\x00\xc3\x01\x81\x83\x00\xc6\x00'\
-    b'\x65\xff\xa0\x21\x80\x21\x80\x21\x80\x61\x80\xc1\x01\x81\x07\x0f'\
-    b'\x00\x00\x00\x00\x00\x00\x02\x08\x83\x0d\x87\xff\xe0\x1f\xc7\x82'\
-    b'\x00\x3f\xe0\x01\x07\xbd\x40\x3f\xe7\xff\xe6\xcf\xc6\xf8\xc7\xc9'\
-    b'\xa7\xfb\x60\x00\x00\x00\x00\x00\x00\x84\x01\x08\x03\x19\x86\x3f'\
-    b'\x04\x8c\xc1\x38\xc3\x3f\xe7\x18\x05\x1f\xc1\x30\x81\x79\x81\x0f'\
-    b'\x01\x0f\x81\x70\xe0\x00\x00\x00\x00\x00\x00\xc1\x00\x43\x07\xff'\
-    b'\xe7\xff\xe0\x00\x43\xf2\x42\x12\x43\xf2\x42\x12\x42\x12\x43\xf2'\
-    b'\x42\x12\x42\x10\x42\x71\xc0\x00\x00\x00\x00\x00\x00\x00\x03\xff'\
-    b'\xc3\x00\x43\x00\x43\xff\xc3\x0c\x03\x0c\x03\xff\xe3\xff\xe3\x04'\
-    b'\x03\x06\x03\x02\x23\xf1\x23\x81\xe0\x00\x00\x00\x00\x00\x00\x08'\
-    b'\x00\x88\x01\x88\x01\xff\xc3\xff\xc2\x08\x04\x08\x00\x08\x01\xff'\
-    b'\xc0\x08\x00\x08\x00\x08\x00\x08\x07\xff\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x04\x06\x7f\xe3\x04\x00\x3f\xc0\x24\x40\x3f\xc7\x3f\xc1\x24'\
-    b'\x41\x3f\xc1\x04\x01\x7f\xe1\x04\x03\xc0\x04\x7f\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x03\xff\xc0\x10\x00\x30\x00\x20\x00\x20\x03\xff'\
-    b'\x80\x60\x80\x40\x80\x40\x80\x40\x80\x40\x80\xc0\x87\xff\xe0\x00'\
-    b'\x00\x00\x00\x00\x03\xfc\x83\xf5\x80\x27\x03\x62\x61\xc3\x81\xff'\
-    b'\x86\x64\x64\x64\x20\x64\x07\xff\xc0\x64\x00\x44\x21\x84\x67\x07'\
-    b'\xc0\x00\x00\x00\x00\x00\x07\xe7\xe4\x24\x24\x24\x27\xe7\xe4\x24'\
-    b'\x27\xe7\xe4\x00\x24\x7e\x24\x42\x24\x7e\x24\x42\x24\x7e\x24\x7e'\
-    b'\x24\x01\xe0\x00\x00\x00\x00\x00\x01\x00\xc1\x80\xc0\x80\xc7\xff'\
-    b'\xe0\x2f\xe2\x60\xc2\x4c\xc1\x46\xc1\xc2\xc0\xc2\xc0\xc0\xc1\x20'\
-    b'\xc3\x30\xc6\x03\xc0\x00\x00\x00\x00\x00\x00\x10\x00\x10\x00\x10'\
-    b'\x00\x10\x00\x10\x00\x1f\xc0\x10\x00\x10\x00\x10\x00\x10\x00\x10'\
-    b'\x00\x10\x07\xff\xe7\xff\xe0\x00\x00\x00\x00\x00\x00\x80\x00\x87'\
-    b'\xe7\xf6\x62\x16\x41\x26\x41\x26\x87\xfe\xc0\x06\x40\x06\x23\xf6'\
-    b'\x22\x16\x22\x17\xe2\x16\x03\xf6\x00\x00\x00\x00\x00\x00\x00\x18'\
-    b'\x07\xff\xe0\x18\x03\xff\xc3\xff\xc2\x18\xc3\xff\xc2\x18\xc3\xff'\
-    b'\xc3\xff\xc0\x7e\x00\xdb\x03\x99\xe6\x18\x60\x00\x00\x00\x00\x00'\
-    b'\x00\x10\x00\x10\x43\xfe\xc0\x11\x87\xff\xe7\xff\xe0\x70\x01\xff'\
-    b'\x87\x80\x80\x80\x80\xff\x80\x80\x80\x80\x80\xff\x80\x80\x00\x00'\
-    b'\x00\x00\x00\x18\x01\x99\x00\x98\x07\xff\xc6\x00\x46\x00\x40\xff'\
-    b'\x00\x81\x00\x81\x00\xff\x00\x64\x00\x44\x21\x84\x27\x07\xe0\x00'\
-    b'\x00\x00\x00\x00\x01\x02\x01\x12\x01\x12\x01\x12\xc7\xd7\xc1\x1e'\
-    b'\x41\x32\x41\x12\x41\x12\x41\x12\xc3\x92\x06\x10\x20\x10\x20\x1f'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x18\x00\x3c\x00\x66\x01\xc3\x87\x00'\
-    b'\xe5\xff\xa1\xff\x80\x00\x01\xff\x81\x00\x81\x00\x81\x00\x81\xff'\
-    b'\x81\x00\x80\x00\x00\x00\x00\x00\x00\x10\x00\x10\x07\xff\xe0\x18'\
-    b'\x00\x18\x03\xff\xc3\xff\xc3\x18\xc3\x18\xc3\x18\xc3\x18\xc3\x1b'\
-    b'\x83\x1b\x80\x18\x00\x00\x00\x00\x00\x00\x00\x24\x43\xa4\xc0\x24'\
-    b'\x07\xff\xe0\xc3\x00\x42\x07\xff\xe0\x18\x03\xff\xc0\x18\x07\xff'\
-    b'\xe0\x7e\x01\xdb\x87\x18\xe0\x00\x00\x00\x00\x00\x00\x18\x00\x18'\
-    b'\x00\x18\x03\xff\xc2\x10\x42\x10\x42\x18\x42\x34\x42\x62\x42\xc1'\
-    b'\x42\x81\x42\x00\x42\x00\x42\x03\xc0\x00\x00\x00\x00\x00\x01\x80'\
-    b'\x01\x9f\xe1\x98\x67\xf8\x61\x9f\xe1\x9f\xe3\xd8\x63\xf8\x63\x9f'\
-    b'\xe5\x98\x65\x98\x61\x98\x61\x9f\xe1\x98\x60\x00\x00\x00\x00\x00'\
-    b'\x00\x30\x00\x18\x00\x18\x07\xff\xe0\x40\x00\x40\x00\x7f\x80\x7f'\
-    b'\x80\x40\x80\xc0\x80\xc0\x81\x80\x83\x00\x86\x07\x80\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x07\xff\xe6\x64\x66\x64\x66\x64\x66\x44\x66\x44'\
-    b'\x66\x44\x66\xc4\x67\x87\xe7\x00\x66\x00\x67\xff\xe7\xff\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x18\x07\xff\xe6\x00\x66\x00\x61\xff\x81\xff'\
-    b'\x80\x18\x00\x98\x00\x9f\x81\x9f\x81\x98\x03\xd8\x02\x78\x06\x1f'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x08\x00\x18\x00\x3c\x00\xe3\x01\x91'\
-    b'\x87\x18\xe4\x08\x20\x00\x03\xff\x80\x01\x80\x03\x00\x06\x00\x0c'\
-    b'\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xc2\x00\x42\x00'\
-    b'\x42\x7e\x42\x42\x42\x42\x42\x42\x42\x42\x42\x7e\x42\x00\x42\x00'\
-    b'\x43\xff\xc2\x00\x40\x00\x00\x00\x00\x00\x00\x80\x27\xf7\xe7\xf4'\
-    b'\x01\x24\x01\x24\x07\xf7\xe0\x84\x40\x84\x47\xf4\x42\x84\x42\xa4'\
-    b'\x46\x9c\x44\x88\x43\x88\x40\x00\x00\x00\x00\x00\x01\x1f\xc1\x1f'\
-    b'\xc1\x1f\xc1\x10\x47\xdf\xc1\x00\x01\x3f\xe1\x0c\x01\x1f\xe1\x36'\
-    b'\xe3\x8d\x66\x3b\x60\x06\x60\x1d\xc0\x00\x00\x00\x00\x00\x00\x18'\
-    b'\x00\x3c\x00\x66\x01\xc1\x87\x00\xe4\xff\x20\x18\x00\x18\x03\xff'\
-    b'\xc0\x18\x00\x99\x80\x99\x00\xdb\x07\xff\xe0\x00\x00\x00\x00\x00'\
-    b'\x01\xff\x81\xff\x81\x00\x81\xff\x83\xff\xc3\xff\xc3\x00\xc3\xff'\
-    b'\xc3\x00\xc3\xff\xc3\x00\xc3\xff\xc0\x42\x03\xc1\xe2\x00\x00\x00'\
-    b'\x00\x00\x00\x20\x00\x20\x00\x60\x03\xff\x00\x61\x00\x61\x00\x41'\
-    b'\x00\x41\x00\x41\x00\xc1\x00\x81\x21\x81\x23\x01\x26\x01\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x20\x00\x30\x00\x18\x00\x18\x00\x1c\x00\x1c'\
-    b'\x00\x34\x00\x26\x00\x62\x00\x43\x00\x81\x01\x81\x83\x00\xc6\x00'\
-    b'\x60\x00\x00\x00\x00\x00\x00\x7b\xc6\x4a\x43\x7b\xc0\x42\x00\x4e'\
-    b'\x60\x39\x87\x19\x01\x7f\xe1\x19\x01\x7f\xe1\x19\x81\x70\xc3\xc0'\
-    b'\x04\x7f\xe0\x00\x00\x00\x00\x00\x00\x10\x00\x10\x00\x18\x07\xff'\
-    b'\xe0\x01\x01\x81\x80\x81\x80\xc1\x00\xc1\x00\x43\x00\x42\x00\x66'\
-    b'\x00\x06\x07\xff\xe0\x00\x00\x00\x00\x00\x07\xe7\xe4\x27\xe4\x24'\
-    b'\x27\xe7\xe4\x24\x27\xe7\xe4\xff\x24\xff\x24\x24\x25\xff\x25\xff'\
-    b'\x24\x44\x24\xc4\x24\x85\xe0\x00\x00\x00\x00\x00\x00\x01\xc3\xff'\
-    b'\x03\x08\x00\x08\x00\x08\x03\xff\xc0\x08\x00\x08\x07\xff\xe0\x08'\
-    b'\x00\x08\x00\x08\x00\x08\x00\x78\x00\x00\x00\x00\x00\x00\x00\x18'\
-    b'\x03\x18\xc1\x99\x80\x99\x00\x99\x07\xff\xe7\xff\xe0\x3c\x00\x7e'\
-    b'\x00\xdb\x01\x99\x83\x18\xc6\x18\x60\x18\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x20\x00\x20\x00\x20\x03\xff\xc0\x20\x40\x20\x40\x20\x40\x20'\
-    b'\x40\x60\x40\x40\x40\xc0\x41\x80\xc3\x00\xc6\x07\x80\x00\x00\x00'\
-    b'\x00\x00\x01\x10\x81\x99\x80\x03\x07\xff\xe4\x00\x64\x00\x61\xff'\
-    b'\x00\x06\x00\x18\x07\xff\xe0\x18\x00\x18\x00\x18\x00\x78\x00\x00'\
-    b'\x00\x00\x00\x00\x07\xe7\xe4\x24\x24\x24\x27\xe7\xe4\x24\x27\xe7'\
-    b'\xe4\x00\x24\x00\x24\x7e\x24\x42\x24\x42\x24\x7e\x24\x00\x24\x01'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x10\x07\xff\xe0\x00\x01\xff\x81\x00'\
-    b'\x81\xff\x80\x00\x07\xff\xe6\x00\x66\xfe\x66\xc2\x66\xc2\x66\xfe'\
-    b'\x66\x01\xe6\x00\x00\x00\x00\x00\x00\xc8\x00\x89\x01\x88\x81\x08'\
-    b'\x03\x0f\xe3\x7e\x05\x0c\x05\x0c\x01\x04\x01\x04\x01\x06\x01\x03'\
-    b'\x21\x01\x21\x01\xe0\x00\x00\x00\x00\x00\x00\x0f\xe7\xef\xe6\x68'\
-    b'\x66\x68\x66\x6f\xe6\x6f\xe7\xe8\x66\x68\x66\x6f\xe6\x6f\xe7\xe8'\
-    b'\x66\x18\x66\x18\x60\x11\xe0\x00\x00\x00\x00\x00\x00\x10\x07\xff'\
-    b'\xe7\xff\xe4\x00\x20\x18\x01\xff\x80\x18\x01\xff\x80\x18\x07\xff'\
-    b'\xe7\xff\xe0\x6c\x01\xc7\x07\x01\xe0\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x03\xff\xc2\x18\x42\x18\x42\x18\x42\x18\x42\x18\x43\xff\xc2\x00'\
-    b'\x42\x00\x42\x00\x42\x00\x42\x00\x42\x07\xc0\x00\x00\x00\x00\x00'\
-    b'\x07\xe7\xe4\x24\x27\xe7\xe4\x24\x27\xe7\xe4\x00\x24\x66\x24\x24'\
-    b'\x24\xfe\x24\x10\x24\xff\x24\x10\x24\x26\x24\xc2\x60\x00\x00\x00'\
-    b'\x00\x00\x02\x04\x03\x04\x01\x04\x00\x3f\xc4\x04\xc3\x04\xc0\x04'\
-    b'\xc0\x7f\xe1\x0e\x01\x0a\x03\x1b\x02\x11\x86\x30\xc4\xe0\x60\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x03\xff\xc0\x01\x80\x07\x00\x0c\x00\x18'\
-    b'\x00\x18\x07\xff\xe0\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x78'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x71\x07\xc1\x07\xf9\x07\xff\xe7\xf1'\
-    b'\x27\xf1\x26\x91\x27\xf3\x26\x93\x27\xf2\x20\x82\x27\xf6\x60\x84'\
-    b'\x67\xfd\xc0\x00\x00\x00\x00\x00\x00\x10\x00\x18\x07\xff\xe0\x00'\
-    b'\x01\xff\x81\x00\x81\x00\x81\x00\x81\xff\x80\x18\x00\x9b\x01\x98'\
-    b'\xc6\x18\x64\x78\x00\x00\x00\x00\x00\x00\x00\x18\x00\x3c\x00\x66'\
-    b'\x00\xc3\x01\x81\x87\xff\xe4\x18\x20\x18\x00\x18\x01\xff\x80\x18'\
-    b'\x00\x18\x00\x18\x03\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x01\xff'\
-    b'\x81\x00\x81\x00\x81\xff\x81\xff\x81\x00\x81\x00\x81\xff\x81\x00'\
-    b'\x81\x00\x81\x00\x81\xff\x81\x00\x80\x00\x00\x00\x00\x00\x00\x18'\
-    b'\x07\xff\xe7\xff\xe0\x18\x03\xff\xc0\x18\x07\xff\xe0\x28\x00\x4c'\
-    b'\x41\xc5\xc7\xc3\x04\xc3\x00\xd8\xc0\xf0\x60\x00\x00\x00\x00\x00'\
-    b'\x01\x12\x06\xb2\xc2\x22\x47\xf2\x04\x97\xe4\x97\x07\xf3\x64\x93'\
-    b'\x47\xf1\xc0\x81\x87\xf9\x87\xfb\x80\x86\xa0\x8c\xe0\x00\x00\x00'\
-    b'\x00\x00\x01\x00\x01\x1f\xc3\x48\xc2\x4c\x84\x87\x87\x83\x01\x5d'\
-    b'\xe2\x73\x67\xe3\x06\x3f\xe4\x43\x07\xe3\x04\xa3\x04\x9f\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x3f\xc6\x3f\xc3\x0f\x80\x06\x00\x3f\xe0\x26'\
-    b'\x67\x3f\xe1\x26\x61\x3f\xe1\x26\x61\x26\x61\x27\xc3\xc0\x04\x7f'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x82\x00\x82\x01\xf2\x01\xf2\x01\x12'\
-    b'\x02\x12\x07\x33\x05\xa2\x80\x62\x40\x42\x40\xc2\x01\x82\x07\x02'\
-    b'\x06\x02\x00\x00\x00\x00\x00\x00\x01\xff\x81\xff\x81\xff\x81\x00'\
-    b'\x81\xff\x80\x00\x07\xff\xe2\x30\x03\xf7\xc2\x34\x43\xf4\x82\x33'\
-    b'\x87\xfb\x84\x3e\xe0\x00\x00\x00\x00\x00\x00\x10\x00\x18\x07\xff'\
-    b'\xe0\x00\x03\xff\xc0\x00\x00\x00\x03\xff\xc0\x00\x03\xff\x83\x00'\
-    b'\x83\x00\x83\xff\x83\xff\x80\x00\x00\x00\x00\x00\x00\x00\x80\xff'\
-    b'\xc3\xc8\x03\x08\x03\x08\x03\x08\x03\xff\xe3\x0c\x03\x04\x03\x04'\
-    b'\x03\x06\x03\x12\x23\xf1\x23\x80\xe0\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x07\xdf\xc1\x10\x41\x1f\xc1\x10\x41\x10\x47\xdf\xc1\x10\x41\x1f'\
-    b'\xc1\x1f\xc1\xc5\x07\x89\x04\x19\x20\x31\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x07\xff\xc1\x32\x41\x32\x41\x3f\xc1\x32\x47\xb2\x41\x3f'\
-    b'\xc1\x02\x01\x02\x01\xbf\xc7\x82\x04\x02\x00\x3f\xe0\x00\x00\x00'\
-    b'\x00\x00\x03\x00\x01\x1f\xe7\xd2\x60\x12\x67\xd7\xe0\x12\x60\x17'\
-    b'\xe7\xd0\x60\x17\xe7\xd4\xe6\x54\xe6\x57\xe7\xf0\x67\xe1\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x84\x01\x84\x01\x04\x01\x7f\xe3\x0e\x07\x0d'\
-    b'\x05\x15\x05\x15\x81\x34\x81\x24\x41\x5f\xe1\x5f\xa1\x04\x01\x04'\
-    b'\x00\x04\x00\x00\x00\x00\x00\xc8\x00\x88\x01\x88\x41\x08\xc3\x09'\
-    b'\x83\x0b\x05\x0c\x05\x38\x01\x28\x01\x08\x01\x08\x21\x08\x21\x08'\
-    b'\x61\x0f\xe0\x00\x00\x00\x00\x00\x00\x00\x03\xff\xc2\x18\x42\x18'\
-    b'\x42\x18\x42\x18\x43\xff\xc3\xff\xc2\x18\x42\x18\x42\x18\x42\x18'\
-    b'\x43\xff\xc2\x00\x40\x00\x00\x00\x00\x00\x00\x18\x03\x18\xc1\x18'\
-    b'\x80\x99\x80\x18\x03\xff\xc0\x00\xc0\x00\xc0\x00\xc3\xff\xc0\x00'\
-    b'\xc0\x00\xc3\xff\xc3\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x46'\
-    b'\x00\x46\x00\x42\x00\x42\x00\x42\x00\xc3\x00\x81\x00\x81\x01\x81'\
-    b'\x81\x00\x83\x00\xc6\x00\x66\x00\x20\x00\x20\x00\x00\x00\x00\x10'\
-    b'\x00\x18\x00\x08\x00\x00\x07\xff\xe0\x00\x00\x00\x00\x62\x00\x43'\
-    b'\x00\x81\x81\x80\xc3\x00\x46\x00\x64\x00\x20\x00\x00\x00\x00\x00'\
-    b'\x01\x86\x01\x04\x01\x24\x02\x6f\xe6\xd8\x67\x90\x61\xe4\x63\x26'\
-    b'\x67\xe2\x66\x02\x60\xa0\x62\xa0\x46\xb0\x44\x83\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x10\x00\x10\x00\x18\x07\xff\xe0\x18\x00\x18\x00\x18'\
-    b'\x03\xff\xc0\x18\x00\x18\x00\x18\x00\x18\x00\x18\x07\xff\xe0\x00'\
-    b'\x00\x00\x00\x00\x03\xef\xe2\x2f\xe2\x23\x03\xef\xc2\x2c\x43\xef'\
-    b'\xc0\x0c\x47\xff\xc0\xcc\x42\xcf\xc2\xe0\x03\xcc\x47\xc8\x24\xff'\
-    b'\xe4\x00\x00\x00\x00\x00\x00\x00\x07\xff\xe0\x10\x00\x10\x00\x10'\
-    b'\x00\x10\x00\x1c\x00\x16\x00\x13\x00\x11\x80\x10\x00\x10\x00\x10'\
-    b'\x00\x10\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x42\x07\xff\xe7\xff'\
-    b'\xe0\x10\x01\xff\x81\x00\x81\xff\x81\xff\x81\x00\x81\xff\x81\x00'\
-    b'\x81\xff\x81\xff\x80\x00\x00\x00\x00\x00\x00\x18\x03\xff\xc0\xc3'\
-    b'\x00\x42\x07\xff\xe1\xff\x81\xff\x81\xff\x81\x00\x81\xff\x80\x00'\
-    b'\x03\xd8\x46\xc1\x64\xff\x20\x00\x00\x00\x00\x00\x02\x06\x03\x06'\
-    b'\x01\x06\x00\x3f\xc4\x06\x03\x06\x00\x06\x00\x7f\xe1\x0c\x01\x09'\
-    b'\x83\x18\x82\x10\xc6\x2f\xc4\x38\x40\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x07\xff\xe0\x08\x00\x18\x00\x30\x00\x76\x00\x53\x00\x91\x83\x10'\
-    b'\xc6\x10\x64\x10\x20\x10\x00\x10\x00\x10\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x18\x00\x18\x03\xff\xc1\x18\x81\x99\x80\x9b\x00\x18\x07\xff'\
-    b'\xe0\x3c\x00\x7a\x00\xdb\x03\x99\xc6\x18\x64\x18\x20\x00\x00\x00'\
-    b'\x00\x00\x00\x98\x01\x90\x01\x3f\xe1\x2c\x03\x6c\x07\x4c\x05\x4f'\
-    b'\xc5\x0c\x01\x0c\x01\x0f\xc1\x0f\xc1\x0c\x01\x0c\x01\x0c\x00\x00'\
-    b'\x00\x00\x00\x00\x01\x02\x01\x12\x01\x12\x05\x9f\xe5\xff\xe5\x22'\
-    b'\x05\x62\x05\x02\x01\x1f\xe1\x02\x01\x02\x01\x02\x01\x02\x01\x3f'\
-    b'\xe0\x00\x00\x00\x00\x00\x01\x06\x01\x04\x07\xc4\x04\x4f\xe4\x58'\
-    b'\x64\x50\x64\x44\x67\xc6\x64\x42\x64\x42\x64\x40\x64\x40\x47\xc0'\
-    b'\x44\x03\xc0\x00\x00\x00\x00\x00\x07\xff\xe7\xff\xe0\x24\x03\xff'\
-    b'\xc2\x24\x42\x24\x43\xff\xc0\x10\x07\xff\xe0\x61\x00\xc3\x01\xe6'\
-    b'\x00\x3e\x07\xe3\xe0\x00\x00\x00\x00\x00\x00\x00\x03\xff\xc3\x08'\
-    b'\x43\x08\x43\x08\x43\xff\xc3\x08\x43\x08\x43\xff\xc3\xff\xc2\x08'\
-    b'\x42\x08\x46\x08\x44\x09\xc0\x00\x00\x00\x00\x00\x00\x40\x62\x40'\
-    b'\x63\xf9\x66\x41\x64\x41\x67\xfd\x60\x41\x67\xf9\x67\xf9\x66\x49'\
-    b'\x66\x49\x66\x48\x66\x78\x60\x41\xe0\x00\x00\x00\x00\x00\x02\x0c'\
-    b'\x03\x08\x01\x19\x00\x31\x84\x60\xc3\x7f\xe0\x00\x20\x00\x01\x7f'\
-    b'\xc1\x60\x43\x60\x42\x60\x46\x7f\xc4\x60\x40\x00\x00\x00\x00\x00'\
-    b'\x00\x18\x03\xff\xe2\x00\x02\x21\x02\xff\xe2\x21\x02\x21\x02\x3f'\
-    b'\x02\x00\x02\xff\xc2\x31\x82\x1b\x06\x1e\x05\xf3\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x02\x07\xe7\xc0\x67\xc3\xcc\x41\x8a\x87\xf1\x81\xa6'\
-    b'\xe1\xaa\x23\x82\x02\x8f\xe6\x82\x64\x84\x60\x8c\x43\x99\xc0\x00'\
-    b'\x00\x00\x00\x00\x00\x06\x07\xcc\x80\xc8\xc0\xff\xe3\xda\x26\x02'\
-    b'\x06\x1f\xc4\x12\x47\x92\x40\x9f\xc0\x82\x00\x82\x40\x82\xe3\xbf'\
-    b'\x20\x00\x00\x00\x00\x00\x01\x80\x01\xff\xe3\x00\x02\x00\x04\xff'\
-    b'\xc0\x00\x03\xff\x80\x00\x80\x18\x83\x90\x80\xe0\x80\x78\xa1\x8c'\
-    b'\xa3\x04\x60\x00\x40\x00\x00\x00\x00\x08\x00\x08\x00\x08\x00\x89'\
-    b'\x00\x89\x81\x88\x81\x08\xc1\x08\x43\x08\x42\x08\x66\x08\x20\x08'\
-    b'\x00\x08\x00\xf8\x00\x00\x00\x00\x00\x00\x00\x20\x00\x20\x00\x20'\
-    b'\x00\x20\x00\x20\xe1\xff\xc7\x20\x00\x20\x00\x20\x00\x20\x00\x20'\
-    b'\x20\x20\x60\x20\x60\x3f\xc0\x00\x00\x00\x00\x00\x00\x05\x80\x04'\
-    b'\x83\xff\xc3\xff\xc2\x04\x02\x04\x43\xe4\xc2\x26\x82\x22\x82\x23'\
-    b'\x82\x23\x06\x23\x04\xe7\xa4\x0c\xe0\x00\x00\x00\x00\x00\x03\x20'\
-    b'\x03\x27\xe7\xfe\x63\x26\x63\x27\xe3\xe7\xe3\x26\x63\xe6\x63\x27'\
-    b'\xe3\x24\x67\xfc\x61\x04\x63\x2c\x66\x29\xc0\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x42\x00\xc3\x00\x81\x01\x80\x81\x10\xc3\x10\x66\x30'\
-    b'\x20\x22\x00\x62\x00\xc1\x00\x81\x81\x3f\x81\xf8\xc0\x00\x00\x00'\
-    b'\x00\x00\x01\x03\x01\x03\x01\x1f\xe7\xc3\x01\x03\x01\x1f\xe1\x00'\
-    b'\xc1\xc0\xc7\x1f\xe5\x00\xc1\x08\xc1\x0c\xc1\x00\xc7\x03\xc0\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x07\xef\xc4\xa0\xc4\xa6\x87\xe3\x04\xa1'\
-    b'\x84\xaf\xe7\xe1\x60\x81\x47\xe1\x47\xe1\x00\x81\x03\xf1\x07\x07'\
-    b'\x00\x00\x00\x00\x00\x00\x03\x04\x03\x3f\xc3\x3f\xc3\x0c\x47\x98'\
-    b'\x43\x33\xc3\x20\x03\x21\x83\x7f\xe3\x2d\xa3\x2d\xa3\x6d\x23\x4b'\
-    b'\x23\xda\xe3\x00\x00\x00\x00\x00\x00\x00\x07\xff\xe2\x24\x62\x24'\
-    b'\x43\xe6\x42\x22\x42\x22\xc3\xe2\x82\x23\x82\x21\x82\xf1\x87\xe2'\
-    b'\xc0\x26\x40\x2c\x20\x00\x00\x00\x00\x00\x00\x80\x00\x9f\xe7\xf6'\
-    b'\x60\xa6\x47\xfe\x47\xfe\x81\x06\xc7\xf6\x47\x16\x23\x16\x23\xf6'\
-    b'\x23\x17\xe3\xf6\x03\x16\x00\x00\x00\x00\x00\x00\x00\x70\x07\xc7'\
-    b'\xe0\x87\xe0\x84\x67\xf4\x67\xf4\x60\xc4\x61\xe4\x63\xb4\x62\x94'\
-    b'\x64\x84\x64\x87\xe0\x87\xe0\x84\x60\x00\x00\x00\x00\x00\x01\x02'\
-    b'\x01\x02\x03\x5f\xe2\xc4\x04\x84\x87\x88\xc1\x5b\xc2\x5d\x67\xc5'\
-    b'\x04\x4d\x04\x49\x07\x49\x25\xd9\x25\xb1\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x01\x02\x01\x02\x61\x02\x21\x02\x31\x02\x11\x02\x01\x02\x01'\
-    b'\x02\x03\x02\x73\x03\xc6\x83\x04\xc0\x18\x60\x30\x20\x00\x00\x00'\
-    b'\x00\x00\x01\x12\x41\x32\x81\x2a\xa7\xfb\xc3\x12\xc3\x2a\xa3\xfb'\
-    b'\xe5\x82\x05\x7f\xe5\x7f\xe1\x31\x41\x2d\x81\x21\xa1\x46\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x03\xff\xc0\x18\x03\x18\x81\x99\x81\x99'\
-    b'\x80\x9b\x00\x18\x07\xff\xe0\x18\x00\x18\x00\x18\x00\x18\x00\x18'\
-    b'\x00\x00\x00\x00\x00\x00\x01\x00\x81\x0c\x83\x48\xc2\xda\x44\x96'\
-    b'\x27\x84\x81\x4c\xc2\x5f\xc7\xe0\x46\x05\x05\x55\x67\x54\x25\xb4'\
-    b'\xe5\xa7\x80\x00\x00\x00\x00\x00\x01\x00\x01\x07\xe1\x07\xe7\xf4'\
-    b'\x61\x14\x61\x14\x61\x14\x61\x14\x61\x14\x61\x34\x63\x34\x62\x37'\
-    b'\xe6\x27\xe4\xe4\x64\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18'\
-    b'\x02\x18\x42\x18\x42\x18\x42\x18\x42\x18\x42\x18\x42\x18\x42\x18'\
-    b'\x42\x18\x43\xff\xc0\x00\x40\x00\x40\x00\x00\x00\x00\x00\x03\xff'\
-    b'\xc3\x18\x43\x18\x43\xff\xc3\x18\x43\x18\x43\xff\xc0\x00\x00\xd8'\
-    b'\x42\xc8\x42\xc9\x64\xc1\x24\x7f\x00\x00\x00\x00\x00\x00\x00\x10'\
-    b'\x07\xff\xe7\xff\xe4\x00\x21\xff\x80\x30\x01\xd8\xc3\x1b\x80\x6f'\
-    b'\x03\xcd\x02\x34\x80\xe4\xc7\x8c\x60\x7c\x00\x00\x00\x00\x00\x00'\
-    b'\x03\x00\xc1\x1f\x87\xdb\x00\x03\x07\xc3\x00\x1f\xe0\x03\x07\xc3'\
-    b'\x00\x1f\xc7\xd8\x46\x58\x46\x58\x47\xdf\xc7\xdf\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x11\x01\x11\x01\x11\x01\x11\x07\xff\xe1\x11\x01\x11'\
-    b'\x01\x11\x01\x11\x01\x1f\x01\x00\x01\x00\x01\xff\xe1\xff\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x07\xc3\xfe\x01\x10\xc1\x98\x80\x01\x07\xff'\
-    b'\xe6\x00\x67\xff\x61\xff\x00\x43\x00\x36\x00\x1c\x00\x77\x07\xc1'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x00\x03\xff\xc2\x00\x02\xc1\x02\x63'\
-    b'\x02\x36\x02\x1c\x02\x0c\x02\x1e\x02\x33\x02\xc1\x82\x00\x02\x00'\
-    b'\x03\xff\xe0\x00\x00\x00\x00\x00\x03\x03\x43\x03\x63\x3f\xe3\x3f'\
-    b'\xe7\xa1\x03\x21\x63\x3d\x43\x25\x43\x25\x43\xa5\xc3\xa5\x86\x7d'\
-    b'\xa0\x43\xa0\xc6\x60\x00\x00\x00\x00\x00\x00\x64\x00\x64\x00\x64'\
-    b'\x00\x64\x67\xe5\xc0\x67\x00\x64\x00\x64\x00\x64\x00\x64\x01\xe4'\
-    b'\x27\x64\x24\x64\x20\x67\xe0\x00\x00\x00\x00\x00\x00\x18\x01\x18'\
-    b'\x80\x99\x80\xd9\x00\x18\x03\xff\xc0\x18\x00\x18\x00\x18\x07\xff'\
-    b'\xe0\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x00\x00\x00\x03\x00'\
-    b'\x01\x1f\xc7\xe0\x40\x00\x47\xc0\x40\x00\x40\x0f\xc7\xc8\x40\x08'\
-    b'\x07\xc8\x06\x48\x26\x48\x27\xc8\x27\xcf\xc0\x00\x00\x00\x00\x00'\
-    b'\x00\x18\x01\x98\x81\x18\xc3\x1b\x60\x0e\x00\x78\x03\xff\xc7\x80'\
-    b'\xc1\xff\xc1\xff\xc1\x80\xc1\xff\xc1\x80\xc1\xff\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x07\xff\xe0\x24\x00\x24\x03\xff\xc3\xff\xc2\x24'\
-    b'\x42\x64\x42\xc7\xc2\x83\xc2\x00\x42\x00\x43\xff\xc2\x00\x40\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x03\xff\xe2\x08\x02\x7f\xc2\x40\x42\x40'\
-    b'\x42\x7f\xc2\x40\x42\x7f\xc2\x04\x06\x24\x86\x44\xc4\xc4\x65\x9c'\
-    b'\x00\x00\x00\x00\x00\x00\x01\x00\x81\x00\x81\x00\x87\xdf\xe1\x1f'\
-    b'\xe1\x80\x83\x88\x83\x4c\x83\x44\x85\x06\x85\x00\x81\x00\x81\x00'\
-    b'\x81\x03\x80\x00\x00\x00\x00\x00\x01\x18\x01\x1f\xc1\x24\x07\x84'\
-    b'\x03\x3f\xe3\x0b\x03\x9f\xe5\xb1\x05\x31\x05\x5f\xe1\x11\x01\x1f'\
-    b'\xe1\x11\x01\x1f\xe0\x00\x00\x00\x00\x00\x00\x20\x00\x30\x00\x18'\
-    b'\x00\x0c\x00\x44\x03\x40\xc2\x40\x42\x40\x42\x40\x66\x40\x26\x41'\
-    b'\xa4\x41\x80\x41\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff'\
-    b'\xc3\x18\xc3\xff\xc3\xff\xc3\x18\xc3\xff\xc0\xc3\x01\x81\x87\x42'\
-    b'\x60\x42\x00\x42\x00\xc2\x03\x82\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x01\xff\x81\x00\x81\x00\x81\x00\x81\xff\x80\x00\x07\xe7\xe7\xe7'\
-    b'\xe6\x24\x66\x24\x66\x24\x67\xe7\xe7\xe7\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x10\x00\x10\x00\x18\x07\xff\xe1\x81\x00\x81\x00\xc3\x00\x42'\
-    b'\x00\x66\x00\x3c\x00\x3c\x00\x6e\x01\xc3\x87\x00\xe4\x00\x00\x00'\
-    b'\x00\x00\x00\x87\xe7\xf4\x67\xf4\x60\x84\x67\xe7\xe6\x24\x67\xe4'\
-    b'\x66\x24\x66\x27\xe7\xe4\x60\x84\x67\xfc\x60\x88\x60\x88\xc0\x00'\
-    b'\x00\x00\x00\x00\x03\xff\xe3\xff\xe2\x00\x63\xff\xe3\xff\xe2\x04'\
-    b'\x02\x04\x02\xff\xe2\x84\x62\x84\x62\xff\xe6\x84\x66\xff\xe4\xff'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x8f\xc0\x8f\xc7\xe8\x40\x88\x47\xf9'\
-    b'\xc2\x48\x02\x4f\xe7\xe8\x67\xea\x61\x8a\x47\xe9\xc1\x89\x81\x89'\
-    b'\xc1\x8b\x60\x00\x00\x00\x00\x00\x00\x10\x86\x19\x03\x7f\xe0\x04'\
-    b'\x00\x3f\xc0\x20\x47\x3f\xc1\x20\x41\x3f\xc1\x20\x41\x3f\xc1\x3f'\
-    b'\xc3\xc0\x04\x7f\xe0\x00\x00\x00\x00\x00\x00\x10\x00\x18\x07\xff'\
-    b'\xe0\x24\x01\x25\x83\x24\xc6\x24\x60\x40\x00\xff\x81\x81\x06\x63'\
-    b'\x00\x3e\x00\x3e\x03\xc3\xe0\x00\x00\x00\x00\x00\x01\x06\x01\x7f'\
-    b'\xe1\x06\x05\x3f\xc5\x86\x05\x7f\xe5\x00\x05\x3f\xc1\x20\x41\x3f'\
-    b'\xc1\x20\x41\x3f\xc1\x20\x41\x21\xc0\x00\x00\x00\x00\x00\x01\x83'\
-    b'\x03\x83\x07\x9f\xe7\xc3\x05\x83\x05\xbf\xe5\x80\xc1\xc0\xc1\xff'\
-    b'\xe7\x80\xc5\x88\xc1\x8c\xc1\x80\xc1\x83\x80\x00\x00\x00\x00\x00'\
-    b'\x01\x10\x01\x13\xc1\x1e\x07\xd0\x21\x10\x61\x1f\xc1\x00\x01\xdf'\
-    b'\xc7\x10\x45\x10\x41\x1f\xc1\x10\x41\x1f\xc7\x1f\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x03\xff\xc0\x00\x00\x00\x00\x00\x07\xff\xe0\x18'\
-    b'\x00\x18\x00\x9b\x01\x99\x81\x18\xc3\x18\x66\x18\x20\x78\x00\x00'\
-    b'\x00\x00\x00\x00\x01\x00\x01\x0f\xc3\x48\x42\x48\x44\x88\x47\x8f'\
-    b'\xc1\x48\x42\x68\x47\xe8\x46\x2f\xc4\x48\x47\xe8\x44\xa8\x44\xbf'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x10\x00\x20\x07\xff\xe0\x40\x00\xc0'\
-    b'\x01\xff\xc3\x80\xc6\xff\xc0\xff\xc0\x80\xc0\xff\xc0\x80\xc0\x80'\
-    b'\xc0\x87\xc0\x80\x00\x00\x00\x00\x00\x30\x00\x30\x63\xff\xc0\x31'\
-    b'\x87\xff\xe0\x1c\x00\x70\x01\xff\xc6\x40\x00\x40\x00\x7f\xc0\x00'\
-    b'\xc0\x00\xc0\x0f\x80\x00\x00\x00\x00\x00\x00\x00\x03\xff\xe0\x08'\
-    b'\x00\x08\x00\x08\x01\x08\x01\x0f\xc1\x08\x01\x08\x01\x08\x01\x08'\
-    b'\x01\x08\x01\x08\x07\xff\xe0\x00\x00\x00\x00\x00\x03\x02\x01\x07'\
-    b'\x07\xcd\x80\x18\xc7\xf7\xa0\x00\x00\x1f\xe7\xd5\x20\x15\x27\xdf'\
-    b'\xe6\x5f\xe6\x55\x27\xd5\x27\xd5\x60\x00\x00\x00\x00\x00\x00\x20'\
-    b'\x00\x30\x80\x19\x80\x09\x03\x43\x03\x42\xc2\x46\x42\x4c\x46\x48'\
-    b'\x66\x50\x24\x60\xa0\xc1\x83\xc1\x86\x7f\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x84\x01\x86\x01\x00\x01\x7f\xe3\x06\x07\x06\x05\x06\x05\x06'\
-    b'\x01\x3f\xc1\x06\x01\x06\x01\x06\x01\x06\x01\x7f\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x06\x07\xdf\xc0\x86\x41\xbf\xe3\x06\x43\xdf\xc0\xdf'\
-    b'\xc0\x86\x06\xbf\xc2\x86\x03\xff\xe1\x06\x03\xe0\x06\x7f\xe0\x00'\
-    b'\x00\x00\x00\x00\x01\x8c\x03\x88\x07\x8f\xe7\xd6\xa5\xb4\xa5\xa5'\
-    b'\xa5\x85\x21\xc9\x21\xdb\x27\xb2\x65\xa6\x61\x8c\x61\x98\x41\x83'\
-    b'\xc0\x00\x00\x00\x00\x00\x00\x86\x01\xff\xe1\x7f\xe3\x06\x03\x7f'\
-    b'\xe7\x66\x67\x66\x67\x7f\xe3\x7f\xe3\x24\x03\x34\x03\x0c\x03\x3f'\
-    b'\x03\xe1\xe0\x00\x00\x00\x00\x00\x00\x10\x00\x10\x00\x1f\xc0\x10'\
-    b'\x00\x10\x03\xff\xc3\x00\xc3\x00\xc3\x00\xc3\xff\xc0\x00\x03\x44'\
-    b'\xc2\x66\x66\x22\x20\x00\x00\x00\x00\x00\x00\x80\x01\xbf\xc1\x20'\
-    b'\xc1\x20\xc3\x3f\xc7\x06\x05\x06\x05\x7f\xe1\x06\x01\x0f\x01\x1f'\
-    b'\x81\x36\xc1\x66\x61\x46\x00\x00\x00\x00\x00\x00\x00\x02\x07\xc2'\
-    b'\x01\x1f\xe1\x14\x22\x15\x02\x0f\xe7\xd9\x07\x4f\xe7\x4f\xe3\x49'\
-    b'\x03\x4f\xe3\xc9\x03\x4f\xe3\x0f\xe0\x00\x00\x00\x00\x00\x00\x42'\
-    b'\x07\xff\xe7\xff\xe0\x5a\x00\x18\x01\xff\x81\x18\x81\x18\x81\x10'\
-    b'\x87\xff\xe0\x34\x00\x66\x01\x83\x87\x00\xe0\x00\x00\x00\x00\x00'\
-    b'\x02\xd2\x02\xf2\x02\xc6\x07\xff\xe1\xc4\x43\xf4\x46\xcc\x40\x8e'\
-    b'\xc7\xf2\x81\x23\x82\x61\x01\xc3\x81\xe6\xc7\x2c\x60\x00\x00\x00'\
-    b'\x00\x00\x02\x01\x83\x09\xc7\xbe\xa0\x14\xa7\x94\x80\x3f\xe0\x00'\
-    b'\x87\xbe\xa0\x26\xe7\xa6\xc4\xbe\xe4\xa6\xa7\xbf\x67\x86\x60\x00'\
-    b'\x00\x00\x00\x00\x00\x06\x83\xff\xe3\xff\xe2\xfa\x42\xfa\x42\xfa'\
-    b'\x82\xfb\x82\x89\x26\xfb\xa0\x06\xc2\xd8\x82\xc8\x46\xc1\x64\xff'\
-    b'\x00\x00\x00\x00\x00\x00\x01\x10\x80\x99\x87\xff\xe7\xff\xe6\x00'\
-    b'\x67\xff\xe1\x81\x81\xff\x81\xff\x81\x81\x81\xff\x80\x24\x00\x44'\
-    b'\x27\x87\xe0\x00\x00\x00\x00\x00\x00\x81\x07\xff\xe0\x81\x00\xff'\
-    b'\x00\x81\x00\xff\x00\x81\x07\xff\xe7\xff\xe1\x99\x87\xff\xe4\xff'\
-    b'\x20\x18\x03\xff\xc0\x00\x00\x00\x00\x00\x00\x02\x07\xe2\x06\x22'\
-    b'\x06\x2f\xe7\xe2\x27\xe2\x26\x22\x26\x22\x27\xe6\x26\x24\x66\x24'\
-    b'\x66\x7c\x67\xc8\x40\x11\xc0\x00\x00\x00\x00\x00\x00\x40\x00\xff'\
-    b'\x81\xff\x81\xc3\x00\x76\x00\x3c\x07\xe7\xe7\x00\x41\xff\x81\xff'\
-    b'\x81\x00\x81\x00\x81\xff\x81\xff\x80\x00\x00\x00\x00\x00\x00\x07'\
-    b'\x81\xfc\x00\x18\x07\xff\xe0\x3c\x00\xdb\x03\x99\xe4\x18\x60\x30'\
-    b'\x07\xff\xe0\x43\x00\xf6\x00\x1e\x07\xe3\xc0\x00\x00\x00\x00\x00'\
-    b'\x00\xc0\x80\x80\x81\x80\x81\x7f\xe3\x7f\xe3\x00\x85\x30\x85\x18'\
-    b'\x81\x08\x81\x0c\x81\x00\x81\x00\x81\x00\x81\x07\x80\x00\x00\x00'\
-    b'\x00\x00\x01\x80\x01\x80\x01\xff\xe1\xff\xe1\x80\x01\x80\x01\xff'\
-    b'\xc1\xff\xc0\x00\x40\x00\x47\xfe\xc0\x00\xc0\x00\x80\x0f\x80\x00'\
-    b'\x00\x00\x00\x00\x00\x82\x01\x92\x01\x32\x03\x3f\xe3\x62\x07\x42'\
-    b'\x07\x42\x07\x02\x03\x7f\xe3\x02\x03\x02\x03\x02\x03\x02\x03\x02'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x24\x07\xff\xc0\x24\x43\xff\xc3\xff'\
-    b'\xe1\x84\x67\x05\xc1\xff\x81\x00\x81\xff\x81\xff\x81\xff\x80\x00'\
-    b'\x07\xe7\xe4\x00\x00\x00\x00\x00\x00\x19\x00\x19\x87\xff\xe7\xff'\
-    b'\xe1\x18\x81\x1c\x81\x9d\x80\x9f\x00\x3a\x00\xdb\x03\x99\x86\x18'\
-    b'\xc4\x18\x60\x78\x00\x00\x00\x00\x00\x00\x00\x18\x03\xff\xe2\x00'\
-    b'\x02\x08\x02\x0c\x02\x06\x02\x12\x42\x50\x42\xd0\x42\xd0\x62\x90'\
-    b'\x22\x90\xa6\x10\x84\x1f\x00\x00\x00\x00\x00\x00\x00\x08\x07\xff'\
-    b'\xc0\x18\x01\xff\x81\x80\x81\xff\x81\x80\x81\xff\x81\x80\x81\xff'\
-    b'\x81\x80\x87\xff\xe0\x43\x07\xc1\xc0\x00\x00\x00\x00\x00\x03\x02'\
-    b'\x01\x3f\xe7\xff\xe0\x02\x07\xdf\xc0\x00\x00\x1f\xe7\xdf\xe0\x15'\
-    b'\xa7\xd5\x86\x45\x86\x4d\x87\xc9\xa7\xf1\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x40\x66\x48\x62\x59\x63\x51\x60\x41\x67\xf9\x60\x41\x60\x41'\
-    b'\x60\x41\x67\xfd\x60\xc1\x60\x80\x61\x80\x63\x01\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x10\x03\xff\xc7\xff\xe0\x10\xc3\xff\xc0\x10\x03\xff'\
-    b'\xc0\x10\x07\xff\xe3\xff\xc3\x00\xc3\xff\xc3\x00\xc3\xff\xc0\x00'\
-    b'\x00\x00\x00\x00\x01\x82\x03\xf7\xe6\x4c\x84\x08\x83\xff\xc0\x18'\
-    b'\xc1\xff\xc3\xff\xc2\x18\x03\xff\xc0\x38\x40\xd8\x43\x9b\xc6\x18'\
-    b'\x00\x00\x00\x00\x00\x00\x01\x81\x01\x01\x01\x2f\xe2\x61\x06\xc1'\
-    b'\x07\x8f\xe1\xef\xe3\x20\x07\xef\xe6\x08\x60\xa8\x62\xa8\x66\xbf'\
-    b'\xe4\x88\x60\x00\x00\x00\x00\x00\x00\x00\x03\xff\xc3\x18\xc3\xff'\
-    b'\xc3\x18\xc3\x18\xc3\xff\xc0\x18\x07\xff\xe7\xff\xe0\x7e\x00\xdb'\
-    b'\x03\x99\xe6\x18\x60\x18\x00\x00\x00\x00\x00\x08\x02\x18\x03\x1f'\
-    b'\xc1\xbf\xc0\x30\xc0\x64\x80\x04\x00\x84\x01\x86\x01\x8e\x03\x0b'\
-    b'\x03\x19\x86\x30\xc4\xe0\x60\x00\x00\x00\x00\x00\x02\x11\x83\x7f'\
-    b'\xe1\x11\x80\x11\x84\xff\xe3\x04\x00\x7f\xe0\x44\x61\x55\xe1\x55'\
-    b'\xe3\x55\xe2\x5f\xe6\x40\x64\x40\xe0\x00\x00\x00\x00\x00\x03\xff'\
-    b'\xc0\x18\x07\xff\xe4\x18\x25\xff\xa0\x18\x01\xff\x80\x00\x07\xff'\
-    b'\xe0\x10\x03\xff\xc2\x24\x42\x24\x42\x25\xc0\x00\x00\x00\x00\x00'\
-    b'\x01\x03\x01\x03\x03\x45\x82\xcc\xc4\x98\x67\x97\xa1\x47\x82\x40'\
-    b'\x07\xef\xc6\x08\x44\x48\x47\x48\x45\xef\xc5\x88\x40\x00\x00\x00'\
-    b'\x00\x00\x01\x80\x01\xef\xe3\x22\x26\x42\x27\xf5\xe2\x90\x02\x97'\
-    b'\x83\xf7\xe2\x97\xe3\xf1\x82\x9f\xe2\x91\x82\x91\x86\x71\x80\x00'\
-    b'\x00\x00\x00\x00\x00\x38\x47\xe0\x40\x42\x40\x42\x47\xfa\x47\xfa'\
-    b'\x40\xc2\x41\xe2\x41\x72\x43\x5a\x46\x4a\x44\x40\x40\x40\x40\x41'\
-    b'\xc0\x00\x00\x00\x00\x00\x02\x00\xc3\x3f\x81\x32\x00\x02\x04\x02'\
-    b'\x03\x7f\xe0\x02\x00\x02\x01\x3f\xc1\x20\x43\x20\x42\x20\x46\x3f'\
-    b'\xc4\x3f\xc0\x00\x00\x00\x00\x00\x02\x10\x03\xbf\xc0\x26\xc0\x8e'\
-    b'\x07\x39\xc4\x20\x41\xff\x81\x00\x81\xff\x81\xff\x81\x00\x81\xff'\
-    b'\x80\x42\x03\xc1\xe0\x00\x00\x00\x00\x00\x00\x10\x00\x30\x03\xff'\
-    b'\xc2\x00\x42\x00\x42\x00\x42\x00\x43\xff\xc2\x00\x42\x00\x42\x00'\
-    b'\x42\x00\x43\xff\xc2\x00\x40\x00\x40\x00\x00\x00\x00\x18\x03\xff'\
-    b'\xc2\x00\x40\x30\x07\xff\xe0\xc6\x00\x7c\x01\xf7\x83\x18\x47\xff'\
-    b'\xe0\x3c\x00\x5a\x01\x99\x87\x18\xe0\x18\x00\x00\x00\x00\x01\x80'\
-    b'\x01\x8f\xc7\xe8\x47\xef\xc1\x88\x41\x88\x47\xef\xc1\x88\x41\x0f'\
-    b'\xc1\x8f\xc1\x45\x02\x6d\x06\x09\x24\x39\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x10\x00\x30\x00\x20\x07\xff\xe0\x41\x00\x41\x00\xc3\x00\x82'\
-    b'\x01\xc6\x00\x74\x00\x1c\x00\x3f\x00\xe1\x83\x80\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x40\x27\x57\xe7\x54\x06\xd4\x06\x44\x07\xf7\xe6\x44'\
-    b'\x46\xe4\x47\xd4\x47\x54\x46\x44\x46\x4c\x47\xe8\x40\x08\x40\x00'\
-    b'\x00\x00\x00\x00\x00\x04\x07\xc4\x00\x44\x00\x4f\xe0\x48\x40\x48'\
-    b'\x47\xdc\xc6\x14\x86\x06\x86\x03\x86\x03\x06\x03\x87\xc6\xc7\x18'\
-    b'\x60\x00\x00\x00\x00\x00\x00\xc3\x07\xff\xe0\xc3\x00\xc3\x00\xff'\
-    b'\x00\x18\x03\xff\xc2\x18\xc2\x18\xc3\xff\xc0\x18\x07\xff\xe0\x18'\
-    b'\x00\x18\x00\x00\x00\x00\x00\x00\x07\xf0\x07\xff\xc1\x40\x47\xe0'\
-    b'\x45\x60\x45\x60\x45\x6f\xc5\x68\x46\x68\x04\x28\x07\xe8\x24\x28'\
-    b'\x27\xe8\x24\x2f\xe0\x00\x00\x00\x00\x00\x01\x3f\xc1\x3f\xc1\x30'\
-    b'\x47\xff\xc1\x30\x41\x3f\xc1\x00\x01\xff\xe7\x02\x05\x12\x01\x33'\
-    b'\xc1\x32\x01\x7a\x07\xc7\xe0\x00\x00\x00\x00\x00\x00\x60\x00\xff'\
-    b'\x81\xc1\x83\x63\x00\x3c\x00\xff\x07\x81\xe0\x18\x07\xff\xe0\x18'\
-    b'\x00\xdb\x01\x99\x83\x18\xc2\x38\x40\x00\x00\x00\x00\x00\x01\x80'\
-    b'\x21\x7c\x21\x11\x23\x31\x23\x3d\x27\x3d\x27\x65\x23\x6d\x23\xf9'\
-    b'\x23\x09\x23\x11\x23\x30\x23\x20\x23\x61\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x30\x00\x10\x07\xff\xe0\x00\x00\xc3\x01\x81\x87\x00\xc0\x83'\
-    b'\x40\xc2\x00\x66\x00\x1c\x00\x3e\x00\xe3\x87\x80\xe4\x00\x00\x00'\
-    b'\x00\x00\x00\x20\x00\x20\x07\xff\xe0\x60\x00\x40\x00\x40\x00\xff'\
-    b'\x80\xa1\x81\x91\x01\x1a\x03\x0e\x06\x0e\x04\x33\x80\xe0\xe0\x00'\
-    b'\x00\x00\x00\x00\x01\x00\x01\x1f\xc1\x00\xc7\xc1\x83\x43\x02\x42'\
-    b'\x02\x7f\xe2\x7f\xe6\xc2\x03\x82\x01\x82\x01\xc2\x03\x62\x06\x0e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x30\x00\x20\x03\xff\xc2\x00\x42\x00'\
-    b'\x42\x7e\x42\x7e\x42\x42\x42\x42\x42\x42\x42\x7e\x42\x00\x42\x00'\
-    b'\x42\x01\xc0\x00\x00\x00\x00\x00\x01\x08\xc1\x08\x81\x3f\xe1\x22'\
-    b'\x27\xff\xe1\x22\x21\x3f\xe1\x00\x01\x1f\xc1\x10\x43\x9f\xc6\x10'\
-    b'\x40\x1f\xc0\x1f\xc0\x00\x00\x00\x00\x00\x03\x00\x01\x1f\xc7\xc2'\
-    b'\x40\x12\x47\xd6\x40\x14\x40\x08\x47\xf9\xc0\x02\x07\xdf\x46\x5d'\
-    b'\x66\x5c\xa7\xec\xa7\xcf\x80\x00\x00\x00\x00\x00\x00\x18\x00\x3f'\
-    b'\x80\xe0\x83\xc1\x80\x26\x00\x3c\x03\xe0\x00\x1f\xc0\x7f\xc1\xc0'\
-    b'\x81\x63\x00\x26\x00\x78\x07\xc0\x04\x00\x00\x00\x00\x00\x00\x18'\
-    b'\x00\x18\x00\x99\x81\x98\x81\x18\x43\x18\x62\x18\x06\x18\x80\x19'\
-    b'\x80\x1b\x00\x0e\x00\x38\x00\xf0\x07\x80\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x01\x81\xff\x01\x00\x01\x00\x01\x00\x01\xff\x81\xc0\x81\x41'\
-    b'\x81\x61\x03\x32\x03\x1e\x02\x1e\x06\x73\x84\xc0\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x03\x83\xfe\x00\x20\x00\x46\x01\x8c\x01\xf9\x00\x21'\
-    b'\x00\xc0\x83\xff\xc0\x18\x40\x9b\x01\x99\x87\x18\xc4\x38\x40\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x47\xf8\x40\x82\x40\x82\x41\xf2\x41\xf2'\
-    b'\x43\x12\x43\x32\x45\xa2\x40\xa2\x40\x42\x40\xc0\x41\x80\x46\x01'\
-    b'\xc0\x00\x00\x00\x00\x00\x00\x06\x86\x06\xc3\x06\x00\x7f\xe0\x06'\
-    b'\x00\x0f\x07\x0e\x81\x16\xc1\x36\x41\x66\x61\x46\x01\x06\x03\xc0'\
-    b'\x04\x7f\xe0\x00\x00\x00\x00\x00\x01\x08\x01\x08\x01\x1f\xe1\x10'\
-    b'\x67\xf0\x61\x24\x61\x02\x61\x02\x61\x00\x61\x07\x63\x9c\x66\x00'\
-    b'\x40\x00\x40\x07\xc0\x00\x00\x00\x00\x00\x01\x82\x03\xf7\xe6\x4d'\
-    b'\x84\x00\x00\x18\x03\xff\xc0\x18\x07\xff\xe0\x01\x03\xff\xe0\x01'\
-    b'\x01\x81\x00\xc1\x00\x1f\x00\x00\x00\x00\x00\x00\x00\x18\x00\x3c'\
-    b'\x00\x66\x00\xdb\x83\x08\xe7\xff\xa1\xff\x80\x03\x00\x02\x01\xff'\
-    b'\xc1\x00\xc1\x00\xc1\xff\xc1\xff\xc0\x00\x00\x00\x00\x00\x00\x10'\
-    b'\x00\x1f\xe3\xff\xe2\x11\x42\xfe\x02\x1f\xe2\x00\x02\xff\xc2\xff'\
-    b'\xc2\xc4\x42\xff\xc2\x24\x46\xa0\xe5\x3f\xa0\x00\x00\x00\x00\x00'\
-    b'\x02\x00\x07\xf7\xc4\x84\x41\x87\xc7\xfc\x41\x44\x43\xf7\xc2\x44'\
-    b'\x46\x47\xc7\xf7\xc2\x42\x83\xf2\x82\x46\xa3\xf4\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x10\x07\xff\xe4\x00\x25\xff\xa1\x34\x82\xa7\x85\xc3'\
-    b'\x01\xbf\xc6\x00\x63\xff\xc3\xff\xc0\xdb\x03\x99\xc6\x38\x40\x00'\
-    b'\x00\x00\x00\x00\x01\x80\x01\x8f\xc3\xc0\x46\x6f\xc4\x00\x43\xc0'\
-    b'\x41\x1f\xe7\xe9\x41\x09\x45\x61\xc7\x47\x83\x0d\x41\xd9\x27\x87'\
-    b'\x00\x00\x00\x00\x00\x00\x03\xf8\x43\xf8\x42\x1a\x42\x1a\x43\xfa'\
-    b'\x43\xfa\x41\x02\x41\xfa\x41\xfa\x41\x1a\x41\x12\x43\x10\x42\x10'\
-    b'\x44\x71\xc0\x00\x00\x00\x00\x00\x00\x1f\xe7\xdf\xe7\xc2\x01\x1f'\
-    b'\xc1\x10\x41\x1f\xc1\x1f\xc1\x10\x41\x1f\xc1\x10\x41\xdf\xc7\x00'\
-    b'\x00\x0c\x80\x38\x60\x00\x00\x00\x00\x00\x00\x00\x01\xff\x81\x00'\
-    b'\x81\x00\x81\xff\x80\x00\x07\xff\xe0\x80\x01\x80\x01\xff\x80\x00'\
-    b'\x80\x00\x80\x00\x80\x0f\x80\x00\x00\x00\x00\x00\x00\xc3\x00\x62'\
-    b'\x03\xff\xe0\x10\x03\xff\xc0\x20\x07\xff\xe0\xff\x81\xff\x86\xff'\
-    b'\x80\x80\x80\xff\x80\x80\x80\xff\x80\x00\x00\x00\x00\x00\x00\x1f'\
-    b'\xc7\xff\xc6\x50\x46\xdf\xc6\x9f\xc7\x90\x46\xdf\xc6\x5f\xc6\x52'\
-    b'\x06\x53\x47\xd1\x86\x11\x86\x12\xc6\x1e\x66\x00\x00\x00\x00\x00'\
-    b'\x00\x98\x01\x98\x01\xff\xc3\xff\xc2\x18\x00\x18\x07\xff\xe0\x00'\
-    b'\x01\xff\xc1\xff\xc1\x00\xc1\x00\xc1\xff\xc1\xff\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x10\x07\xff\xe4\xa5\x44\xf9\xc5\x78\x85\x10\xc5\xef'\
-    b'\x64\x80\x04\xbf\xe4\xbf\xe5\x92\x84\x32\xc4\x62\x64\x0e\x20\x00'\
-    b'\x00\x00\x00\x00\x00\x07\xc3\xfc\x00\x99\x80\x9b\x07\xff\xe0\x7e'\
-    b'\x01\x99\xc6\x18\x61\xff\x81\x18\x81\x18\x81\xff\x81\x18\x81\xff'\
-    b'\x81\x00\x80\x00\x00\x00\x00\x00\x43\xff\xc2\x0c\x02\x0c\x03\xec'\
-    b'\x02\x2f\xe2\x28\x82\x28\x83\xe8\x82\x08\x82\x08\x86\x08\x86\x10'\
-    b'\x84\x10\x80\x00\x00\x00\x00\x00\x00\x03\x07\xe3\x04\x86\x87\xcc'\
-    b'\xc4\x9f\xa7\xc3\x04\x8f\xc4\x8b\x47\xeb\x40\xaf\xc7\xa3\x07\x27'\
-    b'\x8a\x2c\xc0\xd8\x60\x00\x00\x00\x00\x00\x00\xc0\x07\x9f\xc1\x18'\
-    b'\x41\x18\x47\xff\xc1\x00\x01\x80\x01\xdf\xe3\x43\x03\x03\x05\x1f'\
-    b'\xc1\x03\x01\x03\x01\x1f\xe0\x00\x00\x00\x00\x00\x00\x18\x07\xff'\
-    b'\xc7\xff\xc6\x00\x41\xff\x81\xff\x80\x00\x07\xff\xe0\x64\x00\x44'\
-    b'\x00\x44\x00\xc4\x21\x84\x27\x07\xe0\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x03\xff\xc0\x00\xc0\x03\x00\x06\x00\x08\x00\x08\x00\x08\x00\x08'\
-    b'\x00\x08\x00\x08\x00\x08\x00\x08\x00\x78\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x43\xc7\xff\x40\x43\x07\xff\xe0\x43\x07\xfd\x60\x41\x43\xf9'\
-    b'\x43\xf9\x42\x49\x83\xf9\x80\x41\xa7\xfb\xa0\x42\x60\x00\x00\x00'\
-    b'\x00\x00\x01\x09\x81\x3f\xe1\x09\x87\xff\xc1\x09\x83\x7f\xe3\x82'\
-    b'\x03\xff\xc7\x22\x45\x3f\xc5\x22\x41\x7f\xe1\x20\x41\x21\xc0\x20'\
-    b'\x00\x00\x00\x00\x01\x0c\x81\x3f\xe1\x0c\x87\xcc\x81\x1f\xc1\x90'\
-    b'\x43\x9f\xc3\x50\x43\x5f\xc5\x02\x05\x3f\xe1\x05\x01\x0c\xc1\x38'\
-    b'\x60\x00\x00\x00\x00\x00\x00\x80\x06\xaf\xe2\x81\x07\xf7\xe1\x84'\
-    b'\x62\xe7\xe6\xa7\xe0\x24\x60\xa7\xe7\xf4\x61\x87\xe1\x47\xe3\x26'\
-    b'\xc6\x0c\x60\x00\x00\x00\x00\x00\x00\xc0\x00\xfe\x03\x04\x07\xff'\
-    b'\xc3\x08\x43\xff\xc3\xff\xc1\xd8\x87\x39\x80\xef\x07\x1d\x00\x6c'\
-    b'\x83\x8c\xc4\x38\x20\x00\x00\x00\x00\x00\x01\x04\x01\x0f\xc1\x0f'\
-    b'\xc7\xd8\xc1\x15\x81\x83\x03\x87\x83\x5c\xe3\x40\x05\x1f\xc5\x18'\
-    b'\x41\x18\x41\x1f\xc1\x1f\xc0\x00\x00\x00\x00\x00\x03\x12\x01\xbf'\
-    b'\xe0\x22\x06\x7f\xc1\xa2\x00\x3f\xc1\x3f\xc3\x3f\xe6\x3f\xe0\x18'\
-    b'\x07\xff\xe0\x18\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x89'\
-    b'\x01\x89\x01\x7f\xe1\x09\x03\x7f\xe7\x10\x05\x3f\xc5\x32\x41\x32'\
-    b'\x41\x7f\xc1\xd2\x41\x1f\xc1\x12\x41\x12\xc0\x00\x00\x00\x00\x00'\
-    b'\x01\x06\x01\x04\x03\x4f\xc2\xc8\xc4\x9c\x87\x87\x01\x43\x02\x4c'\
-    b'\xe7\xd8\x24\x07\x04\x41\x87\x5c\x05\xa7\x85\x80\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x82\x07\xfa\x00\x96\x00\xa7\xe7\xf4\x40\xc4\x41\xec'\
-    b'\x43\x6e\xc4\xc2\x80\xd3\x83\xf1\x07\xc3\x80\xc6\xc3\x8c\x60\x00'\
-    b'\x00\x00\x00\x00\x00\x18\x07\xff\xe7\xff\xe0\xc1\x01\xbf\xc3\xe0'\
-    b'\x41\xff\x81\xff\x81\x00\x81\xff\x81\x00\x81\xff\x81\x00\x81\x07'\
-    b'\x80\x00\x00\x00\x00\x00\x00\x80\x00\x8f\xc7\xe8\x41\x8f\xc1\xc8'\
-    b'\x42\xef\xc6\xa8\x44\x88\x40\x8f\xc0\x10\x03\xd8\xc2\xcc\x46\xc1'\
-    b'\x64\x7f\x00\x00\x00\x00\x00\x00\x00\x88\x01\x9f\x01\x61\x01\x7f'\
-    b'\xc3\x66\x47\x64\x45\x7f\xc5\x1c\x41\x77\x81\x1b\x81\x76\xc1\x1e'\
-    b'\x41\x72\x61\x0e\x20\x00\x00\x00\x00\x00\x01\x82\x00\x82\x07\xf6'\
-    b'\x07\xf7\xe1\x04\x41\x04\x41\xec\x41\x2e\xc3\x22\x83\x23\x82\x21'\
-    b'\x02\x23\x86\x26\xc4\xec\x60\x00\x00\x00\x00\x00\x00\x10\x86\x19'\
-    b'\x83\x01\x00\x3f\xc0\x06\x00\x06\x07\x7f\xe1\x04\x01\x07\x01\x0d'\
-    b'\x81\x38\xc1\x20\x43\xc0\x04\x7f\xe0\x00\x00\x00\x00\x00\x00\x02'\
-    b'\x07\xbf\xe4\x82\x04\x9f\xc4\x82\x04\xbf\xe7\x80\x04\x9f\xc4\x90'\
-    b'\x44\x9f\xc7\x90\x44\x9f\xc4\x10\x40\x11\xc0\x00\x00\x00\x00\x00'\
-    b'\x01\xff\x81\x00\x81\xff\x81\xff\x80\x00\x03\xff\xc7\xff\xe5\xff'\
-    b'\xa0\x18\x01\xdb\x83\xff\xc7\xff\xe0\xc1\x01\xff\x80\x00\x40\x00'\
-    b'\x00\x00\x00\x00\x07\xff\xe0\x18\x00\x18\x07\xff\xe6\x18\x67\x9e'\
-    b'\x66\x79\xe6\x18\x66\x9e\x66\xdb\x66\x59\x66\x18\x66\x19\xc0\x00'\
-    b'\x00\x00\x00\x00\x03\xff\xc0\x18\x07\xff\xe4\x18\x25\xff\xa0\x18'\
-    b'\x01\xff\x80\x00\x03\xff\xc0\x00\x41\xff\xc1\xff\xc0\x00\x43\xff'\
-    b'\xc0\x00\x00\x00\x00\x00\x03\xff\xc0\x18\x07\xff\xe4\x18\x25\xff'\
-    b'\xa0\x18\x01\xff\x80\x00\x03\xff\xc3\x18\xc3\x18\xc3\xff\xc3\x18'\
-    b'\xc3\xff\xc3\x00\xc0\x00\x00\x00\x03\xff\x83\xff\x82\x02\x82\xfe'\
-    b'\x82\x10\x82\x10\x82\xfe\x82\x92\x82\x92\x82\xfe\x82\x10\x86\x12'\
-    b'\xb6\x7f\x64\xe1\x60\x00\x00\x00\x00\x00\x03\xff\xc0\x18\x07\xff'\
-    b'\xe5\xff\xa0\x18\x01\xff\x87\xe4\x00\x6f\xe1\x8f\xc7\xff\xe1\xa2'\
-    b'\x02\x8f\xc4\x86\x43\x9d\xc0\x00\x00\x00\x00\x00\x01\xff\x81\x00'\
-    b'\x81\xff\x81\x00\x81\xff\x83\xff\x23\xff\xc7\xff\xe0\x1c\x00\xff'\
-    b'\xc7\x80\xc0\xff\xc0\x80\xc0\xff\xc0\x00\x00\x00\x00\x00\x00\x10'\
-    b'\x07\xff\xe7\xff\xe4\x46\x21\xff\x80\x46\x03\xff\xc0\x46\x07\xff'\
-    b'\xe0\xc3\x03\x38\xc6\x06\x60\xf0\x00\x3f\x00\x00\x00\x00\x00\x00'\
-    b'\x02\x04\x03\x04\x01\x7f\xe0\x00\x04\x3f\xc3\x20\x40\x20\x40\x20'\
-    b'\x40\xbf\xc1\x86\x01\x36\xc3\x26\x42\x46\x66\x5c\x00\x00\x00\x00'\
-    b'\x00\x00\x02\x00\x03\x3f\xc1\x20\xc0\x3f\xc4\x20\xc3\x20\xc0\x3f'\
-    b'\xc0\x00\x01\x7f\xc1\x4b\x43\x4b\x42\x4b\x46\x4b\x44\xff\xe0\x00'\
-    b'\x00\x00\x00\x00\x02\x00\x03\x7f\xc1\x60\x40\x7f\xc4\x60\x43\x60'\
-    b'\x40\x7f\xc0\x0b\x01\x4b\x01\x6b\x63\x2b\xc2\x2b\x86\x0b\x04\xff'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x82\x07\xf2\x07\xf7\xe0\x84\x07\xec'\
-    b'\x06\x2f\xc7\xe0\x46\x20\x86\x21\x07\xe3\x00\x86\x07\xf4\x00\x8c'\
-    b'\x20\x87\xe0\x00\x00\x00\x00\x00\x01\x04\x01\x04\x01\x04\x07\x9f'\
-    b'\xc5\xc4\x45\x44\x45\x04\x45\x7f\xe1\x06\x01\x0e\x01\x09\x01\x19'\
-    b'\x81\x30\xc1\x60\x60\x00\x00\x00\x00\x00\x00\x00\x47\xbf\xc4\x82'\
-    b'\x44\x9a\xc4\xbf\xe4\x84\x07\x8c\x04\xbf\xe4\x88\x04\x9f\xc7\x94'\
-    b'\xc4\x27\x84\x63\x00\x1c\xe0\x10\x20\x00\x00\x00\x00\x06\x06\x06'\
-    b'\x03\x0f\x01\x19\x80\x30\xc0\x66\x60\x42\x20\x00\x01\x3f\xc3\x00'\
-    b'\x83\x11\x82\x1b\x06\x06\x04\x03\x00\x00\x00\x00\x00\x00\x00\x10'\
-    b'\x03\xff\xe0\x30\x03\xff\xc0\x60\x07\xff\xe7\xff\xe1\x81\x83\xff'\
-    b'\xc5\x81\x61\xff\x01\x81\x01\xff\x01\xff\x00\x00\x00\x00\x00\x00'\
-    b'\x07\xff\xe7\xff\xe1\xff\x81\x00\x81\xff\x81\x00\x81\xff\x81\x00'\
-    b'\x81\xff\x80\xff\x83\xff\x86\x67\x00\x3c\x07\xe7\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x43\x07\x83\x05\x03\x01\x03\x47\xea\x41\x0a\xc1\x9b'\
-    b'\x83\x53\x03\x43\x07\x07\x8d\x04\x81\x0c\xc1\x18\x61\x30\x20\x00'\
-    b'\x00\x00\x00\x00\x00\x20\x00\x40\x00\xff\x81\x83\x03\x66\x00\x3c'\
-    b'\x00\x3e\x03\xe3\xc6\x30\x60\x1e\x00\x02\x01\xc0\x00\xfc\x00\x07'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18\x01\x98\x41\x98'\
-    b'\xc1\x18\x83\x19\x80\x19\x00\x34\x00\x36\x00\x62\x00\xc1\x83\x80'\
-    b'\xc7\x00\x60\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18\x40\x18'\
-    b'\xc7\xdd\x80\x5f\x00\x5e\x00\x9a\x00\x9b\x01\x19\x83\x18\xc6\x18'\
-    b'\x64\x18\x20\xf8\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18'\
-    b'\x07\xff\xe7\xff\xe0\x38\x00\x3c\x00\x7e\x00\xdb\x01\x99\x83\x18'\
-    b'\xc6\x18\x64\x18\x20\x18\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18'\
-    b'\x00\x18\x00\x18\x03\xff\xc3\xff\xc0\x18\x00\x18\x00\x18\x00\x18'\
-    b'\x00\x18\x00\x18\x07\xff\xe7\xff\xe0\x00\x00\x00\x00\x00\x00\x7f'\
-    b'\xe7\x84\x64\xa5\x64\x8d\x64\xb5\xe4\x84\x67\x92\x04\xbf\xe4\xe2'\
-    b'\x04\xff\xe7\xa2\x04\xbf\xe4\x22\x00\x3f\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x3f\xc6\x3f\xc3\x22\x40\x2f\xc0\x22\x40\x3f\xc7\x20\x41\x2f'\
-    b'\x41\x29\x41\x2f\x41\x60\x41\x00\xc3\xc0\x04\x7f\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x80\x00\x80\x01\xff\xc1\x08\x03\x08\x06\x08\x00\x08'\
-    b'\x07\xff\xe0\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x08\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x10\x00\x18\x07\xff\xe0\x88\x00\x8f\xc1\x9f'\
-    b'\xc1\x10\xc3\x24\x87\x71\x85\x59\x05\x0f\x01\x06\x01\x1d\x81\x30'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x00\x03\xff\xc2\x00\x43\xff\xc2\x01'\
-    b'\x02\x01\x83\xff\x83\x81\xe5\xff\xa5\x81\x81\x81\x81\xff\x80\x00'\
-    b'\x07\xff\xe0\x00\x00\x00\x00\x00\x00\x30\x00\x20\x00\x7f\xc0\x40'\
-    b'\x80\xc0\x81\xc1\x83\x61\x00\x33\x00\x16\x00\x0c\x00\x18\x00\x30'\
-    b'\x01\xe0\x03\x80\x00\x00\x00\x00\x00\x00\x00\x80\x40\xc0\x47\xfa'\
-    b'\x41\x82\x41\x32\x42\x22\x47\xe2\x40\xda\x41\x92\x43\x32\x44\x62'\
-    b'\x40\xf0\x43\x90\x46\x01\xc0\x00\x00\x00\x00\x00\x00\x42\x07\x82'\
-    b'\x05\x0a\xc1\x1a\x47\xfa\x61\x12\x21\xb2\x23\x52\x43\x42\xc7\x02'\
-    b'\x8d\x01\x81\x07\x01\x0c\x01\x78\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x01\xff\x80\x03\x00\x46\x00\x7c\x00\x1c\x07\xff\xe0\x08\x40\x08'\
-    b'\xc0\x08\x80\x08\x00\x08\x00\x08\x00\x38\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x18\x07\xff\xe7\xff\xe0\x18\x03\xff\xc3\x18\xc3\x18\xc3\x18'\
-    b'\xc3\xff\xc0\x3c\x00\x5e\x01\x99\x87\x18\xe4\x18\x20\x18\x00\x00'\
-    b'\x00\x00\x00\xc2\x07\xfa\x00\xc7\xe3\xf4\x42\xd2\x83\xf1\x81\xe3'\
-    b'\x86\xf6\x60\xc0\x03\xff\xc0\x18\x01\x9f\x81\x98\x07\xff\xe0\x00'\
-    b'\x00\x00\x00\x00\x01\x80\x01\x8f\xe7\xe3\x01\x8f\xe5\xa8\x65\xaf'\
-    b'\xe5\xaf\xe5\xa8\x65\xaf\xe7\xe8\x61\x8f\xe1\x8f\xe1\xe6\xc0\x9c'\
-    b'\x60\x00\x00\x00\x00\x00\x01\x1f\xc1\x1f\xc1\x00\x47\x9f\xc1\x00'\
-    b'\x41\x1f\xc1\x7f\xe1\xff\xe7\x02\x01\x1f\xe1\x12\x61\x12\x61\x12'\
-    b'\xc7\x12\x00\x00\x00\x00\x00\x00\x00\x06\x07\x86\x04\x8d\x05\x98'\
-    b'\xc5\x30\x65\x2f\xa5\x06\x04\x86\x04\xff\xe4\x96\x05\x96\xc4\x26'\
-    b'\x44\x66\x24\x0e\x04\x00\x00\x00\x00\x00\x03\xff\xc2\x24\x42\x24'\
-    b'\x43\xff\xc0\x00\x01\xff\x81\x00\x81\xff\x81\x00\x81\xff\x81\x00'\
-    b'\x81\xff\x80\x42\x07\xc3\xe0\x00\x00\x00\x00\x00\x00\x04\x87\xdf'\
-    b'\xe6\x44\x86\x5f\xc7\xc4\x86\x5f\xe6\x43\x07\xdf\xc6\x5b\x46\x5f'\
-    b'\xc7\xdb\x42\xbf\xe6\xd8\x44\x59\xc0\x00\x00\x00\x00\x00\x00\x00'\
-    b'\xc7\xcf\x84\x48\x04\x48\x07\xc8\x04\x4f\xc4\x4e\x47\xca\x44\x5a'\
-    b'\xc4\x5b\x87\xd1\x82\x91\x86\x76\xc4\x2c\x60\x00\x00\x00\x00\x00'\
-    b'\x00\x18\x07\xff\xe0\x18\x00\x18\x03\xff\xc0\x00\x07\xff\xe6\x00'\
-    b'\x66\x24\x60\x64\x00\x64\x00\x44\x01\xc4\x27\x07\xe0\x00\x00\x00'\
-    b'\x00\x00\x01\x10\x81\x99\x80\x03\x07\xff\xe4\x00\x65\xff\xe1\x01'\
-    b'\x81\x01\x81\xff\x80\x00\x03\xff\x82\x00\x82\x00\x83\xff\x80\x00'\
-    b'\x00\x00\x00\x00\x00\x80\xc4\x94\xc6\xa6\xc2\xa3\xc0\x80\xc7\xec'\
-    b'\xc0\x86\xc1\x82\xc1\xc0\xe2\xe7\xc6\xa4\xc4\x80\xc0\x80\xc0\x80'\
-    b'\xc0\x80\x00\x00\x00\x00\x01\x06\x01\x02\x03\x5f\xe2\xd0\x65\x9f'\
-    b'\xe7\x1f\xe3\x50\x02\xd7\xe7\xd6\xa0\x16\xa3\x57\xe7\x56\xa5\xd6'\
-    b'\xa5\x34\x60\x00\x00\x00\x00\x00\x00\x88\x01\xff\xc3\x08\x07\xff'\
-    b'\xc5\x08\x01\xff\xc1\x08\x01\xff\xe1\x18\x07\xff\xe7\xff\xe0\x7e'\
-    b'\x03\x99\xc6\x18\x60\x18\x00\x00\x00\x00\x00\x86\x01\x86\x01\x7f'\
-    b'\xe1\x00\x03\x3f\xc7\x00\x05\x00\x05\x3f\xc1\x00\x01\x3f\xc1\x20'\
-    b'\x41\x20\x41\x3f\xc1\x3f\xc0\x00\x00\x00\x00\x00\x00\x00\xc6\x3f'\
-    b'\x83\x20\x00\x20\x00\x3f\xc0\x20\x47\x38\x81\x2d\x81\x23\x01\x67'\
-    b'\x81\x5c\xc1\x10\x03\xc0\x04\x7f\xe0\x00\x00\x00\x00\x00\x01\x82'\
-    b'\x01\x06\x01\x04\x87\xec\xc3\x68\x42\x5f\xe2\x40\x22\x40\x06\x4f'\
-    b'\xc1\x88\x40\x88\x41\xc8\x43\x6f\xc6\x08\x40\x00\x00\x00\x00\x00'\
-    b'\x01\x0c\x01\x7f\xc1\x00\x02\x3f\xc2\x20\x46\x3f\xc6\x00\x02\xff'\
-    b'\xe2\xc0\x22\xff\xa2\x04\x02\x04\x02\x04\x02\x1c\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x0c\x00\x0c\x00\x0c\x01\x8c\x01\x8c\x01\x8f\xe1\x8c'\
-    b'\x01\x8c\x01\x8c\x01\x8c\x01\x8c\x01\x8c\x01\x8c\x07\xff\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x07\xff\xe0\x18\x03\xff\xc3\xff\xc3\x18'\
-    b'\xc3\xff\xc3\xff\xc3\x18\xc7\xff\xe7\xff\xe3\x00\xc3\x00\xc3\x03'\
-    b'\xc0\x00\x00\x00\x00\x00\x00\x80\x00\x8f\xc3\xe0\x40\x80\x40\x80'\
-    b'\x47\xf7\xc0\xc4\x02\xc4\x02\xf4\x02\xc4\x22\xc4\x67\xc7\xc5\xc0'\
-    b'\x04\x7f\xe0\x00\x00\x00\x00\x00\x01\x00\x01\x1f\xe1\x01\x87\xc1'\
-    b'\x81\x01\x81\x01\x81\x01\x81\xc1\x87\x01\x85\x01\x81\x01\x81\x01'\
-    b'\x81\x01\x87\x07\x00\x00\x00\x00\x00\x00\x03\xff\xc0\x18\x07\xff'\
-    b'\xe4\x18\x25\xff\xa0\x18\x01\xff\x83\xff\x82\x10\x83\xff\x82\x10'\
-    b'\x83\xff\x80\x10\x20\x1f\xe0\x00\x00\x00\x00\x00\x01\x06\x01\x07'\
-    b'\xc3\x4f\xc2\xcc\xc4\x96\x87\x83\x01\x47\x82\x5c\xe7\xe0\x06\x0f'\
-    b'\xc4\x48\x47\x48\x45\xef\xc5\x8f\xc0\x00\x00\x00\x00\x00\x01\x03'\
-    b'\x01\x0b\x67\xcb\x40\x1a\xc7\xc3\x80\x0c\xc0\x1b\x67\xc3\x00\x0b'\
-    b'\x47\xda\x46\x53\x46\x47\x87\xcc\xc7\xf8\x60\x00\x20\x00\x00\x00'\
-    b'\x00\x8c\x01\x84\x01\x7f\xe3\x7f\xe3\x0a\x07\x1a\x07\x32\x67\x73'\
-    b'\xc3\xf1\x83\xb1\x03\x31\x83\x30\xc3\x36\x63\x38\x20\x00\x00\x00'\
-    b'\x00\x00\x00\x80\x00\x8f\xe7\xf1\x00\x8f\xe7\xec\x66\xaf\xe6\xaf'\
-    b'\xe6\xac\x67\xef\xe1\x8c\x63\xef\xe2\xaf\xe4\x86\xc0\x8c\x60\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x01\xff\x80\x07\x00\x1c\x07\x99\x20\xbd'\
-    b'\x40\x99\x80\xff\x81\x98\x81\x18\x81\x7e\xc2\x18\x46\x18\x64\x78'\
-    b'\x20\x00\x00\x00\x00\x00\x01\x80\x01\x07\xe3\xf7\xe2\xc4\x66\xc4'\
-    b'\x60\x84\x67\xf4\x67\xf4\x60\x84\x60\xc4\x61\xe4\x61\x37\xe2\x07'\
-    b'\xe6\x04\x60\x00\x00\x00\x00\x00\x02\x04\x03\x7f\xe1\x00\x80\x31'\
-    b'\x84\x1f\x03\x1f\xe0\x70\xe0\x30\xc0\xbf\xc1\xa0\xc1\x3f\xc3\x3f'\
-    b'\xc2\x60\xc6\xc0\xc0\x00\x00\x00\x00\x00\x00\x18\x00\x18\x03\xff'\
-    b'\xc3\xff\xc0\x18\x00\x18\x07\xff\xc0\x3c\x00\x7c\x00\x5a\x01\x99'\
-    b'\x83\x18\xc6\x18\x60\x18\x00\x00\x00\x00\x00\x00\x00\x12\x06\x13'\
-    b'\x03\x3f\xe0\x22\x00\x62\x00\x7f\xc7\x22\x01\x22\x01\x3f\xc1\x22'\
-    b'\x01\x3f\xe1\x3f\xe3\xc0\x04\x7f\xe0\x00\x00\x00\x00\x00\x00\x82'\
-    b'\x01\x82\x03\x1f\xe6\x02\x00\xc2\x01\xbf\xe1\x00\x83\x00\x85\x3f'\
-    b'\xe1\x00\x81\x18\x81\x08\x81\x00\x81\x03\x81\x00\x00\x00\x00\x00'\
-    b'\x00\x00\xc7\xdf\x80\xc1\x01\x81\x03\x19\x03\xd9\xc3\xd9\x00\x59'\
-    b'\x02\xd9\x02\x99\x03\x9f\xe1\x80\x03\xe0\x06\x3f\xe4\x00\x00\x00'\
-    b'\x00\x00\x00\x18\x00\x3c\x00\xe7\x03\x99\xe7\xff\xa1\xff\x81\x00'\
-    b'\x81\xff\x81\x00\x81\xff\x81\x00\x41\x3d\x81\x13\x81\xf0\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x80\xc1\xcf\x81\x68\x02\xa8\x04\xc8\x03\xef'\
-    b'\xe2\x2a\x43\xea\x42\x2a\x43\xe9\xc2\x09\x82\x59\x82\xdb\xc3\xb6'\
-    b'\x60\x00\x00\x00\x00\x00\x00\x82\x01\xc6\x03\x67\xe6\x94\x24\xcc'\
-    b'\x63\xe9\x42\x29\x03\xe1\x02\x23\x03\xe3\x82\x02\x82\x66\xc2\xe4'\
-    b'\x63\x8c\x20\x00\x00\x00\x00\x00\x02\x04\x03\x34\x01\x24\x00\x7f'\
-    b'\xc4\x44\x03\x44\x00\x7f\xe0\x7f\xe1\x19\x01\x11\x03\x11\x02\x31'\
-    b'\x26\x61\x24\xc1\xe0\x00\x00\x00\x00\x00\x00\x7b\xe2\x7b\xe1\x49'\
-    b'\x20\x09\x64\x7b\xa6\x0a\x20\x26\x00\x7f\xe0\xe2\x03\xff\xe2\x62'\
-    b'\x02\x7f\xe6\x62\x04\x7f\xe0\x00\x00\x00\x00\x00\x01\x04\x01\x04'\
-    b'\x01\x04\x01\x04\x01\xff\xc1\x00\x01\x00\x01\x00\x01\xff\x01\x01'\
-    b'\x03\x01\x02\x01\x06\x01\x04\x01\x00\x00\x00\x00\x00\x00\x03\x62'\
-    b'\x03\x62\x07\xf6\x03\x67\xe7\xf4\x47\xf4\x43\xfc\x43\xfe\xc2\x32'\
-    b'\x83\xf3\x82\x31\x03\xf3\x82\x36\xc2\xec\x60\x00\x00\x00\x00\x00'\
-    b'\x00\x08\x00\x88\x00\x8f\xc0\x88\x00\x88\x07\xff\xe0\x08\x00\x89'\
-    b'\x81\x88\xc3\x08\x62\x0b\x80\x06\x00\x38\x03\xe0\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x7f\xe6\x7f\xe3\x46\x20\x3f\x80\x06\x00\x3f\xc7\x3f'\
-    b'\xc1\x26\x41\x3f\xc1\x06\x01\x7f\xe1\x06\x03\xc0\x04\x7f\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x03\xc7\xbf\x04\x82\x04\xbf\xe4\x92\xc7\x92'\
-    b'\xc4\xbf\xe4\xbf\xe7\x92\xc4\x92\xc4\xbf\xe7\x82\x07\x82\x04\x3f'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x00\x07\xdf\xe4\xd0\x64\xd0\x64\xdf'\
-    b'\xe7\xd1\x04\xd1\x04\xd1\x07\xdf\xe4\xd1\x04\xd1\x07\xd1\x87\xd6'\
-    b'\xa4\x1c\xe0\x00\x00\x00\x00\x00\x00\x84\x01\x84\x01\x04\x03\x7f'\
-    b'\xe3\x06\x07\x0e\x07\x0f\x07\x1d\x03\x15\x83\x34\xc3\x64\x43\xc4'\
-    b'\x63\x04\x23\x04\x00\x00\x00\x00\x00\x00\x00\x63\x07\x8f\xe0\x8c'\
-    b'\x67\xfc\x60\x8f\xe3\xec\x63\xef\xe2\x2c\x63\xef\xe0\x00\x02\xd8'\
-    b'\x82\xc8\x46\xc1\x64\xff\x00\x00\x00\x00\x00\x00\x01\xbf\xc5\xbf'\
-    b'\xc5\x80\x45\x9f\xc5\x80\x45\xbf\xc5\xff\xe5\xff\xe5\x82\x05\xbf'\
-    b'\xc1\x22\x41\x22\x43\x22\xc6\x22\x00\x00\x00\x00\x00\x00\x00\x10'\
-    b'\x07\xff\xe7\xff\xe4\x00\x20\x07\x81\xfc\x00\x10\x00\x10\x00\x3f'\
-    b'\xe7\xf0\x00\x10\x00\x10\x60\x10\x60\x1f\xc0\x00\x00\x00\x00\x00'\
-    b'\x00\x07\xe7\xf7\xe6\x84\x67\xe4\x66\x84\x67\xe4\x66\x87\xe6\x84'\
-    b'\x87\xf4\x80\x54\x86\xd4\xc6\xdc\x44\x18\x60\xe8\x20\x00\x00\x00'\
-    b'\x00\x00\x00\x18\x03\xff\xe2\x00\x02\x08\x02\x08\x02\x0f\xe2\x08'\
-    b'\x02\x08\x02\xff\xc2\xc0\x42\xc0\x42\xc0\x46\xff\xc4\xff\xc0\xc0'\
-    b'\x40\x00\x00\x00\x01\x02\x01\x02\x01\x1f\xe7\xc0\x01\x0c\x81\x98'\
-    b'\xc3\xb0\x23\x48\x83\x4c\x85\x05\x85\x07\x01\x07\x01\x0d\xc1\x38'\
-    b'\x60\x00\x00\x00\x00\x00\x00\x06\x07\xc2\x04\xdf\xe4\x90\x24\x90'\
-    b'\x25\x0f\x84\x80\x04\xff\xe4\x7f\xe4\x45\x05\x8d\x04\x09\x24\x19'\
-    b'\x24\x31\xe0\x00\x00\x00\x00\x00\x00\x00\x07\xff\xe6\x18\x66\xff'\
-    b'\x67\xff\xe7\xff\xe6\xff\x66\x81\x66\xff\x66\x65\x67\xa6\x66\x21'\
-    b'\x66\x00\x67\xff\xe0\x00\x00\x00\x00\x00\x00\x82\x01\xc3\x03\x7f'\
-    b'\xe6\x90\x2c\x8f\xc3\xe8\x42\x68\x43\xef\xc2\x68\x03\xe8\x02\x0f'\
-    b'\xc2\x48\x42\xc8\x43\x8f\xc0\x00\x00\x00\x00\x00\x00\x18\x00\x18'\
-    b'\x07\xff\xe0\x18\x03\xff\xc2\x00\x42\x66\x42\xff\x42\xff\x42\x18'\
-    b'\x43\xff\x42\x18\x42\x18\x42\x1b\xc0\x00\x00\x00\x00\x00\x00\x20'\
-    b'\x00\x60\x07\xff\xe7\xff\xe0\x40\x00\xc0\x00\x80\x01\xff\xc1\x08'\
-    b'\x02\x08\x06\x08\x00\x08\x00\x08\x03\xff\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x10\x00\x30\x00\x20\x07\xff\xe0\x60\x00\x40\x00\x80\x01\xff'\
-    b'\xc6\x80\xc4\x80\xc0\x80\xc0\x80\xc0\xff\xc0\x80\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x00\xc6\x3f\xc3\x20\x00\x20\x00\x3f\xe0\x3f\xe7\x21'\
-    b'\x01\x21\x01\x21\x01\x61\x01\x41\x01\x01\x03\xc0\x04\x7f\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x06\x06\x3f\xc3\x06\x00\x7f\xe0\x00\x00\x3f'\
-    b'\xc7\x20\x41\x3f\xc1\x0c\x01\x3e\xc1\x69\x81\x08\x63\xc0\x04\x7f'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x00\x07\xff\xe0\x40\x00\x40\x00\x40'\
-    b'\x00\x7f\x80\x40\x80\x40\x80\x40\x80\x80\x80\x80\x81\x80\x83\x01'\
-    b'\x86\x07\x00\x00\x00\x00\x00\x00\x00\x00\x81\xff\xc3\xf8\x00\x18'\
-    b'\x00\x18\x00\x18\x07\xff\xe0\x18\x00\x18\x00\x18\x00\x18\x00\x18'\
-    b'\x00\x18\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x07\xff\xe0\x10'\
-    b'\x00\x10\x01\xff\x81\x00\x81\x00\x81\x00\x81\xff\x81\x00\x81\x00'\
-    b'\x81\x00\x81\xff\x81\x00\x80\x00\x00\x00\x00\x00\x01\x0c\x01\x7f'\
-    b'\xc1\x11\x82\x11\x02\xff\xe6\x7f\xc6\x60\x42\x7f\xc2\x60\x42\x7f'\
-    b'\xc2\x00\x02\x56\x42\xd0\xe2\x9f\xa0\x00\x00\x00\x00\x00\x00\x64'\
-    b'\x00\x64\x06\x64\xc3\x65\x81\xe7\x00\x64\x00\x64\x00\xe7\x07\x65'\
-    b'\xc6\x64\x40\x44\x00\xc4\x21\x84\x26\x07\xe0\x00\x00\x00\x00\x00'\
-    b'\x01\x00\x01\x7f\xe1\x44\x62\x44\x62\x5f\xe6\x44\x66\x44\x62\x5f'\
-    b'\x62\x51\x62\x51\x62\x5f\x62\x40\x62\x7f\xe2\x7f\xe0\x00\x00\x00'\
-    b'\x00\x00\x01\x84\x01\x84\x01\x84\x07\xef\xe1\x88\x41\x88\x43\xdc'\
-    b'\xc3\xf4\x83\x86\x85\x83\x85\x83\x01\x83\x81\x86\xc1\x98\x60\x00'\
-    b'\x00\x00\x00\x00\x00\x30\x00\x60\x00\x43\x00\xc1\x81\x80\xc7\xff'\
-    b'\xc3\x00\x40\x00\x03\xff\x83\x00\x83\x00\x83\x00\x83\xff\x83\x00'\
-    b'\x80\x00\x00\x00\x00\x00\x00\x30\x00\x7f\xc0\xff\xc1\x80\x87\xc3'\
-    b'\x00\x26\x00\x3c\x01\xf0\x07\xff\xc0\x80\x40\x80\x40\x80\x40\xff'\
-    b'\xc0\xff\xc0\x00\x00\x00\x00\x00\x00\x10\x00\x18\x01\xff\x81\x00'\
-    b'\x81\xff\x81\xff\x81\x00\x81\xff\x81\x10\x01\x08\x61\x0d\x81\x07'\
-    b'\x01\x33\x81\xe0\xe0\x00\x00\x00\x00\x00\x03\xff\xe3\xff\xe0\x24'\
-    b'\x03\xff\xc3\x24\xc3\xff\xc3\xff\xc0\x24\x07\xff\xe0\x10\x03\xd8'\
-    b'\xc2\xc9\x46\xc1\x64\x7f\x00\x00\x00\x00\x00\x00\x00\x18\x06\x7e'\
-    b'\x63\x42\xc1\x42\x80\x7e\x01\xc3\x87\x42\x64\x7e\x00\x18\x07\xff'\
-    b'\xe0\x3c\x00\x5a\x01\x99\x87\x18\xe0\x18\x00\x00\x00\x00\x00\x42'\
-    b'\x00\x42\x07\xff\xe0\x42\x00\x18\x07\xff\xe0\x18\x00\x18\x01\xff'\
-    b'\x81\xff\x81\x00\x81\x00\x81\xff\x81\xff\x80\x00\x00\x00\x00\x00'\
-    b'\x03\x23\x87\xf2\x83\x24\xc3\xe7\xe0\x8c\x87\xfc\x84\x9f\xe7\xf4'\
-    b'\x80\x84\x87\xf7\xe7\xf4\x81\x84\x81\x67\xe6\x34\x00\x00\x00\x00'\
-    b'\x00\x00\x01\xff\x81\xff\x81\x00\x81\xff\x81\x00\x81\xff\x80\xc0'\
-    b'\x01\xff\xe3\xff\xe4\x62\x60\xc4\x63\x8c\x42\x38\x40\xe3\xc0\x40'\
-    b'\x00\x00\x00\x00\x01\x06\x01\x02\x01\x03\x07\xbf\xe5\xd8\x05\x58'\
-    b'\x05\x18\x05\x18\x01\x18\x01\x18\x01\x18\x01\x18\x01\x18\x01\x1f'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x00\x07\xbd\xe4\xa4\x64\xa4\x64\xa5'\
-    b'\xe4\xbd\xe7\xa0\x04\xbd\xe4\xbd\x24\xa1\x67\xbd\xc4\xa0\xc4\x21'\
-    b'\xc0\x23\x60\x00\x00\x00\x00\x00\x00\x00\x03\xff\xc0\x00\x00\x00'\
-    b'\x00\x00\x07\xff\xe0\x44\x00\x44\x00\x44\x00\x44\x00\xc4\x20\x84'\
-    b'\x23\x84\x26\x07\xe0\x00\x00\x00\x00\x00\x00\x08\x01\xff\xe1\x00'\
-    b'\x05\x00\x05\x7f\xe3\x04\x01\x04\x03\x7f\xef\x66\x65\x67\x61\x69'\
-    b'\xe3\x78\xe2\x60\x66\x61\xc0\x00\x00\x00\x00\x00\x00\x0c\x01\xff'\
-    b'\xe1\xff\xe5\xbf\xc7\xbf\xc7\x8f\x01\xbf\xe1\xa6\x67\xa6\x65\xbf'\
-    b'\xe1\x26\x61\x3f\xe3\x26\x62\x27\xe0\x00\x00\x00\x00\x00\x00\x08'\
-    b'\x01\xff\xe1\x00\x05\x06\x05\x3f\xc3\x26\x41\x26\x43\x3f\xcf\x20'\
-    b'\xc5\x28\x81\x6d\x83\x47\x02\xcf\x86\xb8\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x10\x07\xff\xe7\xff\xe4\x30\x20\x20\x00\x60\x07\xff\xe0\xc3'\
-    b'\x00\x83\x01\xc2\x00\x7c\x00\x1e\x00\x73\x87\xc0\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x40\x00\xff\x01\x83\x03\x06\x07\xff\xe1\x00\x01\x7f'\
-    b'\x81\x7f\x81\x60\x81\x60\x83\x63\x83\x60\x22\x60\x26\x3f\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x02\x07\xc7\x04\xcd\x84\x98\xc4\xaf\xa5\x02'\
-    b'\x04\xbf\xc4\xf2\x44\x72\x44\x7f\xc5\x87\x04\x0d\x84\x18\xc4\x30'\
-    b'\x60\x00\x00\x00\x00\x00\x00\x40\x00\xfe\x01\x86\x03\x0c\x07\xff'\
-    b'\x80\x00\x81\xff\x80\x00\x81\xff\x80\x00\x02\xd8\x82\xc8\x46\xc1'\
-    b'\x64\xff\x00\x00\x00\x00\x00\x00\x00\x00\x06\x3f\xe3\x20\x60\x3f'\
-    b'\xe0\x24\x80\x26\x87\x2f\xe1\x2f\xc1\x2f\xc1\x7f\xe1\x5f\xe1\x41'\
-    b'\x03\xc0\x04\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x03\xff\x83\x00'\
-    b'\x83\xff\x83\xff\x83\x00\x83\xff\x80\x18\x00\x18\x07\xff\xe0\x18'\
-    b'\x00\x18\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x06\x06\x7f'\
-    b'\xe3\x06\x00\x06\x00\x3f\xc0\x26\x47\x26\x41\x3f\xc1\x0e\x01\x17'\
-    b'\xc1\x66\x61\x06\x03\xc0\x04\x7f\xe0\x00\x00\x00\x00\x00\x00\x18'\
-    b'\x00\x18\x03\xff\xc0\x18\x00\x18\x07\xff\xe0\x66\x01\x66\x81\x66'\
-    b'\x82\x46\xc6\x46\x44\xc6\x61\x86\x03\x1e\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x18\x03\xff\xc0\x18\x03\xff\xc0\x18\x07\xff\xe0\x00\x01\xff'\
-    b'\xc1\x00\xc1\xff\xc1\x00\xc1\xff\xc1\x00\xc1\x03\x81\x00\x00\x00'\
-    b'\x00\x00\x00\xc2\x07\xff\xe7\xff\xe0\xc2\x07\xff\xe0\x18\x01\xff'\
-    b'\x81\x18\x81\xff\x81\x18\x81\x18\x81\xff\x80\xc3\x07\x81\xe0\x00'\
-    b'\x00\x00\x00\x00\x01\x00\x01\x0f\xc3\x40\x42\xcf\xc4\x80\x47\x80'\
-    b'\x41\x5f\xe2\x49\x47\xe9\x46\x01\xc4\x47\x87\x4d\x45\xf9\x25\x87'\
-    b'\x00\x00\x00\x00\x00\x00\x03\xff\xc3\xff\xc3\x18\xc3\xff\xc3\x18'\
-    b'\xc3\xff\xc0\x18\x03\xff\xc3\xff\xc0\x18\x07\xff\xe2\x04\x42\x66'\
-    b'\x46\x22\x60\x00\x00\x00\x00\x00\x00\xc3\x07\xff\xe7\xff\xe0\xdb'\
-    b'\x00\x3c\x00\xe7\x03\x99\xe6\x18\x63\xff\xc0\x18\x00\x99\x01\x99'\
-    b'\x87\x18\xc0\x38\x40\x00\x00\x00\x00\x00\x00\x44\x42\x45\xc2\x77'\
-    b'\x02\x44\x22\x74\x67\x87\xc0\x42\x01\xfc\x00\x31\x81\xc0\xc3\xff'\
-    b'\x60\x1a\x01\x99\x87\x38\x60\x30\x00\x00\x00\x00\x01\x02\x01\x7f'\
-    b'\xc1\x09\xa7\xb9\x63\x10\x83\x2f\x43\xc0\x25\x9f\x85\x10\x85\x1f'\
-    b'\x81\x1f\x81\x10\x81\x19\x81\x7f\xe0\x00\x00\x00\x00\x00\x00\x40'\
-    b'\x00\x40\x07\xff\xe0\xc0\x00\xc4\x00\x84\x40\x94\x40\xa4\xc1\xa6'\
-    b'\x81\x06\x83\x0f\x02\x19\x86\x30\xc4\xe0\x60\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x07\xff\xe4\x00\x24\x80\x20\xff\x80\x80\x01\x80\x01\xff'\
-    b'\xc0\x00\xc0\x00\xc7\xfe\xc0\x00\xc0\x00\x80\x0f\x80\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x07\xff\xe0\x00\x00\xff\x06\x99\x46\x99\x46\xff'\
-    b'\x46\xff\x46\x99\x46\x99\x46\xff\x46\x00\x47\xff\xc6\x00\x40\x00'\
-    b'\x00\x00\x00\x00\x00\x10\x03\xff\xc0\x00\x00\xc3\x00\x42\x07\xff'\
-    b'\xe0\x00\x01\xff\x81\x00\x81\x00\x81\xff\x81\x00\x81\xff\x81\xff'\
-    b'\x80\x00\x00\x00\x00\x00\x00\x18\x07\xff\xe0\x18\x00\x18\x03\xff'\
-    b'\xc0\x00\x03\xff\xc3\x08\x43\x08\x43\xff\xc2\x00\x42\x00\x02\x00'\
-    b'\x06\x00\x00\x00\x00\x00\x00\x00\x00\x02\x07\x82\x04\x82\x04\x9f'\
-    b'\xc4\x92\x44\x92\x47\x92\x44\xbf\xe4\xbf\xe4\x87\x07\x85\x04\x08'\
-    b'\x84\x18\x40\x30\x20\x00\x00\x00\x00\x00\x00\x18\x07\xff\xe0\x18'\
-    b'\x00\x18\x03\xff\xc2\x18\x43\xff\xc2\x18\x42\x18\x43\xff\xc0\x18'\
-    b'\x07\xff\xe0\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x06\x03\xe7'\
-    b'\xc2\x6f\xc2\x6c\xc2\x76\x83\xe3\x00\x87\x82\x9c\xe2\xe0\x02\x8f'\
-    b'\xc2\x88\x42\x88\x43\xef\xc7\x0f\xc0\x00\x00\x00\x00\x00\x00\x10'\
-    b'\x07\xff\xe7\xff\xe4\x00\x20\x67\x01\xc1\x87\x00\xe0\x00\x03\xff'\
-    b'\xc0\x18\x00\x18\x00\x18\x00\x18\x07\xff\xe0\x00\x00\x00\x00\x00'\
-    b'\x02\x10\x03\x3f\xe1\x3f\xe0\x60\x04\x5f\xc3\x34\x40\x32\x40\x7f'\
-    b'\xe1\x7f\xe1\x24\x43\x22\x42\x3f\xe6\x00\xc4\x03\x80\x00\x00\x00'\
-    b'\x00\x00\x00\x00\xc1\x08\xc1\x08\xc1\x08\xc1\x08\xc1\x08\xc1\x08'\
-    b'\xc1\x08\xc1\x08\xc1\x08\xc3\x08\xc2\x08\xc6\x08\xc4\x00\xc0\x00'\
-    b'\x00\x00\x00\x00\x02\x06\x03\x36\x01\x36\x00\x36\xc4\x37\xc3\x7e'\
-    b'\x40\x76\x40\x36\x41\x36\x41\x37\xc3\x36\x02\x30\x26\x30\x24\x3f'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x42\x07\xff\xe7\xff\xe0\x42\x00\x4c'\
-    b'\x00\xcc\x41\x8d\xc1\x8f\x07\x8e\x05\xbc\x01\x8c\x01\x8c\x21\x8c'\
-    b'\x21\x8f\xe1\x80\x00\x00\x00\x00\x00\x60\x03\xff\x82\x00\x83\xff'\
-    b'\x82\x00\x83\xff\x82\x00\x03\xff\xe2\x00\x03\xff\xe0\x00\x62\xdb'\
-    b'\x66\x49\x44\x61\xc0\x00\x00\x00\x00\x00\x00\x19\x00\x19\x80\x18'\
-    b'\x80\x18\x07\xff\xe0\x18\x00\x18\x00\x1c\x00\x34\x00\x66\x00\xc3'\
-    b'\x01\x81\x83\x00\xc6\x00\x60\x00\x00\x00\x00\x00\x04\x48\x82\x88'\
-    b'\x83\xbf\xe3\x08\x87\x88\x84\x80\x01\xbf\xe1\xb2\x62\xb2\x66\xbf'\
-    b'\xe4\xb2\x60\xb2\x60\xbf\xe7\xbf\xe0\x00\x00\x00\x00\x00\x00\x60'\
-    b'\x00\xfe\x01\x82\x03\x06\x07\xff\xc1\x18\xc1\x18\xc1\xff\xc1\x18'\
-    b'\xc1\x18\xc1\xff\xc2\x04\x02\x66\xc6\x22\x60\x00\x00\x00\x00\x00'\
-    b'\x00\x80\x07\xf7\xc7\xf4\x41\x27\xc1\x24\x47\xf4\x40\x87\xc0\x84'\
-    b'\x47\xf7\xc2\x87\xc2\xa2\x86\x96\x84\x84\xa3\x8c\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x03\xff\x83\x00\x83\x00\x83\x00\x83\x00\x83\xff'\
-    b'\x80\x44\x00\x44\x00\x44\x00\xc4\x00\x84\x23\x84\x26\x07\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x43\x00\x66\x03\xff\xc0\x18\x40\x18\x43\xff'\
-    b'\xc2\x18\x02\x18\x03\xff\xe0\x38\x60\x78\x40\xd8\x43\x1b\xc6\x18'\
-    b'\x00\x00\x00\x00\x00\x00\x01\x03\x01\x03\x01\x1f\xe7\xc3\x03\x43'\
-    b'\x02\x5f\xe2\x5b\x62\x5b\x66\xdb\x63\x9b\x61\x9b\x61\xdb\xe3\x7b'\
-    b'\xc6\x03\x00\x03\x00\x00\x00\x00\x01\x02\x01\x02\x01\x1f\xc7\xdf'\
-    b'\xc2\x42\x02\x42\x02\xdf\xe6\x87\x06\x87\x01\x8a\x81\x9a\xc1\x52'\
-    b'\x42\x32\x26\x22\x24\x00\x00\x00\x00\x00\x00\x10\x00\x10\x00\x10'\
-    b'\x03\xff\xc0\x10\x00\x10\x00\x10\x07\xff\xe0\x18\x00\x34\x00\x66'\
-    b'\x00\xc3\x01\x81\x86\x00\xe4\x00\x00\x00\x00\x00\x00\x10\x07\xff'\
-    b'\xc0\x10\x03\xff\x80\x10\x87\xff\xe0\x10\x83\xff\x80\x20\x07\xff'\
-    b'\xe0\xc2\x00\xe6\x00\x1e\x07\xf3\xc0\x00\x00\x00\x00\x00\x00\x30'\
-    b'\x01\xff\x81\x00\x81\xff\x81\x00\x81\xff\x81\x00\x81\xff\x81\xff'\
-    b'\x80\x10\x03\xd8\xc2\xcc\x46\xc1\x64\x7f\x00\x00\x00\x00\x00\x00'\
-    b'\x01\x06\x01\x02\x01\x1f\xc7\xd8\x43\x5f\xc2\x5f\xc2\x58\x42\x5f'\
-    b'\xc6\xda\x03\x9b\x61\x99\xc1\xd9\x83\x7e\xc6\x1c\x60\x00\x00\x00'\
-    b'\x00\x00\x03\x00\x01\x0f\xc7\xc8\x40\x48\x40\xc8\x40\x8f\xc1\x08'\
-    b'\x43\x88\x47\x68\x45\x4f\xc1\x08\x41\x08\x41\x08\x41\x3f\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x42\x00\x81\x81\x80\xc3\x00\x46\x81'\
-    b'\x40\xc3\x00\x66\x00\x24\x00\x3c\x00\x3c\x00\x66\x01\xc3\x87\x00'\
-    b'\xe0\x00\x00\x00\x00\x00\x00\x00\x01\xff\xc1\x00\xc1\x38\xc1\x0c'\
-    b'\xc1\x00\xc7\xff\xe1\x00\x81\x30\x83\x0c\x83\x00\x83\xff\xe0\x01'\
-    b'\x80\x0f\x00\x00\x00\x00\x00\x00\x00\x06\x06\x7f\xc3\x06\x00\x7f'\
-    b'\xe0\x10\x80\x19\x07\x7f\xe1\x06\x01\x3f\xc1\x06\x01\x7f\xe1\x06'\
-    b'\x03\xc0\x04\x7f\xe0\x00\x00\x00\x00\x00\x00\x98\x00\x98\x01\x98'\
-    b'\x01\xff\xc3\x18\x02\x18\x00\x18\x07\xff\xe0\x64\x00\x44\x00\x44'\
-    b'\x20\xc4\x21\x84\x27\x07\xe0\x00\x00\x00\x00\x00\x00\x24\x07\xe7'\
-    b'\xe3\xe7\xc0\x24\x07\xe7\xe0\x18\x07\xff\xe3\xff\xc3\x18\xc3\xff'\
-    b'\xc3\x18\xc3\xff\xc7\xff\xe0\x18\x00\x00\x00\x00\x00\x00\x01\x0c'\
-    b'\x01\x08\x01\x7f\xc2\x11\x42\x71\xc6\x7f\xc6\xe0\xe2\x3f\x82\x20'\
-    b'\x82\x3f\x82\x04\x02\x24\x82\xc4\x42\x1c\x40\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x03\xff\xc0\x00\x40\x00\x43\xfe\x40\x00\x41\xfc\x41\xfc'\
-    b'\x41\x04\x41\x04\x41\xfc\x41\x00\x40\x00\x40\x01\xc0\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x03\xff\xc2\x30\x02\x3f\x82\x7f\x82\xc4\x02\x04'\
-    b'\x02\xff\xc2\x08\x02\x1e\x02\x33\x82\xe0\xc2\x00\x03\xff\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x18\x01\x9f\xc1\x98\x07\xff\xe7\xff\xe0\x5a'\
-    b'\x02\x7e\x42\xff\x42\xff\x42\x3e\x42\xdb\x42\x99\x42\x00\x43\xff'\
-    b'\xc0\x00\x00\x00\x00\x00\x00\x40\x87\x88\x85\x06\x81\x02\x87\xe0'\
-    b'\x81\x18\x81\x8c\x83\x44\x83\x40\xe7\x1f\xcd\x18\x81\x00\x81\x00'\
-    b'\x81\x00\x80\x00\x00\x00\x00\x00\x00\x42\x07\xff\xe0\x42\x02\x7e'\
-    b'\x43\x7e\xc0\x62\x80\xfe\x83\xe2\xc6\x7e\x40\x18\x07\xff\xe0\x7e'\
-    b'\x01\xdb\x86\x18\x60\x18\x00\x00\x00\x00\x00\x8f\xc1\x8f\xc3\xc8'\
-    b'\x46\x2f\xc4\x0f\xc3\xc8\x40\x8f\xc7\xef\xc0\x8b\x04\xa9\x66\xe9'\
-    b'\xc2\x88\x80\xeb\xc7\xce\x60\x00\x00\x00\x00\x00\x00\x38\x03\xe3'\
-    b'\xe0\x42\x27\xfa\x42\x52\x42\x52\xc7\xfa\xc2\x52\x42\x52\x27\xfa'\
-    b'\x27\xfa\x20\x42\xe1\xfa\x07\xc2\x00\x02\x00\x00\x00\x00\x03\xff'\
-    b'\xe3\xff\xe2\x00\x63\xff\xe3\xff\xe2\x00\x03\xff\xe2\x00\x22\xfe'\
-    b'\x22\xc2\x62\xc2\x66\xfe\x66\x00\x44\x03\xc0\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x07\xff\xe6\x08\x66\x69\x66\x2f\x66\xb2\x66\xc6\x66\x6c'\
-    b'\x66\x38\x66\x3c\x66\xe7\x66\x81\x67\xff\xe7\xff\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x80\x01\x9f\x83\x10\x86\x10\x80\xf0\x81\xe0\xe1\x00'\
-    b'\x03\x3f\xc5\x10\xc1\x18\x81\x09\x81\x07\x01\x0f\x01\x70\xe1\x00'\
-    b'\x00\x00\x00'
-
-WIDTHS = memoryview(_WIDTHS)
-OFFSETS = memoryview(_OFFSETS)
-BITMAPS = memoryview(_BITMAPS)
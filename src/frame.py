@@ -0,0 +1,57 @@
+"""Keyed screen regions and the diff between consecutive frames.
+
+A mode handler first lays out the screen as a list of ``Region``s: a stable
+key, the rectangle it owns, the content drawn into it and the function that
+draws it. ``diff`` compares that list with the previous frame so only the
+regions whose rectangle or content changed are repainted.
+
+The content tuple itself is the region's hash key. Comparing it exactly
+costs no more than hashing it and cannot collide (MicroPython's str hashes
+are only 16 bits wide).
+"""
+
+
+class Region:
+    __slots__ = ("key", "rect", "content", "draw")
+
+    def __init__(self, key, rect, content, draw):
+        self.key = key
+        self.rect = rect  # (x, y, w, h)
+        self.content = content
+        self.draw = draw  # draw(rect, content)
+
+
+def area(rect):
+    return rect[2] * rect[3]
+
+
+def snapshot(regions):
+    """The frame as stored for the next diff: key -> (rect, content)."""
+    return {r.key: (r.rect, r.content) for r in regions}
+
+
+def diff(previous, regions):
+    """Return (changed, stale) against ``previous`` (a snapshot).
+
+    ``changed`` are the regions to repaint. ``stale`` are ``(key, rect)``
+    pairs no longer covered (keys that disappeared or moved) which must be
+    cleared before the changed regions are drawn.
+    """
+    changed = []
+    stale = []
+    matched = 0
+    for region in regions:
+        old = previous.get(region.key)
+        if old is None:
+            changed.append(region)
+            continue
+        matched += 1
+        if old[0] != region.rect:
+            stale.append((region.key, old[0]))
+            changed.append(region)
+        elif old[1] != region.content:
+            changed.append(region)
+    if matched < len(previous):
+        current = {r.key for r in regions}
+        stale.extend((key, old[0]) for key, old in previous.items() if key not in current)
+    return changed, stale
@@ -0,0 +1,145 @@
+"""Frame extraction over a preallocated receive buffer.
+
+Handles newline-delimited JSON lines and the length-prefixed binary frames
+of codec.py (a type byte below 0x09 followed by a u32 big-endian length);
+the framing is detected per frame, so a peer may switch at any time.
+
+Shared by the Pico client (main.py) and the Pi host (command_server.py),
+so it sticks to what both MicroPython and CPython provide.
+
+Data is received straight into ``writable()`` (``recv_into`` / ``readinto``)
+and frames are handed out as memoryview slices of the same buffer, so no
+per-chunk or per-line bytes objects are built. Consumed bytes are only
+compacted away once the tail of the buffer is exhausted, which keeps the
+copying amortized linear even for frames much larger than a recv chunk.
+"""
+
+import json
+
+# Returned by next_frame() once per frame that exceeded the buffer size.
+FRAME_TOO_LARGE = object()
+
+# frame_type of newline-delimited JSON; binary types are defined in codec.py.
+FRAME_JSON = 0
+_BINARY_LIMIT = 0x09   # first byte below this (and not whitespace) is binary
+_HEADER_SIZE = 5
+
+_HAS_FIND = hasattr(bytearray, "find")
+
+
+def _is_space(byte):
+    return byte == 0x20 or 0x09 <= byte <= 0x0D
+
+
+def _find_newline(buf, view, start, end):
+    if _HAS_FIND:
+        return buf.find(b"\n", start, end)
+    # MicroPython's bytearray has no find(); only the newly received span
+    # is copied, so each byte is scanned exactly once.
+    idx = bytes(view[start:end]).find(b"\n")
+    return idx + start if idx >= 0 else -1
+
+
+def decode_json(frame):
+    """Decode a JSON frame without copying where the runtime allows it."""
+    try:
+        return json.loads(frame)
+    except TypeError:
+        # CPython's json rejects memoryview; MicroPython accepts any buffer.
+        return json.loads(bytes(frame))
+
+
+class LineFramer:
+    def __init__(self, max_frame):
+        self.buf = bytearray(max_frame)
+        self.view = memoryview(self.buf)
+        self.reset()
+
+    def reset(self):
+        """Forget any partial frame, e.g. after the connection dropped."""
+        self.start = 0   # first byte of the pending frame
+        self.end = 0     # end of received data
+        self.scan = 0    # newline search resumes here
+        self.discarding = False
+        self.skip = 0    # bytes left of an oversized binary frame
+        self.frame_type = FRAME_JSON
+
+    def writable(self):
+        """Free space to receive into; frames from next_frame() become invalid."""
+        if self.start == self.end:
+            self.start = self.end = self.scan = 0
+        elif self.end == len(self.buf) and self.start:
+            pending = self.end - self.start
+            self.buf[:pending] = bytes(self.view[self.start:self.end])
+            self.scan -= self.start
+            self.start = 0
+            self.end = pending
+        return self.view[self.end:]
+
+    def commit(self, nbytes):
+        self.end += nbytes
+
+    def next_frame(self):
+        """Return the next complete frame body as a memoryview, or None.
+
+        ``frame_type`` tells how to decode it. JSON lines come without the
+        newline and surrounding whitespace.
+        """
+        buf = self.buf
+        while True:
+            if self.skip:
+                dropped = min(self.skip, self.end - self.start)
+                self.skip -= dropped
+                self.start += dropped
+                if self.skip:
+                    self.start = self.end = self.scan = 0
+                    return None
+            if not self.discarding:
+                while self.start < self.end and _is_space(buf[self.start]):
+                    self.start += 1
+                if self.scan < self.start:
+                    self.scan = self.start
+                if self.start == self.end:
+                    return None
+                if buf[self.start] < _BINARY_LIMIT:
+                    return self._binary_frame()
+            nl = _find_newline(buf, self.view, self.scan, self.end)
+            if nl < 0:
+                self.scan = self.end
+                if self.end - self.start >= len(buf):
+                    # Full buffer without a newline: drop it and everything
+                    # up to the next newline, reporting the frame once.
+                    self.start = self.end = self.scan = 0
+                    if not self.discarding:
+                        self.discarding = True
+                        self.frame_type = FRAME_JSON
+                        return FRAME_TOO_LARGE
+                return None
+            first = self.start
+            self.start = self.scan = nl + 1
+            if self.discarding:
+                self.discarding = False
+                continue
+            last = nl
+            while last > first and _is_space(buf[last - 1]):
+                last -= 1
+            if first < last:
+                self.frame_type = FRAME_JSON
+                return self.view[first:last]
+
+    def _binary_frame(self):
+        buf = self.buf
+        start = self.start
+        if self.end - start < _HEADER_SIZE:
+            return None
+        length = ((buf[start + 1] << 24) | (buf[start + 2] << 16)
+                  | (buf[start + 3] << 8) | buf[start + 4])
+        total = _HEADER_SIZE + length
+        self.frame_type = buf[start]
+        if total > len(buf):
+            self.skip = total
+            return FRAME_TOO_LARGE
+        if self.end - start < total:
+            return None
+        self.start = self.scan = start + total
+        return self.view[start + _HEADER_SIZE:start + total]
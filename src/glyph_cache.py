@@ -0,0 +1,175 @@
+"""Glyphs pushed by the host, kept in one size-capped file on flash.
+
+Characters outside the baked-in font are rasterized by the host and sent
+in ``glyph_pack`` commands. They are appended to a single file rather than
+one file per glyph (a 34-byte glyph would otherwise take a whole flash
+block). The index and LRU order live in RAM; when the file outgrows
+``max_bytes`` it is rewritten with the most recently used glyphs only, and
+the dropped codepoints are reported so the host stops counting on them.
+
+File layout (little-endian)::
+
+    0   4 bytes  magic b"GLC1"
+    4   u8       glyph height
+    5   ...      zero padding up to HEADER_SIZE
+    8   records: u32 codepoint, u8 width, rows (MONO_HLSB, byte-padded)
+
+``glyph_pack`` data uses the same record format.
+"""
+
+import os
+import struct
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ucollections import OrderedDict
+
+MAGIC = b"GLC1"
+HEADER_SIZE = 8
+RECORD_HEADER = 5
+KEEP_RATIO = 3 / 4  # fraction of max_bytes kept after a compaction
+
+
+def row_bytes(width, height):
+    return ((width + 7) >> 3) * height
+
+
+def iter_records(data, height):
+    """Yield (codepoint, width, rows memoryview) from packed records."""
+    view = memoryview(data)
+    pos = 0
+    while pos + RECORD_HEADER <= len(view):
+        cp, width = struct.unpack("<IB", view[pos:pos + RECORD_HEADER])
+        pos += RECORD_HEADER
+        size = row_bytes(width, height)
+        if pos + size > len(view):
+            raise ValueError("truncated glyph record")
+        yield cp, width, view[pos:pos + size]
+        pos += size
+    if pos != len(view):
+        raise ValueError("truncated glyph record")
+
+
+class GlyphCache:
+    compressed = False  # plain rows, unlike a JPF2 BinaryFont
+
+    def __init__(self, path, max_bytes, height):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.height = height
+        self.max_width = 16
+        self.entries = OrderedDict()  # codepoint -> (offset, width), oldest first
+        self._file = None
+        self._open()
+
+    def _open(self):
+        try:
+            f = open(self.path, "r+b")
+        except OSError:
+            f = None
+        if f is not None:
+            header = f.read(HEADER_SIZE)
+            if len(header) == HEADER_SIZE and header[:4] == MAGIC and header[4] == self.height:
+                self._file = f
+                self._scan()
+                return
+            f.close()
+        self._reset()
+
+    def _reset(self):
+        self._file = open(self.path, "w+b")
+        self._file.write(MAGIC + bytes((self.height,)) + bytes(HEADER_SIZE - 5))
+        self.entries = OrderedDict()
+
+    def _scan(self):
+        f = self._file
+        pos = HEADER_SIZE
+        while True:
+            f.seek(pos)
+            header = f.read(RECORD_HEADER)
+            if len(header) < RECORD_HEADER:
+                break
+            cp, width = struct.unpack("<IB", header)
+            pos += RECORD_HEADER
+            self.entries[cp] = (pos, width)
+            pos += row_bytes(width, self.height)
+
+    def codepoints(self):
+        return list(self.entries)
+
+    def total_bytes(self):
+        self._file.seek(0, 2)
+        return self._file.tell()
+
+    def lookup(self, ch):
+        """(index, width) for ch or None; the index is the codepoint."""
+        entry = self.entries.get(ord(ch))
+        if entry is None:
+            return None
+        return ord(ch), entry[1]
+
+    def glyph_at(self, cp):
+        entry = self.entries.pop(cp)
+        self.entries[cp] = entry  # most recently used
+        offset, width = entry
+        rows = bytearray(row_bytes(width, self.height))
+        self._file.seek(offset)
+        self._file.readinto(rows)
+        return rows
+
+    def add(self, data, skip=None):
+        """Append packed glyph records; returns (stored, evicted) codepoints.
+
+        ``skip(cp)`` filters out glyphs the caller already has elsewhere.
+        ``evicted`` lists the glyphs a compaction dropped to make room.
+        The whole pack is parsed first: a malformed one raises ValueError
+        with nothing written.
+        """
+        records = list(iter_records(data, self.height))
+        stored = []
+        f = self._file
+        end = self.total_bytes()
+        for cp, width, rows in records:
+            if cp in self.entries or (skip and skip(cp)):
+                continue
+            f.seek(end)
+            f.write(struct.pack("<IB", cp, width))
+            f.write(rows)
+            self.entries[cp] = (end + RECORD_HEADER, width)
+            end += RECORD_HEADER + len(rows)
+            stored.append(cp)
+        f.flush()
+        evicted = self._compact() if end > self.max_bytes else []
+        return stored, evicted
+
+    def _compact(self):
+        """Rewrite the file keeping the most recently used glyphs; returns the dropped ones."""
+        budget = int(self.max_bytes * KEEP_RATIO) - HEADER_SIZE
+        keep = []
+        for cp, (offset, width) in reversed(list(self.entries.items())):
+            size = RECORD_HEADER + row_bytes(width, self.height)
+            if size > budget:
+                break
+            budget -= size
+            keep.append((cp, offset, width))
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as out:
+            out.write(MAGIC + bytes((self.height,)) + bytes(HEADER_SIZE - 5))
+            entries = OrderedDict()
+            pos = HEADER_SIZE
+            for cp, offset, width in reversed(keep):
+                rows = bytearray(row_bytes(width, self.height))
+                self._file.seek(offset)
+                self._file.readinto(rows)
+                out.write(struct.pack("<IB", cp, width))
+                out.write(rows)
+                entries[cp] = (pos + RECORD_HEADER, width)
+                pos += RECORD_HEADER + len(rows)
+        self._file.close()
+        os.remove(self.path)
+        os.rename(tmp, self.path)
+        self._file = open(self.path, "r+b")
+        evicted = [cp for cp in self.entries if cp not in entries]
+        self.entries = entries
+        return evicted
@@ -0,0 +1,14 @@
+"""Font module filled in by binfont.subset() for one panel.write call.
+
+panel.write only accepts a module, so the glyphs of the text being drawn
+are published here instead of in a dedicated object.
+"""
+
+MAP = ""
+BPP = 1
+HEIGHT = 17
+MAX_WIDTH = 16
+OFFSET_WIDTH = 2
+WIDTHS = b""
+OFFSETS = b""
+BITMAPS = b""
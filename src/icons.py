@@ -0,0 +1,92 @@
+"""Weather icons and button chrome drawn from rectangles.
+
+These are the shapes the sprite atlas is built from (tools/build_sprites.py
+paints them onto an RGB565 canvas) and what the Pico falls back to when
+sprites.bin is missing. ``target`` is anything with fill_rect() and rect()
+taking a 16-bit color: the panel, or the host tool's canvas.
+"""
+
+ICON_SIZE = 32
+
+# Sprite id -> icon color (r, g, b)
+ICON_COLORS = {
+    "sun": (255, 205, 60),
+    "cloud": (180, 180, 180),
+    "rain": (64, 150, 235),
+    "snow": (200, 230, 255),
+    "storm": (220, 80, 120),
+}
+
+# Button chrome per state: (fill, border)
+BUTTON_STYLES = {
+    "button": ((30, 30, 30), (180, 180, 180)),
+    "button_active": ((90, 90, 90), (255, 255, 255)),
+}
+
+_GRAY = (100, 100, 100)
+
+
+def color565(r, g, b):
+    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+
+def paint_sun(target, x, y, color):
+    # Filled circle with rays
+    target.fill_rect(x + 8, y + 8, 16, 16, color)
+    for dy in (0, 28):
+        target.fill_rect(x + 12, y + dy, 8, 4, color)
+    for dx in (0, 28):
+        target.fill_rect(x + dx, y + 12, 4, 8, color)
+
+
+def paint_cloud(target, x, y, color):
+    # Two overlapping rectangles
+    target.fill_rect(x + 4, y + 12, 24, 12, color)
+    target.fill_rect(x + 8, y + 6, 16, 8, color)
+
+
+def _paint_dark_cloud(target, x, y):
+    c = color565(*_GRAY)
+    target.fill_rect(x + 4, y + 4, 24, 10, c)
+    target.fill_rect(x + 8, y + 0, 16, 6, c)
+
+
+def paint_rain(target, x, y, color):
+    # Cloud + rain drops
+    _paint_dark_cloud(target, x, y)
+    for dx in (6, 14, 22):
+        target.fill_rect(x + dx, y + 18, 2, 6, color)
+        target.fill_rect(x + dx, y + 26, 2, 4, color)
+
+
+def paint_storm(target, x, y, color):
+    # Cloud + lightning bolt
+    _paint_dark_cloud(target, x, y)
+    target.fill_rect(x + 14, y + 14, 6, 4, color)
+    target.fill_rect(x + 12, y + 18, 6, 4, color)
+    target.fill_rect(x + 10, y + 22, 6, 4, color)
+
+
+def paint_snow(target, x, y, color):
+    # Snowflake: cross pattern
+    target.fill_rect(x + 14, y + 2, 4, 28, color)
+    target.fill_rect(x + 2, y + 14, 28, 4, color)
+    target.fill_rect(x + 6, y + 6, 4, 4, color)
+    target.fill_rect(x + 22, y + 6, 4, 4, color)
+    target.fill_rect(x + 6, y + 22, 4, 4, color)
+    target.fill_rect(x + 22, y + 22, 4, 4, color)
+
+
+def paint_button(target, x, y, width, height, style):
+    fill, border = BUTTON_STYLES[style]
+    target.fill_rect(x, y, width, height, color565(*fill))
+    target.rect(x, y, width, height, color565(*border))
+
+
+PAINTERS = {
+    "sun": paint_sun,
+    "cloud": paint_cloud,
+    "rain": paint_rain,
+    "storm": paint_storm,
+    "snow": paint_snow,
+}
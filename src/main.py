@@ -1,18 +1,39 @@
 import time
-import socket
-import json
 import os
 import network
-from machine import Pin, SPI
+import ubinascii
+from machine import Pin, SPI, unique_id
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
 
 from display_manager import DisplayManager
+from framing import LineFramer, FRAME_TOO_LARGE
+from coalesce import coalesce
+from bg_transfer import TRANSFER_COMMANDS
+from rgb565 import EXTENSION as RAW_EXTENSION
+from text_renderer import GLYPH_HEIGHT, store_glyphs, glyph_inventory
+from codec import (
+    PROTO_JSON, SUPPORTED_PROTOCOLS, encode_message, decode_message, negotiate,
+)
 from config import (
-    TCP_SERVER_HOST, TCP_SERVER_PORT, BUFFER_SIZE, RECONNECT_DELAY,
-    SOCKET_TIMEOUT, AUTO_REFRESH_INTERVAL, NTP_SYNC_INTERVAL,
-    SD_CS, SD_MOUNT_POINT,
+    TCP_SERVER_HOST, TCP_SERVER_PORT, MAX_FRAME_SIZE, RECONNECT_DELAY,
+    AUTO_REFRESH_INTERVAL, NTP_SYNC_INTERVAL, TOUCH_POLL_MS,
+    WIFI_CHECK_INTERVAL, SD_CS, SD_MOUNT_POINT, DEVICE_ID, DEVICE_GROUPS,
 )
 from secrets import WIFI_SSID, WIFI_PASSWORD
 
+FIRMWARE_VERSION = "1.0"
+NTP_RETRY_TIMEOUT = 0.2  # seconds; background re-syncs run on the event loop
+# Announced in hello so the host knows what it may send this device.
+CAPABILITIES = ("bg_transfer", "glyph_pack", "prelaid", "coalesce", "stats")
+
+
+def device_id():
+    return DEVICE_ID or ubinascii.hexlify(unique_id()).decode()
+
 
 def mount_sd():
     try:
@@ -31,9 +52,16 @@ def mount_sd():
         spi.init(baudrate=20_000_000)
         os.mount(os.VfsFat(sd), SD_MOUNT_POINT)
         print("SD mount OK")
-        files = [SD_MOUNT_POINT + "/" + f
-                 for f in os.listdir(SD_MOUNT_POINT)
-                 if f.startswith("background_") and f.endswith(".jpg")]
+        # Prefer a pre-converted .rgb565 over the JPEG with the same name.
+        stems = {}
+        for f in os.listdir(SD_MOUNT_POINT):
+            if not f.startswith("background_"):
+                continue
+            if f.endswith(RAW_EXTENSION):
+                stems[f[:-len(RAW_EXTENSION)]] = f
+            elif f.endswith(".jpg"):
+                stems.setdefault(f[:-4], f)
+        files = [SD_MOUNT_POINT + "/" + f for f in stems.values()]
         files.sort()
         print("SD backgrounds:", len(files))
         return files
@@ -42,28 +70,22 @@ def mount_sd():
         return []
 
 
-def sync_ntp():
+def sync_ntp(attempts=3, timeout=1):
+    """Set the RTC from NTP; ``timeout`` is the socket timeout per attempt (s)."""
     import ntptime
-    for attempt in range(3):
+    ntptime.timeout = timeout
+    for attempt in range(attempts):
         try:
             ntptime.settime()
             print("NTP sync OK")
             return True
         except Exception as e:
             print("NTP sync attempt", attempt + 1, "failed:", e)
-            time.sleep(2)
+            if attempt + 1 < attempts:
+                time.sleep(2)
     return False
 
 
-def send_event(sock, event):
-    if not event:
-        return
-    try:
-        sock.send((json.dumps(event) + "\n").encode())
-    except OSError:
-        pass
-
-
 def connect_wifi():
     wlan = network.WLAN(network.STA_IF)
     if not wlan.active():
@@ -80,79 +102,262 @@ def handle_command(payload, display):
     cmd = payload.get("cmd")
     if cmd == "set_mode":
         mode = payload.get("mode")
-        data = payload.get("payload", {})
-        return display.set_mode(mode, data)
+        data = payload.get("payload") or {}
+        response = display.set_mode(mode, data, payload.get("replace", False))
+        if "rev" in data:
+            # Echoed so the host can match the answer to its command.
+            response["rev"] = data["rev"]
+        return response
     if cmd == "refresh":
-        display.refresh()
+        display.refresh(full=True)
         return {"status": "ok", "mode": display.current_mode}
+    if cmd in TRANSFER_COMMANDS:
+        return display.handle_transfer(payload)
+    if cmd == "has_asset":
+        return {"status": "ok", "cmd": cmd,
+                "present": display.has_assets(payload.get("hashes"))}
+    if cmd == "glyph_pack":
+        return handle_glyph_pack(payload)
     return {"status": "error", "reason": "unknown_command"}
 
 
+def handle_glyph_pack(payload):
+    cmd = "glyph_pack"
+    if payload.get("height") != GLYPH_HEIGHT:
+        return {"status": "error", "cmd": cmd, "reason": "bad_height"}
+    data = payload.get("data") or b""
+    try:
+        if not isinstance(data, (bytes, bytearray)):
+            data = ubinascii.a2b_base64(data)
+        stored, evicted = store_glyphs(data)
+    except ValueError:
+        return {"status": "error", "cmd": cmd, "reason": "bad_data"}
+    response = {"status": "ok", "cmd": cmd, "stored": len(stored)}
+    if evicted:
+        response["evicted"] = evicted  # the host must send these again when needed
+    return response
+
+
+class LoopStats:
+    """Scheduling lag of a periodic task, i.e. how late it woke up."""
+
+    def __init__(self, period_ms):
+        self.period_ms = period_ms
+        self.reset()
+
+    def reset(self):
+        self.samples = 0
+        self.total_ms = 0
+        self.max_ms = 0
+        self.last_ms = 0
+        self.late = 0
+
+    def record(self, lag_ms):
+        self.samples += 1
+        self.total_ms += lag_ms
+        self.last_ms = lag_ms
+        if lag_ms > self.max_ms:
+            self.max_ms = lag_ms
+        if lag_ms > self.period_ms:
+            self.late += 1
+
+    def snapshot(self):
+        avg = self.total_ms / self.samples if self.samples else 0
+        return {
+            "period_ms": self.period_ms,
+            "samples": self.samples,
+            "avg_ms": round(avg, 2),
+            "max_ms": self.max_ms,
+            "last_ms": self.last_ms,
+            "late": self.late,
+        }
+
+
+class Runtime:
+    """Cooperative tasks sharing one DisplayManager through a render lock.
+
+    - network: TCP stream reader, dispatches host commands
+    - touch: polls the touch panel every TOUCH_POLL_MS
+    - clock: refreshes status_datetime on minute boundaries
+    - supervisor: keeps Wi-Fi up and re-syncs NTP in the background
+    """
+
+    def __init__(self, display, wlan, ntp_ok):
+        self.display = display
+        self.wlan = wlan
+        self.framer = LineFramer(MAX_FRAME_SIZE)
+        self.proto = PROTO_JSON
+        self.render_lock = asyncio.Lock()
+        self.writer = None
+        # Tasks must not wait on the socket together (uasyncio asserts).
+        self.send_lock = asyncio.Lock()
+        self.loop_stats = LoopStats(TOUCH_POLL_MS)
+        self.superseded = 0  # commands dropped by coalesce, reported by stats
+        self.last_ntp_sync = time.time() if ntp_ok else 0
+
+    async def send(self, message):
+        writer = self.writer
+        if writer is None or not message:
+            return
+        async with self.send_lock:
+            try:
+                writer.write(encode_message(message, self.proto))
+                await writer.drain()
+            except OSError:
+                pass
+
+    def capabilities(self):
+        caps = list(CAPABILITIES)
+        if self.display.viewport.hardware:
+            caps.append("hw_scroll")
+        return caps
+
+    def dispatch(self, payload):
+        cmd = payload.get("cmd")
+        if cmd == "hello":
+            # Host's answer to our hello: switch outgoing framing.
+            self.proto = negotiate((payload.get("proto"),))
+            print("Protocol", self.proto)
+            return None
+        if cmd == "stats":
+            if payload.get("reset"):
+                self.loop_stats.reset()
+                self.superseded = 0
+            return {"status": "ok", "loop": self.loop_stats.snapshot(),
+                    "superseded": self.superseded}
+        return handle_command(payload, self.display)
+
+    async def network_task(self):
+        while True:
+            if not self.wlan.isconnected():
+                await asyncio.sleep(1)
+                continue
+            writer = None
+            try:
+                reader, writer = await asyncio.open_connection(
+                    TCP_SERVER_HOST, TCP_SERVER_PORT)
+                self.writer = writer
+                self.proto = PROTO_JSON
+                font_id, glyphs = glyph_inventory()
+                await self.send({"cmd": "hello", "proto": list(SUPPORTED_PROTOCOLS),
+                                 "font": font_id, "glyphs": glyphs,
+                                 "device": device_id(), "fw": FIRMWARE_VERSION,
+                                 "caps": self.capabilities(),
+                                 "groups": list(DEVICE_GROUPS),
+                                 "screen": {"mode": self.display.current_mode,
+                                            "rev": self.display.current_payload.get("rev")}})
+                await self._read_commands(reader)
+            except Exception as exc:
+                print("Socket error", exc)
+            finally:
+                self.writer = None
+                if writer:
+                    try:
+                        writer.close()
+                        await writer.wait_closed()
+                    except Exception:
+                        pass
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _read_commands(self, reader):
+        framer = self.framer
+        framer.reset()
+        while True:
+            nbytes = await reader.readinto(framer.writable())
+            if not nbytes:
+                raise OSError("socket closed")
+            framer.commit(nbytes)
+            # Drain every complete frame first so a burst renders only once.
+            batch = []
+            while True:
+                frame = framer.next_frame()
+                if frame is None:
+                    break
+                if frame is FRAME_TOO_LARGE:
+                    await self.send({"status": "error", "reason": "frame_too_large"})
+                    continue
+                try:
+                    payload = decode_message(framer.frame_type, frame)
+                except Exception:
+                    continue
+                if isinstance(payload, dict):
+                    batch.append(payload)
+            kept, superseded = coalesce(batch, self.display.handlers)
+            for payload in superseded:
+                self.superseded += 1
+                reply = {"status": "superseded", "cmd": payload.get("cmd"),
+                         "mode": payload.get("mode")}
+                rev = (payload.get("payload") or {}).get("rev")
+                if rev is not None:
+                    reply["rev"] = rev
+                await self.send(reply)
+            for payload in kept:
+                async with self.render_lock:
+                    response = self.dispatch(payload)
+                await self.send(response)
+
+    async def touch_task(self):
+        expected = time.ticks_add(time.ticks_ms(), TOUCH_POLL_MS)
+        while True:
+            delay = time.ticks_diff(expected, time.ticks_ms())
+            await asyncio.sleep_ms(delay if delay > 0 else 0)
+            now = time.ticks_ms()
+            lag = time.ticks_diff(now, expected)
+            self.loop_stats.record(lag)
+            # Skip missed slots instead of bursting to catch up.
+            expected = time.ticks_add(now if lag > TOUCH_POLL_MS else expected,
+                                      TOUCH_POLL_MS)
+            async with self.render_lock:
+                event = self.display.poll_touch()
+            if event:
+                await self.send(event)
+
+    async def clock_task(self):
+        while True:
+            # Wake just after the next minute boundary.
+            delay = AUTO_REFRESH_INTERVAL - (time.time() % AUTO_REFRESH_INTERVAL)
+            await asyncio.sleep(delay + 0.05)
+            if self.display.current_mode == "status_datetime":
+                async with self.render_lock:
+                    self.display.refresh()
+
+    async def supervisor_task(self):
+        while True:
+            await asyncio.sleep(WIFI_CHECK_INTERVAL)
+            if not self.wlan.isconnected():
+                print("Wi-Fi lost, reconnecting")
+                await self._reconnect_wifi()
+                continue
+            # ntptime blocks the whole loop while it waits for the reply, so
+            # make one short attempt per tick: a dead NTP server stalls touch
+            # for at most NTP_RETRY_TIMEOUT (plus the DNS lookup), not seconds.
+            if time.time() - self.last_ntp_sync >= NTP_SYNC_INTERVAL:
+                if sync_ntp(attempts=1, timeout=NTP_RETRY_TIMEOUT):
+                    self.last_ntp_sync = time.time()
+
+    async def _reconnect_wifi(self):
+        if not self.wlan.active():
+            self.wlan.active(True)
+        self.wlan.connect(WIFI_SSID, WIFI_PASSWORD)
+        deadline = time.time() + 15
+        while not self.wlan.isconnected() and time.time() < deadline:
+            await asyncio.sleep(0.5)
+
+    async def main(self):
+        asyncio.create_task(self.touch_task())
+        asyncio.create_task(self.clock_task())
+        asyncio.create_task(self.supervisor_task())
+        await self.network_task()
+
+
 def run():
     bg_list = mount_sd()
     display = DisplayManager()
     display.set_backgrounds(bg_list)
     wlan = connect_wifi()
     ntp_ok = sync_ntp()
-    last_ntp_sync = time.time() if ntp_ok else 0
-    last_refresh = time.time()
-    while True:
-        if not wlan.isconnected():
-            wlan = connect_wifi()
-        # Periodic NTP re-sync
-        now = time.time()
-        if now - last_ntp_sync >= NTP_SYNC_INTERVAL:
-            if sync_ntp():
-                last_ntp_sync = time.time()
-        sock = None
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(SOCKET_TIMEOUT)
-            sock.connect((TCP_SERVER_HOST, TCP_SERVER_PORT))
-            buffer = b""
-            while True:
-                try:
-                    chunk = sock.recv(BUFFER_SIZE)
-                except OSError as e:
-                    if e.args[0] == 110:  # ETIMEDOUT
-                        send_event(sock, display.poll_touch())
-                        # Auto-refresh for status_datetime mode
-                        now = time.time()
-                        if (display.current_mode == "status_datetime"
-                                and now - last_refresh >= AUTO_REFRESH_INTERVAL):
-                            display.refresh()
-                            last_refresh = now
-                        # Periodic NTP re-sync
-                        if now - last_ntp_sync >= NTP_SYNC_INTERVAL:
-                            if sync_ntp():
-                                last_ntp_sync = time.time()
-                        continue
-                    raise
-                if not chunk:
-                    raise OSError("socket closed")
-                buffer += chunk.replace(b"\r", b"")
-                while b"\n" in buffer:
-                    line, buffer = buffer.split(b"\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        payload = json.loads(line.decode("utf-8"))
-                    except Exception:
-                        continue
-                    response = handle_command(payload, display)
-                    if response.get("status") == "ok":
-                        last_refresh = time.time()
-                    try:
-                        sock.send((json.dumps(response) + "\n").encode())
-                    except OSError:
-                        raise
-        except Exception as exc:
-            print("Socket error", exc)
-            time.sleep(RECONNECT_DELAY)
-        finally:
-            if sock:
-                sock.close()
+    runtime = Runtime(display, wlan, ntp_ok)
+    asyncio.run(runtime.main())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,224 @@
+"""Background pixels saved under dynamic text areas.
+
+Redrawing a text field used to mean a black fill_rect (a hole in the
+background) or a full repaint with another JPEG decode. Instead, the pixels
+under each registered region are captured once per background and stored
+as an RGB565 sidecar file; later redraws restore just that rectangle.
+
+Capture reads the rectangle straight from a pre-converted .rgb565 image or
+decodes only that window of a JPEG with ``panel.jpg_decode``. Sidecars are
+written once per (background, region); regions that fit the RAM budget are
+also kept in memory for the current background so the minute tick does not
+touch storage at all. Larger regions are captured and written in stripes of
+rgb565.STRIP_ROWS rows, so they never need their full size in RAM.
+
+The sidecar directory is capped at ``max_bytes``: the least recently used
+sidecars go first, never those of the background on screen. When the
+AssetCache evicts a background, ``forget`` removes its sidecars with it.
+The LRU order is kept in RAM only; after a reboot it starts from the
+directory listing.
+
+Text and sprites drawn into a region are composited onto its pixels
+(``backdrop``) rather than drawn as opaque cells, so the restored
+background survives around the glyphs.
+"""
+
+import os
+
+import rgb565
+
+
+class Backdrop:
+    """Background pixels of one region, to composite text and sprites onto.
+
+    The rows come from RAM (``pixels``) or from the region's sidecar file.
+    """
+
+    def __init__(self, rect, pixels=None, path=None):
+        self.rect = rect
+        self.pixels = pixels
+        self.path = path
+
+    def fill(self, buf, x, y, w, h):
+        """Copy the background under screen rect (x, y, w, h) into buf.
+
+        False, leaving buf alone, unless the rect lies inside the region.
+        """
+        rx, ry, rw, rh = self.rect
+        if x < rx or y < ry or x + w > rx + rw or y + h > ry + rh:
+            return False
+        if self.pixels is None:
+            try:
+                rgb565.read_rect(self.path, x - rx, y - ry, w, h, buf)
+            except (OSError, ValueError):
+                return False
+            return True
+        stride = w * 2
+        view = memoryview(buf)
+        src = memoryview(self.pixels)
+        for row in range(h):
+            start = ((y - ry + row) * rw + x - rx) * 2
+            view[row * stride:(row + 1) * stride] = src[start:start + stride]
+        return True
+
+
+class RegionCache:
+    def __init__(self, panel, directory, ram_budget, max_bytes):
+        self.panel = panel
+        self.dir = directory
+        self.ram_budget = ram_budget
+        self.max_bytes = max_bytes
+        self.bg_key = None
+        self.ram = {}  # region key -> pixels of the current background
+        self.files = None  # [[sidecar name, size], ...] oldest first, loaded on first use
+
+    def _name(self, bg_key, key, rect):
+        return "{}_{}_{}_{}_{}_{}{}".format(
+            bg_key, key, rect[0], rect[1], rect[2], rect[3], rgb565.EXTENSION)
+
+    def _index(self):
+        if self.files is None:
+            try:
+                names = os.listdir(self.dir)
+            except OSError:
+                names = []
+                try:
+                    os.mkdir(self.dir)
+                except OSError:
+                    pass
+            self.files = [[name, os.stat(self.dir + "/" + name)[6]]
+                          for name in names if name.endswith(rgb565.EXTENSION)]
+        return self.files
+
+    def _find(self, name):
+        for i, entry in enumerate(self._index()):
+            if entry[0] == name:
+                return i
+        return -1
+
+    def _touch(self, name):
+        i = self._find(name)
+        if i >= 0:
+            self.files.append(self.files.pop(i))
+
+    def _added(self, name, w, h):
+        self._index().append([name, rgb565.HEADER_SIZE + w * h * 2])
+        total = sum(entry[1] for entry in self.files)
+        current = self.bg_key + "_"
+        i = 0
+        while total > self.max_bytes and i < len(self.files):
+            old, size = self.files[i]
+            if old.startswith(current):
+                i += 1
+                continue
+            self._remove(old)
+            self.files.pop(i)
+            total -= size
+
+    def _remove(self, name):
+        try:
+            os.remove(self.dir + "/" + name)
+        except OSError:
+            pass
+
+    def forget(self, bg_key):
+        """Drop every sidecar of a background (it left the AssetCache)."""
+        prefix = bg_key + "_"
+        files = self._index()
+        i = 0
+        while i < len(files):
+            if files[i][0].startswith(prefix):
+                self._remove(files[i][0])
+                files.pop(i)
+            else:
+                i += 1
+        if bg_key == self.bg_key:
+            self.bg_key = None
+            self.ram = {}
+
+    def _capture(self, path, x, y, w, h):
+        if path.endswith(rgb565.EXTENSION):
+            return rgb565.read_rect(path, x, y, w, h)
+        pixels, _, _ = self.panel.jpg_decode(path, x, y, w, h)
+        return pixels
+
+    def _capture_striped(self, path, name, x, y, w, h):
+        try:
+            with open(self.dir + "/" + name, "wb") as f:
+                rgb565.write_header(f, w, h)
+                row = 0
+                while row < h:
+                    rows = min(rgb565.STRIP_ROWS, h - row)
+                    f.write(self._capture(path, x, y + row, w, rows))
+                    row += rows
+        except Exception:
+            self._remove(name)
+            raise
+
+    def _select(self, bg_key):
+        if bg_key != self.bg_key:
+            self.bg_key = bg_key
+            self.ram = {}
+
+    def _ram_used(self):
+        return sum(len(p) for p in self.ram.values())
+
+    def _load(self, bg_key, path, key, rect):
+        """Ensure the sidecar exists; return the pixels if they fit in RAM."""
+        x, y, w, h = rect
+        name = self._name(bg_key, key, rect)
+        sidecar = self.dir + "/" + name
+        fits = self._ram_used() + w * h * 2 <= self.ram_budget
+        if self._find(name) >= 0:
+            self._touch(name)
+            if not fits:
+                return None
+            pixels = rgb565.read_rect(sidecar, 0, 0, w, h)
+        elif fits:
+            pixels = self._capture(path, x, y, w, h)
+            rgb565.write_file(sidecar, w, h, pixels)
+            self._added(name, w, h)
+        else:
+            self._capture_striped(path, name, x, y, w, h)
+            self._added(name, w, h)
+            return None
+        self.ram[key] = pixels
+        return pixels
+
+    def backdrop(self, source, key, rect):
+        """Backdrop for drawing into a region, captured if needed; None if unknown."""
+        if not source:
+            return None
+        bg_key, path = source
+        self._select(bg_key)
+        try:
+            pixels = self.ram.get(key)
+            if pixels is None:
+                pixels = self._load(bg_key, path, key, rect)
+        except Exception:
+            return None
+        if pixels is not None:
+            return Backdrop(rect, pixels=pixels)
+        return Backdrop(rect, path=self.dir + "/" + self._name(bg_key, key, rect))
+
+    def restore(self, source, key, rect):
+        """Repaint the background under ``rect``; False if it is unknown.
+
+        ``source`` is ``(bg_key, path)`` for the applied background or None.
+        """
+        if not source:
+            return False
+        bg_key, path = source
+        self._select(bg_key)
+        x, y, w, h = rect
+        try:
+            pixels = self.ram.get(key)
+            if pixels is None:
+                pixels = self._load(bg_key, path, key, rect)
+            if pixels is not None:
+                self.panel.blit_buffer(pixels, x, y, w, h)
+            else:
+                rgb565.blit_file(self.panel, self.dir + "/" + self._name(bg_key, key, rect), x, y)
+            return True
+        except Exception:
+            return False
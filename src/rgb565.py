@@ -0,0 +1,77 @@
+"""Pre-converted RGB565 images streamed straight to the panel.
+
+File layout (written by tools/convert_backgrounds.py)::
+
+    0    4 bytes  magic b"R565"
+    4    u16 BE   width
+    6    u16 BE   height
+    8    ...      zero padding up to HEADER_SIZE
+    512  width * height * 2 bytes of big-endian RGB565, row-major
+
+The header fills one SD block so pixel reads stay block-aligned; rows are
+read in strips of STRIP_ROWS (a whole number of 512-byte blocks for a
+240 px wide image) and each strip is sent with one blit_buffer call.
+"""
+
+import struct
+
+MAGIC = b"R565"
+HEADER_SIZE = 512
+STRIP_ROWS = 16
+EXTENSION = ".rgb565"
+
+
+def read_header(f):
+    header = f.read(8)
+    if len(header) != 8 or header[:4] != MAGIC:
+        raise ValueError("not an RGB565 image")
+    width, height = struct.unpack(">HH", header[4:])
+    return width, height
+
+
+def write_header(f, width, height):
+    header = MAGIC + struct.pack(">HH", width, height)
+    f.write(header + bytes(HEADER_SIZE - len(header)))
+
+
+def write_file(path, width, height, pixels):
+    with open(path, "wb") as f:
+        write_header(f, width, height)
+        f.write(pixels)
+
+
+def read_rect(path, x, y, width, height, out=None):
+    """Read a rectangle of pixels from an RGB565 file into ``out`` (default: a new bytearray)."""
+    with open(path, "rb") as f:
+        img_width, img_height = read_header(f)
+        if x + width > img_width or y + height > img_height:
+            raise ValueError("rectangle outside image")
+        stride = width * 2
+        if out is None:
+            out = bytearray(stride * height)
+        view = memoryview(out)
+        for row in range(height):
+            f.seek(HEADER_SIZE + ((y + row) * img_width + x) * 2)
+            f.readinto(view[row * stride:(row + 1) * stride])
+    return out
+
+
+def blit_file(panel, path, x=0, y=0, buf=None):
+    """Stream an RGB565 file onto the panel; returns (width, height)."""
+    with open(path, "rb") as f:
+        width, height = read_header(f)
+        stride = width * 2
+        if buf is None or len(buf) < stride:
+            buf = bytearray(stride * STRIP_ROWS)
+        rows_per_read = len(buf) // stride
+        view = memoryview(buf)
+        f.seek(HEADER_SIZE)
+        row = 0
+        while row < height:
+            rows = min(rows_per_read, height - row)
+            nbytes = rows * stride
+            if f.readinto(view[:nbytes]) != nbytes:
+                raise ValueError("truncated RGB565 image")
+            panel.blit_buffer(view[:nbytes], x, y + row, width, rows)
+            row += rows
+    return width, height
@@ -0,0 +1,47 @@
+"""Hardware vertical scrolling of the content area (ST7789 VSCRDEF/VSCSAD).
+
+The area below the button bar is defined as the panel's vertical scroll
+area. Its frame memory is used as a ring: content row ``c`` is always
+drawn at ring row ``c % height``, and moving the scroll start address
+(VSCSAD) changes which ring row appears at the top of the viewport. A
+scroll by one line therefore costs one register write plus drawing the
+single line that became visible.
+
+Scroll areas are defined in frame memory order, top to bottom as the panel
+scans. With rotation=2 (the board mounted upside down) memory row 0 is at
+the bottom of the picture: the button bar is the *bottom* fixed area, and
+the start address moves the other way.
+"""
+
+
+class ScrollViewport:
+    def __init__(self, panel, top, height, screen_height, flipped):
+        self.panel = panel
+        self.top = top          # first screen row of the viewport
+        self.height = height    # rows in the viewport (the ring size)
+        self.flipped = flipped
+        self.offset = 0         # content row shown at the top of the viewport
+        self.hardware = hasattr(panel, "vscrdef") and hasattr(panel, "vscsad")
+        if flipped:
+            self._tfa = 0
+            bfa = top
+        else:
+            self._tfa = top
+            bfa = screen_height - top - height
+        if self.hardware:
+            panel.vscrdef(self._tfa, height, bfa)
+            panel.vscsad(self._tfa)
+
+    def set_offset(self, offset):
+        """Show content row ``offset`` at the top of the viewport."""
+        self.offset = offset
+        shift = -offset if self.flipped else offset
+        self.panel.vscsad(self._tfa + shift % self.height)
+
+    def reset(self):
+        if self.offset:
+            self.set_offset(0)
+
+    def screen_y(self, content_y):
+        """Screen row to draw content row ``content_y`` at (its ring row)."""
+        return self.top + content_y % self.height
@@ -0,0 +1,87 @@
+"""Pre-rendered RGB565 sprites drawn with one window write each.
+
+Weather icons and button chrome used to be painted with several fill_rect
+and rect calls, each its own SPI window setup. tools/build_sprites.py
+renders them once into sprites.bin; drawing a sprite reads its pixels into
+a reusable buffer and sends them with one blit_buffer.
+
+Black pixels are the sprites' transparent areas (build_sprites.py flattens
+alpha onto black). Given a backdrop (region_cache.Backdrop), a sprite is
+blitted onto the background pixels with black as the framebuf key, so an
+icon does not bring a black square with it.
+
+File layout (little-endian header, big-endian pixels as the panel wants)::
+
+    0   4 bytes  magic b"SPA1"
+    4   u16      sprite count N
+    6   u16      zero
+    8   N x 24   entries: 16-byte NUL-padded id, u16 width, u16 height,
+                 u32 pixel offset from the start of the file
+    ..  pixels, RGB565 big-endian, row-major per sprite
+"""
+
+import struct
+
+try:
+    import framebuf
+except ImportError:
+    framebuf = None
+
+MAGIC = b"SPA1"
+HEADER_SIZE = 8
+ENTRY_SIZE = 24
+ID_SIZE = 16
+
+
+class SpriteAtlas:
+    def __init__(self, path):
+        self.path = path
+        self.sprites = {}  # id -> (width, height, offset)
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE or header[:4] != MAGIC:
+                raise ValueError("not a SPA1 sprite atlas")
+            count = struct.unpack("<H", header[4:6])[0]
+            table = f.read(count * ENTRY_SIZE)
+        largest = 0
+        for i in range(count):
+            entry = table[i * ENTRY_SIZE:(i + 1) * ENTRY_SIZE]
+            name = bytes(entry[:ID_SIZE]).rstrip(b"\0").decode()
+            width, height, offset = struct.unpack("<HHI", entry[ID_SIZE:])
+            self.sprites[name] = (width, height, offset)
+            largest = max(largest, width * height * 2)
+        self._buf = bytearray(largest)
+        self._back = None  # backdrop pixels for keyed draws, allocated on first use
+        self._file = open(path, "rb")
+
+    def __contains__(self, sprite_id):
+        return sprite_id in self.sprites
+
+    def size(self, sprite_id):
+        width, height, _ = self.sprites[sprite_id]
+        return width, height
+
+    def draw(self, panel, sprite_id, x, y, backdrop=None):
+        """Blit a sprite; False if the atlas does not have it.
+
+        With a backdrop its black pixels show the background instead.
+        """
+        entry = self.sprites.get(sprite_id)
+        if entry is None:
+            return False
+        width, height, offset = entry
+        size = width * height * 2
+        view = memoryview(self._buf)[:size]
+        self._file.seek(offset)
+        self._file.readinto(view)
+        if backdrop is not None and framebuf:
+            if self._back is None:
+                self._back = bytearray(len(self._buf))
+            back = memoryview(self._back)[:size]
+            if backdrop.fill(back, x, y, width, height):
+                # Black is 0 in either byte order, so the key needs no swap.
+                out = framebuf.FrameBuffer(back, width, height, framebuf.RGB565)
+                out.blit(framebuf.FrameBuffer(view, width, height, framebuf.RGB565), 0, 0, 0)
+                view = back
+        panel.blit_buffer(view, x, y, width, height)
+        return True
@@ -2,28 +2,155 @@
 
 Provides unified text drawing that auto-selects between:
 - panel.text(vga1_8x16, ...) fast path for ASCII-only text (8px/char)
-- panel.write(font_jp16, ...) for text containing Japanese/non-ASCII (16px/char)
+- font_jp16 glyphs for Japanese/non-ASCII (16px/char), read on demand from
+  the binary font file (see binfont.py), then glyphs pushed by the host
+  (see glyph_cache.py)
 - Custom rendering for ° (degree sign) which has a broken glyph in the font
 
+Mixed strings are composed into one RGB565 line buffer with framebuf and
+sent with a single blit_buffer call. Without framebuf they are split into
+maximal ASCII / degree / JP runs, one panel call per run. Given a backdrop
+(region_cache.Backdrop), the line buffer starts from the background pixels
+and only glyph ink is written over them, so the text has no solid cell.
+
 Also provides pixel-width-based text wrapping for Japanese text.
+
+Measuring and wrapping also run under CPython, where the host uses them to
+lay out payloads ahead of time (host/layout.py); there is no vga1_8x16 or
+framebuf there, only the fonts given to set_fonts().
 """
 
-import vga1_8x16 as font_ascii
-import font_jp16
+try:
+    import vga1_8x16 as font_ascii
+except ImportError:
+    font_ascii = None  # CPython: width model only
+from binfont import BinaryFont, subset
+from glyph_cache import GlyphCache
+from config import (
+    FONT_JP_FILE, FONT_GLYPH_CACHE, GLYPH_CACHE_FILE, GLYPH_CACHE_MAX_BYTES,
+    TEXT_LAYOUT_CACHE,
+)
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ucollections import OrderedDict
+
+try:
+    import framebuf
+except ImportError:
+    framebuf = None
 
 # Character widths by rendering path
 _ASCII_CHAR_W = 8   # vga1_8x16 fixed width
 _JP_CHAR_W = 16     # font_jp16 (DroidSansFallbackFull full-width)
 _DEGREE_CHAR_W = 7  # custom ° rendering width
 
+# Run kinds for _split_runs
+_RUN_ASCII = 0
+_RUN_DEGREE = 1
+_RUN_JP = 2
+
+GLYPH_HEIGHT = 17   # font_jp16 glyph height, also required of pushed glyphs
+
+_LINE_WIDTH = 240   # panel width; wider strings fall back to runs
+_LINE_HEIGHT = GLYPH_HEIGHT
+_ASCII_GLYPH_BYTES = 16  # vga1_8x16: 8 px wide, one byte per row
+
+_line = None  # [line buffer, palette, ascii glyph buffer, ascii glyph fb]
+_font_jp = None
+_pushed = None
+
+# Layout memo, oldest first: (text, width) -> (lines, widths) for wrapping,
+# (text, max_px) -> prefix for truncation. The dict hashes the text and
+# compares it on collision, so equal keys always mean equal text.
+_wrapped = OrderedDict()
+_truncated = OrderedDict()
+
+
+def _jp_font():
+    """The Japanese font, opened on first use; False if the file is missing."""
+    global _font_jp
+    if _font_jp is None:
+        try:
+            _font_jp = BinaryFont(FONT_JP_FILE, FONT_GLYPH_CACHE)
+        except (OSError, ValueError) as exc:
+            print("Japanese font unavailable:", exc)
+            _font_jp = False
+    return _font_jp
+
+
+def _pushed_glyphs():
+    """Host-pushed glyph cache, opened on first use; False if unusable."""
+    global _pushed
+    if _pushed is None:
+        try:
+            _pushed = GlyphCache(GLYPH_CACHE_FILE, GLYPH_CACHE_MAX_BYTES, GLYPH_HEIGHT)
+        except OSError as exc:
+            print("Glyph cache unavailable:", exc)
+            _pushed = False
+    return _pushed
+
+
+def set_fonts(baked, pushed):
+    """Use these glyph sources instead of opening the configured files.
+
+    Either may be False. The host passes its copy of the baked font and
+    the widths of the glyphs it would push.
+    """
+    global _font_jp, _pushed
+    _font_jp = baked
+    _pushed = pushed
+    clear_layout_cache()
+
+
+def glyph_lookup(ch):
+    """(font, index, width) of a non-ASCII ch; font is None if missing.
+
+    The baked font is binary-searched over its sorted codepoint index (cost
+    grows with log2 of the charset size), then host-pushed glyphs are
+    checked. Missing glyphs keep the full-width pitch.
+    """
+    font = _jp_font()
+    if font:
+        index = font.find(ch)
+        if index >= 0:
+            return font, index, font.widths[index]
+    pushed = _pushed_glyphs()
+    if pushed:
+        hit = pushed.lookup(ch)
+        if hit:
+            return pushed, hit[0], hit[1]
+    return None, -1, _JP_CHAR_W
+
+
+def store_glyphs(data):
+    """Add glyph_pack records from the host; returns (stored, evicted) codepoints."""
+    pushed = _pushed_glyphs()
+    if not pushed:
+        return [], []
+    font = _jp_font()
+    stored, evicted = pushed.add(data, skip=lambda cp: bool(font) and font.find(chr(cp)) >= 0)
+    if stored or evicted:
+        clear_layout_cache()  # layouts measured with the old set of glyphs
+    return stored, evicted
+
+
+def glyph_inventory():
+    """(baked font id, pushed codepoints) advertised to the host in hello."""
+    font = _jp_font()
+    pushed = _pushed_glyphs()
+    return (font.index_id() if font else None), (pushed.codepoints() if pushed else [])
 
-def _char_px_width(ch):
+
+def char_width(ch):
     """Get pixel width for a character as draw_text would render it."""
-    if ch == '\u00b0':
+    code = ord(ch)
+    if code <= 126:
+        return _ASCII_CHAR_W
+    if code == 0xB0:
         return _DEGREE_CHAR_W
-    if ord(ch) > 126:
-        return _JP_CHAR_W
-    return _ASCII_CHAR_W
+    return glyph_lookup(ch)[2]
 
 
 def _has_non_ascii(text):
@@ -34,30 +161,207 @@ def _has_non_ascii(text):
     return False
 
 
-def draw_text(panel, text, x, y, fg_color, bg_color=0):
+def _run_kind(ch):
+    code = ord(ch)
+    if code <= 126:
+        return _RUN_ASCII
+    if code == 0xB0:
+        return _RUN_DEGREE
+    return _RUN_JP
+
+
+def _split_runs(text):
+    """Split text into maximal (kind, substring) runs."""
+    runs = []
+    start = 0
+    kind = _run_kind(text[0])
+    for i in range(1, len(text)):
+        k = _run_kind(text[i])
+        if k != kind:
+            runs.append((kind, text[start:i]))
+            start = i
+            kind = k
+    runs.append((kind, text[start:]))
+    return runs
+
+
+def text_width(text):
+    width = 0
+    for ch in text:
+        width += char_width(ch)
+    return width
+
+
+def draw_text(panel, text, x, y, fg_color, bg_color=0, backdrop=None):
     """Draw text, auto-selecting the appropriate font per character.
 
     - ASCII chars: vga1_8x16 at 8px
     - ° (degree sign): custom small circle (font glyph is broken)
     - Other non-ASCII: font_jp16 at 16px
+
+    With a backdrop the text is composited onto the background instead of
+    drawn on bg_color cells.
     """
     if not text:
         return
-    if not _has_non_ascii(text):
+    if backdrop is None and not _has_non_ascii(text):
         panel.text(font_ascii, text, x, y, fg_color)
         return
-    # Mixed text: render character by character
+    if framebuf and _compose(panel, text, x, y, fg_color, bg_color, backdrop):
+        return
+    for kind, run in _split_runs(text):
+        if kind == _RUN_ASCII:
+            panel.text(font_ascii, run, x, y, fg_color)
+            x += _ASCII_CHAR_W * len(run)
+        elif kind == _RUN_DEGREE:
+            for _ in run:
+                # Draw ° as a small hollow rectangle (degree sign)
+                panel.rect(x + 1, y + 1, 4, 4, fg_color)
+                x += _DEGREE_CHAR_W
+        else:
+            x = _write_jp_run(panel, run, x, y, fg_color, bg_color)
+
+
+def _write_jp_run(panel, run, x, y, fg_color, bg_color):
+    """Write a run of JP glyphs, one call per glyph source; returns the x after it."""
+    # panel.write skips glyphs missing from the font without advancing, so
+    # split where the source changes (or a glyph is missing) to keep the
+    # pitch used for measuring.
+    current = None
+    start = 0
+    start_x = x
+    for i, ch in enumerate(run):
+        font, _, width = glyph_lookup(ch)
+        if font is not current:
+            if current is not None:
+                part = run[start:i]
+                panel.write(subset(current, part), part, start_x, y, fg_color, bg_color)
+            current = font
+            start = i
+            start_x = x
+        x += width
+    if current is not None:
+        part = run[start:]
+        panel.write(subset(current, part), part, start_x, y, fg_color, bg_color)
+    return x
+
+
+def _swap(color):
+    # framebuf stores RGB565 little-endian; the panel expects big-endian.
+    return ((color & 0xFF) << 8) | (color >> 8)
+
+
+def _line_state():
+    global _line
+    if _line is None:
+        buf = bytearray(_LINE_WIDTH * _LINE_HEIGHT * 2)
+        ascii_buf = bytearray(_ASCII_GLYPH_BYTES)
+        _line = [
+            buf,
+            framebuf.FrameBuffer(bytearray(4), 2, 1, framebuf.RGB565),
+            ascii_buf,
+            framebuf.FrameBuffer(ascii_buf, _ASCII_CHAR_W, font_ascii.HEIGHT,
+                                 framebuf.MONO_HLSB),
+        ]
+    return _line
+
+
+def _compose(panel, text, x, y, fg_color, bg_color, backdrop=None):
+    """Render text into the line buffer and blit it once; False if too wide."""
+    width = text_width(text)
+    if width > _LINE_WIDTH:
+        return False
+    buf, palette, ascii_buf, ascii_fb = _line_state()
+    fg = _swap(fg_color)
+    bg = _swap(bg_color)
+    # A FrameBuffer exactly as wide as the text keeps the rows contiguous.
+    line = framebuf.FrameBuffer(buf, width, _LINE_HEIGHT, framebuf.RGB565)
+    if backdrop is not None and backdrop.fill(buf, x, y, width, _LINE_HEIGHT):
+        # Glyph background pixels map to a colour other than fg, which the
+        # blits skip: only the ink lands on the background.
+        key = fg ^ 1
+        palette.pixel(0, 0, key)
+    else:
+        key = -1
+        palette.pixel(0, 0, bg)
+        line.fill(bg)
+    palette.pixel(1, 0, fg)
+    cx = 0
     for ch in text:
-        if ch == '\u00b0':
-            # Draw ° as a small hollow rectangle (degree sign)
-            panel.rect(x + 1, y + 1, 4, 4, fg_color)
-            x += _DEGREE_CHAR_W
-        elif ord(ch) <= 126:
-            panel.text(font_ascii, ch, x, y, fg_color)
-            x += _ASCII_CHAR_W
+        code = ord(ch)
+        if code == 0xB0:
+            line.rect(cx + 1, 1, 4, 4, fg)
+            cx += _DEGREE_CHAR_W
+        elif code <= 126:
+            if code >= font_ascii.FIRST:
+                g = (code - font_ascii.FIRST) * _ASCII_GLYPH_BYTES
+                ascii_buf[:] = font_ascii.FONT[g:g + _ASCII_GLYPH_BYTES]
+                line.blit(ascii_fb, cx, 0, key, palette)
+            cx += _ASCII_CHAR_W
         else:
-            panel.write(font_jp16, ch, x, y, fg_color, bg_color)
-            x += _JP_CHAR_W
+            font, index, glyph_w = glyph_lookup(ch)
+            if font:
+                if font.compressed:
+                    _blit_packed(line, palette, font.packed_at(index), cx, glyph_w, key)
+                else:
+                    glyph_fb = framebuf.FrameBuffer(font.glyph_at(index), glyph_w, font.height,
+                                                    framebuf.MONO_HLSB)
+                    line.blit(glyph_fb, cx, 0, key, palette)
+            cx += glyph_w
+    panel.blit_buffer(memoryview(buf)[:width * _LINE_HEIGHT * 2], x, y, width, _LINE_HEIGHT)
+    return True
+
+
+def _blit_packed(line, palette, data, x, width, key=-1):
+    """Expand a packed (JPF2) glyph straight into the line buffer.
+
+    Consecutive stored rows are blitted as one MONO_HLSB block read in place
+    from ``data``; repeated rows re-blit the row above. Blank rows above and
+    below the ink are never touched (the line already holds bg or the
+    backdrop). ``key`` is the framebuf transparent colour.
+    """
+    top = data[0]
+    count = data[1]
+    stride = (width + 7) >> 3
+    src = 2 + ((count + 7) >> 3)
+    view = memoryview(data)
+    MONO_HLSB = framebuf.MONO_HLSB
+    y = 0
+    while y < count:
+        if data[2 + (y >> 3)] & (0x80 >> (y & 7)):
+            row = framebuf.FrameBuffer(view[src - stride:src], width, 1, MONO_HLSB)
+            while y < count and data[2 + (y >> 3)] & (0x80 >> (y & 7)):
+                line.blit(row, x, top + y, key, palette)
+                y += 1
+            continue
+        start = y
+        y += 1
+        while y < count and not data[2 + (y >> 3)] & (0x80 >> (y & 7)):
+            y += 1
+        size = (y - start) * stride
+        block = framebuf.FrameBuffer(view[src:src + size], width, y - start, MONO_HLSB)
+        line.blit(block, x, top + start, key, palette)
+        src += size
+
+
+def _memo_get(cache, key):
+    value = cache.pop(key, None)
+    if value is not None:
+        cache[key] = value  # re-insert as most recently used
+    return value
+
+
+def _memo_put(cache, key, value):
+    if len(cache) >= TEXT_LAYOUT_CACHE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+    return value
+
+
+def clear_layout_cache():
+    """Forget memoized layouts (glyph widths changed)."""
+    _wrapped.clear()
+    _truncated.clear()
 
 
 def wrap_text_jp(text, max_width_px):
@@ -66,26 +370,41 @@ def wrap_text_jp(text, max_width_px):
     Each paragraph (split by newline) is wrapped independently.
     Japanese chars can break at any boundary; ASCII words break at spaces.
     """
-    if not text:
-        return []
+    return list(wrap_lines(text, max_width_px)[0])
 
-    lines = []
-    for paragraph in text.split('\n'):
-        if not paragraph:
-            lines.append('')
-            continue
 
-        non_ascii = _has_non_ascii(paragraph)
+def wrap_lines(text, max_width_px):
+    """(lines, pixel widths) of wrapped text, both tuples; memoized.
 
-        if not non_ascii:
-            _wrap_ascii(paragraph, max_width_px, _ASCII_CHAR_W, lines)
-        else:
-            _wrap_mixed(paragraph, max_width_px, lines)
+    Paragraphs are memoized on their own as well, so text that only grew
+    (a note with a line appended) rewraps just the paragraphs that changed.
+    """
+    if not text:
+        return (), ()
+    key = (text, max_width_px)
+    hit = _memo_get(_wrapped, key)
+    if hit is not None:
+        return hit
 
-    return lines
+    lines = []
+    widths = []
+    if '\n' in text:
+        for paragraph in text.split('\n'):
+            if not paragraph:
+                lines.append('')
+                widths.append(0)
+                continue
+            part = wrap_lines(paragraph, max_width_px)
+            lines.extend(part[0])
+            widths.extend(part[1])
+    elif not _has_non_ascii(text):
+        _wrap_ascii(text, max_width_px, _ASCII_CHAR_W, lines, widths)
+    else:
+        _wrap_mixed(text, max_width_px, lines, widths)
+    return _memo_put(_wrapped, key, (tuple(lines), tuple(widths)))
 
 
-def _wrap_ascii(text, max_w, char_w, lines):
+def _wrap_ascii(text, max_w, char_w, lines, widths):
     """Wrap pure ASCII text by words."""
     line = ''
     line_w = 0
@@ -94,6 +413,7 @@ def _wrap_ascii(text, max_w, char_w, lines):
         if line:
             if line_w + char_w + w_w > max_w:
                 lines.append(line)
+                widths.append(line_w)
                 line = word
                 line_w = w_w
             else:
@@ -104,9 +424,10 @@ def _wrap_ascii(text, max_w, char_w, lines):
             line_w = w_w
     if line:
         lines.append(line)
+        widths.append(line_w)
 
 
-def _wrap_mixed(text, max_w, lines):
+def _wrap_mixed(text, max_w, lines, widths):
     """Wrap mixed Japanese/ASCII text with per-character width."""
     line = ''
     line_w = 0
@@ -114,12 +435,13 @@ def _wrap_mixed(text, max_w, lines):
     word_w = 0
 
     for ch in text:
-        ch_w = _char_px_width(ch)
+        ch_w = char_width(ch)
         if ord(ch) > 0x7E and ch != '\u00b0':
             # Non-ASCII (not °): flush pending ASCII word first
             if word:
                 if line and line_w + word_w > max_w:
                     lines.append(line)
+                    widths.append(line_w)
                     line = word
                     line_w = word_w
                 else:
@@ -130,6 +452,7 @@ def _wrap_mixed(text, max_w, lines):
             # Add the Japanese character (can break at any char)
             if line and line_w + ch_w > max_w:
                 lines.append(line)
+                widths.append(line_w)
                 line = ch
                 line_w = ch_w
             else:
@@ -140,6 +463,7 @@ def _wrap_mixed(text, max_w, lines):
             if word:
                 if line and line_w + word_w > max_w:
                     lines.append(line)
+                    widths.append(line_w)
                     line = word
                     line_w = word_w
                 else:
@@ -149,6 +473,7 @@ def _wrap_mixed(text, max_w, lines):
                 word_w = 0
             if line and line_w + ch_w > max_w:
                 lines.append(line)
+                widths.append(line_w)
                 line = ''
                 line_w = 0
             else:
@@ -163,21 +488,29 @@ def _wrap_mixed(text, max_w, lines):
     if word:
         if line and line_w + word_w > max_w:
             lines.append(line)
+            widths.append(line_w)
             line = word
+            line_w = word_w
         else:
             line += word
+            line_w += word_w
     if line:
         lines.append(line)
+        widths.append(line_w)
 
 
 def truncate_to_width(text, max_px):
-    """Truncate text to fit within max_px pixels."""
+    """Truncate text to fit within max_px pixels (memoized)."""
     if not text:
         return text
+    key = (text, max_px)
+    hit = _memo_get(_truncated, key)
+    if hit is not None:
+        return hit
     width = 0
     for i, ch in enumerate(text):
-        w = _char_px_width(ch)
+        w = char_width(ch)
         if width + w > max_px:
-            return text[:i]
+            return _memo_put(_truncated, key, text[:i])
         width += w
-    return text
+    return _memo_put(_truncated, key, text)
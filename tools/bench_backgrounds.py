@@ -0,0 +1,50 @@
+"""
+On-device benchmark: JPEG decode vs raw RGB565 blit per SD background.
+
+Runs on the Pico (MicroPython) with the firmware files already copied:
+
+    mpremote run tools/bench_backgrounds.py
+
+For every ``background_<name>`` that exists in both formats on the SD card,
+each variant is drawn ROUNDS times and the average time is printed.
+"""
+
+import os
+import time
+
+from main import mount_sd
+from display_manager import DisplayManager
+from config import SD_MOUNT_POINT
+
+ROUNDS = 3
+
+
+def average_ms(fn, path):
+    total = 0
+    for _ in range(ROUNDS):
+        start = time.ticks_ms()
+        fn(path)
+        total += time.ticks_diff(time.ticks_ms(), start)
+    return total / ROUNDS
+
+
+def main():
+    mount_sd()
+    display = DisplayManager()
+    names = os.listdir(SD_MOUNT_POINT)
+    stems = sorted(n[:-7] for n in names
+                   if n.startswith("background_") and n.endswith(".rgb565")
+                   and n[:-7] + ".jpg" in names)
+    if not stems:
+        print("No background_* with both .jpg and .rgb565 on", SD_MOUNT_POINT)
+        return
+    print("{:<28} {:>9} {:>9} {:>7}".format("background", "jpeg ms", "raw ms", "speedup"))
+    for stem in stems:
+        base = SD_MOUNT_POINT + "/" + stem
+        jpeg_ms = average_ms(display._render_jpeg, base + ".jpg")
+        raw_ms = average_ms(display._render_raw, base + ".rgb565")
+        print("{:<28} {:>9.1f} {:>9.1f} {:>6.1f}x".format(
+            stem, jpeg_ms, raw_ms, jpeg_ms / raw_ms if raw_ms else 0))
+
+
+main()
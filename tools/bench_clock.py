@@ -0,0 +1,82 @@
+"""
+On-device benchmark: full clock redraw with the large digit atlases.
+
+Runs on the Pico (MicroPython) with the firmware files and digits*.bin
+copied:
+
+    mpremote run tools/bench_clock.py
+
+Times a full redraw of the status clock region (clear + date + time, as
+on the minute tick) with the per-field sizes in STATUS_FIELD_SIZES, and the
+same region drawn with the 16 px fonts only, then the temperature field.
+Each row reports panel calls (window writes) and the average time; the
+atlas layout must stay under BUDGET_MS.
+"""
+
+import time
+
+import display_manager
+from display_manager import DisplayManager, STATUS_REGIONS
+from st7789 import color565
+
+ROUNDS = 20
+BUDGET_MS = 25
+SAMPLES = (("2026/02/22", "23:59"), ("2026/12/31", "10:08"))
+
+
+class CountingPanel:
+    """Forwards to the real panel and counts the calls."""
+
+    def __init__(self, panel):
+        self.panel = panel
+        self.calls = 0
+
+    def __getattr__(self, name):
+        fn = getattr(self.panel, name)
+
+        def call(*args):
+            self.calls += 1
+            return fn(*args)
+        return call
+
+
+def measure(display, fn):
+    real = display.panel
+    counter = CountingPanel(real)
+    display.panel = counter
+    fn()
+    display.panel = real
+    start = time.ticks_us()
+    for _ in range(ROUNDS):
+        fn()
+    return counter.calls, time.ticks_diff(time.ticks_us(), start) / ROUNDS / 1000
+
+
+def main():
+    display = DisplayManager()
+    rect = STATUS_REGIONS["clock"]
+    color = color565(255, 255, 255)
+    sizes = display_manager.STATUS_FIELD_SIZES
+    small = dict((field, 16) for field in sizes)
+    worst = 0
+    print("{:<24} {:>14} {:>14}".format("clock", "16 px", "atlas"))
+    for date, time_text in SAMPLES:
+        cols = []
+        for layout in (small, dict(sizes)):
+            display_manager.STATUS_FIELD_SIZES = layout
+
+            def redraw():
+                display._clear_region("clock", rect)
+                display._draw_clock(rect, (date, time_text, color))
+            calls, ms = measure(display, redraw)
+            cols.append("{:>3} {:>6.1f}ms".format(calls, ms))
+        worst = max(worst, ms)
+        print("{:<24} {:>14} {:>14}".format(date + " " + time_text, *cols))
+    display_manager.STATUS_FIELD_SIZES = sizes
+    calls, ms = measure(display, lambda: display._draw_field("temp", "-12°C", 12, 120, color))
+    print("{:<24} {:>14} {:>3} {:>6.1f}ms".format("temp -12°C", "", calls, ms))
+    print("clock redraw {:.1f} ms, budget {} ms: {}".format(
+        worst, BUDGET_MS, "OK" if worst <= BUDGET_MS else "OVER"))
+
+
+main()
@@ -0,0 +1,58 @@
+"""
+On-device benchmark: load time and heap of the Japanese font.
+
+Runs on the Pico (MicroPython) with the firmware files already copied:
+
+    mpremote run tools/bench_font_boot.py
+
+Compares importing the old font_jp16.py module (copy it to the Pico first
+to get the "before" numbers; skipped if absent) with opening the binary
+font, and then drawing a few strings through the glyph cache. Peak heap is
+the highest gc.mem_alloc() seen right after each step.
+"""
+
+import gc
+import sys
+import time
+
+from binfont import BinaryFont
+from config import FONT_JP_FILE, FONT_GLYPH_CACHE
+
+SAMPLE = "会議の準備 資料作成 レビュー依頼 晴れのち曇り 湿度"
+
+
+def measure(label, fn):
+    gc.collect()
+    base = gc.mem_alloc()
+    start = time.ticks_us()
+    result = fn()
+    elapsed = time.ticks_diff(time.ticks_us(), start) / 1000
+    peak = gc.mem_alloc() - base
+    gc.collect()
+    resident = gc.mem_alloc() - base
+    print("{:<28} {:>8.1f} ms {:>8} B peak {:>8} B resident".format(
+        label, elapsed, peak, resident))
+    return result
+
+
+def import_module():
+    try:
+        import font_jp16
+        return font_jp16
+    except ImportError:
+        return None
+
+
+def main():
+    module = measure("import font_jp16.py", import_module)
+    if module is None:
+        print("  (font_jp16.py not on the device, no 'before' numbers)")
+    else:
+        del module
+        sys.modules.pop("font_jp16", None)
+    font = measure("open " + FONT_JP_FILE, lambda: BinaryFont(FONT_JP_FILE, FONT_GLYPH_CACHE))
+    measure("first draw (cold glyphs)", lambda: [font.glyph(ch) for ch in SAMPLE])
+    measure("second draw (cached)", lambda: [font.glyph(ch) for ch in SAMPLE])
+
+
+main()
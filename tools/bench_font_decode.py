@@ -0,0 +1,95 @@
+"""
+Microbenchmark: per-glyph cost of plain (JPF1) vs packed (JPF2) glyphs.
+
+For every glyph of the Japanese font, times reading it from flash with the
+cache disabled, and drawing it into an RGB565 line buffer three ways:
+
+- plain:  plain rows -> one MONO_HLSB blit (what a JPF1 font costs)
+- expand: binfont.expand() to plain rows, then one blit
+- packed: text_renderer._blit_packed() straight from the packed bytes
+
+Runs on the Pico with the firmware files copied (font_jp16.bin in JPF2):
+
+    mpremote run tools/bench_font_decode.py
+
+Under CPython (from the repository root) only the read and expand columns
+are measured, since there is no framebuf module.
+"""
+
+import sys
+import time
+
+try:
+    import binfont
+    FONT_PATH = "font_jp16.bin"
+except ImportError:
+    sys.path.insert(0, "src")
+    import binfont
+    FONT_PATH = "src/font_jp16.bin"
+
+try:
+    import framebuf
+except ImportError:
+    framebuf = None
+
+ROUNDS = 5
+
+
+def now_us():
+    if hasattr(time, "ticks_us"):
+        return time.ticks_us()
+    return int(time.perf_counter() * 1000000)
+
+
+def elapsed_us(start):
+    if hasattr(time, "ticks_diff"):
+        return time.ticks_diff(time.ticks_us(), start)
+    return now_us() - start
+
+
+def per_glyph(fn, count):
+    start = now_us()
+    for _ in range(ROUNDS):
+        for index in range(count):
+            fn(index)
+    return elapsed_us(start) / (ROUNDS * count)
+
+
+def main():
+    font = binfont.BinaryFont(FONT_PATH, 1)
+    if not font.compressed:
+        print(FONT_PATH, "is not packed; rebuild it with tools/font_compiler.py")
+        return
+    count = len(font.codepoints)
+    height = font.height
+    widths = font.widths
+    packed = [bytearray(font.packed_at(i)) for i in range(count)]
+    plain = [binfont.expand(packed[i], widths[i], height) for i in range(count)]
+    plain_bytes = sum(len(rows) for rows in plain)
+    packed_bytes = sum(len(data) for data in packed)
+    print("{} glyphs: plain {} B, packed {} B ({:.1%})".format(
+        count, plain_bytes, packed_bytes, packed_bytes / plain_bytes))
+
+    results = [("read (cold)", per_glyph(font.packed_at, count)),
+               ("expand", per_glyph(lambda i: binfont.expand(packed[i], widths[i], height), count))]
+    if framebuf:
+        import text_renderer
+        buf = bytearray(16 * height * 2)
+        line = framebuf.FrameBuffer(buf, 16, height, framebuf.RGB565)
+        palette = framebuf.FrameBuffer(bytearray(4), 2, 1, framebuf.RGB565)
+        palette.pixel(1, 0, 0xFFFF)
+
+        def blit_rows(rows, i):
+            fb = framebuf.FrameBuffer(rows, widths[i], height, framebuf.MONO_HLSB)
+            line.blit(fb, 0, 0, -1, palette)
+
+        results.append(("plain blit", per_glyph(lambda i: blit_rows(plain[i], i), count)))
+        results.append(("expand + blit", per_glyph(
+            lambda i: blit_rows(binfont.expand(packed[i], widths[i], height), i), count)))
+        results.append(("packed blit", per_glyph(
+            lambda i: text_renderer._blit_packed(line, palette, packed[i], 0, widths[i]), count)))
+    for label, us in results:
+        print("{:<16} {:>8.1f} us/glyph".format(label, us))
+
+
+main()
@@ -0,0 +1,102 @@
+"""
+Microbenchmark: Japanese glyph lookup cost vs. charset size.
+
+Builds synthetic 100, 1000 and 3000 glyph fonts (CJK codepoints from
+U+4E00 with blank 16x17 bitmaps) and times looking up every glyph of a
+sample string against each: the old linear ``MAP.find`` scan and the
+binary search of src/binfont.py used by text_renderer.
+
+Runs under CPython from the repository root or on the Pico:
+
+    python3 tools/bench_glyph_lookup.py
+    mpremote run tools/bench_glyph_lookup.py   # binfont.py and glyph_run.py on the Pico
+"""
+
+import os
+import struct
+import sys
+import time
+
+try:
+    import tempfile
+except ImportError:  # MicroPython
+    tempfile = None
+
+try:
+    import binfont
+except ImportError:
+    sys.path.insert(0, "src")
+    import binfont
+
+SIZES = (100, 1000, 3000)
+ROUNDS = 20
+HEIGHT = 17
+GLYPH_BYTES = 2 * HEIGHT
+
+
+def now_us():
+    if hasattr(time, "ticks_us"):
+        return time.ticks_us()
+    return int(time.perf_counter() * 1000000)
+
+
+def elapsed_us(start):
+    if hasattr(time, "ticks_diff"):
+        return time.ticks_diff(time.ticks_us(), start)
+    return now_us() - start
+
+
+def scratch_path():
+    """Where the synthetic fonts are written; main() removes it."""
+    if tempfile is None:
+        return "bench_font.bin"
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    os.close(fd)
+    return path
+
+
+def write_font(path, count):
+    codepoints = [0x4E00 + i for i in range(count)]
+    with open(path, "wb") as f:
+        header = binfont.MAGIC + struct.pack("<HBBB", count, HEIGHT, 16, 2)
+        f.write(header + bytes(binfont.HEADER_SIZE - len(header)))
+        for cp in codepoints:
+            f.write(struct.pack("<H", cp))
+        for i in range(count):
+            f.write(struct.pack("<I", i * GLYPH_BYTES))
+        f.write(bytes([16]) * count)
+        f.write(bytes(GLYPH_BYTES * count))
+    return "".join(chr(cp) for cp in codepoints)
+
+
+def time_lookups(fn, sample):
+    start = now_us()
+    for _ in range(ROUNDS):
+        for ch in sample:
+            fn(ch)
+    return elapsed_us(start) / (ROUNDS * len(sample))
+
+
+def main():
+    print("{:>7} {:>14} {:>14}".format("glyphs", "linear us/ch", "bisect us/ch"))
+    path = scratch_path()
+    try:
+        for count in SIZES:
+            font_map = write_font(path, count)
+            font = binfont.BinaryFont(path, 8)
+            try:
+                # Spread the sample over the whole charset, plus one missing glyph.
+                sample = font_map[::max(1, count // 20)] + "あ"
+                linear = time_lookups(font_map.find, sample)
+                bisect = time_lookups(font.find, sample)
+            finally:
+                font._file.close()
+            print("{:>7} {:>14.2f} {:>14.2f}".format(count, linear, bisect))
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+main()
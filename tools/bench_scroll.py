@@ -0,0 +1,50 @@
+"""
+On-device benchmark: one-line scroll of a long free_text note.
+
+Runs on the Pico (MicroPython) with the firmware files copied:
+
+    mpremote run tools/bench_scroll.py
+
+Shows a note longer than the screen and steps it down and back up one line
+at a time, first with the panel's scroll registers (one line drawn per
+step), then with them disabled (the visible window redrawn by the frame
+diff). Reports the average time per step of each.
+"""
+
+import time
+
+from display_manager import DisplayManager
+
+LINES = 48
+
+
+def step_all(display):
+    """Scroll to the end and back; returns (steps, ms per step)."""
+    steps = 0
+    start = time.ticks_us()
+    for step in (1, -1):
+        while display.scroll(step):
+            steps += 1
+    return steps, time.ticks_diff(time.ticks_us(), start) / max(1, steps) / 1000
+
+
+def main():
+    display = DisplayManager()
+    text = "\n".join("line {:02d} スクロール試験".format(i) for i in range(LINES))
+    display.set_mode("free_text", {"text": text})
+    hardware = display.viewport.hardware
+    results = []
+    for label, use_hw in (("hardware scroll", True), ("redraw window", False)):
+        if use_hw and not hardware:
+            print("panel driver has no vscrdef/vscsad; skipping hardware scroll")
+            continue
+        display.viewport.hardware = use_hw
+        steps, ms = step_all(display)
+        results.append(ms)
+        print("{:<18} {:>4} steps {:>7.1f} ms/step".format(label, steps, ms))
+    display.viewport.hardware = hardware
+    if len(results) == 2:
+        print("speedup x{:.1f}".format(results[1] / max(results[0], 0.001)))
+
+
+main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: broadcast latency and CPU of the command server with many
+simulated displays.
+
+The server runs in this process; the simulated Picos run in a child
+process on one asyncio loop, so their work does not count towards the
+server's CPU time. Each client says hello (JSON protocol) and records when
+each broadcast arrives; a broadcast's latency is the time from the
+broadcast() call until the last client has received it.
+
+Usage (on the Pi 5):
+    python3 tools/bench_server.py
+    python3 tools/bench_server.py --clients 500 --rounds 200 --interval 0.05
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_DIR, "host"))
+
+from command_server import DisplayCommandServer  # noqa: E402
+
+
+def raise_fd_limit(needed):
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+
+async def run_clients(port, count, rounds, ready, results):
+    received = [0] * rounds
+
+    async def client():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b'{"cmd": "hello", "proto": [1]}\n')
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            seq = (message.get("payload") or {}).get("seq")
+            if seq is None:
+                continue
+            received[seq] += 1
+            if received[seq] == count:
+                results.put((seq, time.perf_counter()))
+        writer.close()
+
+    tasks = []
+    for _ in range(count):
+        tasks.append(asyncio.ensure_future(client()))
+        await asyncio.sleep(0)
+    ready.put(True)
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def client_process(port, count, rounds, ready, results):
+    raise_fd_limit(count + 64)
+    asyncio.run(run_clients(port, count, rounds, ready, results))
+
+
+def wait_clients(server, count, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with server.clients_lock:
+            if len(server.protocols) >= count:
+                return True
+        time.sleep(0.05)
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Broadcast benchmark with simulated Picos")
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--interval", type=float, default=0.1, help="seconds between broadcasts")
+    parser.add_argument("--port", type=int, default=5099)
+    args = parser.parse_args()
+
+    raise_fd_limit(args.clients + 64)
+    quiet = io.StringIO()  # per-connection log lines
+    with contextlib.redirect_stdout(quiet):
+        server = DisplayCommandServer(bind="127.0.0.1", port=args.port, glyph_font=None)
+        server.start()
+    ready = multiprocessing.Queue()
+    results = multiprocessing.Queue()
+    child = multiprocessing.Process(target=client_process, daemon=True,
+                                    args=(args.port, args.clients, args.rounds, ready, results))
+    child.start()
+    ready.get()
+    try:
+        with contextlib.redirect_stdout(quiet):
+            connected = wait_clients(server, args.clients, 30)
+            time.sleep(0.2)  # let the last hello lines be logged
+        if not connected:
+            print(f"only {len(server.protocols)} of {args.clients} clients said hello")
+            return 1
+
+        latencies = []
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for seq in range(args.rounds):
+            payload = {"time": time.strftime("%H:%M:%S"), "seq": seq}
+            sent = time.perf_counter()
+            server.broadcast({"cmd": "set_mode", "mode": "status_datetime", "payload": payload})
+            _, done = results.get(timeout=30)
+            latencies.append((done - sent) * 1000)
+            time.sleep(args.interval)
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+    finally:
+        with contextlib.redirect_stdout(quiet):
+            server.stop()
+        child.join(5)
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else latencies[-1]
+    print(f"{args.clients} clients, {args.rounds} broadcasts every {args.interval * 1000:.0f} ms")
+    print(f"broadcast -> all received: median {statistics.median(latencies):.2f} ms, "
+          f"p95 {p95:.2f} ms, max {latencies[-1]:.2f} ms")
+    print(f"server CPU {cpu:.2f} s over {wall:.1f} s ({cpu / wall * 100:.1f}% of one core), "
+          f"{cpu / args.rounds * 1000:.2f} ms per broadcast")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+On-device benchmark: panel calls and time per draw_text string.
+
+Runs on the Pico (MicroPython) with the firmware files already copied:
+
+    mpremote run tools/bench_text_calls.py
+
+Each sample is drawn three ways: the old per-character loop, one call per
+ASCII / degree / JP run, and the composed line buffer (one blit_buffer).
+Prints the number of panel calls and the average time of each.
+"""
+
+import time
+
+import text_renderer
+from binfont import subset
+from text_renderer import draw_text, font_ascii
+from display_manager import DisplayManager
+
+ROUNDS = 10
+SAMPLES = (
+    "資料作成",
+    "会議の準備 10:00",
+    "レビュー依頼 (PR #12)",
+    "晴れ",
+    "12°C",
+    "曇り 湿度45%",
+    "雨のち晴れ",
+    "2026/02/22 14:30",
+)
+
+
+class CountingPanel:
+    """Forwards to the real panel and counts the calls."""
+
+    def __init__(self, panel):
+        self.panel = panel
+        self.calls = 0
+
+    def __getattr__(self, name):
+        fn = getattr(self.panel, name)
+
+        def call(*args):
+            self.calls += 1
+            return fn(*args)
+        return call
+
+
+def draw_per_char(panel, text, x, y, fg_color, bg_color=0):
+    """draw_text as it was before run batching."""
+    if not text_renderer._has_non_ascii(text):
+        panel.text(font_ascii, text, x, y, fg_color)
+        return
+    for ch in text:
+        if ch == '°':
+            panel.rect(x + 1, y + 1, 4, 4, fg_color)
+            x += 7
+        elif ord(ch) <= 126:
+            panel.text(font_ascii, ch, x, y, fg_color)
+            x += 8
+        else:
+            panel.write(subset(text_renderer._jp_font(), ch), ch, x, y, fg_color, bg_color)
+            x += 16
+
+
+def measure(panel, fn, text):
+    counter = CountingPanel(panel)
+    fn(counter, text, 12, 100, 0xFFFF)
+    start = time.ticks_us()
+    for _ in range(ROUNDS):
+        fn(panel, text, 12, 100, 0xFFFF)
+    return counter.calls, time.ticks_diff(time.ticks_us(), start) / ROUNDS / 1000
+
+
+def draw_runs(panel, text, x, y, fg_color):
+    saved = text_renderer.framebuf
+    text_renderer.framebuf = None
+    try:
+        draw_text(panel, text, x, y, fg_color)
+    finally:
+        text_renderer.framebuf = saved
+
+
+def main():
+    panel = DisplayManager().panel
+    print("{:<22} {:>12} {:>12} {:>12}".format("text", "per-char", "runs", "composed"))
+    for text in SAMPLES:
+        cols = []
+        for fn in (draw_per_char, draw_runs, draw_text):
+            calls, ms = measure(panel, fn, text)
+            cols.append("{:>3} {:>5.1f}ms".format(calls, ms))
+        print("{:<22} {:>12} {:>12} {:>12}".format(text, *cols))
+
+
+main()
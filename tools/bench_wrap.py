@@ -0,0 +1,50 @@
+"""
+On-device benchmark: wrapping a long free_text note with the layout memo.
+
+Runs on the Pico (MicroPython) with the firmware files already copied:
+
+    mpremote run tools/bench_wrap.py
+
+Times wrap_text_jp on a 30-paragraph note cold (memo cleared), again
+unchanged (what refresh() costs), and with one paragraph appended.
+"""
+
+import time
+
+import text_renderer
+from text_renderer import wrap_text_jp
+
+WIDTH = 216
+ROUNDS = 5
+NOTE = "\n".join(
+    "メモ %d: レビュー依頼 (PR #%d) と会議の準備を 10:00 までに済ませる" % (i, i)
+    for i in range(30))
+
+
+def timed(fn):
+    start = time.ticks_us()
+    for _ in range(ROUNDS):
+        fn()
+    return time.ticks_diff(time.ticks_us(), start) / ROUNDS / 1000
+
+
+def cold():
+    text_renderer.clear_layout_cache()
+    wrap_text_jp(NOTE, WIDTH)
+
+
+def appended():
+    text_renderer._wrapped.pop((NOTE + "\n追記", WIDTH), None)
+    wrap_text_jp(NOTE + "\n追記", WIDTH)
+
+
+def main():
+    lines = len(wrap_text_jp(NOTE, WIDTH))
+    print("{} paragraphs, {} lines".format(NOTE.count("\n") + 1, lines))
+    print("{:<12} {:>8.2f} ms".format("cold", timed(cold)))
+    wrap_text_jp(NOTE, WIDTH)
+    print("{:<12} {:>8.2f} ms".format("unchanged", timed(lambda: wrap_text_jp(NOTE, WIDTH))))
+    print("{:<12} {:>8.2f} ms".format("appended", timed(appended)))
+
+
+main()
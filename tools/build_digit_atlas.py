@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Render the large digit atlases read by src/digit_atlas.py.
+
+Each size is one DGA1 file holding the characters ``0-9 : / ° % C -``
+side by side in a single MONO_HLSB bitmap. The pixel size of the face is
+the largest at which every glyph fits the cell height; digits share one
+advance so the clock does not jitter from minute to minute.
+
+Needs freetype-py (``pip install freetype-py``). DejaVu Sans Bold is the
+default face (Bitstream Vera license, fine to ship rendered bitmaps of).
+
+Usage:
+    python3 tools/build_digit_atlas.py                  # src/digits32.bin, src/digits48.bin
+    python3 tools/build_digit_atlas.py --ttf Other.ttf --sizes 32 48 64
+"""
+
+import argparse
+import os
+import struct
+import sys
+
+import freetype
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TTF = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+CHARS = "0123456789:/°%C-"
+DIGITS = "0123456789"
+MAGIC = b"DGA1"
+
+
+def render(face, ch):
+    """(advance, left, top, width, rows, bits) of ch at the face's current size."""
+    face.load_char(ch, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_MONO)
+    glyph = face.glyph
+    bitmap = glyph.bitmap
+    bits = []
+    for y in range(bitmap.rows):
+        row = bitmap.buffer[y * bitmap.pitch:(y + 1) * bitmap.pitch]
+        bits.append([bool(row[x >> 3] & (0x80 >> (x & 7))) for x in range(bitmap.width)])
+    return (glyph.advance.x >> 6, glyph.bitmap_left, glyph.bitmap_top,
+            bitmap.width, bitmap.rows, bits)
+
+
+def fit(face, height):
+    """Render CHARS at the largest pixel size whose ink fits `height` rows."""
+    for pixels in range(height, 4, -1):
+        face.set_pixel_sizes(0, pixels)
+        glyphs = {ch: render(face, ch) for ch in CHARS}
+        ascent = max(g[2] for g in glyphs.values())
+        descent = max(g[4] - g[2] for g in glyphs.values())
+        if ascent + descent <= height:
+            baseline = (height - ascent - descent) // 2 + ascent
+            return glyphs, baseline
+    raise ValueError(f"glyphs do not fit {height} px")
+
+
+def build(face, height):
+    glyphs, baseline = fit(face, height)
+    digit_width = max(max(glyphs[d][0], glyphs[d][1] + glyphs[d][3]) for d in DIGITS)
+    cells = []
+    for ch in CHARS:
+        advance, left, top, width, rows, bits = glyphs[ch]
+        cell = digit_width if ch in DIGITS else max(advance, left + width)
+        shift = max(0, (cell - advance) // 2) + left
+        ink = [[False] * cell for _ in range(height)]
+        for j in range(rows):
+            y = baseline - top + j
+            if 0 <= y < height:
+                for i in range(width):
+                    x = shift + i
+                    if 0 <= x < cell and bits[j][i]:
+                        ink[y][x] = True
+        cells.append(ink)
+    return cells
+
+
+def pack(cells, height):
+    widths = [len(cell[0]) for cell in cells]
+    xs = []
+    x = 0
+    for width in widths:
+        xs.append(x)
+        x += width
+    atlas_width = x
+    stride = (atlas_width + 7) // 8
+    bitmap = bytearray(stride * height)
+    for cell, x0 in zip(cells, xs):
+        for y in range(height):
+            for i, on in enumerate(cell[y]):
+                if on:
+                    x = x0 + i
+                    bitmap[y * stride + (x >> 3)] |= 0x80 >> (x & 7)
+    header = MAGIC + struct.pack("<BBH", height, len(cells), atlas_width)
+    return (header + CHARS.encode("latin-1") + bytes(widths)
+            + struct.pack("<%dH" % len(xs), *xs) + bytes(bitmap))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build DGA1 digit atlases")
+    parser.add_argument("--ttf", default=DEFAULT_TTF, help="TrueType/OpenType face")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[32, 48])
+    parser.add_argument("--out-dir", default=os.path.join(PROJECT_DIR, "src"))
+    args = parser.parse_args()
+
+    face = freetype.Face(args.ttf)
+    for size in args.sizes:
+        data = pack(build(face, size), size)
+        path = os.path.join(args.out_dir, f"digits{size}.bin")
+        with open(path, "wb") as fh:
+            fh.write(data)
+        print(f"{size} px: {len(CHARS)} glyphs, {len(data)} bytes -> {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
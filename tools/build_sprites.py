@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Build the sprite atlas (src/sprites.bin) read by src/sprites.py.
+
+Without arguments the atlas holds the built-in sprites: the weather icons
+and the two button states, painted with the same rectangles the Pico uses
+when no atlas is present (src/icons.py). PNGs in --png-dir add sprites or
+replace built-in ones; the file name is the sprite id, e.g. ``sun.png``,
+``button_active.png`` or ``button_MODE.png`` (a button with its label
+baked in, drawn instead of chrome + text). Transparent pixels become black.
+
+Prerequisites for --png-dir:
+    pip install Pillow
+
+Usage:
+    python3 tools/build_sprites.py
+    python3 tools/build_sprites.py --png-dir art/sprites
+"""
+
+import argparse
+import os
+import struct
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_DIR, "src"))
+
+from icons import BUTTON_STYLES, ICON_COLORS, ICON_SIZE, PAINTERS, color565, paint_button  # noqa: E402
+
+MAGIC = b"SPA1"
+HEADER_SIZE = 8
+ENTRY_SIZE = 24
+ID_SIZE = 16
+# display_manager: (WIDTH - 2 * BUTTON_MARGIN) // len(BUTTON_LABELS) - 2, BUTTON_HEIGHT
+BUTTON_SIZE = (74, 28)
+
+
+class Canvas:
+    """RGB565 drawing surface with the panel calls icons.py uses."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.pixels = [0] * (width * height)
+
+    def fill_rect(self, x, y, w, h, color):
+        for row in range(max(0, y), min(self.height, y + h)):
+            for col in range(max(0, x), min(self.width, x + w)):
+                self.pixels[row * self.width + col] = color
+
+    def rect(self, x, y, w, h, color):
+        self.fill_rect(x, y, w, 1, color)
+        self.fill_rect(x, y + h - 1, w, 1, color)
+        self.fill_rect(x, y, 1, h, color)
+        self.fill_rect(x + w - 1, y, 1, h, color)
+
+    def to_bytes(self):
+        return struct.pack(">%dH" % len(self.pixels), *self.pixels)
+
+
+def builtin_sprites():
+    sprites = {}
+    for sprite_id, painter in PAINTERS.items():
+        canvas = Canvas(ICON_SIZE, ICON_SIZE)
+        painter(canvas, 0, 0, color565(*ICON_COLORS[sprite_id]))
+        sprites[sprite_id] = canvas
+    for style in BUTTON_STYLES:
+        canvas = Canvas(*BUTTON_SIZE)
+        paint_button(canvas, 0, 0, BUTTON_SIZE[0], BUTTON_SIZE[1], style)
+        sprites[style] = canvas
+    return sprites
+
+
+def load_png(path):
+    from PIL import Image  # optional dependency, see module docstring
+    img = Image.open(path).convert("RGBA")
+    flat = Image.new("RGBA", img.size, (0, 0, 0, 255))
+    flat.alpha_composite(img)
+    canvas = Canvas(*img.size)
+    canvas.pixels = [color565(r, g, b) for r, g, b, _ in flat.getdata()]
+    return canvas
+
+
+def write_atlas(path, sprites):
+    table = bytearray()
+    pixels = bytearray()
+    base = HEADER_SIZE + ENTRY_SIZE * len(sprites)
+    for sprite_id, canvas in sprites.items():
+        name = sprite_id.encode()
+        if len(name) > ID_SIZE:
+            raise ValueError(f"sprite id longer than {ID_SIZE} bytes: {sprite_id}")
+        table += name.ljust(ID_SIZE, b"\0")
+        table += struct.pack("<HHI", canvas.width, canvas.height, base + len(pixels))
+        pixels += canvas.to_bytes()
+    with open(path, "wb") as fh:
+        fh.write(MAGIC + struct.pack("<HH", len(sprites), 0))
+        fh.write(table)
+        fh.write(pixels)
+    return base + len(pixels)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the SPA1 sprite atlas")
+    parser.add_argument("--png-dir", help="directory of <sprite id>.png files")
+    parser.add_argument("--output", default=os.path.join(PROJECT_DIR, "src", "sprites.bin"))
+    args = parser.parse_args()
+
+    sprites = builtin_sprites()
+    if args.png_dir:
+        for name in sorted(os.listdir(args.png_dir)):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() == ".png":
+                sprites[stem] = load_png(os.path.join(args.png_dir, name))
+    size = write_atlas(args.output, sprites)
+    for sprite_id, canvas in sprites.items():
+        print(f"  {sprite_id:<16} {canvas.width}x{canvas.height}")
+    print(f"{len(sprites)} sprites, {size} bytes -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
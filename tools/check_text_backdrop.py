@@ -0,0 +1,128 @@
+"""
+On-device check: status text and icons are composited onto the background.
+
+Runs on the Pico (MicroPython) with the firmware files, fonts,
+digits*.bin and sprites.bin copied:
+
+    mpremote run tools/check_text_backdrop.py
+
+Draws mixed text (draw_text), atlas digits (draw_large) and weather icons
+(SpriteAtlas) into a region whose background is a known pattern, as a
+redraw after restore does, into a panel that only records the pixels it is
+sent. Every pixel inside a text cell must be either glyph ink or the
+background pixel under it, and every black icon pixel must show the
+background; a solid cell, or a stray fill_rect/text call, fails the check.
+"""
+
+import digit_atlas
+from display_manager import SPRITE_ATLAS_FILE
+from region_cache import Backdrop
+from sprites import SpriteAtlas
+from st7789 import color565
+from text_renderer import draw_text
+
+RECT = (12, 60, 216, 64)
+FG = color565(255, 255, 255)
+SAMPLES = (
+    ("text", "晴れ 12°C", 16),
+    ("text", "Rain 80%", 16),
+    ("digits", "-12°C", 32),
+    ("digits", "23:59", 48),
+    ("sprite", "sun", 0),
+    ("sprite", "rain", 0),
+)
+
+
+def pattern():
+    """Background pixels (big-endian RGB565) that never match FG or black."""
+    rw, rh = RECT[2], RECT[3]
+    pixels = bytearray(rw * rh * 2)
+    for y in range(rh):
+        for x in range(rw):
+            i = (y * rw + x) * 2
+            pixels[i] = 0x10 + (x * 7 + y * 3) % 0xC0
+            pixels[i + 1] = 0x21 + (x + y) % 0x40
+    return pixels
+
+
+class RecordingPanel:
+    """Keeps the screen pixels of RECT as blit_buffer leaves them."""
+
+    def __init__(self, background):
+        self.screen = bytearray(background)
+        self.calls = []
+
+    def blit_buffer(self, buf, x, y, w, h):
+        rx, ry, rw, rh = RECT
+        self.calls.append(("blit_buffer", x, y, w, h))
+        assert rx <= x and x + w <= rx + rw and ry <= y and y + h <= ry + rh, "blit outside region"
+        src = memoryview(buf)
+        for row in range(h):
+            start = ((y - ry + row) * rw + x - rx) * 2
+            self.screen[start:start + w * 2] = src[row * w * 2:(row + 1) * w * 2]
+
+    def fill_rect(self, *args):
+        self.calls.append(("fill_rect",) + args)
+
+    def text(self, *args):
+        self.calls.append(("text",) + args[1:])
+
+
+def sprite_ink(atlas, sprite_id, x, y):
+    """The sprite's pixels placed in a black region-sized buffer."""
+    ink = RecordingPanel(bytearray(RECT[2] * RECT[3] * 2))
+    atlas.draw(ink, sprite_id, x, y)
+    return ink.screen
+
+
+def check(kind, text, size, background, atlas):
+    panel = RecordingPanel(background)
+    backdrop = Backdrop(RECT, pixels=background)
+    x, y = RECT[0], RECT[1] + 4
+    ink_buf = None
+    if kind == "text":
+        draw_text(panel, text, x, y, FG, backdrop=backdrop)
+    elif kind == "digits":
+        if not digit_atlas.draw_large(panel, text, x, y, size, FG, backdrop=backdrop):
+            return "no {} px atlas".format(size)
+    elif not atlas or not atlas.draw(panel, text, x, y, backdrop):
+        return "no sprite"
+    else:
+        ink_buf = sprite_ink(atlas, text, x, y)
+    opaque = [call for call in panel.calls if call[0] != "blit_buffer"]
+    if opaque:
+        return "opaque call {}".format(opaque[0])
+    ink_hi, ink_lo = FG >> 8, FG & 0xFF
+    ink = 0
+    for i in range(0, len(background), 2):
+        hi, lo = panel.screen[i], panel.screen[i + 1]
+        if hi == background[i] and lo == background[i + 1]:
+            continue
+        if ink_buf is not None:
+            ink_hi, ink_lo = ink_buf[i], ink_buf[i + 1]
+        if (ink_hi or ink_lo) and hi == ink_hi and lo == ink_lo:
+            ink += 1
+        else:
+            p = i // 2
+            return "pixel ({}, {}) is neither ink nor background".format(
+                RECT[0] + p % RECT[2], RECT[1] + p // RECT[2])
+    if not ink:
+        return "nothing drawn"
+    return None
+
+
+def main():
+    background = pattern()
+    try:
+        atlas = SpriteAtlas(SPRITE_ATLAS_FILE)
+    except (OSError, ValueError):
+        atlas = None
+    failed = 0
+    for kind, text, size in SAMPLES:
+        error = check(kind, text, size, background, atlas)
+        failed += error is not None
+        print("{:<8} {:<12} {}".format(kind, text, error or "OK"))
+    print("FAIL" if failed else "all backgrounds kept")
+
+
+main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Convert a folder of images into raw RGB565 backgrounds for the Pico.
+
+Each image is rotated into the panel's portrait orientation, scaled and
+center-cropped to 240x320, and written as ``background_<name>.rgb565``
+(see src/rgb565.py for the layout). Copy the output next to the JPEGs on
+the SD card; the Pico prefers the raw file and keeps the JPEG as fallback.
+
+Prerequisites:
+    pip install Pillow
+
+Usage:
+    python3 tools/convert_backgrounds.py <input_dir> <output_dir>
+    python3 tools/convert_backgrounds.py photos/ out/ --rotate 90 --jpeg
+"""
+
+import argparse
+import os
+import struct
+import sys
+
+WIDTH = 240
+HEIGHT = 320
+MAGIC = b"R565"
+HEADER_SIZE = 512
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp")
+
+
+def fit_to_panel(img, rotate):
+    """Rotate to portrait and cover-crop to the panel size."""
+    if rotate == "auto":
+        rotate = 90 if img.width > img.height else 0
+    if rotate:
+        img = img.rotate(-int(rotate), expand=True)
+    scale = max(WIDTH / img.width, HEIGHT / img.height)
+    size = (max(WIDTH, round(img.width * scale)), max(HEIGHT, round(img.height * scale)))
+    img = img.resize(size)
+    left = (img.width - WIDTH) // 2
+    top = (img.height - HEIGHT) // 2
+    return img.crop((left, top, left + WIDTH, top + HEIGHT))
+
+
+def to_rgb565(img):
+    rgb = img.convert("RGB").tobytes()
+    out = bytearray(WIDTH * HEIGHT * 2)
+    j = 0
+    for i in range(0, len(rgb), 3):
+        value = ((rgb[i] & 0xF8) << 8) | ((rgb[i + 1] & 0xFC) << 3) | (rgb[i + 2] >> 3)
+        out[j] = value >> 8
+        out[j + 1] = value & 0xFF
+        j += 2
+    return out
+
+
+def write_rgb565(path, pixels):
+    header = MAGIC + struct.pack(">HH", WIDTH, HEIGHT)
+    with open(path, "wb") as fh:
+        fh.write(header.ljust(HEADER_SIZE, b"\0"))
+        fh.write(pixels)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert images to Pico RGB565 backgrounds")
+    parser.add_argument("input_dir")
+    parser.add_argument("output_dir")
+    parser.add_argument("--rotate", default="auto", choices=["auto", "0", "90", "180", "270"],
+                        help="clockwise rotation before fitting (auto: landscape -> portrait)")
+    parser.add_argument("--jpeg", action="store_true",
+                        help="also write the fitted image as a JPEG fallback")
+    args = parser.parse_args()
+
+    try:
+        from PIL import Image
+    except ImportError:
+        print("ERROR: Pillow is required (pip install Pillow)", file=sys.stderr)
+        return 1
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    count = 0
+    for name in sorted(os.listdir(args.input_dir)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() not in IMAGE_EXTENSIONS:
+            continue
+        if not stem.startswith("background_"):
+            stem = "background_" + stem
+        with Image.open(os.path.join(args.input_dir, name)) as img:
+            fitted = fit_to_panel(img, args.rotate)
+        out = os.path.join(args.output_dir, stem + ".rgb565")
+        write_rgb565(out, to_rgb565(fitted))
+        if args.jpeg:
+            fitted.convert("RGB").save(os.path.join(args.output_dir, stem + ".jpg"), quality=85)
+        print(f"{name} -> {out}")
+        count += 1
+    print(f"Converted {count} image(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Compile a bitmap font for the Pico (src/font_jp16.bin) from a TTF/OTF, a
+BDF, an existing JPF1/JPF2 font or a font2bitmap module.
+
+TTF/OTF glyphs are rasterized with freetype-py exactly like the glyphs the
+host pushes at runtime (host/glyph_push.py). BDF input needs no third-party
+packages, so a freely licensed bitmap font can be used where shipping or
+testing with a TTF is a problem. Glyphs are written as packed JPF2 bitmaps
+(see src/binfont.py) unless --plain is given, and the tool reports the
+compression ratio and the decode cost per glyph against plain rows.
+
+Usage:
+    python3 tools/font_compiler.py DroidSansFallbackFull.ttf src/font_jp16.bin \\
+        -c "$(python3 tools/jp_charset.py)"
+    python3 tools/font_compiler.py unifont.bdf src/font_jp16.bin -c 0x3041-0x3096
+    python3 tools/font_compiler.py src/font_jp16.bin src/font_jp16.bin   # re-pack
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(TOOLS_DIR)
+sys.path.insert(0, os.path.join(PROJECT_DIR, "src"))
+sys.path.insert(0, os.path.join(PROJECT_DIR, "host"))
+
+import binfont  # noqa: E402
+from jp_charset import range_chars  # noqa: E402
+
+GLYPH_HEIGHT = 17
+MAX_WIDTH = 16
+
+
+def stride(width):
+    return (width + 7) // 8
+
+
+def load_ttf(path, chars):
+    from glyph_push import GlyphRasterizer  # needs freetype-py
+    rasterizer = GlyphRasterizer(path)
+    glyphs = {}
+    for ch in chars:
+        glyph = rasterizer.render(ord(ch))
+        if glyph is not None:
+            glyphs[ord(ch)] = glyph
+    return glyphs
+
+
+def load_bdf(path, chars):
+    """Glyphs of a BDF font placed on the baseline of a 17 px cell."""
+    wanted = {ord(ch) for ch in chars} if chars else None
+    glyphs = {}
+    ascent = None
+    with open(path, encoding="latin-1") as fh:
+        lines = iter(fh.read().splitlines())
+    for line in lines:
+        key, _, value = line.partition(" ")
+        if key == "FONT_ASCENT":
+            ascent = int(value)
+        elif key == "STARTCHAR":
+            cp = width = None
+            bbx = (0, 0, 0, 0)
+            for line in lines:
+                key, _, value = line.partition(" ")
+                if key == "ENCODING":
+                    cp = int(value.split()[0])
+                elif key == "DWIDTH":
+                    width = int(value.split()[0])
+                elif key == "BBX":
+                    bbx = tuple(int(v) for v in value.split())
+                elif key == "BITMAP":
+                    break
+            bitmap = []
+            for line in lines:
+                if line == "ENDCHAR":
+                    break
+                bitmap.append(int(line, 16) if line else 0)
+            if cp is None or cp < 0 or (wanted is not None and cp not in wanted):
+                continue
+            if ascent is None:
+                raise ValueError("FONT_ASCENT must come before the glyphs")
+            width = max(1, min(MAX_WIDTH, width or bbx[0]))
+            glyphs[cp] = (width, bdf_rows(bitmap, bbx, ascent, width))
+    return glyphs
+
+
+def bdf_rows(bitmap, bbx, ascent, width):
+    bw, bh, bx, by = bbx
+    row_bits = stride(bw) * 8
+    rows = bytearray(stride(width) * GLYPH_HEIGHT)
+    top = ascent - (by + bh)
+    for j, bits in enumerate(bitmap):
+        y = top + j
+        if not 0 <= y < GLYPH_HEIGHT:
+            continue
+        for i in range(bw):
+            x = bx + i
+            if 0 <= x < width and bits & (1 << (row_bits - 1 - i)):
+                rows[y * stride(width) + (x >> 3)] |= 0x80 >> (x & 7)
+    return bytes(rows)
+
+
+def load_binfont(path, chars):
+    font = binfont.BinaryFont(path, 1)
+    if font.height != GLYPH_HEIGHT:
+        raise ValueError(f"{path}: height {font.height}, expected {GLYPH_HEIGHT}")
+    wanted = {ord(ch) for ch in chars} if chars else None
+    glyphs = {}
+    for index, cp in enumerate(font.codepoints):
+        if wanted is None or cp in wanted:
+            glyphs[cp] = (font.widths[index], bytes(font.glyph_at(index)))
+    font._file.close()
+    return glyphs
+
+
+def load_module(path, chars):
+    import font_to_bin
+    module = font_to_bin.load_module(path)
+    if module.HEIGHT != GLYPH_HEIGHT:
+        raise ValueError(f"{path}: height {module.HEIGHT}, expected {GLYPH_HEIGHT}")
+    glyphs = font_to_bin.build(module)
+    if chars:
+        wanted = {ord(ch) for ch in chars}
+        glyphs = {cp: g for cp, g in glyphs.items() if cp in wanted}
+    return glyphs
+
+
+LOADERS = {
+    ".ttf": load_ttf,
+    ".otf": load_ttf,
+    ".ttc": load_ttf,
+    ".bdf": load_bdf,
+    ".bin": load_binfont,
+    ".py": load_module,
+}
+
+
+def write_font(path, glyphs, packed=True):
+    """Write a JPF1/JPF2 font; returns (file size, index size, bitmap size)."""
+    codepoints = sorted(glyphs)
+    cp_size = 2 if codepoints[-1] <= 0xFFFF else 4
+    offsets = []
+    bitmaps = bytearray()
+    for cp in codepoints:
+        width, rows = glyphs[cp]
+        offsets.append(len(bitmaps))
+        bitmaps.extend(binfont.pack(rows, width, GLYPH_HEIGHT) if packed else rows)
+    max_width = max(width for width, _ in glyphs.values())
+    magic = binfont.MAGIC_PACKED if packed else binfont.MAGIC
+    header = magic + struct.pack("<HBBB", len(codepoints), GLYPH_HEIGHT, max_width, cp_size)
+    with open(path, "wb") as fh:
+        fh.write(header.ljust(binfont.HEADER_SIZE, b"\0"))
+        fh.write(struct.pack("<%d%s" % (len(codepoints), "H" if cp_size == 2 else "I"),
+                             *codepoints))
+        fh.write(struct.pack("<%dI" % len(offsets), *offsets))
+        fh.write(bytes(glyphs[cp][0] for cp in codepoints))
+        fh.write(bitmaps)
+    index = len(codepoints) * (cp_size + 5)
+    return binfont.HEADER_SIZE + index + len(bitmaps), index, len(bitmaps)
+
+
+def decode_cost(glyphs, rounds=20):
+    """(plain, packed) microseconds per glyph to get plain rows, under CPython.
+
+    Plain rows are a straight copy; packed ones go through binfont.expand.
+    On the Pico the packed glyphs skip expand and are blitted in place, see
+    tools/bench_font_decode.py for the on-device numbers.
+    """
+    items = list(glyphs.values())
+    packed = [(width, binfont.pack(rows, width, GLYPH_HEIGHT)) for width, rows in items]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _, rows in items:
+            bytearray(rows)
+    plain_us = (time.perf_counter() - start) * 1e6 / (rounds * len(items))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for width, data in packed:
+            binfont.expand(data, width, GLYPH_HEIGHT)
+    packed_us = (time.perf_counter() - start) * 1e6 / (rounds * len(items))
+    return plain_us, packed_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a JPF1/JPF2 font for the Pico")
+    parser.add_argument("source", help="TTF/OTF, BDF, JPF font (.bin) or font2bitmap module (.py)")
+    parser.add_argument("output", help="binary font to write, e.g. src/font_jp16.bin")
+    parser.add_argument("-c", "--charset", default="",
+                        help='characters as "0xAAAA-0xBBBB,0xNN" (default: all glyphs of a bitmap source)')
+    parser.add_argument("--plain", action="store_true", help="write uncompressed JPF1 rows")
+    args = parser.parse_args()
+
+    loader = LOADERS.get(os.path.splitext(args.source)[1].lower())
+    if loader is None:
+        parser.error(f"unsupported font type: {args.source}")
+    chars = range_chars(args.charset.split(",")) if args.charset else None
+    if loader is load_ttf and not chars:
+        parser.error("-c is required for TTF/OTF sources")
+    glyphs = loader(args.source, chars)
+    if not glyphs:
+        print("No glyphs selected", file=sys.stderr)
+        return 1
+    if chars:
+        missing = len(set(chars)) - len(glyphs)
+        if missing:
+            print(f"{missing} characters not in {args.source}", file=sys.stderr)
+
+    plain_bytes = sum(len(rows) for _, rows in glyphs.values())
+    size, index, bitmaps = write_font(args.output, glyphs, packed=not args.plain)
+    print(f"{len(glyphs)} glyphs, {size} bytes -> {args.output} (index {index} bytes in RAM)")
+    if not args.plain:
+        plain_us, packed_us = decode_cost(glyphs)
+        print("{:<10} {:>9} {:>14}".format("bitmaps", "bytes", "decode us/gl"))
+        print("{:<10} {:>9} {:>14.2f}".format("plain", plain_bytes, plain_us))
+        print("{:<10} {:>9} {:>14.2f}".format("packed", bitmaps, packed_us))
+        print(f"Compression: {bitmaps / plain_bytes:.1%} of plain "
+              f"({plain_bytes / len(glyphs):.1f} -> {bitmaps / len(glyphs):.1f} bytes per glyph)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
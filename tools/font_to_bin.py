@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Convert a font2bitmap.py font module into the binary font read by src/binfont.py.
+
+font2bitmap emits a Python module (MAP, WIDTHS, OFFSETS, BITMAPS with
+glyphs as one contiguous bit stream). The Pico now reads glyphs on demand
+from a binary file instead, with a sorted codepoint index and byte-padded
+rows (see src/binfont.py for the layout).
+
+Usage:
+    python3 tools/font_to_bin.py font_jp16.py src/font_jp16.bin
+"""
+
+import argparse
+import importlib.util
+import struct
+import sys
+
+MAGIC = b"JPF1"
+HEADER_SIZE = 16
+
+
+def load_module(path):
+    spec = importlib.util.spec_from_file_location("font_module", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def glyph_rows(module, index):
+    """Extract glyph `index` as MONO_HLSB rows (each row padded to bytes)."""
+    width = module.WIDTHS[index]
+    ow = module.OFFSET_WIDTH
+    bit = int.from_bytes(bytes(module.OFFSETS[index * ow:(index + 1) * ow]), "big")
+    bitmaps = module.BITMAPS
+    stride = (width + 7) // 8
+    rows = bytearray(stride * module.HEIGHT)
+    for y in range(module.HEIGHT):
+        for x in range(width):
+            if bitmaps[bit >> 3] & (0x80 >> (bit & 7)):
+                rows[y * stride + (x >> 3)] |= 0x80 >> (x & 7)
+            bit += 1
+    return width, bytes(rows)
+
+
+def build(module):
+    if module.BPP != 1:
+        raise ValueError("only 1 bpp fonts are supported")
+    glyphs = {}
+    for index, ch in enumerate(module.MAP):
+        glyphs[ord(ch)] = glyph_rows(module, index)
+    return glyphs
+
+
+def write_font(path, glyphs, height, max_width):
+    codepoints = sorted(glyphs)
+    cp_size = 2 if codepoints[-1] <= 0xFFFF else 4
+    offsets = []
+    bitmaps = bytearray()
+    for cp in codepoints:
+        offsets.append(len(bitmaps))
+        bitmaps.extend(glyphs[cp][1])
+    header = MAGIC + struct.pack("<HBBB", len(codepoints), height, max_width, cp_size)
+    with open(path, "wb") as fh:
+        fh.write(header.ljust(HEADER_SIZE, b"\0"))
+        fh.write(struct.pack("<%d%s" % (len(codepoints), "H" if cp_size == 2 else "I"),
+                             *codepoints))
+        fh.write(struct.pack("<%dI" % len(offsets), *offsets))
+        fh.write(bytes(glyphs[cp][0] for cp in codepoints))
+        fh.write(bitmaps)
+    index = len(codepoints) * (cp_size + 5)
+    return HEADER_SIZE + index + len(bitmaps), index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a font2bitmap module to a JPF1 font")
+    parser.add_argument("module", help="font module generated by font2bitmap.py")
+    parser.add_argument("output", help="binary font to write, e.g. src/font_jp16.bin")
+    args = parser.parse_args()
+
+    module = load_module(args.module)
+    glyphs = build(module)
+    size, index = write_font(args.output, glyphs, module.HEIGHT, module.MAX_WIDTH)
+    print(f"{len(glyphs)} glyphs, {size} bytes -> {args.output} (index {index} bytes in RAM)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,39 +1,45 @@
 #!/bin/bash
-# Generate Japanese bitmap font module for Pico 2 W display
+# Generate Japanese bitmap font for Pico 2 W display
 #
 # Prerequisites:
-#   - freetype-py (pip install freetype-py)
-#   - DroidSansFallbackFull.ttf
+#   - freetype-py (pip install freetype-py) for TTF/OTF sources
+#   - DroidSansFallbackFull.ttf, or any font given in FONT_SOURCE
+#     (a BDF source needs no extra packages)
 #
-# Output: src/font_jp16.py
+# Output: src/font_jp16.bin (packed JPF2, compiled by tools/font_compiler.py)
+#
+# Usage:
+#   tools/generate_jp_font.sh          # curated charset
+#   tools/generate_jp_font.sh --jis1   # full JIS level 1 kanji
+#   tools/generate_jp_font.sh --corpus /tmp/pico-server.log --budget 24000
+#                                      # charset chosen from displayed text
+#   FONT_SOURCE=unifont.bdf tools/generate_jp_font.sh
 
 set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 PROJECT_DIR="$(dirname "$SCRIPT_DIR")"
 
-FONT2BITMAP="/mnt/ssd/workspace/st7789_mpy/utils/font2bitmap.py"
-TTF_FILE="/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf"
+FONT_SOURCE="${FONT_SOURCE:-/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf}"
 CHARSET_SCRIPT="${SCRIPT_DIR}/jp_charset.py"
-OUTPUT="${PROJECT_DIR}/src/font_jp16.py"
-FONT_HEIGHT=16
+OUTPUT="${PROJECT_DIR}/src/font_jp16.bin"
 
 # Validate prerequisites
-for f in "$FONT2BITMAP" "$TTF_FILE" "$CHARSET_SCRIPT"; do
+for f in "$FONT_SOURCE" "$CHARSET_SCRIPT"; do
     if [ ! -f "$f" ]; then
         echo "ERROR: Required file not found: $f" >&2
         exit 1
     fi
 done
 
-# Get character set string
-CHARSET=$(python3 "$CHARSET_SCRIPT")
+# Get character set string (a --budget is measured with this font's packed glyphs)
+CHARSET=$(python3 "$CHARSET_SCRIPT" --font "$FONT_SOURCE" "$@")
 
-echo "Generating Japanese font (${FONT_HEIGHT}px)..."
-echo "  Font: $TTF_FILE"
+echo "Generating Japanese font (16px)..."
+echo "  Font: $FONT_SOURCE"
 echo "  Output: $OUTPUT"
 
-python3 "$FONT2BITMAP" "$TTF_FILE" "$FONT_HEIGHT" -c "$CHARSET" > "$OUTPUT"
+python3 "${SCRIPT_DIR}/font_compiler.py" "$FONT_SOURCE" "$OUTPUT" -c "$CHARSET"
 
 # Show file size
 SIZE=$(wc -c < "$OUTPUT")
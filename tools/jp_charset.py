@@ -2,14 +2,33 @@
 """
 Character set definition for Japanese bitmap font generation.
 
-Outputs a character code range string for font2bitmap.py -c option.
+Outputs a character code range string for the font_compiler.py -c option.
 
 Usage:
     python3 tools/jp_charset.py          # print -c argument string
     python3 tools/jp_charset.py --count  # print character count
+    python3 tools/jp_charset.py --jis1   # full JIS X 0208 level 1 kanji set
+
+Corpus mode picks the charset from what the displays actually show. It
+reads the host's command log (``[fifo] mode tasks_short {...}`` lines, raw
+JSON commands, preload files) and/or plain text files, counts how often
+each character is drawn, and fills a byte budget with the most frequent
+characters first, then the curated set below. A coverage/size table goes to
+stderr, the -c string to stdout:
+
+    python3 tools/jp_charset.py --corpus /tmp/pico-server.log --budget 24000
+    python3 tools/jp_charset.py --corpus /tmp/pico-server.log notes.txt \
+        --budget 24000 --generate   # then run generate_jp_font.sh with it
+
+Characters left out are still drawn once the host pushes them (glyph_pack).
 """
 
+import argparse
+import json
+import os
+import subprocess
 import sys
+from collections import Counter
 
 
 def unique_chars(s):
@@ -90,6 +109,189 @@ KANJI_CHARS = unique_chars(_KANJI_RAW)
 KANJI_CODES = [f"0x{ord(c):04x}" for c in KANJI_CHARS]
 
 
+def jis_level1_kanji():
+    """All 2965 JIS X 0208 level 1 kanji (rows 16-47), in JIS order.
+
+    Decoded from EUC-JP: row bytes 0xB0-0xCF, cells 0xA1-0xFE, except
+    row 47 (0xCF) which ends at cell 0xD3.
+    """
+    chars = []
+    for row in range(0xB0, 0xD0):
+        last = 0xD3 if row == 0xCF else 0xFE
+        for cell in range(0xA1, last + 1):
+            chars.append(bytes((row, cell)).decode("euc_jp"))
+    return chars
+
+
+def range_chars(ranges):
+    """Expand "0xAAAA-0xBBBB" / "0xNN" strings into characters."""
+    chars = []
+    for part in ranges:
+        start, _, end = part.partition("-")
+        for cp in range(int(start, 16), int(end or start, 16) + 1):
+            chars.append(chr(cp))
+    return chars
+
+
+# ---------------------------------------------------------------------------
+# Corpus mode
+# ---------------------------------------------------------------------------
+FONT_HEADER_BYTES = 16   # JPF1/JPF2 header, see src/binfont.py
+INDEX_ENTRY_BYTES = 2 + 4 + 1  # u16 codepoint, u32 offset, u8 width
+GLYPH_ROWS = 17
+LOG_PREFIX = "[fifo] "
+DEFAULT_SIZE_FONT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 "src", "font_jp16.bin")
+
+
+class GlyphSizes:
+    """Bytes each glyph takes in font_jp16.bin as tools/font_compiler.py writes it.
+
+    Glyphs of a reference font are packed with binfont.pack (JPF2), so the
+    budget matches the compiled file rather than plain rows. Characters the
+    reference lacks get its mean packed size for their width class (ASCII
+    half width, everything else 16 px); without any reference, plain rows.
+    """
+
+    def __init__(self, path=None, chars=None):
+        self.sizes = {}
+        self.mean = {8: INDEX_ENTRY_BYTES + GLYPH_ROWS, 16: INDEX_ENTRY_BYTES + 2 * GLYPH_ROWS}
+        if path:
+            self._measure(path, chars)
+
+    def _measure(self, path, chars):
+        import font_compiler  # puts src/ on sys.path
+        import binfont
+        loader = font_compiler.LOADERS.get(os.path.splitext(path)[1].lower())
+        if loader is None:
+            raise ValueError(f"unsupported font type: {path}")
+        glyphs = loader(path, chars)
+        by_width = {8: [], 16: []}
+        for cp, (width, rows) in glyphs.items():
+            size = INDEX_ENTRY_BYTES + len(binfont.pack(rows, width, GLYPH_ROWS))
+            self.sizes[chr(cp)] = size
+            by_width[8 if cp < 0x80 else 16].append(size)
+        for width, sizes in by_width.items():
+            if sizes:
+                self.mean[width] = round(sum(sizes) / len(sizes))
+
+    def glyph(self, ch):
+        size = self.sizes.get(ch)
+        if size is None:
+            size = self.mean[8 if ord(ch) < 0x80 else 16]
+        return size
+
+    def font(self, chars):
+        return FONT_HEADER_BYTES + sum(self.glyph(ch) for ch in chars)
+
+
+def payload_strings(value):
+    """Strings a command payload draws (background data skipped)."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            stack.extend(v for k, v in item.items() if k != "background")
+        elif isinstance(item, list):
+            stack.extend(item)
+
+
+def line_text(line):
+    """Displayed text of one log / corpus line.
+
+    Command lines (optionally prefixed with "[fifo] ") contribute the
+    strings of their JSON payload; anything else counts as plain text.
+    """
+    if line.startswith(LOG_PREFIX):
+        line = line[len(LOG_PREFIX):]
+    start = line.find("{")
+    if start >= 0:
+        try:
+            payload, _ = json.JSONDecoder().raw_decode(line[start:])
+        except ValueError:
+            payload = None
+        if payload is not None:
+            return "".join(payload_strings(payload))
+    return line
+
+
+def corpus_counts(paths):
+    """Occurrences of every character the Japanese font would draw."""
+    counts = Counter()
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                counts.update(ch for ch in line_text(line.rstrip("\n"))
+                              if ord(ch) > 126 and ch != "°")
+    return counts
+
+
+def choose_charset(counts, budget, fallback, sizes):
+    """Fill `budget` bytes: ASCII + °, corpus characters by frequency, then fallback.
+
+    Packed glyph sizes vary with the ink, so a character that no longer
+    fits is skipped rather than ending the pass: a smaller one further down
+    the list may still fit the remaining bytes.
+    """
+    chosen = range_chars(["0x20-0x7e", "0xb0"])
+    used = sizes.font(chosen)
+    seen = set(chosen)
+    ranked = [ch for ch, _ in counts.most_common()]
+    for ch in ranked + fallback:
+        if ch in seen:
+            continue
+        size = sizes.glyph(ch)
+        if used + size > budget:
+            continue
+        chosen.append(ch)
+        seen.add(ch)
+        used += size
+    return chosen
+
+
+def coverage(counts, chars):
+    total = sum(counts.values())
+    if not total:
+        return 1.0
+    present = set(chars)
+    return sum(n for ch, n in counts.items() if ch in present) / total
+
+
+def print_tradeoff(counts, chosen, curated, jis1, sizes, out=sys.stderr):
+    """Coverage/size table: corpus-ranked prefixes vs. the fixed charsets."""
+    total = sum(counts.values())
+    print(f"Corpus: {total} drawn characters, {len(counts)} distinct", file=out)
+    print("{:<24} {:>7} {:>9} {:>9}".format("charset", "glyphs", "bytes", "coverage"), file=out)
+
+    def row(label, chars):
+        print("{:<24} {:>7} {:>9} {:>8.2%}".format(
+            label, len(chars), sizes.font(chars), coverage(counts, chars)), file=out)
+
+    base = range_chars(["0x20-0x7e", "0xb0"])
+    ranked = [ch for ch, _ in counts.most_common()]
+    covered = 0
+    targets = [0.5, 0.8, 0.9, 0.95, 0.99, 1.0]
+    for i, ch in enumerate(ranked):
+        covered += counts[ch]
+        reached = None
+        while targets and covered >= targets[0] * total:
+            reached = targets.pop(0)
+        if reached is not None:
+            row("top %d (%d%%)" % (i + 1, round(reached * 100)), base + ranked[:i + 1])
+    row("curated", curated)
+    row("jis1", jis1)
+    row("selected", chosen)
+
+
+def run_generate(args):
+    """Re-run generate_jp_font.sh with the same corpus options."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generate_jp_font.sh")
+    forwarded = [a for a in args if a != "--generate"]
+    return subprocess.call([script] + forwarded)
+
+
 def count_chars_in_ranges(ranges):
     """Count the number of individual characters covered by range strings."""
     total = 0
@@ -108,20 +310,66 @@ def count_chars_in_ranges(ranges):
     return total
 
 
-def main():
-    all_parts = RANGES + KANJI_CODES
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", action="store_true", help="print character counts")
+    parser.add_argument("--jis1", action="store_true", help="full JIS X 0208 level 1 kanji set")
+    parser.add_argument("--corpus", nargs="+", metavar="FILE",
+                        help="command log or text files to compute coverage from")
+    parser.add_argument("--budget", type=int, default=0,
+                        help="font size budget in bytes for --corpus (default: size of the curated set)")
+    parser.add_argument("--font", default=DEFAULT_SIZE_FONT,
+                        help="font whose packed glyph sizes --budget is measured with "
+                             "(TTF/OTF, BDF or JPF; default: src/font_jp16.bin)")
+    parser.add_argument("--generate", action="store_true",
+                        help="run generate_jp_font.sh with the selected charset")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    opts = parse_args(argv)
+    curated = range_chars(RANGES) + KANJI_CHARS
+    kanji_codes = KANJI_CODES
+    if opts.jis1:
+        # Keep the curated list first so its extra (level 2) kanji stay in.
+        kanji = unique_chars(KANJI_CHARS + jis_level1_kanji())
+        kanji_codes = [f"0x{ord(c):04x}" for c in kanji]
+    all_parts = RANGES + kanji_codes
+
+    if opts.corpus:
+        if opts.generate:
+            return run_generate(argv)
+        counts = corpus_counts(opts.corpus)
+        fallback = range_chars(RANGES) + KANJI_CHARS
+        if opts.jis1:
+            fallback += jis_level1_kanji()
+        jis1 = unique_chars(curated + jis_level1_kanji())
+        font = opts.font if opts.font and os.path.exists(opts.font) else None
+        sizes = GlyphSizes(font, unique_chars(list(counts) + jis1 + range_chars(RANGES)))
+        budget = opts.budget or sizes.font(curated)
+        chosen = choose_charset(counts, budget, fallback, sizes)
+        print_tradeoff(counts, chosen, curated, jis1, sizes)
+        print(f"Budget: {budget} bytes", file=sys.stderr)
+        if opts.count:
+            print(f"Total characters : {len(chosen)}")
+        else:
+            print(",".join(f"0x{ord(c):02x}" for c in chosen))
+        return 0
+
     charset_arg = ",".join(all_parts)
 
-    if "--count" in sys.argv:
+    if opts.count:
         range_count = count_chars_in_ranges(RANGES)
-        kanji_count = len(KANJI_CODES)
+        kanji_count = len(kanji_codes)
         total = range_count + kanji_count
         print(f"Range characters : {range_count}")
         print(f"Kanji characters : {kanji_count}")
         print(f"Total characters : {total}")
     else:
         print(charset_arg)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())